@@ -0,0 +1,111 @@
+"""Lazy command registry for argparse-based CLIs.
+
+A command group (``files``, ``movies``, ...) is declared once with its help
+text, a function that adds its arguments and subcommands to the group
+parser, and its handler.  When a parser is built for a command line, only the
+group being run gets its full argument tree; every other group is a bare
+stub that still shows up in ``--help``.  Handlers import their implementation
+modules themselves, so nothing beyond the selected group is loaded.
+"""
+
+import argparse
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+class CommandGroup(NamedTuple):
+    """Declaration of one command group."""
+    name: str
+    help: str
+    description: str
+    add_arguments: Callable[[argparse.ArgumentParser], None]  # Fills in the group parser
+    handler: Callable[[argparse.Namespace], int]
+
+
+class CommandRegistry:
+    """Ordered set of command groups that builds parsers on demand."""
+
+    def __init__(self, value_options: Iterable[str] = (), flag_options: Iterable[str] = ()):
+        """
+        Initialize the registry.
+
+        Args:
+            value_options: Top-level options that take a value (so the value is
+                not mistaken for a group name when finding the selected group)
+            flag_options: Top-level long options without a value, needed to
+                resolve abbreviations (``--profile`` vs ``--profile-dump``)
+        """
+        self.groups: Dict[str, CommandGroup] = {}
+        self.value_options = set(value_options)
+        self.flag_options = set(flag_options)
+
+    def _takes_value(self, token: str) -> bool:
+        """Check whether an option token consumes the next argument."""
+        if '=' in token:
+            return False
+        if token in self.value_options or token in self.flag_options:
+            return token in self.value_options
+        if not token.startswith('--'):
+            return False
+        # argparse accepts any unambiguous prefix of a long option
+        matches = [option for option in self.value_options | self.flag_options
+                   if option.startswith(token)]
+        return len(matches) == 1 and matches[0] in self.value_options
+
+    def register(self, group: CommandGroup) -> None:
+        """Add a command group (groups are listed in registration order)."""
+        self.groups[group.name] = group
+
+    def selected_group(self, argv: List[str]) -> Optional[str]:
+        """
+        Find the group a command line runs.
+
+        Args:
+            argv: Command line arguments (without the program name)
+
+        Returns:
+            Group name, or None if no group is given
+        """
+        skip_next = False
+        for token in argv:
+            if skip_next:
+                skip_next = False
+                continue
+            if token == '--':
+                return None
+            if token.startswith('-'):
+                skip_next = self._takes_value(token)
+                continue
+            return token if token in self.groups else None
+        return None
+
+    def add_to(self, subparsers, argv: List[str]) -> Optional[str]:
+        """
+        Add a parser for every group, with arguments only for the selected one.
+
+        Args:
+            subparsers: Result of ``add_subparsers`` on the top-level parser
+            argv: Command line arguments the parser is built for
+
+        Returns:
+            Name of the fully built group, or None
+        """
+        selected = self.selected_group(argv)
+        for group in self.groups.values():
+            group_parser = subparsers.add_parser(group.name, help=group.help,
+                                                 description=group.description)
+            if group.name == selected:
+                group.add_arguments(group_parser)
+        return selected
+
+    def dispatch(self, args: argparse.Namespace, dest: str = 'command_group') -> int:
+        """
+        Run the handler of the parsed group.
+
+        Args:
+            args: Parsed arguments
+            dest: Namespace attribute holding the group name
+
+        Returns:
+            Handler exit code
+        """
+        return self.groups[getattr(args, dest)].handler(args)
@@ -8,12 +8,14 @@ all file management, media organization, and Plex utilities.
 
 import argparse
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 
 # Import utilities
 from ..plex.config.config import MediaConfig
+from .command_registry import CommandGroup, CommandRegistry
 
 # Version info
 __version__ = "1.0.0"
@@ -25,10 +27,23 @@ class PlexCLI:
     def __init__(self):
         """Initialize the CLI with configuration."""
         self.config = MediaConfig()
-        self.parser = self._create_parser()
+        self.registry = self._create_registry()
+        self._parser: Optional[argparse.ArgumentParser] = None
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the main argument parser with subcommands."""
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Get the argument parser for the current command line."""
+        if self._parser is None:
+            self._parser = self._create_parser()
+        return self._parser
+    
+    def _create_parser(self, argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+        """
+        Create the main argument parser with subcommands.
+        
+        Args:
+            argv: Command line the parser is for (uses sys.argv if None)
+        """
         parser = argparse.ArgumentParser(
             prog='plex-cli',
             description='Unified CLI for Plex media management and file organization',
@@ -54,39 +69,49 @@ class PlexCLI:
             help='Start interactive mode with menu selection'
         )
         
-        # Create subparsers for main command groups
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Print wall time, call counts and bytes per phase when the command exits'
+        )
+        
+        parser.add_argument(
+            '--profile-dump',
+            metavar='FILE',
+            help='With --profile, also write a cProfile (.prof) or collapsed-stack (any other suffix) dump'
+        )
+        
+        # Create subparsers for main command groups (only the group being
+        # run gets its full argument tree)
         subparsers = parser.add_subparsers(
             dest='command_group',
             title='Command Groups',
             description='Available command groups',
             help='Use --help with any command group for detailed help'
         )
-        
-        # Files command group
-        self._add_files_commands(subparsers)
-        
-        # Movies command group (placeholder for Phase 2)
-        self._add_movies_commands(subparsers)
-        
-        # TV command group (placeholder for Phase 2)
-        self._add_tv_commands(subparsers)
-        
-        # Media command group (placeholder for Phase 2)
-        self._add_media_commands(subparsers)
-        
-        # Config command group
-        self._add_config_commands(subparsers)
+        self.registry.add_to(subparsers, sys.argv[1:] if argv is None else argv)
         
         return parser
     
-    def _add_files_commands(self, subparsers) -> None:
-        """Add files command group."""
-        files_parser = subparsers.add_parser(
-            'files',
-            help='General file operations',
-            description='File management utilities'
-        )
-        
+    def _create_registry(self) -> CommandRegistry:
+        """Declare the command groups in the order they are listed in help."""
+        registry = CommandRegistry(value_options=['--profile-dump'],
+                                   flag_options=['--version', '--verbose', '--interactive', '--profile'])
+        registry.register(CommandGroup('files', 'General file operations', 'File management utilities',
+                                       self._add_files_arguments, self._handle_files_command))
+        registry.register(CommandGroup('movies', 'Movie management', 'Movie collection management tools',
+                                       self._add_movies_arguments, self._handle_movies_command))
+        registry.register(CommandGroup('tv', 'TV show management', 'TV show collection management tools',
+                                       self._add_tv_arguments, self._handle_tv_command))
+        registry.register(CommandGroup('media', 'Cross-media operations',
+                                       'Operations across movie and TV collections',
+                                       self._add_media_arguments, self._handle_media_command))
+        registry.register(CommandGroup('config', 'Configuration management', 'Manage plex-cli configuration',
+                                       self._add_config_arguments, self._handle_config_command))
+        return registry
+    
+    def _add_files_arguments(self, files_parser: argparse.ArgumentParser) -> None:
+        """Add the subcommands of the files command group."""
         files_subparsers = files_parser.add_subparsers(
             dest='files_command',
             title='Files Commands',
@@ -123,6 +148,11 @@ class PlexCLI:
             action='store_true',
             help='Rebuild the entire database'
         )
+        database_parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Incrementally refresh the database (only rescans changed directories)'
+        )
         database_parser.add_argument(
             '--status',
             action='store_true',
@@ -217,14 +247,8 @@ class PlexCLI:
             help='List available cached decision files'
         )
     
-    def _add_movies_commands(self, subparsers) -> None:
-        """Add movies command group."""
-        movies_parser = subparsers.add_parser(
-            'movies',
-            help='Movie management',
-            description='Movie collection management tools'
-        )
-        
+    def _add_movies_arguments(self, movies_parser: argparse.ArgumentParser) -> None:
+        """Add the subcommands of the movies command group."""
         movies_subparsers = movies_parser.add_subparsers(
             dest='movies_command',
             title='Movies Commands',
@@ -307,14 +331,8 @@ class PlexCLI:
             help='Metacritic threshold for bad movies (default: 40)'
         )
     
-    def _add_tv_commands(self, subparsers) -> None:
-        """Add TV command group."""
-        tv_parser = subparsers.add_parser(
-            'tv',
-            help='TV show management',
-            description='TV show collection management tools'
-        )
-        
+    def _add_tv_arguments(self, tv_parser: argparse.ArgumentParser) -> None:
+        """Add the subcommands of the TV command group."""
         tv_subparsers = tv_parser.add_subparsers(
             dest='tv_command',
             title='TV Commands',
@@ -377,14 +395,8 @@ class PlexCLI:
         # tv reports command
         tv_subparsers.add_parser('reports', help='Generate comprehensive TV collection reports')
     
-    def _add_media_commands(self, subparsers) -> None:
-        """Add media command group."""
-        media_parser = subparsers.add_parser(
-            'media',
-            help='Cross-media operations',
-            description='Operations across movie and TV collections'
-        )
-        
+    def _add_media_arguments(self, media_parser: argparse.ArgumentParser) -> None:
+        """Add the subcommands of the media command group."""
         media_subparsers = media_parser.add_subparsers(
             dest='media_command',
             title='Media Commands',
@@ -424,6 +436,11 @@ class PlexCLI:
             action='store_true',
             help='Rebuild the entire database'
         )
+        database_parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Incrementally refresh the database (only rescans changed directories)'
+        )
         database_parser.add_argument(
             '--status',
             action='store_true',
@@ -465,14 +482,8 @@ class PlexCLI:
             help='Test enrichment for a specific title'
         )
     
-    def _add_config_commands(self, subparsers) -> None:
-        """Add config command group."""
-        config_parser = subparsers.add_parser(
-            'config',
-            help='Configuration management',
-            description='Manage plex-cli configuration'
-        )
-        
+    def _add_config_arguments(self, config_parser: argparse.ArgumentParser) -> None:
+        """Add the subcommands of the config command group."""
         config_subparsers = config_parser.add_subparsers(
             dest='config_command',
             title='Config Commands',
@@ -563,26 +574,22 @@ Version: """ + __version__
             Exit code (0 for success, non-zero for error)
         """
         try:
-            parsed_args = self.parser.parse_args(args)
-            
-            # Handle interactive mode (explicit flag or no arguments)
-            if parsed_args.interactive or not parsed_args.command_group:
-                return self._run_interactive_mode(parsed_args)
-            
-            # Route to appropriate handler
-            if parsed_args.command_group == 'files':
-                return self._handle_files_command(parsed_args)
-            elif parsed_args.command_group == 'config':
-                return self._handle_config_command(parsed_args)
-            elif parsed_args.command_group == 'movies':
-                return self._handle_movies_command(parsed_args)
-            elif parsed_args.command_group == 'tv':
-                return self._handle_tv_command(parsed_args)
-            elif parsed_args.command_group == 'media':
-                return self._handle_media_command(parsed_args)
+            self._parser = self._create_parser(args)
+            parsed_args = self._parser.parse_args(args)
+            
+            if parsed_args.profile:
+                from ..plex.utils.profiler import profile_run
+                profiling = profile_run(True, parsed_args.profile_dump)
             else:
-                print(f"Unknown command group: {parsed_args.command_group}", file=sys.stderr)
-                return 1
+                profiling = nullcontext()
+            
+            with profiling:
+                # Handle interactive mode (explicit flag or no arguments)
+                if parsed_args.interactive or not parsed_args.command_group:
+                    return self._run_interactive_mode(parsed_args)
+                
+                # Route to the group's handler
+                return self.registry.dispatch(parsed_args)
                 
         except KeyboardInterrupt:
             print("\nOperation cancelled by user.", file=sys.stderr)
@@ -696,6 +703,11 @@ Version: """ + __version__
                 print(f"   ⏱️  Build time: {stats.build_time_seconds:.1f}s")
                 print(f"   💾 Total size: {stats.total_size_bytes / (1024**3):.1f} GB")
                 
+            elif getattr(args, 'refresh', False):
+                print("🔄 Refreshing media database (changed directories only)...")
+                delta = db.refresh_database()
+                self._display_refresh_delta(delta)
+                
             elif args.status:
                 if db.is_current():
                     stats = db.get_stats()
@@ -727,6 +739,15 @@ Version: """ + __version__
             print(f"❌ Error with database operation: {e}")
             return 1
     
+    def _display_refresh_delta(self, delta) -> None:
+        """Display the per-run delta of an incremental database refresh."""
+        print(f"✅ Database refreshed in {delta.refresh_time_seconds:.1f}s")
+        print(f"   📂 Directories listed: {delta.directories_listed} (skipped unchanged: {delta.directories_skipped})")
+        print(f"   🎬 Movies: +{delta.movies_added} added, -{delta.movies_removed} removed, ~{delta.movies_modified} modified")
+        print(f"   📺 Episodes: +{delta.episodes_added} added, -{delta.episodes_removed} removed, ~{delta.episodes_modified} modified")
+        if not delta.total_changes:
+            print("   ℹ️  No changes detected")
+    
     def _handle_files_organize(self, args) -> int:
         """Handle files organize command."""
         try:
@@ -736,52 +757,52 @@ Version: """ + __version__
             is_dry_run = not getattr(args, 'execute', False)
             
             # Initialize organizer
-            organizer = AutoOrganizer(dry_run=is_dry_run, use_ai=not getattr(args, 'no_ai', False))
-            
-            # Handle verify mounts only
-            if getattr(args, 'verify_mounts', False):
-                print("🔍 Verifying mount access...")
-                if organizer.verify_mount_access():
-                    print("✅ All mount points are accessible")
-                    return 0
-                else:
-                    print("❌ Some mount points are not accessible")
+            with AutoOrganizer(dry_run=is_dry_run, use_ai=not getattr(args, 'no_ai', False)) as organizer:
+            
+                # Handle verify mounts only
+                if getattr(args, 'verify_mounts', False):
+                    print("🔍 Verifying mount access...")
+                    if organizer.verify_mount_access():
+                        print("✅ All mount points are accessible")
+                        return 0
+                    else:
+                        print("❌ Some mount points are not accessible")
+                        return 1
+                
+                # Show mode information
+                mode = "DRY RUN" if is_dry_run else "EXECUTION"
+                ai_mode = "Rule-based only" if getattr(args, 'no_ai', False) else "AI + Rule-based"
+                
+                print(f"🗂️  Auto-Organizer - {mode} Mode")
+                print(f"   Classification: {ai_mode}")
+                print()
+                
+                # Verify mount access before proceeding
+                if not organizer.verify_mount_access():
+                    print("\n🚫 Organization cancelled due to mount access issues")
+                    print("💡 Use 'plex-cli files organize --verify-mounts' to check mount status")
                     return 1
-            
-            # Show mode information
-            mode = "DRY RUN" if is_dry_run else "EXECUTION"
-            ai_mode = "Rule-based only" if getattr(args, 'no_ai', False) else "AI + Rule-based"
-            
-            print(f"🗂️  Auto-Organizer - {mode} Mode")
-            print(f"   Classification: {ai_mode}")
-            print()
-            
-            # Verify mount access before proceeding
-            if not organizer.verify_mount_access():
-                print("\n🚫 Organization cancelled due to mount access issues")
-                print("💡 Use 'plex-cli files organize --verify-mounts' to check mount status")
-                return 1
-            
-            # Show execution warning for non-dry-run mode
-            if not is_dry_run:
-                print("\n⚠️  WARNING: Files will be moved to Plex directories!")
-                print("⚠️  Make sure you have backups before proceeding!")
-                confirm = input("\nType 'ORGANIZE' to proceed: ").strip()
-                if confirm != "ORGANIZE":
-                    print("🚫 Organization cancelled")
-                    return 0
-            
-            # Run the organization workflow
-            print("🚀 Starting media organization workflow...")
-            report_path = organizer.run_full_organization()
-            
-            if report_path:
-                print(f"\n📄 Detailed report saved to: {report_path}")
-                print("\n💡 TIP: Review the report for detailed information about each file move")
-                if is_dry_run:
-                    print("💡 TIP: Use --execute to actually move the files")
-                else:
-                    print("💡 TIP: If any moves failed, check mount access and available space")
+                
+                # Show execution warning for non-dry-run mode
+                if not is_dry_run:
+                    print("\n⚠️  WARNING: Files will be moved to Plex directories!")
+                    print("⚠️  Make sure you have backups before proceeding!")
+                    confirm = input("\nType 'ORGANIZE' to proceed: ").strip()
+                    if confirm != "ORGANIZE":
+                        print("🚫 Organization cancelled")
+                        return 0
+                
+                # Run the organization workflow
+                print("🚀 Starting media organization workflow...")
+                report_path = organizer.run_full_organization()
+                
+                if report_path:
+                    print(f"\n📄 Detailed report saved to: {report_path}")
+                    print("\n💡 TIP: Review the report for detailed information about each file move")
+                    if is_dry_run:
+                        print("💡 TIP: Use --execute to actually move the files")
+                    else:
+                        print("💡 TIP: If any moves failed, check mount access and available space")
             
             return 0
             
@@ -852,7 +873,8 @@ Version: """ + __version__
                 print(f"• Mode: {'DRY RUN' if args.dry_run else 'LIVE MOVES'}")
                 print()
                 
-                success = mover.execute_cached_moves(args.execute_cache)
+                with mover:
+                    success = mover.execute_cached_moves(args.execute_cache)
                 return 0 if success else 1
             
             # Handle interactive mode
@@ -870,7 +892,8 @@ Version: """ + __version__
             print()
             
             # Run interactive moves
-            success = mover.run_interactive_moves(args.report)
+            with mover:
+                success = mover.run_interactive_moves(args.report)
             return 0 if success else 1
             
         except ImportError as e:
@@ -3280,6 +3303,11 @@ Version: """ + __version__
                 print(f"   ⏱️  Build time: {stats.build_time_seconds:.1f}s")
                 print(f"   💾 Total size: {stats.total_size_bytes / (1024**3):.1f} GB")
                 
+            elif getattr(args, 'refresh', False):
+                print("🔄 Refreshing media database (changed directories only)...")
+                delta = db.refresh_database()
+                self._display_refresh_delta(delta)
+                
             elif args.status:
                 if db.is_current():
                     stats = db.get_stats()
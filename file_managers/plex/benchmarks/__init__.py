@@ -0,0 +1,25 @@
+"""Benchmark Package
+
+Reproducible synthetic media libraries and a benchmark suite for measuring
+scanner, duplicate detection, search and path resolution performance without
+the real NAS shares.
+
+Key Components:
+- generate_library: Seeded sparse-file library generator
+- run_benchmarks: Times each component at several library sizes
+- compare_results: Flags regressions against a stored baseline
+
+Usage:
+    python -m file_managers.plex.benchmarks run --sizes 1000 10000 100000
+"""
+
+from .library import LibraryManifest, generate_library
+from .suite import Regression, compare_results, run_benchmarks
+
+__all__ = [
+    "LibraryManifest",
+    "generate_library",
+    "Regression",
+    "compare_results",
+    "run_benchmarks",
+]
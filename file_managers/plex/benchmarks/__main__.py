@@ -0,0 +1,85 @@
+"""Command line entry point for the benchmark suite.
+
+Usage:
+    python -m file_managers.plex.benchmarks run --sizes 1000 10000 --output results.json
+    python -m file_managers.plex.benchmarks run --baseline baseline.json
+    python -m file_managers.plex.benchmarks compare results.json baseline.json
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from ..config.config import config
+from .suite import (
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the benchmark argument parser."""
+    parser = argparse.ArgumentParser(
+        prog='python -m file_managers.plex.benchmarks',
+        description='Benchmark scanners, duplicate detection, search and path resolution '
+                    'against synthetic libraries'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Generate libraries and run the benchmarks')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                            help='Library sizes in files (default: 1000 10000 100000)')
+    run_parser.add_argument('--seed', type=int, default=42, help='Library seed (default: 42)')
+    run_parser.add_argument('--repeat', type=int, default=1,
+                            help='Runs per benchmark; the best time is kept (default: 1)')
+    run_parser.add_argument('--workdir', type=Path,
+                            help='Directory for generated libraries (reused between runs)')
+    run_parser.add_argument('--output', type=Path,
+                            help='Results file (default: <reports>/benchmarks/benchmark_<timestamp>.json)')
+    run_parser.add_argument('--baseline', type=Path, help='Compare against this results file')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help='Relative slowdown that counts as a regression (default: 0.25)')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two results files')
+    compare_parser.add_argument('current', type=Path, help='Results to check')
+    compare_parser.add_argument('baseline', type=Path, help='Baseline results')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help='Relative slowdown that counts as a regression (default: 0.25)')
+    return parser
+
+
+def _compare(current: dict, baseline_path: Path, threshold: float) -> int:
+    """Print a comparison and return 1 if anything regressed."""
+    baseline = load_results(baseline_path)
+    regressions = compare_results(current, baseline, threshold)
+    print(f"\n📊 Comparison with {baseline_path}")
+    print(format_comparison(current, baseline, regressions))
+    return 1 if regressions else 0
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the benchmark CLI."""
+    parsed_args = create_parser().parse_args(args)
+
+    if parsed_args.command == 'compare':
+        return _compare(load_results(parsed_args.current), parsed_args.baseline, parsed_args.threshold)
+
+    document = run_benchmarks(parsed_args.sizes, parsed_args.workdir, parsed_args.seed, parsed_args.repeat)
+    output = parsed_args.output or (Path(config.reports_directory) / 'benchmarks' /
+                                    f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    print(f"\n📄 Results saved: {save_results(document, output)}")
+
+    if parsed_args.baseline:
+        return _compare(document, parsed_args.baseline, parsed_args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
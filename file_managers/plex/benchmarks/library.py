@@ -0,0 +1,297 @@
+"""Reproducible synthetic media libraries for benchmarks.
+
+A library is generated from a seed and a file count and mirrors the layout of
+the real shares:
+
+- ``movies_a`` / ``movies_b``: one ``Title (Year)`` folder per movie with a
+  release-style filename; a fraction of movies get a second copy (different
+  quality/source/group) on the other movie share
+- ``tv_a`` / ``tv_b`` / ``tv_c``: ``Show/Season NN/Show.SxxEyy...`` trees for
+  thousands of shows at large sizes; a fraction of episodes get a second
+  release in the same season folder, and a fraction are left loose in a TV
+  root (some for shows that exist, some for shows that do not)
+
+Every file is a sparse file with a realistic apparent size, so a 100k-file
+library takes almost no disk space on filesystems that support sparse files.
+The same seed and size always produce the same paths and sizes; a
+``manifest.json`` in the library root lets later runs reuse it.
+"""
+
+import json
+import os
+import random
+import shutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from ..utils.filename_parser import parse_filename
+
+MANIFEST_NAME = 'manifest.json'
+
+# Library generator version (bump when the layout changes so old libraries are rebuilt)
+LAYOUT_VERSION = 1
+
+MOVIE_SHARE = 0.3          # Fraction of files that are movies
+MOVIE_DUPLICATE_RATE = 0.05
+EPISODE_DUPLICATE_RATE = 0.03
+LOOSE_EPISODE_RATE = 0.05
+LOOSE_NEW_SHOW_RATE = 0.2  # Fraction of loose episodes whose show has no folder
+
+MOVIE_SIZE_RANGE = (700 * 1024**2, 8 * 1024**3)
+EPISODE_SIZE_RANGE = (150 * 1024**2, 3 * 1024**3)
+
+MOVIE_DIRS = ('movies_a', 'movies_b')
+TV_DIRS = ('tv_a', 'tv_b', 'tv_c')
+
+_ADJECTIVES = [
+    'Silent', 'Crimson', 'Hidden', 'Broken', 'Golden', 'Frozen', 'Distant', 'Electric',
+    'Midnight', 'Savage', 'Hollow', 'Restless', 'Wild', 'Burning', 'Iron', 'Velvet',
+    'Lonely', 'Northern', 'Scarlet', 'Quiet', 'Endless', 'Copper', 'Shattered', 'Pale',
+    'Bitter', 'Lucky', 'Rogue', 'Secret', 'Fallen', 'Steel', 'Emerald', 'Twisted',
+    'Amber', 'Brave', 'Cobalt', 'Hungry', 'Ivory', 'Jagged', 'Marble', 'Neon',
+]
+_NOUNS = [
+    'Harbor', 'Empire', 'Signal', 'Garden', 'Kingdom', 'Witness', 'Frontier', 'Circuit',
+    'Orchard', 'Verdict', 'Lantern', 'Compass', 'Horizon', 'Fortress', 'Canyon', 'Voyage',
+    'Parish', 'Protocol', 'Reckoning', 'Covenant', 'Meridian', 'Outpost', 'Station', 'Legacy',
+    'Asylum', 'Dynasty', 'Republic', 'Archive', 'Cartel', 'Precinct', 'Hospital', 'Academy',
+    'Ranch', 'Harvest', 'Shelter', 'Tribunal', 'Mission', 'Sentinel', 'Paradox', 'Gambit',
+]
+_PLACES = [
+    'Avalon', 'Brooklyn', 'Dallas', 'Denver', 'Glasgow', 'Havana', 'Kyoto', 'Lisbon',
+    'Memphis', 'Oslo', 'Phoenix', 'Quebec', 'Seattle', 'Tucson', 'Vienna', 'Yukon',
+]
+_QUALITIES = ['720p', '1080p', '2160p']
+_SOURCES = ['WEB-DL', 'BluRay', 'WEBRip', 'HDTV']
+_CODECS = ['x264', 'x265', 'H.264', 'HEVC']
+_GROUPS = ['NTb', 'FLUX', 'SPARKS', 'GalaxyTV', 'KOGi', 'CAKES', 'SiGMA', 'TEPES']
+_EXTENSIONS = ['.mkv', '.mkv', '.mkv', '.mp4', '.avi']
+
+
+@dataclass
+class LibraryManifest:
+    """Description of a generated library."""
+    root: str
+    seed: int
+    size: int
+    movie_directories: List[str]
+    tv_directories: List[str]
+    movie_files: int = 0
+    duplicate_movies: int = 0
+    episode_files: int = 0
+    duplicate_episodes: int = 0
+    loose_episodes: int = 0
+    shows: int = 0
+    show_names: List[str] = field(default_factory=list)
+    layout_version: int = LAYOUT_VERSION
+
+    @property
+    def total_files(self) -> int:
+        """Get the number of files in the library."""
+        return self.movie_files + self.episode_files
+
+
+def _title_pool(rng: random.Random) -> List[str]:
+    """Get every distinct generated title in a seed-dependent order."""
+    titles = [f"{adjective} {noun}" for adjective in _ADJECTIVES for noun in _NOUNS]
+    for place in _PLACES:
+        titles += [f"The {adjective} {noun} of {place}" for adjective in _ADJECTIVES for noun in _NOUNS]
+        titles += [f"{place} {adjective} {noun}" for adjective in _ADJECTIVES for noun in _NOUNS]
+    rng.shuffle(titles)
+    return titles
+
+
+def _release_tags(rng: random.Random, exclude: Optional[Tuple[str, str, str]] = None) -> Tuple[str, str, str]:
+    """Pick quality, source and group (different from ``exclude``)."""
+    while True:
+        tags = (rng.choice(_QUALITIES), rng.choice(_SOURCES), rng.choice(_GROUPS))
+        if tags != exclude:
+            return tags
+
+
+def _dotted(title: str) -> str:
+    return title.replace(' ', '.')
+
+
+def _touch_sparse(path: Path, size: int) -> None:
+    """Create a file with an apparent size but no allocated data."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.truncate(size)
+
+
+def _unique_titles(rng: random.Random, pool: List[str], count: int,
+                   taken: Set[str]) -> List[str]:
+    """Take titles from the pool whose normalized forms are all distinct."""
+    titles = []
+    while len(titles) < count and pool:
+        title = pool.pop()
+        key = parse_filename(f"{_dotted(title)}.mkv").normalized_title
+        if key in taken:
+            continue
+        taken.add(key)
+        titles.append(title)
+    if len(titles) < count:
+        raise ValueError(f"Title pool exhausted after {len(titles)} of {count} titles")
+    return titles
+
+
+def generate_library(root: Path, size: int, seed: int = 42, reuse: bool = True) -> LibraryManifest:
+    """
+    Generate (or reuse) a synthetic library of about ``size`` files.
+
+    Args:
+        root: Directory to create the library in (emptied unless reused)
+        size: Approximate number of files (the exact count is in the manifest)
+        seed: Random seed; the same seed and size give the same library
+        reuse: Keep an existing library generated with the same seed and size
+
+    Returns:
+        LibraryManifest of the library
+    """
+    root = Path(root)
+    manifest_path = root / MANIFEST_NAME
+    if reuse and manifest_path.exists():
+        existing = load_manifest(root)
+        if (existing.seed, existing.size, existing.layout_version) == (seed, size, LAYOUT_VERSION):
+            return existing
+    if root.exists():
+        shutil.rmtree(root)
+
+    rng = random.Random(f"{seed}:{size}")
+    pool = _title_pool(rng)
+    taken: Set[str] = set()
+    manifest = LibraryManifest(
+        root=str(root), seed=seed, size=size,
+        movie_directories=[str(root / name) for name in MOVIE_DIRS],
+        tv_directories=[str(root / name) for name in TV_DIRS]
+    )
+
+    _generate_movies(rng, pool, taken, manifest, round(size * MOVIE_SHARE))
+    _generate_tv(rng, pool, taken, manifest, size - manifest.movie_files)
+
+    for directory in manifest.movie_directories + manifest.tv_directories:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(asdict(manifest), f, indent=2)
+    return manifest
+
+
+def _generate_movies(rng: random.Random, pool: List[str], taken: Set[str],
+                     manifest: LibraryManifest, target: int) -> None:
+    """Create movie folders, with some titles copied onto the other share."""
+    duplicates = round(target * MOVIE_DUPLICATE_RATE)
+    titles = _unique_titles(rng, pool, target - duplicates, taken)
+    duplicated = set(rng.sample(range(len(titles)), min(duplicates, len(titles))))
+
+    for index, title in enumerate(titles):
+        year = rng.randint(1960, 2024)
+        share = rng.randrange(len(MOVIE_DIRS))
+        tags = _release_tags(rng)
+        copies = [(share, tags)]
+        if index in duplicated:
+            copies.append((1 - share, _release_tags(rng, exclude=tags)))
+
+        for copy_share, (quality, source, group) in copies:
+            name = f"{_dotted(title)}.{year}.{quality}.{source}.{rng.choice(_CODECS)}-{group}{rng.choice(_EXTENSIONS)}"
+            folder = Path(manifest.movie_directories[copy_share]) / f"{title} ({year})"
+            _touch_sparse(folder / name, rng.randint(*MOVIE_SIZE_RANGE))
+            manifest.movie_files += 1
+        manifest.duplicate_movies += index in duplicated
+
+
+def _episode_name(show: str, season: int, episode: int, tags: Tuple[str, str, str],
+                  rng: random.Random) -> str:
+    quality, source, group = tags
+    return f"{_dotted(show)}.S{season:02d}E{episode:02d}.{quality}.{source}.{rng.choice(_CODECS)}-{group}.mkv"
+
+
+def _generate_tv(rng: random.Random, pool: List[str], taken: Set[str],
+                 manifest: LibraryManifest, target: int) -> None:
+    """Create show/season trees, duplicate releases and loose episodes."""
+    loose_target = round(target * LOOSE_EPISODE_RATE)
+    organized_target = target - loose_target
+    shows: List[Tuple[str, int, List[Tuple[int, int]]]] = []
+
+    # Plan shows until the organized episode quota is met
+    planned = 0
+    while planned < organized_target:
+        show = _unique_titles(rng, pool, 1, taken)[0]
+        episodes = [(season, episode)
+                    for season in range(1, rng.randint(1, 6) + 1)
+                    for episode in range(1, rng.randint(6, 13) + 1)]
+        episodes = episodes[:organized_target - planned]
+        shows.append((show, rng.randrange(len(TV_DIRS)), episodes))
+        planned += len(episodes)
+
+    duplicate_budget = round(organized_target * EPISODE_DUPLICATE_RATE)
+    for show, share, episodes in shows:
+        show_dir = Path(manifest.tv_directories[share]) / show
+        for season, episode in episodes:
+            tags = _release_tags(rng)
+            season_dir = show_dir / f"Season {season:02d}"
+            _touch_sparse(season_dir / _episode_name(show, season, episode, tags, rng),
+                          rng.randint(*EPISODE_SIZE_RANGE))
+            manifest.episode_files += 1
+            if duplicate_budget and manifest.episode_files + 1 < target and \
+                    rng.random() < EPISODE_DUPLICATE_RATE * 1.5:
+                second = _release_tags(rng, exclude=tags)
+                _touch_sparse(season_dir / _episode_name(show, season, episode, second, rng),
+                              rng.randint(*EPISODE_SIZE_RANGE))
+                manifest.episode_files += 1
+                manifest.duplicate_episodes += 1
+                duplicate_budget -= 1
+    manifest.shows = len(shows)
+    manifest.show_names = [show for show, _, _ in shows]
+
+    # Loose episodes in TV roots: later seasons of existing shows, or new shows
+    new_shows = _unique_titles(rng, pool, max(1, loose_target // 10), taken) if loose_target else []
+    loose_ids: Set[Tuple[str, int, int]] = set()
+    while manifest.episode_files < target:
+        if shows and rng.random() >= LOOSE_NEW_SHOW_RATE:
+            show, _, episodes = rng.choice(shows)
+            season = episodes[-1][0] + 1
+        else:
+            show = rng.choice(new_shows)
+            season = 1
+        episode = rng.randint(1, 24)
+        if (show, season, episode) in loose_ids:
+            continue
+        loose_ids.add((show, season, episode))
+        tv_root = Path(manifest.tv_directories[rng.randrange(len(TV_DIRS))])
+        _touch_sparse(tv_root / _episode_name(show, season, episode, _release_tags(rng), rng),
+                      rng.randint(*EPISODE_SIZE_RANGE))
+        manifest.episode_files += 1
+        manifest.loose_episodes += 1
+
+
+def load_manifest(root: Path) -> LibraryManifest:
+    """
+    Load the manifest of a generated library.
+
+    Args:
+        root: Library root
+
+    Returns:
+        LibraryManifest
+    """
+    with open(Path(root) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        return LibraryManifest(**json.load(f))
+
+
+def allocated_bytes(root: Path) -> int:
+    """
+    Get the disk space actually used by a library's files.
+
+    Args:
+        root: Library root
+
+    Returns:
+        Allocated bytes (near zero for sparse files)
+    """
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            total += os.stat(os.path.join(dirpath, name)).st_blocks * 512
+    return total
@@ -0,0 +1,262 @@
+"""Benchmark suite run against synthetic libraries.
+
+For each library size the suite times:
+
+- ``find_duplicate_movies`` over the movie shares
+- ``MediaDatabase.rebuild_database`` into a scratch JSON database
+- ``MediaDatabase.search_tv_shows`` for a fixed set of show-name queries
+- ``DuplicateDetector`` scanning plus ``detect_duplicates`` on the TV shares
+- ``PathResolver`` scanning plus ``resolve_episode_paths`` for the loose
+  episodes (with unlimited free space, so results do not depend on the host)
+
+Results are written as JSON.  ``compare_results`` flags benchmarks that got
+slower than a stored baseline by more than a relative threshold.
+"""
+
+import json
+import logging
+import os
+import platform
+import random
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from ..tv_organizer.core.duplicate_detector import DuplicateDetector
+from ..tv_organizer.core.path_resolver import PathResolver
+from ..utils.media_database import MediaDatabase
+from ..utils.movie_scanner import find_duplicate_movies
+from ..utils.space_ledger import SpaceLedger
+from .library import LibraryManifest, generate_library
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+SEARCH_QUERIES = 200
+
+# Relative slowdown that counts as a regression, and an absolute floor (seconds)
+# below which differences are treated as noise
+DEFAULT_THRESHOLD = 0.25
+NOISE_FLOOR_SECONDS = 0.05
+
+_DiskUsage = namedtuple('_DiskUsage', 'total used free')
+
+
+class Regression(NamedTuple):
+    """A benchmark that got slower than its baseline."""
+    size: str
+    benchmark: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds if self.baseline_seconds else float('inf')
+
+
+def _unlimited_disk_usage(path: Union[str, Path]) -> _DiskUsage:
+    """Report plenty of free space on every volume."""
+    return _DiskUsage(2**50, 0, 2**50)
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Run ``func`` ``repeat`` times and return the best time and last result."""
+    best = float('inf')
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _search_queries(manifest: LibraryManifest) -> List[str]:
+    """Build a fixed set of full and partial show-name queries."""
+    rng = random.Random(manifest.seed)
+    names = rng.sample(manifest.show_names, min(SEARCH_QUERIES, len(manifest.show_names)))
+    return [name if index % 2 else ' '.join(name.split()[:2]).lower() for index, name in enumerate(names)]
+
+
+def run_size(manifest: LibraryManifest, workdir: Path, repeat: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every benchmark against one library.
+
+    Args:
+        manifest: Generated library
+        workdir: Scratch directory for the benchmark database
+        repeat: Runs per benchmark (the best time is kept)
+
+    Returns:
+        Benchmark name -> {'seconds': best time, 'items': result count}
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def record(name: str, seconds: float, items: int) -> None:
+        results[name] = {'seconds': round(seconds, 4), 'items': items}
+        print(f"   ⏱️  {name:<32} {seconds:>9.3f}s  ({items:,} results)")
+
+    seconds, groups = _timed(lambda: find_duplicate_movies(manifest.movie_directories), repeat)
+    record('find_duplicate_movies', seconds, len(groups))
+
+    database = MediaDatabase(db_path=str(Path(workdir) / f"benchmark_{manifest.size}.json"), backend='json')
+    seconds, stats = _timed(lambda: database.rebuild_database(
+        force=True, movie_directories=manifest.movie_directories,
+        tv_directories=manifest.tv_directories), repeat)
+    record('rebuild_database', seconds, stats.movies_count + stats.tv_episodes_count)
+
+    queries = _search_queries(manifest)
+    seconds, hits = _timed(lambda: sum(len(database.search_tv_shows(query)) for query in queries), repeat)
+    record('search_tv_shows', seconds, hits)
+
+    detector = DuplicateDetector(tv_directories=manifest.tv_directories)
+    seconds, episodes = _timed(detector.scan_all_directories, repeat)
+    record('tv_duplicates_scan', seconds, len(episodes))
+    seconds, groups = _timed(detector.detect_duplicates, repeat)
+    record('tv_detect_duplicates', seconds, len(groups))
+
+    resolver = PathResolver(tv_directories=manifest.tv_directories,
+                            space_ledger=SpaceLedger(disk_usage=_unlimited_disk_usage))
+    seconds, episodes = _timed(resolver.scan_tv_directories, repeat)
+    record('path_resolver_scan', seconds, len(episodes))
+    seconds, resolutions = _timed(resolver.resolve_episode_paths, repeat)
+    record('resolve_episode_paths', seconds, len(resolutions))
+    return results
+
+
+def run_benchmarks(sizes: List[int], workdir: Optional[Path] = None, seed: int = 42,
+                   repeat: int = 1) -> Dict[str, Any]:
+    """
+    Generate (or reuse) libraries and benchmark each size.
+
+    Args:
+        sizes: Library sizes in files
+        workdir: Directory for the libraries (default: a temp directory);
+            libraries with the same seed and size are reused between runs
+        seed: Library seed
+        repeat: Runs per benchmark (the best time is kept)
+
+    Returns:
+        Results document (``meta`` plus ``results`` keyed by size)
+    """
+    workdir = Path(workdir) if workdir else Path(tempfile.gettempdir()) / 'plex_benchmarks'
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    # Benchmarked components log every file at INFO
+    previous_level = logging.root.level
+    logging.root.setLevel(logging.WARNING)
+    try:
+        results: Dict[str, Any] = {}
+        for size in sizes:
+            print(f"\n📚 Library: {size:,} files (seed {seed})")
+            start = time.perf_counter()
+            manifest = generate_library(workdir / f"library_{size}_{seed}", size, seed)
+            print(f"   🏗️  Ready in {time.perf_counter() - start:.1f}s: {manifest.movie_files:,} movies, "
+                  f"{manifest.episode_files:,} episodes in {manifest.shows:,} shows")
+            results[str(size)] = run_size(manifest, workdir, repeat)
+    finally:
+        logging.root.setLevel(previous_level)
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'seed': seed,
+            'repeat': repeat,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+
+def save_results(document: Dict[str, Any], path: Path) -> Path:
+    """
+    Write a results document as JSON.
+
+    Args:
+        document: Results from ``run_benchmarks``
+        path: Output file
+
+    Returns:
+        Output path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Load a results document."""
+    with open(path, 'r', encoding='utf-8') as f:
+        document: Dict[str, Any] = json.load(f)
+    return document
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD,
+                    noise_floor: float = NOISE_FLOOR_SECONDS) -> List[Regression]:
+    """
+    Find benchmarks that got slower than the baseline.
+
+    Only sizes and benchmarks present in both documents are compared.
+
+    Args:
+        current: Results of this run
+        baseline: Stored baseline results
+        threshold: Relative slowdown that counts as a regression (0.25 = 25%)
+        noise_floor: Ignore slowdowns smaller than this many seconds
+
+    Returns:
+        Regressions, worst first
+    """
+    regressions = []
+    for size, benchmarks in current.get('results', {}).items():
+        baseline_benchmarks = baseline.get('results', {}).get(size, {})
+        for name, result in benchmarks.items():
+            if name not in baseline_benchmarks:
+                continue
+            before = baseline_benchmarks[name]['seconds']
+            after = result['seconds']
+            if after > before * (1 + threshold) and after - before > noise_floor:
+                regressions.append(Regression(size, name, before, after))
+    regressions.sort(key=lambda regression: regression.ratio, reverse=True)
+    return regressions
+
+
+def format_comparison(current: Dict[str, Any], baseline: Dict[str, Any],
+                      regressions: List[Regression]) -> str:
+    """
+    Format a side-by-side comparison table.
+
+    Args:
+        current: Results of this run
+        baseline: Stored baseline results
+        regressions: Output of ``compare_results``
+
+    Returns:
+        Report text
+    """
+    flagged = {(regression.size, regression.benchmark) for regression in regressions}
+    lines = [f"{'Size':>8}  {'Benchmark':<28} {'Baseline s':>11} {'Current s':>10} {'Change':>8}",
+             '-' * 72]
+    for size, benchmarks in current.get('results', {}).items():
+        for name, result in benchmarks.items():
+            before = baseline.get('results', {}).get(size, {}).get(name, {}).get('seconds')
+            if before is None:
+                lines.append(f"{int(size):>8,}  {name:<28} {'-':>11} {result['seconds']:>10.3f} {'new':>8}")
+                continue
+            change = (result['seconds'] - before) / before * 100 if before else 0.0
+            marker = '  ❌' if (size, name) in flagged else ''
+            lines.append(f"{int(size):>8,}  {name:<28} {before:>11.3f} {result['seconds']:>10.3f} "
+                         f"{change:>+7.1f}%{marker}")
+    lines.append('')
+    if regressions:
+        lines.append(f"❌ {len(regressions)} regression(s)")
+    else:
+        lines.append("✅ No regressions")
+    return '\n'.join(lines)
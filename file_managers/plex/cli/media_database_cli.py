@@ -5,11 +5,13 @@ import sys
 from pathlib import Path
 
 try:
-    from ..utils.media_database import MediaDatabase
+    from ..utils.media_database import MediaDatabase, default_database_path
+    from ..utils.media_store import migrate_json_to_sqlite
 except ImportError:
     # Allow running as script
     sys.path.append(str(Path(__file__).parent.parent.parent))
-    from plex.utils.media_database import MediaDatabase
+    from plex.utils.media_database import MediaDatabase, default_database_path
+    from plex.utils.media_store import migrate_json_to_sqlite
 
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
@@ -27,9 +29,11 @@ def main():
         epilog="""
 Examples:
   %(prog)s --rebuild        # Rebuild the entire database
+  %(prog)s --refresh        # Incremental refresh (changed directories only)
   %(prog)s --status         # Show database status
   %(prog)s --clean          # Remove database file
   %(prog)s --stats          # Show detailed statistics
+  %(prog)s --migrate-sqlite # Copy the JSON database into the SQLite backend
         """
     )
     
@@ -39,6 +43,12 @@ Examples:
         help='Rebuild the entire media database'
     )
     
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Incrementally refresh the database, rescanning only changed directories'
+    )
+    
     parser.add_argument(
         '--status',
         action='store_true',
@@ -57,6 +67,12 @@ Examples:
         help='Remove the database file'
     )
     
+    parser.add_argument(
+        '--migrate-sqlite',
+        action='store_true',
+        help='Migrate the JSON database into a SQLite database (--path sets the SQLite file)'
+    )
+    
     parser.add_argument(
         '--path',
         help='Custom path for database file'
@@ -64,10 +80,31 @@ Examples:
     
     args = parser.parse_args()
     
-    if not any([args.rebuild, args.status, args.stats, args.clean]):
+    if not any([args.rebuild, args.refresh, args.status, args.stats, args.clean,
+                args.migrate_sqlite]):
         parser.print_help()
         return
     
+    if args.migrate_sqlite:
+        json_path = default_database_path('json')
+        sqlite_path = Path(args.path) if args.path else default_database_path('sqlite')
+        print(f"🔄 Migrating {json_path} to {sqlite_path}...")
+        
+        try:
+            counts = migrate_json_to_sqlite(json_path, sqlite_path)
+        except Exception as e:
+            print(f"❌ Failed to migrate database: {e}")
+            sys.exit(1)
+        
+        print("✅ Database migrated successfully!")
+        print(f"   Movies: {counts['movies']:,}")
+        print(f"   TV Shows: {counts['tv_shows']:,}")
+        print(f"   TV Episodes: {counts['tv_episodes']:,}")
+        print(f"   Directories: {counts['directories']:,}")
+        print()
+        print("   Set settings.media_database.backend to \"sqlite\" in media_config.yaml to use it.")
+        return
+    
     # Initialize database
     database = MediaDatabase(args.path)
     
@@ -106,6 +143,27 @@ Examples:
             print(f"❌ Failed to rebuild database: {e}")
             sys.exit(1)
     
+    elif args.refresh:
+        print("🔄 Refreshing media database (changed directories only)...")
+        print()
+        
+        try:
+            delta = database.refresh_database()
+            
+            print("✅ Database refreshed successfully!")
+            print()
+            print("📊 REFRESH DELTA:")
+            print(f"   Movies: +{delta.movies_added} / -{delta.movies_removed} / ~{delta.movies_modified}")
+            print(f"   Episodes: +{delta.episodes_added} / -{delta.episodes_removed} / ~{delta.episodes_modified}")
+            print(f"   Directories Listed: {delta.directories_listed:,}")
+            print(f"   Directories Skipped: {delta.directories_skipped:,}")
+            print(f"   Refresh Time: {delta.refresh_time_seconds:.1f} seconds")
+            print(f"   Database File: {database.db_path}")
+                
+        except Exception as e:
+            print(f"❌ Failed to refresh database: {e}")
+            sys.exit(1)
+    
     elif args.status or args.stats:
         if not database.db_path.exists():
             print("❌ Database file does not exist. Run --rebuild to create it.")
@@ -1,9 +1,110 @@
-"""Centralized configuration management for Plex media tools."""
+"""Centralized configuration management for Plex media tools.
+
+Most properties read the raw YAML dict on access.  Values used from per-file
+loops are compiled once into an immutable ``ConfigSnapshot`` (frozen sets,
+tuples and read-only maps) when the file is loaded; ``config.snapshot``
+returns it and ``config.reload()`` swaps in a fresh one.
+"""
 
 import os
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, FrozenSet, Mapping, NamedTuple, Optional, Tuple
+
+# libyaml's loader is ~10x faster than the pure-Python one (same safe subset)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+DEFAULT_VIDEO_EXTENSIONS = [
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.m4v', '.mpg', '.mpeg', '.webm', '.ts'
+]
+
+# Config section of each media type (keys as used by MediaType values)
+MEDIA_TYPE_SECTIONS = {
+    'MOVIE': 'movies',
+    'TV': 'tv',
+    'DOCUMENTARY': 'documentaries',
+    'STANDUP': 'standups',
+}
+
+
+class ConfigSnapshot(NamedTuple):
+    """Immutable, precomputed view of the values read in hot paths."""
+    video_extensions: FrozenSet[str]
+    directories_by_media_type: Mapping[str, Tuple[str, ...]]   # Config order
+    directories_by_priority: Mapping[str, Tuple[str, ...]]     # Lowest priority number first
+    share_mounts: Tuple[Tuple[str, str], ...]                  # (mount path, share name), longest first
+    
+    def directories_for(self, media_type: str) -> Tuple[str, ...]:
+        """
+        Get the directories of a media type.
+        
+        Args:
+            media_type: MediaType value (``MOVIE``, ``TV``, ...; any case)
+            
+        Returns:
+            Directory paths in config order (empty for unknown types)
+        """
+        directories = self.directories_by_media_type.get(media_type)
+        if directories is None:
+            directories = self.directories_by_media_type.get(media_type.upper(), ())
+        return directories
+    
+    def is_video_file(self, path: str) -> bool:
+        """Check a path's extension against the configured video extensions."""
+        return os.path.splitext(path)[1].lower() in self.video_extensions
+    
+    def share_for_path(self, path: str) -> Optional[str]:
+        """
+        Get the configured NAS share containing a path.
+        
+        Args:
+            path: Directory or file path
+            
+        Returns:
+            Share name, or None if no share's mount path contains it
+        """
+        normalized = os.path.normpath(path)
+        for mount_path, name in self.share_mounts:
+            if normalized == mount_path or normalized.startswith(mount_path + os.sep):
+                return name
+        return None
+
+
+def compile_snapshot(raw: Dict[str, Any]) -> ConfigSnapshot:
+    """
+    Compile the loaded YAML into a ConfigSnapshot.
+    
+    Args:
+        raw: Parsed configuration file
+        
+    Returns:
+        ConfigSnapshot
+    """
+    raw = raw or {}
+    extensions = raw.get('settings', {}).get('video_extensions', DEFAULT_VIDEO_EXTENSIONS)
+    
+    by_type = {}
+    by_priority = {}
+    for media_type, section in MEDIA_TYPE_SECTIONS.items():
+        entries = raw.get(section, {}).get('directories', []) or []
+        by_type[media_type] = tuple(entry['path'] for entry in entries)
+        by_priority[media_type] = tuple(entry['path'] for entry in
+                                        sorted(entries, key=lambda entry: entry.get('priority', 999)))
+    
+    mounts = []
+    for share in raw.get('nas', {}).get('shares', []) or []:
+        mount_path = os.path.normpath(share.get('mount_path', ''))
+        if mount_path and mount_path != '.':
+            mounts.append((mount_path, share.get('name', mount_path)))
+    mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+    
+    return ConfigSnapshot(
+        video_extensions=frozenset(ext.lower() for ext in extensions),
+        directories_by_media_type=MappingProxyType(by_type),
+        directories_by_priority=MappingProxyType(by_priority),
+        share_mounts=tuple(mounts)
+    )
 
 
 class MediaConfig:
@@ -11,6 +112,8 @@ class MediaConfig:
     
     _instance = None
     _config = None
+    _snapshot: Optional[ConfigSnapshot] = None
+    _config_stamp: Optional[Tuple[int, int]] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -21,24 +124,63 @@ class MediaConfig:
         if self._config is None:
             self._load_config()
     
+    @property
+    def config_file(self) -> Path:
+        """Get the path of the YAML configuration file."""
+        return Path(__file__).parent / "media_config.yaml"
+    
     def _load_config(self) -> None:
-        """Load configuration from YAML file."""
-        config_dir = Path(__file__).parent
-        config_file = config_dir / "media_config.yaml"
+        """Load configuration from YAML file and compile its snapshot."""
+        config_file = self.config_file
         
         try:
+            stat = config_file.stat()
             with open(config_file, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+                raw = yaml.load(f, Loader=_YAML_LOADER)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing configuration file: {e}")
+        
+        snapshot = compile_snapshot(raw)
+        self._config = raw
+        self._snapshot = snapshot
+        self._config_stamp = (stat.st_mtime_ns, stat.st_size)
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        Re-read the configuration file if it changed.
+        
+        Values copied at import time (e.g. ``tv_scanner.VIDEO_EXTENSIONS``)
+        keep their old contents; code that must follow reloads reads
+        ``config.snapshot`` when it runs.
+        
+        Args:
+            force: Reload even if the file's mtime and size are unchanged
+            
+        Returns:
+            True if the configuration was reloaded
+        """
+        if not force:
+            try:
+                stat = self.config_file.stat()
+            except OSError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) == self._config_stamp:
+                return False
+        self._load_config()
+        return True
     
     @property
     def config(self) -> Dict[str, Any]:
         """Get the full configuration dictionary."""
         return self._config
     
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the precomputed, immutable view of the current configuration."""
+        return self._snapshot
+    
     # NAS Configuration
     @property
     def nas_server_ip(self) -> str:
@@ -118,14 +260,12 @@ class MediaConfig:
     @property
     def video_extensions(self) -> List[str]:
         """Get list of supported video file extensions."""
-        return self._config.get('settings', {}).get('video_extensions', [
-            '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.m4v', '.mpg', '.mpeg', '.webm', '.ts'
-        ])
+        return self._config.get('settings', {}).get('video_extensions', DEFAULT_VIDEO_EXTENSIONS)
     
     @property
-    def video_extensions_set(self) -> set:
+    def video_extensions_set(self) -> FrozenSet[str]:
         """Get set of supported video file extensions for fast lookup."""
-        return set(self.video_extensions)
+        return self._snapshot.video_extensions
     
     @property
     def small_folder_threshold_mb(self) -> int:
@@ -137,6 +277,39 @@ class MediaConfig:
         """Get small folder threshold in bytes."""
         return self.small_folder_threshold_mb * 1024 * 1024
     
+    @property
+    def scan_workers_per_share(self) -> int:
+        """Get number of directory walker threads per NAS share."""
+        return self._config.get('settings', {}).get('scan_workers_per_share', 4)
+    
+    @property
+    def media_database_backend(self) -> str:
+        """Get media database storage backend ('json' or 'sqlite')."""
+        return self._config.get('settings', {}).get('media_database', {}).get('backend', 'json')
+    
+    @property
+    def move_workers_per_volume(self) -> int:
+        """Get number of concurrent cross-share copies per destination volume."""
+        return self._config.get('settings', {}).get('moves', {}).get('workers_per_volume', 2)
+    
+    @property
+    def placement_safety_margin_bytes(self) -> int:
+        """Get bytes that must stay free on a volume after planned moves."""
+        gb = self._config.get('settings', {}).get('moves', {}).get('safety_margin_gb', 1)
+        return int(gb * 1024 * 1024 * 1024)
+    
+    @property
+    def content_hash_sample_bytes(self) -> int:
+        """Get bytes read from each of the start, middle and end of a file for fingerprints."""
+        mib = self._config.get('settings', {}).get('content_hash', {}).get('sample_mib', 4)
+        return int(mib * 1024 * 1024)
+    
+    @property
+    def content_hash_buffer_bytes(self) -> int:
+        """Get read buffer size in bytes used for full-content hashing."""
+        mib = self._config.get('settings', {}).get('content_hash', {}).get('read_buffer_mib', 8)
+        return int(mib * 1024 * 1024)
+    
     # Report Settings
     @property
     def reports_directory(self) -> str:
@@ -210,11 +383,117 @@ class MediaConfig:
         """Get Bedrock temperature."""
         return self._config.get('bedrock', {}).get('temperature', 0.1)
     
+    @property
+    def bedrock_batch_size(self) -> int:
+        """Get maximum number of files per batch classification request."""
+        return self._config.get('bedrock', {}).get('batch', {}).get('max_batch_size', 25)
+    
+    @property
+    def bedrock_batch_token_budget(self) -> int:
+        """Get estimated response token budget for one batch classification request."""
+        budget = self._config.get('bedrock', {}).get('batch', {}).get('response_token_budget')
+        return budget or self.bedrock_max_tokens * 2
+    
+    @property
+    def bedrock_batch_workers(self) -> int:
+        """Get number of concurrent batch classification requests."""
+        return self._config.get('bedrock', {}).get('batch', {}).get('workers', 4)
+    
+    @property
+    def bedrock_requests_per_second(self) -> float:
+        """Get initial Bedrock request rate for batch classification."""
+        return self._config.get('bedrock', {}).get('batch', {}).get('requests_per_second', 2.0)
+    
+    @property
+    def bedrock_min_requests_per_second(self) -> float:
+        """Get lowest Bedrock request rate after throttling."""
+        return self._config.get('bedrock', {}).get('batch', {}).get('min_requests_per_second', 0.2)
+    
+    @property
+    def bedrock_max_requests_per_second(self) -> float:
+        """Get highest Bedrock request rate reached without throttling."""
+        return self._config.get('bedrock', {}).get('batch', {}).get('max_requests_per_second', 8.0)
+    
     @property
     def bedrock_classification_prompt(self) -> str:
         """Get Bedrock classification prompt template."""
         return self._config.get('bedrock', {}).get('classification_prompt', '')
     
+    # OMDB Rating Fetch Configuration
+    @property
+    def omdb_requests_per_second(self) -> float:
+        """Get the OMDB request rate allowed by the API plan."""
+        return self._config.get('external_apis', {}).get('omdb', {}).get('requests_per_second', 10.0)
+    
+    @property
+    def omdb_workers(self) -> int:
+        """Get number of concurrent OMDB requests in bulk rating fetches."""
+        return self._config.get('external_apis', {}).get('omdb', {}).get('workers', 8)
+    
+    @property
+    def omdb_not_found_retry_days(self) -> float:
+        """Get days before a title OMDB did not find is looked up again."""
+        return self._config.get('external_apis', {}).get('omdb', {}).get('not_found_retry_days', 30)
+    
+    @property
+    def omdb_error_retry_minutes(self) -> float:
+        """Get minutes before a title whose lookup failed is retried."""
+        return self._config.get('external_apis', {}).get('omdb', {}).get('error_retry_minutes', 60)
+    
+    # Metadata Enrichment Configuration
+    @property
+    def tmdb_requests_per_second(self) -> float:
+        """Get the TMDB request rate used by metadata enrichment."""
+        return self._config.get('external_apis', {}).get('tmdb', {}).get('requests_per_second', 4.0)
+    
+    @property
+    def tvdb_requests_per_second(self) -> float:
+        """Get the TVDB request rate used by metadata enrichment."""
+        return self._config.get('external_apis', {}).get('tvdb', {}).get('requests_per_second', 1.0)
+    
+    @property
+    def metadata_enrichment_workers(self) -> int:
+        """Get number of titles enriched concurrently."""
+        return self._config.get('external_apis', {}).get('tmdb', {}).get('workers', 8)
+    
+    # Reorganization Analysis Configuration
+    @property
+    def reorganization_ai_batch_size(self) -> int:
+        """Get number of unique titles per AI classification request."""
+        return self._config.get('settings', {}).get('reorganization', {}).get('ai_batch_size', 25)
+    
+    @property
+    def reorganization_ai_workers(self) -> int:
+        """Get number of concurrent AI classification requests."""
+        return self._config.get('settings', {}).get('reorganization', {}).get('ai_workers', 4)
+    
+    @property
+    def event_stream_enabled(self) -> bool:
+        """Check whether runs write structured JSONL telemetry events."""
+        return self._config.get('settings', {}).get('telemetry', {}).get('events_enabled', True)
+    
+    # External API Response Cache Configuration
+    @property
+    def api_response_cache_enabled(self) -> bool:
+        """Check whether TMDB/TVDB responses are cached on disk."""
+        return self._config.get('external_apis', {}).get('response_cache', {}).get('enabled', True)
+    
+    @property
+    def api_search_cache_ttl_hours(self) -> float:
+        """Get hours a cached title search stays fresh."""
+        return self._config.get('external_apis', {}).get('response_cache', {}).get('search_ttl_hours', 168)
+    
+    @property
+    def api_details_cache_ttl_hours(self) -> float:
+        """Get hours cached show details (seasons, status) stay fresh."""
+        return self._config.get('external_apis', {}).get('response_cache', {}).get('details_ttl_hours', 24)
+    
+    # Classification Keyword Rules
+    @property
+    def classification_rules(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get keyword rule tables (table -> category -> keywords, in priority order)."""
+        return self._config.get('classification_rules', {}) or {}
+    
     # Utility Methods
     def get_reports_path(self) -> Path:
         """Get the full path to the reports directory."""
@@ -230,18 +509,14 @@ class MediaConfig:
     def get_directory_by_priority(self, media_type: str) -> Optional[str]:
         """Get the highest priority directory for a media type."""
         if media_type == 'movies':
-            directories = self.movie_directories_full
+            directories = self._snapshot.directories_by_priority['MOVIE']
         elif media_type == 'tv':
-            directories = self.tv_directories_full
+            directories = self._snapshot.directories_by_priority['TV']
         else:
             return None
         
-        if not directories:
-            return None
-        
-        # Sort by priority (lower number = higher priority)
-        sorted_dirs = sorted(directories, key=lambda x: x.get('priority', 999))
-        return sorted_dirs[0]['path']
+        # Lower priority number = higher priority
+        return directories[0] if directories else None
     
     def validate_directories(self, media_type: str) -> List[str]:
         """Validate and return existing directories for a media type."""
@@ -263,18 +538,9 @@ class MediaConfig:
         
         return valid_dirs
     
-    def get_directories_by_media_type(self, media_type: str) -> List[str]:
-        """Get directories for a specific media type."""
-        if media_type.upper() == 'MOVIE':
-            return self.movie_directories
-        elif media_type.upper() == 'TV':
-            return self.tv_directories
-        elif media_type.upper() == 'DOCUMENTARY':
-            return self.documentary_directories
-        elif media_type.upper() == 'STANDUP':
-            return self.standup_directories
-        else:
-            return []
+    def get_directories_by_media_type(self, media_type: str) -> Tuple[str, ...]:
+        """Get directories for a specific media type (empty for unknown types)."""
+        return self._snapshot.directories_for(media_type)
 
 
 # Global config instance
@@ -289,7 +555,7 @@ def get_tv_directories() -> List[str]:
     """Get TV directories for backward compatibility."""
     return config.tv_directories
 
-def get_video_extensions() -> set:
+def get_video_extensions() -> FrozenSet[str]:
     """Get video extensions set for backward compatibility."""
     return config.video_extensions_set
 
@@ -7,7 +7,7 @@ unavailable.
 Key Features:
 - AWS Bedrock integration for AI classification
 - Batch processing for efficiency
-- Intelligent throttling and retry logic
+- Intelligent throttling and retry logic (optionally via a shared adaptive rate limiter)
 - Rule-based fallback classification
 - Support for multiple AI models (Anthropic, Llama, etc.)
 """
@@ -17,12 +17,12 @@ import os
 import random
 import time
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from ..config.config import config
+from ..utils.rate_limiter import AdaptiveRateLimiter
 from .models import ClassificationResult, MediaType
 
 
@@ -45,15 +45,25 @@ load_env_file()
 class BedrockClassifier:
     """AI-powered media classification using AWS Bedrock."""
     
-    def __init__(self):
-        """Initialize the Bedrock classifier."""
+    def __init__(self, client=None):
+        """
+        Initialize the Bedrock classifier.
+        
+        Args:
+            client: Optional pre-built bedrock-runtime client (or a compatible
+                fake exposing ``invoke_model``); skips client creation and the
+                model access test
+        """
         self.region = config.bedrock_region
         self.model_id = config.bedrock_model_id
-        self.client = None
-        self._initialize_client()
+        self.client = client
+        if client is None:
+            self._initialize_client()
     
     def _initialize_client(self) -> None:
         """Initialize the Bedrock client."""
+        import boto3  # Deferred so commands that never call Bedrock skip the AWS SDK import
+        
         try:
             self.client = boto3.client('bedrock-runtime', region_name=self.region)
             # Test the client by making a simple API call
@@ -111,13 +121,16 @@ class BedrockClassifier:
         except Exception as e:
             raise RuntimeError(f"Model access test failed: {e} (Model: {self.model_id}, Region: {self.region})")
     
-    def classify_batch(self, filenames: List[str], max_retries: int = 3) -> List[ClassificationResult]:
+    def classify_batch(self, filenames: List[str], max_retries: int = 3,
+                       rate_limiter: Optional[AdaptiveRateLimiter] = None) -> List[ClassificationResult]:
         """
         Classify multiple files in a single batch request for efficiency.
         
         Args:
             filenames: List of filenames to classify
             max_retries: Maximum number of retry attempts
+            rate_limiter: Optional shared limiter; each attempt waits for a token
+                and throttling slows the limiter instead of sleeping here
             
         Returns:
             List of ClassificationResult objects
@@ -128,6 +141,8 @@ class BedrockClassifier:
         batch_prompt = self._create_batch_prompt(filenames)
         
         for attempt in range(max_retries + 1):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
             try:
                 # Prepare the request body based on model type
                 if "anthropic" in self.model_id:
@@ -165,12 +180,23 @@ class BedrockClassifier:
                 else:  # Llama or other models
                     response_text = response_body['generation'].strip()
                 
+                if rate_limiter is not None:
+                    rate_limiter.on_success()
+                
                 # Parse batch results
                 return self._parse_batch_response(response_text, filenames)
                 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
-                if error_code == 'ThrottlingException' and attempt < max_retries:
+                if error_code == 'ThrottlingException' and rate_limiter is not None:
+                    rate_limiter.on_throttle()
+                    if attempt < max_retries:
+                        print(f"⏳ Throttling detected, slowing to {rate_limiter.rate:.2f} requests/s "
+                              f"(attempt {attempt + 1}/{max_retries + 1})")
+                        continue
+                    print(f"⚠️ Batch classification failed: {e}")
+                    return [self._fallback_classification(filename) for filename in filenames]
+                elif error_code == 'ThrottlingException' and attempt < max_retries:
                     # Exponential backoff with jitter
                     delay = (2 ** attempt) + random.uniform(0, 1)
                     print(f"⏳ Throttling detected, retrying in {delay:.1f} seconds (attempt {attempt + 1}/{max_retries + 1})")
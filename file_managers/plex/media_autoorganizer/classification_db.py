@@ -5,14 +5,18 @@ for caching media file classifications to avoid repeated AI/rule-based analysis.
 
 Key Features:
 - SQLite database for persistent classification storage
-- Efficient lookups by filename
-- Batch operations for performance
+- One long-lived connection in WAL mode
+- Bulk lookups resolved in a single query via a temporary table join
+- In-memory read-through cache for the lifetime of the instance
+- Batched writes committed once per batch
 - Statistics and management functions
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 class ClassificationDatabase:
@@ -27,11 +31,21 @@ class ClassificationDatabase:
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Read-through cache: filename -> row (None for known misses)
+        self._cache: Dict[str, Optional[Tuple[str, str, float]]] = {}
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+        
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_database()
     
     def _init_database(self) -> None:
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS classifications (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,6 +66,40 @@ class ClassificationDatabase:
             
             conn.commit()
     
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _commit(self) -> None:
+        """Commit unless a write batch is open (lock held)."""
+        if self._batch_depth == 0:
+            self._conn.commit()
+    
+    @contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """
+        Group writes into a single transaction committed on exit.
+        
+        Batches may be nested; only the outermost one commits. An exception
+        rolls the batch back.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.rollback()
+                    self._cache.clear()
+            raise
+        else:
+            with self._lock:
+                self._batch_depth -= 1
+                self._commit()
+    
     def get_classification(self, filename: str) -> Optional[Tuple[str, str, float]]:
         """
         Get cached classification for a filename.
@@ -62,15 +110,62 @@ class ClassificationDatabase:
         Returns:
             Tuple of (media_type, classification_source, confidence) or None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
+        with self._lock:
+            if filename in self._cache:
+                return self._cache[filename]
+            
+            cursor = self._conn.execute("""
                 SELECT media_type, classification_source, confidence 
                 FROM classifications 
                 WHERE filename = ?
             """, (filename,))
             
             row = cursor.fetchone()
-            return row if row else None
+            self._cache[filename] = row
+            return row
+    
+    def get_classifications_bulk(self, filenames: Iterable[str]) -> Dict[str, Tuple[str, str, float]]:
+        """
+        Get cached classifications for many filenames in one query.
+        
+        Filenames not already in the in-memory cache are loaded into a
+        temporary table and joined against the classifications table.
+        
+        Args:
+            filenames: Names of the files to look up
+            
+        Returns:
+            Dictionary of filename -> (media_type, classification_source, confidence)
+            for the filenames that have a classification
+        """
+        with self._lock:
+            wanted = set(filenames)
+            missing = [name for name in wanted if name not in self._cache]
+            
+            if missing:
+                conn = self._conn
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_filenames (filename TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM lookup_filenames")
+                conn.executemany("INSERT INTO lookup_filenames (filename) VALUES (?)",
+                                 ((name,) for name in missing))
+                rows = conn.execute("""
+                    SELECT c.filename, c.media_type, c.classification_source, c.confidence
+                    FROM classifications c
+                    JOIN lookup_filenames l ON l.filename = c.filename
+                """).fetchall()
+                conn.execute("DELETE FROM lookup_filenames")
+                self._commit()
+                
+                for name in missing:
+                    self._cache[name] = None
+                for filename, media_type, source, confidence in rows:
+                    self._cache[filename] = (media_type, source, confidence)
+            
+            return {
+                name: self._cache[name]
+                for name in wanted
+                if self._cache[name] is not None
+            }
     
     def store_classification(self, filename: str, media_type: str, 
                            classification_source: str, confidence: float = 0.0) -> None:
@@ -83,14 +178,7 @@ class ClassificationDatabase:
             classification_source: Source of classification (AI, Rule-based, etc.)
             confidence: Confidence score (0.0 to 1.0)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO classifications 
-                (filename, media_type, classification_source, confidence, updated_at)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (filename, media_type, classification_source, confidence))
-            
-            conn.commit()
+        self.store_batch_classifications([(filename, media_type, classification_source, confidence)])
     
     def store_batch_classifications(self, classifications: List[Tuple[str, str, str, float]]) -> None:
         """
@@ -99,14 +187,16 @@ class ClassificationDatabase:
         Args:
             classifications: List of (filename, media_type, classification_source, confidence) tuples
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executemany("""
+        with self._lock:
+            self._conn.executemany("""
                 INSERT OR REPLACE INTO classifications 
                 (filename, media_type, classification_source, confidence, updated_at)
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
             """, classifications)
+            self._commit()
             
-            conn.commit()
+            for filename, media_type, source, confidence in classifications:
+                self._cache[filename] = (media_type, source, confidence)
     
     def get_stats(self) -> Dict[str, int]:
         """
@@ -115,7 +205,8 @@ class ClassificationDatabase:
         Returns:
             Dictionary with database statistics including total count and breakdowns by type/source
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             # Total classifications
             total = conn.execute("SELECT COUNT(*) FROM classifications").fetchone()[0]
             
@@ -141,6 +232,7 @@ class ClassificationDatabase:
     
     def clear_database(self) -> None:
         """Clear all classifications from database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM classifications")
-            conn.commit()
\ No newline at end of file
+        with self._lock:
+            self._conn.execute("DELETE FROM classifications")
+            self._commit()
+            self._cache.clear()
\ No newline at end of file
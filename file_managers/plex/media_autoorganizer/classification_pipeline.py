@@ -0,0 +1,148 @@
+"""Concurrent AI Classification Pipeline
+
+This module provides the ClassificationPipeline class that classifies many
+filenames with concurrent batch requests instead of one batch at a time with
+fixed sleeps in between.
+
+Key Features:
+- Batches packed to the response token budget (and a maximum batch size)
+- Bounded worker pool sharing one adaptive (AIMD) token-bucket rate limiter
+- Results stored in the ClassificationDatabase as each batch completes
+- Works with any classifier exposing ``classify_batch`` (injectable for tests)
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, NamedTuple, Optional
+
+from ..config.config import config
+from ..utils.rate_limiter import AdaptiveRateLimiter
+from .classification_db import ClassificationDatabase
+from .models import ClassificationResult
+
+# Longest media type label, used to estimate each file's response entry
+_RESPONSE_ENTRY_TEMPLATE = '  {{"filename": "{filename}", "type": "DOCUMENTARY"}},\n'
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the token count of a text.
+
+    Release filenames are dense with dots, digits and tags, so this uses a
+    conservative three characters per token.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated number of tokens
+    """
+    return len(text) // 3 + 1
+
+
+def plan_batches(filenames: List[str], max_batch_size: int,
+                 token_budget: int) -> List[List[int]]:
+    """
+    Split filenames into batches sized to the response token budget.
+
+    The model echoes every filename back in its JSON answer, so each file's
+    share of the response is estimated and files are packed until the next
+    one would exceed the budget or the batch reaches ``max_batch_size``.
+
+    Args:
+        filenames: Filenames to classify
+        max_batch_size: Maximum number of files per batch
+        token_budget: Estimated response tokens available per batch
+
+    Returns:
+        Batches of indices into ``filenames`` (every batch holds at least one file)
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for index, filename in enumerate(filenames):
+        cost = estimate_tokens(_RESPONSE_ENTRY_TEMPLATE.format(filename=filename))
+        if current and (len(current) >= max_batch_size or used + cost > token_budget):
+            batches.append(current)
+            current, used = [], 0
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+class ClassifiedBatch(NamedTuple):
+    """Results of one completed batch request."""
+    indices: List[int]                      # Positions in the input filename list
+    filenames: List[str]
+    results: List[ClassificationResult]
+
+
+class ClassificationPipeline:
+    """Classifies filenames with concurrent, rate-limited batch requests."""
+
+    def __init__(self, classifier, database: Optional[ClassificationDatabase] = None,
+                 workers: Optional[int] = None, max_batch_size: Optional[int] = None,
+                 token_budget: Optional[int] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 source: str = "AI-Batch"):
+        """
+        Initialize the pipeline.
+
+        Args:
+            classifier: Object exposing ``classify_batch(filenames, rate_limiter=...)``
+            database: Optional database receiving each batch's results as it completes
+            workers: Concurrent requests (default from config)
+            max_batch_size: Maximum files per batch (default from config)
+            token_budget: Response token budget per batch (default from config)
+            rate_limiter: Shared limiter (default built from config)
+            source: Classification source stored with the results
+        """
+        self.classifier = classifier
+        self.database = database
+        self.workers = max(1, workers or config.bedrock_batch_workers)
+        self.max_batch_size = max(1, max_batch_size or config.bedrock_batch_size)
+        self.token_budget = token_budget or config.bedrock_batch_token_budget
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            rate=config.bedrock_requests_per_second,
+            min_rate=config.bedrock_min_requests_per_second,
+            max_rate=config.bedrock_max_requests_per_second,
+            capacity=self.workers
+        )
+        self.source = source
+
+    def run(self, filenames: List[str]) -> Iterator[ClassifiedBatch]:
+        """
+        Classify filenames, yielding each batch as soon as it completes.
+
+        Args:
+            filenames: Filenames to classify
+
+        Yields:
+            ClassifiedBatch in completion order
+        """
+        batches = plan_batches(filenames, self.max_batch_size, self.token_budget)
+        if not batches:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as executor:
+            futures = {
+                executor.submit(self._classify, [filenames[i] for i in indices]): indices
+                for indices in batches
+            }
+            for future in as_completed(futures):
+                indices = futures[future]
+                batch_filenames = [filenames[i] for i in indices]
+                results = future.result()
+
+                if self.database is not None:
+                    self.database.store_batch_classifications([
+                        (filename, result.media_type.value, self.source, result.confidence)
+                        for filename, result in zip(batch_filenames, results)
+                    ])
+
+                yield ClassifiedBatch(indices, batch_filenames, results)
+
+    def _classify(self, batch_filenames: List[str]) -> List[ClassificationResult]:
+        """Classify one batch through the shared rate limiter."""
+        return self.classifier.classify_batch(batch_filenames, rate_limiter=self.rate_limiter)
@@ -118,52 +118,52 @@ WORKFLOW:
         return
     
     try:
-        organizer = AutoOrganizer(dry_run=not args.execute, use_ai=not args.no_ai)
+        with AutoOrganizer(dry_run=not args.execute, use_ai=not args.no_ai) as organizer:
         
-        # Handle database operations
-        if args.db_stats:
-            show_database_stats(organizer)
-            return
-        
-        if args.clear_db:
-            clear_database(organizer)
-            return
-        
-        # Handle mount verification only
-        if args.verify_mounts:
-            if organizer.verify_mount_access():
-                print("✅ All mount points are accessible")
-            else:
-                print("❌ Some mount points are not accessible")
-            return
-        
-        # Verify mount access before proceeding with organization
-        if not organizer.verify_mount_access():
-            print("\n🚫 Organization cancelled due to mount access issues")
-            print("💡 Use --verify-mounts to check mount status")
-            return
-        
-        # Show execution warning for non-dry-run mode
-        if args.execute:
-            print("\n⚠️  WARNING: Files will be moved to Plex directories!")
-            print("⚠️  Make sure you have backups before proceeding!")
-            confirm = input("\nType 'ORGANIZE' to proceed: ").strip()
-            if confirm != "ORGANIZE":
-                print("🚫 Organization cancelled")
+            # Handle database operations
+            if args.db_stats:
+                show_database_stats(organizer)
+                return
+            
+            if args.clear_db:
+                clear_database(organizer)
                 return
-        
-        # Run the full organization workflow
-        report_path = organizer.run_full_organization()
-        
-        if report_path:
-            print(f"\n📄 Detailed report saved to: {report_path}")
             
-            if not args.quiet:
-                print("\n💡 TIP: Review the report for detailed information about each file move")
-                if args.execute:
-                    print("💡 TIP: If any moves failed, check mount access and available space")
+            # Handle mount verification only
+            if args.verify_mounts:
+                if organizer.verify_mount_access():
+                    print("✅ All mount points are accessible")
                 else:
-                    print("💡 TIP: Run with --execute to actually move the files")
+                    print("❌ Some mount points are not accessible")
+                return
+            
+            # Verify mount access before proceeding with organization
+            if not organizer.verify_mount_access():
+                print("\n🚫 Organization cancelled due to mount access issues")
+                print("💡 Use --verify-mounts to check mount status")
+                return
+            
+            # Show execution warning for non-dry-run mode
+            if args.execute:
+                print("\n⚠️  WARNING: Files will be moved to Plex directories!")
+                print("⚠️  Make sure you have backups before proceeding!")
+                confirm = input("\nType 'ORGANIZE' to proceed: ").strip()
+                if confirm != "ORGANIZE":
+                    print("🚫 Organization cancelled")
+                    return
+            
+            # Run the full organization workflow
+            report_path = organizer.run_full_organization()
+            
+            if report_path:
+                print(f"\n📄 Detailed report saved to: {report_path}")
+                
+                if not args.quiet:
+                    print("\n💡 TIP: Review the report for detailed information about each file move")
+                    if args.execute:
+                        print("💡 TIP: If any moves failed, check mount access and available space")
+                    else:
+                        print("💡 TIP: Run with --execute to actually move the files")
         
     except KeyboardInterrupt:
         print("\n👋 Organization cancelled by user")
@@ -16,33 +16,72 @@ import re
 from pathlib import Path
 from typing import Dict, Optional, Set, Tuple
 
+from ..config.config import config
+from ..utils.filename_parser import normalize_show_name, parse_filename
+from ..utils.media_store import SQLiteMediaStore
+from ..utils.search_index import NgramIndex
+from ..utils.show_matcher import ShowNameMatcher
 from .models import MediaType
 
+# Release year in parentheses trailing a show name, e.g. "Show (2023)"
+_SHOW_YEAR_RE = re.compile(r'\s*\(\d{4}\)$')
+
+# [Group] Show Name - 01 (1080p) [Season 2].mkv (anime style, season defaults to 1).
+# Only used here: on library-wide scans it would read "[YTS] Movie - 2021" as an
+# episode, so the number is at most three digits and must be followed by release
+# tags, another " - " or the end of the name.
+_ANIME_EPISODE_RE = re.compile(
+    r'^\[[^\]]+\]\s*(.+?)\s+-\s+(\d{1,3})(?:v\d+)?(?=\s*(?:[\[(]|-\s|$))'
+    r'(?:.*?\[Season\s*(\d+)\])?',
+    re.IGNORECASE
+)
+
 
 class MediaDatabase:
     """Interface to the prebuilt media database for show location detection."""
     
     def __init__(self):
         """Initialize the media database interface."""
-        self.database_path = Path(__file__).parent.parent.parent.parent / "database" / "media_database.json"
+        database_dir = Path(__file__).parent.parent.parent.parent / "database"
+        self.use_sqlite = config.media_database_backend == 'sqlite'
+        self.database_path = database_dir / ("media_database.db" if self.use_sqlite else "media_database.json")
         self.media_data = None
         self.tv_shows = {}
+        self.show_index = NgramIndex()
+        self.show_matcher: Optional[ShowNameMatcher] = None
         self.failed_directories: Set[str] = set()  # Track directories with access issues
         self._load_database()
     
     def _load_database(self) -> None:
-        """Load the media database JSON file."""
+        """Load TV show summaries from the media database."""
         try:
-            if self.database_path.exists():
+            if self.use_sqlite and self.database_path.exists():
+                # Show rows only; episodes are never read
+                store = SQLiteMediaStore(self.database_path)
+                try:
+                    self.tv_shows = store.get_show_summaries()
+                finally:
+                    store.close()
+                print(f"📚 Loaded media database with {len(self.tv_shows)} TV shows")
+            elif self.database_path.exists():
                 with open(self.database_path, 'r', encoding='utf-8') as f:
                     self.media_data = json.load(f)
                     self.tv_shows = self.media_data.get('tv_shows', {})
+                    postings = self.media_data.get('search_index', {}).get('tv_terms')
+                    if postings is not None:
+                        self.show_index = NgramIndex(postings)
                 print(f"📚 Loaded media database with {len(self.tv_shows)} TV shows")
             else:
                 print(f"⚠️ Media database not found at {self.database_path}")
         except Exception as e:
             print(f"❌ Error loading media database: {e}")
             self.tv_shows = {}
+        
+        if self.tv_shows and not self.show_index.postings:
+            self.show_index = NgramIndex.build(self.tv_shows)
+        self.show_matcher = ShowNameMatcher(
+            ((name, [name]) for name in self.tv_shows), index=self.show_index
+        )
     
     def find_tv_show_location(self, show_name: str) -> Optional[str]:
         """
@@ -64,9 +103,10 @@ class MediaDatabase:
         if normalized_input in self.tv_shows:
             return self._get_best_directory(self.tv_shows[normalized_input])
         
-        # Try fuzzy matching
-        for normalized_name, show_data in self.tv_shows.items():
-            if self._shows_match(normalized_input, normalized_name):
+        # Try fuzzy matching, only against shows sharing index terms (most similar first)
+        for normalized_name, _ in self.show_matcher.match(normalized_input, threshold=0.0):
+            show_data = self.tv_shows.get(normalized_name)
+            if show_data and self._shows_match(normalized_input, normalized_name):
                 return self._get_best_directory(show_data)
         
         return None
@@ -158,8 +198,10 @@ class MediaDatabase:
         """
         Extract show name, season, and episode from filename.
         
-        This method uses various regex patterns to extract TV show information
-        from common filename formats.
+        Uses the shared filename parser, which handles the common
+        S01E01, 1x01 and "Season 1 Episode 1" formats, then falls back to
+        anime-style "[Group] Show - 01" numbering.  Underscores count as
+        separators and a trailing "(2023)" year is dropped from the show name.
         
         Args:
             filename: Name of the file to analyze
@@ -167,33 +209,14 @@ class MediaDatabase:
         Returns:
             Tuple of (show_name, season, episode) or (None, None, None)
         """
-        # Common TV show patterns
-        patterns = [
-            # Show.Name.S01E01.Title.mkv
-            r'(.+?)\.S(\d+)E(\d+)',
-            # Show Name - S01E01 - Title.mkv  
-            r'(.+?)\s*-\s*S(\d+)E(\d+)',
-            # Show.Name.1x01.Title.mkv
-            r'(.+?)\.(\d+)x(\d+)',
-            # Show Name (2023) S01E01.mkv
-            r'(.+?)\s*(?:\(\d{4}\))?\s*S(\d+)E(\d+)',
-            # [Group] Show Name - 01 [Season 1].mkv (anime style)
-            r'(?:\[.+?\])?\s*(.+?)\s*-\s*(\d+)\s*(?:\[Season\s*(\d+)\])?',
-        ]
-        
-        filename_clean = filename.replace('_', ' ')
-        
-        for pattern in patterns:
-            match = re.search(pattern, filename_clean, re.IGNORECASE)
-            if match:
-                show_name = match.group(1).replace('.', ' ').strip()
-                season = int(match.group(2)) if match.group(2) else 1
-                episode = int(match.group(3)) if match.group(3) else None
-                
-                # Clean up show name
-                show_name = re.sub(r'\s+', ' ', show_name)  # Normalize spaces
-                show_name = show_name.strip()
-                
-                return show_name, season, episode
-        
-        return None, None, None
\ No newline at end of file
+        parsed = parse_filename(filename.replace('_', ' '))
+        if parsed.is_episode:
+            show_name = _SHOW_YEAR_RE.sub('', parsed.show_name)
+            return show_name, parsed.season, parsed.episode
+        
+        match = _ANIME_EPISODE_RE.match(Path(filename.replace('_', ' ')).stem)
+        if match:
+            show_name = _SHOW_YEAR_RE.sub('', normalize_show_name(match.group(1)))
+            return show_name, int(match.group(3) or 1), int(match.group(2))
+        
+        return None, None, None
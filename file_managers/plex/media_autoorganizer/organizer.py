@@ -15,17 +15,20 @@ Key Features:
 
 import csv
 import os
-import random
 import re
-import shutil
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from ..config.config import config
+from ..utils.dir_sizes import DirectorySizeCache
+from ..utils.keyword_rules import load_rule_set
+from ..utils.move_engine import MoveEngine
+from ..utils.placement_planner import PlacementItem, plan_placements
+from ..utils.space_ledger import SpaceLedger
 from .ai_classifier import BedrockClassifier
 from .classification_db import ClassificationDatabase
+from .classification_pipeline import ClassificationPipeline
 from .media_database import MediaDatabase
 from .models import MediaFile, MediaType, MoveResult
 
@@ -33,19 +36,23 @@ from .models import MediaFile, MediaType, MoveResult
 class AutoOrganizer:
     """Automatic media file organizer with intelligent placement."""
     
-    def __init__(self, dry_run: bool = True, use_ai: bool = True):
+    def __init__(self, dry_run: bool = True, use_ai: bool = True, classifier=None):
         """
         Initialize the AutoOrganizer.
         
         Args:
             dry_run: If True, only simulate moves without actually moving files
             use_ai: If True, use AI classification; otherwise use rule-based only
+            classifier: Optional classifier exposing ``classify_batch`` (replaces
+                the default BedrockClassifier)
         """
         self.dry_run = dry_run
         self.use_ai = use_ai
         
         # Initialize AI classifier if requested
-        if use_ai:
+        if use_ai and classifier is not None:
+            self.classifier = classifier
+        elif use_ai:
             try:
                 self.classifier = BedrockClassifier()
             except RuntimeError as e:
@@ -56,6 +63,9 @@ class AutoOrganizer:
         else:
             print("🔧 Using rule-based classification only (AI disabled)")
             self.classifier = None
+        
+        # Keyword pre-filter rules (categories are MediaType values)
+        self.prefilter_rules = load_rule_set('prefilter')
             
         self.downloads_dir = Path(config.downloads_directory)
         self.cache_file = self.downloads_dir / ".media_classification_cache.csv"
@@ -65,6 +75,27 @@ class AutoOrganizer:
         db_dir = project_root / "database"
         self.classification_db = ClassificationDatabase(db_dir / "media_classifications.db")
         self.media_db = MediaDatabase()
+        
+        # Journaled move executor (cross-share copies run in the background)
+        self.move_engine = MoveEngine()
+        
+        # Free space per volume, net of the moves planned in this run
+        self.space_ledger = SpaceLedger()
+        
+        # Cached folder sizes, kept current by the move engine
+        self.dir_sizes = DirectorySizeCache()
+        self.move_engine.add_listener(self.dir_sizes.on_move)
+    
+    def close(self) -> None:
+        """Detach and close the folder size cache (after the last run)."""
+        self.move_engine.remove_listener(self.dir_sizes.on_move)
+        self.dir_sizes.close()
+    
+    def __enter__(self) -> 'AutoOrganizer':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def verify_mount_access(self) -> bool:
         """
@@ -177,7 +208,7 @@ class AutoOrganizer:
                 # For directories, classify by directory name, not contents
                 try:
                     # Calculate directory size (for reporting)
-                    total_size = sum(f.stat().st_size for f in item_path.rglob('*') if f.is_file())
+                    total_size = self.dir_sizes.size(item_path).size
                     media_file = MediaFile(path=item_path, size=total_size)
                     media_files.append(media_file)
                     print(f"    📁 Found directory: {item_path.name}")
@@ -189,7 +220,7 @@ class AutoOrganizer:
     
     def _is_media_file(self, file_path: Path) -> bool:
         """Check if a file is a media file based on extension."""
-        return file_path.suffix.lower() in config.video_extensions_set
+        return file_path.suffix.lower() in config.snapshot.video_extensions
     
     def classify_files(self, media_files: List[MediaFile]) -> List[MediaFile]:
         """
@@ -214,46 +245,48 @@ class AutoOrganizer:
         
         print(f"🔍 Pre-filtering {len(media_files)} files...")
         
-        for media_file in media_files:
-            filename = media_file.path.name
-            filename_lower = filename.lower()
-            
-            # Check database first (highest priority)
-            db_result = self.classification_db.get_classification(filename)
-            if db_result:
-                media_type_str, classification_source, confidence = db_result
-                try:
-                    media_type = MediaType(media_type_str)
-                    db_cached_files.append((media_file, media_type, f"DB-{classification_source}"))
-                    continue
-                except ValueError:
-                    # Invalid cached media type, re-classify
-                    pass
-            
-            # Check CSV cache second
-            if filename in cache:
-                media_type_str, classification_source = cache[filename]
-                try:
-                    media_type = MediaType(media_type_str)
-                    csv_cached_files.append((media_file, media_type, f"CSV-{classification_source}"))
-                    # Also store in database for future use
-                    self.classification_db.store_classification(filename, media_type_str, classification_source, 0.7)
-                    continue
-                except ValueError:
-                    # Invalid cached media type, re-classify
-                    pass
-            
-            # Very obvious TV patterns - no AI needed
-            if any(pattern in filename_lower for pattern in ['s0', 's1', 's2', 's3', 's4', 's5', 's6', 's7', 's8', 's9', 'season', 'episode']):
-                obvious_files.append((media_file, MediaType.TV, "Rule-based"))
-            # Very obvious documentary patterns
-            elif any(pattern in filename_lower for pattern in ['documentary', 'docu', 'bbc', 'nat geo', 'national geographic']):
-                obvious_files.append((media_file, MediaType.DOCUMENTARY, "Rule-based"))
-            # Very obvious standup patterns
-            elif any(pattern in filename_lower for pattern in ['standup', 'stand-up', 'comedy special', 'chappelle', 'carlin']):
-                obvious_files.append((media_file, MediaType.STANDUP, "Rule-based"))
-            else:
-                ai_needed_files.append(media_file)
+        # Resolve every database hit in one query (and write CSV hits in one batch)
+        db_results = self.classification_db.get_classifications_bulk(
+            media_file.path.name for media_file in media_files
+        )
+        
+        with self.classification_db.batch_writes():
+            for media_file in media_files:
+                filename = media_file.path.name
+                filename_lower = filename.lower()
+                
+                # Check database first (highest priority)
+                db_result = db_results.get(filename)
+                if db_result:
+                    media_type_str, classification_source, confidence = db_result
+                    try:
+                        media_type = MediaType(media_type_str)
+                        db_cached_files.append((media_file, media_type, f"DB-{classification_source}"))
+                        continue
+                    except ValueError:
+                        # Invalid cached media type, re-classify
+                        pass
+                
+                # Check CSV cache second
+                if filename in cache:
+                    media_type_str, classification_source = cache[filename]
+                    try:
+                        media_type = MediaType(media_type_str)
+                        csv_cached_files.append((media_file, media_type, f"CSV-{classification_source}"))
+                        # Also store in database for future use
+                        self.classification_db.store_classification(filename, media_type_str, classification_source, 0.7)
+                        continue
+                    except ValueError:
+                        # Invalid cached media type, re-classify
+                        pass
+                
+                # Very obvious TV/documentary/standup keywords - no AI needed
+                # (one automaton pass; the first category in rule order wins)
+                rule_type = self.prefilter_rules.scan(filename_lower).first()
+                if rule_type:
+                    obvious_files.append((media_file, MediaType(rule_type), "Rule-based"))
+                else:
+                    ai_needed_files.append(media_file)
         
         print(f"🗄️  {len(db_cached_files)} files loaded from database")
         print(f"💾 {len(csv_cached_files)} files loaded from CSV cache")
@@ -293,7 +326,7 @@ class AutoOrganizer:
             
             # Fall back to default directories if no specific location found
             if not target_directory:
-                target_dirs = config.get_directories_by_media_type(media_type.value)
+                target_dirs = config.snapshot.directories_for(media_type.value)
                 target_directory = target_dirs[0] if target_dirs else None
             
             classified_file = media_file._replace(
@@ -332,7 +365,7 @@ class AutoOrganizer:
             
             # Fall back to default directories if no specific location found
             if not target_directory:
-                target_dirs = config.get_directories_by_media_type(media_type.value)
+                target_dirs = config.snapshot.directories_for(media_type.value)
                 target_directory = target_dirs[0] if target_dirs else None
             
             classified_file = media_file._replace(
@@ -369,47 +402,29 @@ class AutoOrganizer:
         if self.use_ai and self.classifier:
             print(f"🤖 Starting batch AI classification for {len(ai_needed_files)} files...")
             
-            # Process files in batches of 10
-            batch_size = 10
-            for batch_start in range(0, len(ai_needed_files), batch_size):
-                batch_end = min(batch_start + batch_size, len(ai_needed_files))
-                batch_files = ai_needed_files[batch_start:batch_end]
-                batch_filenames = [f.path.name for f in batch_files]
-                
-                batch_num = (batch_start // batch_size) + 1
-                total_batches = (len(ai_needed_files) + batch_size - 1) // batch_size
-                
-                print(f"📦 Batch {batch_num}/{total_batches}: Classifying {len(batch_files)} files...")
-                
-                # Classify the batch
-                batch_results = self.classifier.classify_batch(batch_filenames)
+            # Concurrent, rate-limited batches; results are stored as they arrive
+            pipeline = ClassificationPipeline(self.classifier, database=self.classification_db)
+            filenames = [f.path.name for f in ai_needed_files]
+            classified_by_index = {}
+            
+            for batch_num, batch in enumerate(pipeline.run(filenames), 1):
+                print(f"📦 Batch {batch_num}: Classified {len(batch.indices)} files")
                 
-                # Process batch results
-                batch_db_entries = []
-                for media_file, result in zip(batch_files, batch_results):
+                for index, result in zip(batch.indices, batch.results):
+                    media_file = ai_needed_files[index]
                     classified_file = self._create_classified_file(media_file, result, "AI-Batch")
-                    processed_files.append(classified_file)
-                    
-                    # Prepare for database storage
-                    batch_db_entries.append((
-                        media_file.path.name,
-                        result.media_type.value,
-                        "AI-Batch",
-                        result.confidence
-                    ))
+                    classified_by_index[index] = classified_file
                     
                     show_info = f" ({classified_file.show_name})" if classified_file.show_name else ""
                     print(f"    {media_file.path.name} → {result.media_type.value}{show_info} (AI-Batch)")
-                
-                # Store batch results in database
-                if batch_db_entries:
-                    self.classification_db.store_batch_classifications(batch_db_entries)
-                
-                # Delay between batches with jitter
-                if batch_num < total_batches:  # Don't delay after last batch
-                    delay = 2.0 + random.uniform(0, 1)
-                    print(f"⏳ Waiting {delay:.1f}s before next batch...")
-                    time.sleep(delay)
+            
+            # Keep the input order regardless of completion order
+            processed_files.extend(classified_by_index[i] for i in sorted(classified_by_index))
+            
+            limiter = pipeline.rate_limiter
+            if limiter.throttle_count:
+                print(f"⏳ Throttled {limiter.throttle_count} times; "
+                      f"settled at {limiter.rate:.2f} requests/s")
         else:
             # Fallback to rule-based classification for all AI-needed files
             print(f"📋 Using rule-based classification for {len(ai_needed_files)} remaining files...")
@@ -445,7 +460,7 @@ class AutoOrganizer:
         
         # Fall back to default directories if no specific location found
         if not target_directory:
-            target_dirs = config.get_directories_by_media_type(result.media_type.value)
+            target_dirs = config.snapshot.directories_for(result.media_type.value)
             target_directory = target_dirs[0] if target_dirs else None
         
         return media_file._replace(
@@ -469,6 +484,9 @@ class AutoOrganizer:
         """
         results = []
         
+        # Choose shares for the whole batch before moving anything
+        classified_files = self._plan_placements(classified_files)
+        
         # Group files by media type
         files_by_type = {}
         for media_file in classified_files:
@@ -478,6 +496,13 @@ class AutoOrganizer:
         
         print(f"📦 Organizing {len(classified_files)} files...")
         
+        # Finish moves an interrupted run left in the journal
+        if not self.dry_run:
+            resumed = self.move_engine.resume()
+            if resumed:
+                completed = sum(1 for outcome in resumed if outcome.success)
+                print(f"♻️  Resumed {len(resumed)} interrupted moves ({completed} completed)")
+        
         total_processed = 0
         total_files = len(classified_files)
         
@@ -526,8 +551,69 @@ class AutoOrganizer:
                 else:
                     print(f"    ❌ Move failed: {result.error}")
         
+        # Wait for queued cross-share copies and record any that failed
+        if self.move_engine.has_pending():
+            print(f"\n⏳ Waiting for queued cross-share moves to finish...")
+        failed = {outcome.source: outcome for outcome in self.move_engine.wait() if not outcome.success}
+        if failed:
+            for i, result in enumerate(results):
+                outcome = failed.get(str(result.source_path))
+                if outcome and result.success:
+                    print(f"    ❌ Failed to move '{result.source_path.name}': {outcome.error}")
+                    results[i] = result._replace(success=False, target_path=None, space_freed=0,
+                                                 error=f"Failed to move: {outcome.error}")
+        
         return results
     
+    def _plan_placements(self, classified_files: List[MediaFile]) -> List[MediaFile]:
+        """
+        Assign destination shares to the whole batch at once.
+        
+        Files going to an existing show folder keep it; files headed for a
+        default media directory may use any configured directory for their type,
+        with a new show's episodes kept together on one share.
+        
+        Args:
+            classified_files: Classified files with their default target directories
+            
+        Returns:
+            Files with target directories replaced by the planned ones
+        """
+        items = []
+        for media_file in classified_files:
+            if media_file.media_type in (None, MediaType.OTHER, MediaType.AUDIOBOOK):
+                continue
+            if not media_file.target_directory:
+                continue
+            
+            defaults = [d for d in config.snapshot.directories_for(media_file.media_type.value)
+                        if d not in self.media_db.failed_directories]
+            group = None
+            if media_file.target_directory in defaults:
+                candidates = defaults
+                if media_file.media_type == MediaType.TV and media_file.show_name:
+                    group = f"TV:{media_file.show_name.lower()}"
+            else:
+                candidates = [media_file.target_directory]
+            
+            items.append(PlacementItem(str(media_file.path), media_file.size,
+                                       str(media_file.path), candidates, group))
+        
+        if not items:
+            return classified_files
+        
+        plan = plan_placements(items, self.space_ledger, config.placement_safety_margin_bytes)
+        print(f"🧮 Placement plan: {self._format_size(plan.rename_bytes)} by same-volume rename, "
+              f"{self._format_size(plan.copy_bytes)} by cross-share copy")
+        if plan.unplaced:
+            print(f"    ⚠️  {len(plan.unplaced)} items do not fit on any share")
+        
+        return [
+            media_file._replace(target_directory=plan.assignments[str(media_file.path)])
+            if str(media_file.path) in plan.assignments else media_file
+            for media_file in classified_files
+        ]
+    
     def _move_file(self, media_file: MediaFile) -> MoveResult:
         """Move a single file to its target directory with intelligent placement."""
         if not media_file.target_directory:
@@ -551,7 +637,7 @@ class AutoOrganizer:
             return self._create_tv_show_directory(media_file)
         
         # For movies or other media, try all available directories
-        target_dirs = config.get_directories_by_media_type(media_file.media_type.value)
+        target_dirs = config.snapshot.directories_for(media_file.media_type.value)
         
         for target_dir in target_dirs:
             # Skip directories we've already marked as failed for this move attempt
@@ -601,7 +687,7 @@ class AutoOrganizer:
             )
         
         # Check available space
-        if not self._check_space(media_file.size, target_path):
+        if not self._check_space(media_file.size, target_path, media_file.path):
             return MoveResult(
                 success=False,
                 source_path=media_file.path,
@@ -611,49 +697,60 @@ class AutoOrganizer:
         # Determine final target path
         final_target = target_path / media_file.path.name
         
-        # Handle filename conflicts
-        if final_target.exists():
+        # Handle filename conflicts (including targets of queued moves)
+        if self.move_engine.is_target_taken(final_target):
             final_target = self._resolve_filename_conflict(final_target)
         
         # Perform the move
         if self.dry_run:
             item_type = "directory" if media_file.path.is_dir() else "file"
             print(f"    📋 DRY RUN: Would move {item_type} '{media_file.path.name}' from {media_file.path.parent} to {final_target}")
+            # Keep the space claimed so later files are planned against what is left
+            self.space_ledger.reserve(final_target, media_file.size, media_file.path)
             return MoveResult(
                 success=True,
                 source_path=media_file.path,
                 target_path=final_target
             )
         else:
-            try:
-                if media_file.path.is_dir():
-                    # Move entire directory
-                    print(f"    🚚 Moving directory '{media_file.path.name}' from {media_file.path.parent} to {final_target.parent}/...")
-                    shutil.move(str(media_file.path), str(final_target))
-                    print(f"    ✅ Successfully moved directory '{media_file.path.name}' to {final_target}")
-                else:
-                    # Move single file
-                    print(f"    🚚 Moving file '{media_file.path.name}' from {media_file.path.parent} to {final_target.parent}/...")
-                    shutil.move(str(media_file.path), str(final_target))
-                    print(f"    ✅ Successfully moved file '{media_file.path.name}' to {final_target}")
-                
+            item_type = "directory" if media_file.path.is_dir() else "file"
+            print(f"    🚚 Moving {item_type} '{media_file.path.name}' from {media_file.path.parent} to {final_target.parent}/...")
+            reservation = self.space_ledger.reserve(final_target, media_file.size, media_file.path)
+            future = self.move_engine.submit(media_file.path, final_target, media_file.size)
+            future.add_done_callback(
+                lambda f: self._settle_reservation(reservation, f)
+            )
+            
+            if not future.done():
+                # Cross-share copy queued on the destination volume's lane
+                print(f"    📤 Queued cross-share copy of '{media_file.path.name}' to {final_target}")
                 return MoveResult(
                     success=True,
                     source_path=media_file.path,
                     target_path=final_target,
                     space_freed=media_file.size
                 )
-            except Exception as e:
-                print(f"    ❌ Failed to move '{media_file.path.name}': {e}")
+            
+            outcome = future.result()
+            if outcome.success:
+                print(f"    ✅ Successfully moved {item_type} '{media_file.path.name}' to {final_target}")
                 return MoveResult(
-                    success=False,
+                    success=True,
                     source_path=media_file.path,
-                    error=f"Failed to move: {e}"
+                    target_path=final_target,
+                    space_freed=media_file.size
                 )
+            
+            print(f"    ❌ Failed to move '{media_file.path.name}': {outcome.error}")
+            return MoveResult(
+                success=False,
+                source_path=media_file.path,
+                error=f"Failed to move: {outcome.error}"
+            )
     
     def _create_tv_show_directory(self, media_file: MediaFile) -> MoveResult:
         """Create a new TV show directory and move the episode there."""
-        tv_dirs = config.get_directories_by_media_type("TV")
+        tv_dirs = config.snapshot.directories_for("TV")
         
         for tv_base_dir in tv_dirs:
             # Skip directories we've already marked as failed
@@ -713,18 +810,26 @@ class AutoOrganizer:
         sanitized = re.sub(r'\s+', ' ', sanitized)  # Normalize spaces
         return sanitized.strip()
     
-    def _check_space(self, file_size: int, target_path: Path) -> bool:
+    def _check_space(self, file_size: int, target_path: Path,
+                     source_path: Optional[Path] = None) -> bool:
         """Check if there's enough space in the target directory."""
-        try:
-            stat = shutil.disk_usage(target_path)
-            available_space = stat.free
-            
-            # Require at least 1GB buffer beyond file size
-            required_space = file_size + (1024 * 1024 * 1024)  # 1GB buffer
-            
-            return available_space >= required_space
-        except OSError:
-            return False
+        # Renames within one volume need no free space
+        if source_path is not None:
+            volume = self.space_ledger.volume_of(target_path)
+            if volume is not None and volume == self.space_ledger.volume_of(source_path):
+                return True
+        
+        # Require a safety buffer beyond file size (and earlier planned moves)
+        return self.space_ledger.has_room(target_path, file_size,
+                                          buffer=config.placement_safety_margin_bytes)
+    
+    def _settle_reservation(self, reservation, future) -> None:
+        """Release a space reservation once its move future has finished."""
+        # A move that raised wrote nothing we can count on, so give the space back
+        if future.cancelled() or future.exception() is not None:
+            self.space_ledger.release(reservation, False)
+        else:
+            self.space_ledger.release(reservation, future.result().success)
     
     def _resolve_filename_conflict(self, target_path: Path) -> Path:
         """Resolve filename conflicts by adding a number suffix."""
@@ -736,7 +841,7 @@ class AutoOrganizer:
         while True:
             new_name = f"{base_name}_{counter}{extension}"
             new_path = parent / new_name
-            if not new_path.exists():
+            if not self.move_engine.is_target_taken(new_path):
                 return new_path
             counter += 1
     
@@ -31,6 +31,7 @@ from file_managers.plex.tv_organizer.core.path_resolver import PathResolver
 from file_managers.plex.tv_organizer.models.path_resolution import ConfidenceLevel, ResolutionType
 from file_managers.plex.tv_organizer.models.duplicate import DeletionMode, DeletionStatus, DeletionPlan
 from file_managers.plex.config.config import config
+from file_managers.plex.utils.profiler import profile_run
 
 
 class CLIDuplicateDetector(DuplicateDetector):
@@ -38,8 +39,8 @@ class CLIDuplicateDetector(DuplicateDetector):
     CLI-aware duplicate detector that can handle user confirmations.
     """
     
-    def __init__(self, tv_directories=None, force_mode=False):
-        super().__init__(tv_directories)
+    def __init__(self, tv_directories=None, force_mode=False, verify_content=False):
+        super().__init__(tv_directories, verify_content=verify_content)
         self.force_mode = force_mode
     
     def _confirm_deletion(self, operation) -> bool:
@@ -133,6 +134,18 @@ class TVOrganizerCLI:
             help='Custom TV directories to scan (overrides config)'
         )
         
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Print wall time, call counts and bytes per phase when the command exits'
+        )
+        
+        parser.add_argument(
+            '--profile-dump',
+            metavar='FILE',
+            help='With --profile, also write a cProfile (.prof) or collapsed-stack (any other suffix) dump'
+        )
+        
         # Create subcommands
         subparsers = parser.add_subparsers(
             dest='command',
@@ -220,6 +233,13 @@ class TVOrganizerCLI:
             help='Minimum confidence score for deletion (0-100, default: 80)'
         )
         
+        duplicates_parser.add_argument(
+            '--verify-content',
+            action='store_true',
+            help='Verify byte-identical copies with cached content hashes '
+                 '(verified copies are deletable regardless of --confidence)'
+        )
+        
         duplicates_parser.add_argument(
             '--force',
             action='store_true',
@@ -413,11 +433,15 @@ Configuration:
         print("   ✅ False positive filtering enabled")
         print("   ✅ Content analysis enabled")
         print("   ✅ Confidence scoring enabled")
+        verify_content = getattr(args, 'verify_content', False)
+        if verify_content:
+            print("   ✅ Byte-level content verification enabled")
         print()
         
         # Initialize detector
         force_mode = getattr(args, 'force', False)
-        detector = CLIDuplicateDetector(directories, force_mode=force_mode)
+        detector = CLIDuplicateDetector(directories, force_mode=force_mode,
+                                        verify_content=verify_content)
         
         try:
             # Always scan first
@@ -1262,22 +1286,23 @@ Configuration:
         
         # Route to command handlers
         try:
-            if parsed_args.command in ['duplicates', 'dup', 'd']:
-                return self.run_duplicates_command(parsed_args)
-            elif parsed_args.command in ['loose', 'l']:
-                return self.run_future_command('loose')
-            elif parsed_args.command in ['resolve', 'r']:
-                return self.run_resolve_command(parsed_args)
-            elif parsed_args.command in ['config', 'cfg']:
-                return self.run_config_command(parsed_args)
-            elif parsed_args.command in ['status', 'stat']:
-                return self.run_status_command(parsed_args)
-            elif parsed_args.command in ['organize', 'org', 'o']:
-                return self.run_future_command(parsed_args.command)
-            else:
-                print(f"❌ Unknown command: {parsed_args.command}")
-                parser.print_help()
-                return 1
+            with profile_run(parsed_args.profile, parsed_args.profile_dump):
+                if parsed_args.command in ['duplicates', 'dup', 'd']:
+                    return self.run_duplicates_command(parsed_args)
+                elif parsed_args.command in ['loose', 'l']:
+                    return self.run_future_command('loose')
+                elif parsed_args.command in ['resolve', 'r']:
+                    return self.run_resolve_command(parsed_args)
+                elif parsed_args.command in ['config', 'cfg']:
+                    return self.run_config_command(parsed_args)
+                elif parsed_args.command in ['status', 'stat']:
+                    return self.run_status_command(parsed_args)
+                elif parsed_args.command in ['organize', 'org', 'o']:
+                    return self.run_future_command(parsed_args.command)
+                else:
+                    print(f"❌ Unknown command: {parsed_args.command}")
+                    parser.print_help()
+                    return 1
                 
         except KeyboardInterrupt:
             print("\n⚠️  Operation cancelled by user")
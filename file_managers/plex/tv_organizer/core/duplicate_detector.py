@@ -6,6 +6,7 @@ Addresses issues with false positive duplicate detection by implementing:
 2. Version detection (files with _1, _2 suffixes)
 3. Better filename parsing for complex patterns
 4. Confidence scoring for duplicate detection
+5. Optional byte-level verification of candidate groups (content_hasher)
 """
 
 import re
@@ -22,7 +23,11 @@ from ..models.duplicate import (
     DuplicateGroup, DuplicateAction, DeletionOperation, DeletionPlan,
     DeletionMode, DeletionStatus, SafetyCheck
 )
-from ...utils.tv_scanner import extract_tv_info_from_filename, is_video_file
+from ...utils.filename_parser import VERSION_RE, parse_filename
+from ...utils.tv_scanner import VIDEO_EXTENSIONS
+from ...utils.fs_walker import walk_files
+from ...utils.content_hasher import ContentHasher
+from ...utils.keyword_rules import load_rule_set
 from ...config.config import config
 
 
@@ -32,65 +37,29 @@ class DuplicateDetector:
     episode content and filename patterns.
     """
     
-    def __init__(self, tv_directories: Optional[List[str]] = None):
-        """Initialize the enhanced duplicate detector."""
+    def __init__(self, tv_directories: Optional[List[str]] = None,
+                 verify_content: bool = False,
+                 hasher: Optional[ContentHasher] = None):
+        """
+        Initialize the enhanced duplicate detector.
+        
+        Args:
+            tv_directories: TV directories to scan (defaults to config)
+            verify_content: Confirm byte-identical copies with content hashes
+            hasher: Optional ContentHasher to use for verification
+        """
         self.tv_directories = tv_directories or config.tv_directories
         self.logger = logging.getLogger(__name__)
+        self.verify_content = verify_content
+        self.hasher = hasher
         
         # Results storage
         self.episodes: List[Episode] = []
         self.duplicate_groups: List[DuplicateGroup] = []
         
-        # Quality detection patterns
-        self.quality_patterns = {
-            Quality.UHD_8K: [r'8k', r'4320p'],
-            Quality.UHD_4K: [r'4k', r'2160p', r'uhd'],
-            Quality.FHD_1080P: [r'1080p', r'fhd'],
-            Quality.HD_720P: [r'720p', r'hd'],
-            Quality.SD_480P: [r'480p', r'sd']
-        }
-        
-        # Source detection patterns
-        self.source_patterns = {
-            'BluRay': [r'bluray', r'blu-ray', r'bdrip', r'brrip'],
-            'WEB-DL': [r'web-dl', r'webdl'],
-            'WEBRip': [r'webrip', r'web-rip'],
-            'HDTV': [r'hdtv'],
-            'DVDRip': [r'dvdrip', r'dvd-rip'],
-            'CAM': [r'cam', r'camrip'],
-            'TS': [r'\bts\b', r'telesync']
-        }
-        
-        # Patterns for detecting file versions (true duplicates)
-        self.version_patterns = [
-            r'_(\d+)\.(?:mkv|mp4|avi)$',  # filename_1.mkv, filename_2.mkv
-            r'_(\d+)$',                    # filename_1, filename_2
-            r'\((\d+)\)\.(?:mkv|mp4|avi)$', # filename(1).mkv, filename(2).mkv
-            r'\((\d+)\)$',                 # filename(1), filename(2)
-            r'\.(\d+)\.(?:mkv|mp4|avi)$',  # filename.1.mkv, filename.2.mkv
-        ]
-        
-        # Patterns for multi-episode files (should not be duplicates)
-        self.multi_episode_patterns = [
-            r'S\d+E\d+.*S\d+E\d+',        # S01E01-S01E02, S01E01 S01E02
-            r'E\d+-E\d+',                 # E01-E02
-            r'Episodes?\s+\d+-\d+',       # Episodes 1-2
-        ]
-        
-        # Words that indicate different content (not duplicates)
-        self.content_differentiators = {
-            # Geographic/location terms
-            'alaska', 'boston', 'dubai', 'tokyo', 'hong kong', 'iceland', 'venice',
-            'transatlantic', 'panama', 'gotthard', 'cooper river', 'oakland',
-            
-            # Engineering/construction terms  
-            'tunnel', 'bridge', 'airport', 'stadium', 'platform', 'excavator',
-            'dam', 'cable car', 'subway', 'pyramid', 'resort', 'barriers',
-            
-            # Generic differentiators
-            'part 1', 'part 2', 'part i', 'part ii', 'chapter', 'volume',
-            'disc 1', 'disc 2', 'cd1', 'cd2'
-        }
+        # Whole words/phrases that indicate different content (not duplicates),
+        # compiled into one automaton so multiword terms match too
+        self.content_differentiators = load_rule_set('content_differentiators', whole_words=True)
     
     def scan_all_directories(self) -> List[Episode]:
         """
@@ -130,53 +99,49 @@ class DuplicateDetector:
         
         try:
             # Recursively find all video files
-            for file_path in directory_path.rglob('*'):
-                if file_path.is_file() and is_video_file(file_path):
-                    episode = self._create_episode_from_file(file_path)
-                    if episode:
-                        episodes.append(episode)
+            for entry in walk_files([directory], VIDEO_EXTENSIONS):
+                episode = self._create_episode_from_file(Path(entry.path), entry.size)
+                if episode:
+                    episodes.append(episode)
         
         except Exception as e:
             self.logger.error(f"Error scanning directory {directory}: {e}")
         
         return episodes
     
-    def _create_episode_from_file(self, file_path: Path) -> Optional[Episode]:
+    def _create_episode_from_file(self, file_path: Path,
+                                  file_size: Optional[int] = None) -> Optional[Episode]:
         """
         Create an Episode object from a video file.
         
         Args:
             file_path: Path to the video file
+            file_size: File size if already known from the directory walk
             
         Returns:
             Episode object or None if not a valid TV episode
         """
         try:
-            # Extract TV show information
-            tv_info = extract_tv_info_from_filename(file_path.name)
-            if not tv_info:
+            # Extract TV show information, quality and source in one parse
+            parsed = parse_filename(file_path.name)
+            if not parsed.is_episode:
                 return None
             
-            show_name, season, episode_num = tv_info
-            
             # Get file information
-            file_size = file_path.stat().st_size
+            if file_size is None:
+                file_size = file_path.stat().st_size
             file_extension = file_path.suffix.lower()
             
-            # Detect quality and source
-            quality = self._detect_quality(file_path.name)
-            source = self._detect_source(file_path.name)
-            
             # Create episode object
             episode = Episode(
                 file_path=file_path,
                 file_size=file_size,
                 file_extension=file_extension,
-                show_name=show_name,
-                season=season,
-                episode=episode_num,
-                quality=quality,
-                source=source,
+                show_name=parsed.show_name,
+                season=parsed.season,
+                episode=parsed.episode,
+                quality=Quality(parsed.quality),
+                source=parsed.source,
                 status=self._determine_episode_status(file_path)
             )
             
@@ -196,14 +161,7 @@ class DuplicateDetector:
         Returns:
             Detected quality level
         """
-        filename_lower = filename.lower()
-        
-        for quality, patterns in self.quality_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, filename_lower):
-                    return quality
-        
-        return Quality.UNKNOWN
+        return Quality(parse_filename(filename).quality)
     
     def _detect_source(self, filename: str) -> Optional[str]:
         """
@@ -215,14 +173,7 @@ class DuplicateDetector:
         Returns:
             Detected source or None
         """
-        filename_lower = filename.lower()
-        
-        for source, patterns in self.source_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, filename_lower):
-                    return source
-        
-        return None
+        return parse_filename(filename).source
     
     def _determine_episode_status(self, file_path: Path) -> EpisodeStatus:
         """
@@ -255,8 +206,7 @@ class DuplicateDetector:
         content = Path(content).stem
         
         # Remove version indicators
-        for pattern in self.version_patterns:
-            content = re.sub(pattern, '', content)
+        content = VERSION_RE.sub('', content)
         
         # Remove quality indicators
         quality_terms = ['720p', '1080p', '4k', 'hdtv', 'webrip', 'bluray', 'x264', 'x265', 'hevc']
@@ -279,11 +229,7 @@ class DuplicateDetector:
         Returns:
             Version number if detected, None otherwise
         """
-        for pattern in self.version_patterns:
-            match = re.search(pattern, filename.lower())
-            if match:
-                return int(match.group(1))
-        return None
+        return parse_filename(filename).version
     
     def _is_multi_episode_file(self, filename: str) -> bool:
         """
@@ -295,10 +241,7 @@ class DuplicateDetector:
         Returns:
             True if this appears to be a multi-episode file
         """
-        for pattern in self.multi_episode_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                return True
-        return False
+        return parse_filename(filename).is_multi_episode
     
     def _has_content_differences(self, filenames: List[str]) -> bool:
         """
@@ -315,20 +258,21 @@ class DuplicateDetector:
         
         content_signatures = [self._extract_content_signature(f) for f in filenames]
         
-        # Check for content differentiator words
-        for signature in content_signatures:
-            words = set(signature.split())
-            if any(diff in words for diff in self.content_differentiators):
+        # Check for content differentiator words (one scan per signature)
+        differentiators = [
+            set(self.content_differentiators.scan(signature).keywords('differentiator'))
+            for signature in content_signatures
+        ]
+        for signature, signature_diffs in zip(content_signatures, differentiators):
+            if signature_diffs:
                 # If any file has differentiator words, check if others do too
-                other_signatures = [s for s in content_signatures if s != signature]
-                for other in other_signatures:
-                    other_words = set(other.split())
+                for other, other_diffs in zip(content_signatures, differentiators):
+                    if other == signature:
+                        continue
                     # If one has differentiators and another doesn't, they're different
-                    if not any(diff in other_words for diff in self.content_differentiators):
+                    if not other_diffs:
                         return True
                     # If they have different differentiators, they're different
-                    signature_diffs = words & self.content_differentiators
-                    other_diffs = other_words & self.content_differentiators
                     if signature_diffs != other_diffs:
                         return True
         
@@ -389,22 +333,33 @@ class DuplicateDetector:
             # Extract filenames for analysis
             filenames = [ep.filename for ep in episodes]
             
-            # Check for multi-episode files (not duplicates)
+            # Check for multi-episode files and content differences (not duplicates)
             if any(self._is_multi_episode_file(f) for f in filenames):
-                self.logger.debug(f"Skipping multi-episode file group: {episode_id}")
-                false_positives_filtered += 1
-                continue
-            
-            # Check for content differences (not duplicates)
-            if self._has_content_differences(filenames):
-                self.logger.debug(f"Skipping content-different group: {episode_id}")
-                false_positives_filtered += 1
-                continue
+                false_positive = "multi-episode file"
+            elif self._has_content_differences(filenames):
+                false_positive = "content-different"
+            else:
+                false_positive = None
             
             # Check for version files (true duplicates)
             versions = [self._detect_file_version(f) for f in filenames]
             has_versions = any(v is not None for v in versions)
             
+            # Byte-identical copies are duplicates whatever their names say
+            identical_sets = self._find_identical_sets(episodes) if self.verify_content else []
+            if identical_sets:
+                # The other files are removable only if their names pass the checks
+                names_confirm = (false_positive is None and
+                                 self._calculate_confidence_score(episodes, has_versions) >= 0.7)
+                duplicate_group = self._create_verified_group(episodes, identical_sets, names_confirm)
+                self.duplicate_groups.append(duplicate_group)
+                continue
+            
+            if false_positive is not None:
+                self.logger.debug(f"Skipping {false_positive} group: {episode_id}")
+                false_positives_filtered += 1
+                continue
+            
             if has_versions:
                 self.logger.debug(f"Confirmed version duplicates: {episode_id}")
             
@@ -425,6 +380,7 @@ class DuplicateDetector:
             duplicate_group.metadata['confidence_score'] = confidence_score
             duplicate_group.metadata['has_version_files'] = has_versions
             duplicate_group.metadata['analysis_method'] = 'enhanced'
+            duplicate_group.metadata['content_verified'] = self.verify_content
             
             if confidence_score >= 0.7:  # Only include high-confidence duplicates
                 self.duplicate_groups.append(duplicate_group)
@@ -439,6 +395,99 @@ class DuplicateDetector:
         
         return self.duplicate_groups
     
+    def _find_identical_sets(self, episodes: List[Episode]) -> List[List[str]]:
+        """
+        Find byte-identical files among a group of episodes.
+        
+        Args:
+            episodes: Episodes sharing the same show/season/episode
+            
+        Returns:
+            Groups of identical file paths (empty if none are identical)
+        """
+        if self.hasher is None:
+            self.hasher = ContentHasher()
+        return self.hasher.find_identical(str(ep.file_path) for ep in episodes)
+    
+    def _create_verified_group(self, episodes: List[Episode], identical_sets: List[List[str]],
+                               names_confirm: bool = True) -> DuplicateGroup:
+        """
+        Create a duplicate group for episodes with byte-identical copies.
+        
+        Args:
+            episodes: Episodes sharing the same show/season/episode
+            identical_sets: Groups of identical file paths among them
+            names_confirm: Whether the filenames alone pass the duplicate checks;
+                if not, only copies identical to the keeper are recommended for removal
+            
+        Returns:
+            Analyzed DuplicateGroup carrying the verification metadata
+        """
+        first_episode = episodes[0]
+        duplicate_group = DuplicateGroup(
+            show_name=first_episode.show_name,
+            season=first_episode.season,
+            episode=first_episode.episode,
+            episodes=episodes
+        )
+        duplicate_group.analyze_duplicates()
+        
+        all_identical = len(identical_sets) == 1 and len(identical_sets[0]) == len(episodes)
+        duplicate_group.metadata['confidence_score'] = 1.0
+        duplicate_group.metadata['has_version_files'] = any(
+            self._detect_file_version(ep.filename) is not None for ep in episodes
+        )
+        duplicate_group.metadata['analysis_method'] = 'content_hash'
+        duplicate_group.metadata['content_verified'] = True
+        duplicate_group.metadata['content_identical'] = all_identical
+        duplicate_group.metadata['identical_sets'] = identical_sets
+        duplicate_group.metadata['names_confirm_duplicates'] = names_confirm
+        
+        copies = sum(len(paths) for paths in identical_sets)
+        duplicate_group.analysis_notes.append(
+            f"Byte-identical copies verified: {copies} of {len(episodes)} files"
+        )
+        
+        if not all_identical and not names_confirm:
+            # e.g. a multi-episode file: it may hold the only copy of another episode
+            duplicate_group.recommended_removals = self._verified_removals(duplicate_group)
+            duplicate_group.potential_space_saved = sum(
+                ep.file_size for ep in duplicate_group.recommended_removals
+            )
+            duplicate_group.analysis_notes.append(
+                "Files that are not identical copies differ by name; keeping them"
+            )
+        return duplicate_group
+    
+    def _verified_removals(self, group: DuplicateGroup) -> List[Episode]:
+        """
+        Get recommended removals that are byte-identical to the keeper.
+        
+        Args:
+            group: Duplicate group (verified groups carry 'identical_sets')
+            
+        Returns:
+            Removals whose content matches the recommended keeper exactly
+        """
+        if not group.recommended_keeper:
+            return []
+        
+        keeper_path = str(group.recommended_keeper.file_path)
+        for paths in group.metadata.get('identical_sets', []):
+            if keeper_path in paths:
+                return [ep for ep in group.recommended_removals if str(ep.file_path) in paths]
+        return []
+    
+    @staticmethod
+    def _is_same_file(episode: Episode, keeper: Optional[Episode]) -> bool:
+        """Check whether an episode path reaches the same file as the keeper (link or mount alias)."""
+        if keeper is None:
+            return False
+        try:
+            return os.path.samefile(episode.file_path, keeper.file_path)
+        except OSError:
+            return False
+    
     def _calculate_confidence_score(self, episodes: List[Episode], has_versions: bool) -> float:
         """
         Calculate confidence score for duplicate detection.
@@ -544,6 +593,9 @@ class DuplicateDetector:
             
             report.append(f"\n{i}. {group.get_summary()}")
             report.append(f"   Confidence: {confidence:.2f} {'(Version Files)' if has_versions else ''}")
+            if group.metadata.get('identical_sets'):
+                status = "all files" if group.metadata.get('content_identical') else "some files"
+                report.append(f"   Content: byte-identical ({status})")
             report.append(f"   Action: {group.recommended_action.value}")
             
             if group.recommended_keeper:
@@ -637,7 +689,8 @@ class DuplicateDetector:
         Args:
             deletion_mode: How to handle deletions (dry_run, trash, permanent)
             specific_groups: Specific groups to delete from (None = all groups)
-            min_confidence_score: Minimum confidence score for safe deletion
+            min_confidence_score: Minimum confidence score for safe deletion.
+                Removals verified byte-identical to the keeper are always included.
             
         Returns:
             DeletionPlan with all operations and safety checks
@@ -651,14 +704,29 @@ class DuplicateDetector:
             if not group.recommended_removals:
                 continue
             
-            # Only include high-confidence removals
+            # Never delete a path that reaches the keeper's own file
+            removals = [ep for ep in group.recommended_removals
+                        if not self._is_same_file(ep, group.recommended_keeper)]
+            if not removals:
+                self.logger.warning(f"Skipping group {group.episode_id} - removals are the kept file itself")
+                continue
+            
+            # Files whose names failed the duplicate checks go only if identical to the keeper
+            if group.metadata.get('names_confirm_duplicates') is False:
+                removals = [ep for ep in self._verified_removals(group) if ep in removals]
+                if not removals:
+                    continue
+            
+            # Only include high-confidence removals, unless verified identical
             group_confidence = self._calculate_group_confidence(group)
             if group_confidence < min_confidence_score:
-                self.logger.debug(f"Skipping group {group.episode_id} - confidence {group_confidence:.1f} < {min_confidence_score}")
-                continue
+                removals = [ep for ep in self._verified_removals(group) if ep in removals]
+                if not removals:
+                    self.logger.debug(f"Skipping group {group.episode_id} - confidence {group_confidence:.1f} < {min_confidence_score}")
+                    continue
             
             # Create deletion operations for recommended removals
-            for episode in group.recommended_removals:
+            for episode in removals:
                 reason = self._get_deletion_reason(group, episode)
                 operation = DeletionOperation(
                     episode=episode,
@@ -676,6 +744,10 @@ class DuplicateDetector:
     
     def _calculate_group_confidence(self, group: DuplicateGroup) -> float:
         """Calculate confidence score for a duplicate group."""
+        # Every file verified byte-identical: deleting extras loses nothing
+        if group.metadata.get('content_identical'):
+            return 100.0
+        
         confidence = 50.0  # Base confidence
         
         # Higher confidence for clear quality differences
@@ -705,6 +777,9 @@ class DuplicateDetector:
     
     def _get_deletion_reason(self, group: DuplicateGroup, episode: Episode) -> str:
         """Get human-readable reason for deleting this episode."""
+        if episode in self._verified_removals(group):
+            return "Byte-identical copy of kept file"
+        
         if group.recommended_keeper:
             keeper = group.recommended_keeper
             if episode.quality != keeper.quality:
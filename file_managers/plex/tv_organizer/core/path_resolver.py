@@ -6,18 +6,20 @@ determining optimal destinations for file organization.
 """
 
 import re
-import shutil
 import logging
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from collections import defaultdict
-import difflib
 
 from ..models.episode import Episode, EpisodeStatus
 from ..models.path_resolution import (
     ShowDirectory, PathDestination, PathResolution, ResolutionPlan,
     ResolutionType, DestinationType, ConfidenceLevel
 )
+from ...utils.filename_parser import parse_filename
+from ...utils.placement_planner import PlacementItem, plan_placements
+from ...utils.show_matcher import ShowNameMatcher
+from ...utils.space_ledger import SpaceLedger
 from ...utils.tv_scanner import extract_tv_info_from_filename, is_video_file
 from ...config.config import config
 
@@ -28,14 +30,20 @@ class PathResolver:
     and determines optimal destinations for episode organization.
     """
     
-    def __init__(self, tv_directories: Optional[List[str]] = None):
+    def __init__(self, tv_directories: Optional[List[str]] = None,
+                 space_ledger: Optional[SpaceLedger] = None):
         """Initialize the path resolver."""
         self.tv_directories = tv_directories or config.tv_directories
         self.logger = logging.getLogger(__name__)
         
+        # Free space per volume, net of the episodes already resolved onto it
+        self.space_ledger = space_ledger or SpaceLedger()
+        self._new_show_bases: Dict[str, Path] = {}
+        
         # Discovered show directories
         self.show_directories: Dict[str, ShowDirectory] = {}
         self.show_name_index: Dict[str, List[ShowDirectory]] = defaultdict(list)
+        self._show_matcher: Optional[ShowNameMatcher] = None
         
         # Analysis results
         self.episodes: List[Episode] = []
@@ -66,6 +74,7 @@ class PathResolver:
         self.episodes.clear()
         self.show_directories.clear()
         self.show_name_index.clear()
+        self._show_matcher = None
         
         for tv_dir in self.tv_directories:
             tv_path = Path(tv_dir)
@@ -209,36 +218,11 @@ class PathResolver:
         """Detect video quality from filename."""
         from ..models.episode import Quality
         
-        filename_lower = filename.lower()
-        
-        if any(pattern in filename_lower for pattern in ['2160p', '4k', 'uhd']):
-            return Quality.UHD_4K
-        elif '1080p' in filename_lower:
-            return Quality.FHD_1080P
-        elif '720p' in filename_lower:
-            return Quality.HD_720P
-        elif '480p' in filename_lower:
-            return Quality.SD_480P
-        else:
-            return Quality.UNKNOWN
+        return Quality(parse_filename(filename).quality)
     
     def _detect_source(self, filename: str) -> Optional[str]:
         """Detect video source from filename."""
-        filename_lower = filename.lower()
-        
-        sources = {
-            'BluRay': ['bluray', 'blu-ray', 'bdrip', 'brrip'],
-            'WEB-DL': ['web-dl', 'webdl'],
-            'WEBRip': ['webrip', 'web-rip'],
-            'HDTV': ['hdtv'],
-            'DVDRip': ['dvdrip', 'dvd-rip']
-        }
-        
-        for source, patterns in sources.items():
-            if any(pattern in filename_lower for pattern in patterns):
-                return source
-        
-        return None
+        return parse_filename(filename).source
     
     def _normalize_show_name(self, name: str) -> str:
         """Normalize show name for matching."""
@@ -253,6 +237,15 @@ class PathResolver:
         
         return name
     
+    def _get_show_matcher(self) -> ShowNameMatcher:
+        """Get the show-name matcher, building it once per scan."""
+        if self._show_matcher is None or len(self._show_matcher) != len(self.show_directories):
+            self._show_matcher = ShowNameMatcher(
+                ((show_dir, show_dir.show_name_variations) for show_dir in self.show_directories.values()),
+                threshold=self.similarity_threshold
+            )
+        return self._show_matcher
+    
     def find_show_matches(self, episode: Episode) -> List[Tuple[ShowDirectory, float]]:
         """
         Find show directories that could match an episode.
@@ -261,36 +254,12 @@ class PathResolver:
             List of (ShowDirectory, similarity_score) tuples, sorted by score
         """
         episode_show = self._normalize_show_name(episode.show_name)
-        matches = []
+        matches = self._get_show_matcher().match(episode_show, self.similarity_threshold)
         
-        # Check all show directories
-        for show_dir in self.show_directories.values():
-            # Check exact match first
-            if episode_show.lower() == show_dir.normalized_name.lower():
-                matches.append((show_dir, 1.0))
-                continue
-            
-            # Check fuzzy similarity
-            similarity = difflib.SequenceMatcher(None, 
-                                                episode_show.lower(), 
-                                                show_dir.normalized_name.lower()).ratio()
-            
-            if similarity >= self.similarity_threshold:
-                matches.append((show_dir, similarity))
-            
-            # Also check against variations
-            for variation in show_dir.show_name_variations:
-                var_similarity = difflib.SequenceMatcher(None, 
-                                                        episode_show.lower(), 
-                                                        variation.lower()).ratio()
-                if var_similarity >= self.similarity_threshold:
-                    matches.append((show_dir, var_similarity))
-                    break
-        
-        # Sort by similarity score (highest first) and remove duplicates
+        # Remove duplicates (the same folder can be indexed under two keys)
         seen_dirs = set()
         unique_matches = []
-        for show_dir, score in sorted(matches, key=lambda x: x[1], reverse=True):
+        for show_dir, score in matches:
             if show_dir.path not in seen_dirs:
                 unique_matches.append((show_dir, score))
                 seen_dirs.add(show_dir.path)
@@ -327,14 +296,60 @@ class PathResolver:
             normalized_show = self._normalize_show_name(episode.show_name)
             episodes_by_show[normalized_show].append(episode)
         
+        # Choose TV directories for all new shows together
+        self._new_show_bases = self._plan_new_show_directories(episodes_by_show)
+        
         # Resolve each show's episodes
         for show_name, show_episodes in episodes_by_show.items():
             self.logger.info(f"Resolving {len(show_episodes)} episodes for show: {show_name}")
             show_resolutions = self._resolve_show_episodes(show_episodes)
+            for resolution in show_resolutions:
+                self._reserve_space(resolution)
             self.resolutions.extend(show_resolutions)
         
         return self.resolutions
     
+    def _plan_new_show_directories(self, episodes_by_show: Dict[str, List[Episode]]) -> Dict[str, Path]:
+        """
+        Pick a TV directory for every new show in one batch.
+        
+        Episodes of existing shows are booked against their show's volume
+        first; each new show then goes, whole, to the directory with room that
+        needs the fewest cross-volume copies.
+        
+        Args:
+            episodes_by_show: Episodes grouped by normalized show name
+            
+        Returns:
+            Dictionary mapping normalized show name to its planned TV directory
+        """
+        tv_dirs = [tv_dir for tv_dir in self.tv_directories if Path(tv_dir).exists()]
+        items = []
+        new_shows = set()
+        for show_name, show_episodes in episodes_by_show.items():
+            show_matches = self.find_show_matches(show_episodes[0])
+            if show_matches:
+                candidates = [str(show_matches[0][0].path)]
+            else:
+                candidates = tv_dirs
+                new_shows.add(show_name)
+            for episode in show_episodes:
+                items.append(PlacementItem(str(episode.file_path), episode.file_size,
+                                           str(episode.file_path), candidates, show_name))
+        
+        if not new_shows:
+            return {}
+        
+        plan = plan_placements(items, self.space_ledger, int(self.min_free_space_gb * 1024**3))
+        if plan.unplaced:
+            self.logger.warning(f"{len(plan.unplaced)} episodes do not fit in any TV directory")
+        
+        return {
+            show_name: Path(plan.assignments[str(show_episodes[0].file_path)])
+            for show_name, show_episodes in episodes_by_show.items()
+            if show_name in new_shows and str(show_episodes[0].file_path) in plan.assignments
+        }
+    
     def _resolve_show_episodes(self, episodes: List[Episode]) -> List[PathResolution]:
         """Resolve path for episodes from a single show."""
         resolutions = []
@@ -476,27 +491,34 @@ class PathResolver:
                 return folder
         return None
     
+    def _reserve_space(self, resolution: PathResolution) -> None:
+        """Set aside space on the destination volume for a resolution's episodes."""
+        if not resolution.primary_destination:
+            return
+        target = resolution.primary_destination.path
+        for episode in resolution.episodes:
+            self.space_ledger.reserve(target, episode.file_size, episode.file_path)
+    
     def _calculate_space_score(self, path: Path) -> float:
         """Calculate space availability score for a destination."""
-        try:
-            stat = shutil.disk_usage(path)
-            free_gb = stat.free / (1024**3)
-            
-            if free_gb >= 100:
-                return 100.0
-            elif free_gb >= 50:
-                return 80.0
-            elif free_gb >= 20:
-                return 60.0
-            elif free_gb >= 10:
-                return 40.0
-            elif free_gb >= 5:
-                return 20.0
-            else:
-                return 0.0
-                
-        except Exception:
+        free_bytes = self.space_ledger.free_bytes(path)
+        if free_bytes is None:
             return 50.0  # Default score if can't determine space
+        
+        free_gb = free_bytes / (1024**3)
+        
+        if free_gb >= 100:
+            return 100.0
+        elif free_gb >= 50:
+            return 80.0
+        elif free_gb >= 20:
+            return 60.0
+        elif free_gb >= 10:
+            return 40.0
+        elif free_gb >= 5:
+            return 20.0
+        else:
+            return 0.0
     
     def _create_new_show_resolution(self, episodes: List[Episode], season: int) -> PathResolution:
         """Create resolution for episodes that need a new show directory."""
@@ -565,6 +587,10 @@ class PathResolver:
     
     def _find_best_tv_directory_for_new_show(self, episodes: List[Episode]) -> Path:
         """Find the best TV base directory for creating a new show folder."""
+        planned = self._new_show_bases.get(self._normalize_show_name(episodes[0].show_name))
+        if planned:
+            return planned
+        
         best_dir = None
         best_score = 0
         
@@ -1,6 +1,5 @@
 """AI-powered query processor for natural language media search requests."""
 
-import boto3
 import json
 import re
 import os
@@ -64,6 +63,7 @@ class AIQueryProcessor:
                     'aws_secret_access_key': os.getenv('AWS_SECRET_ACCESS_KEY')
                 })
             
+            import boto3  # Deferred until an AI query actually needs the client
             self.bedrock_client = boto3.client(**bedrock_kwargs)
             
             # Allow model override from environment
@@ -0,0 +1,256 @@
+"""Byte-level content verification for duplicate media files.
+
+The duplicate detectors group files by parsed title or episode number, which
+cannot tell a genuine second copy from a different cut, a mislabelled episode
+or a re-encode.  This module confirms which candidates are byte-identical in
+three increasingly expensive stages:
+
+1. Group by exact file size (free - comes from ``stat``)
+2. Compare a sampled fingerprint of the first, middle and last few MiB
+3. Only when fingerprints tie, compare a full streaming hash
+
+Fingerprints and full hashes are persisted in a SQLite cache keyed by
+(path, size, mtime), so reruns never reread unchanged multi-GB files.
+
+Key Features:
+- Large unbuffered ``readinto`` reads into a reused buffer
+- Files no larger than three samples are hashed in full in stage 2
+- Cache entries are invalidated automatically when size or mtime change
+- Paths reaching the same inode are hashed once and never reported as copies
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Digest size in bytes for BLAKE2b fingerprints and full hashes
+DIGEST_SIZE = 20
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS content_hashes (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime REAL NOT NULL,
+        sample_bytes INTEGER NOT NULL,
+        sample_hash TEXT,
+        full_hash TEXT,
+        updated_at TEXT NOT NULL
+    );
+'''
+
+
+def default_cache_path() -> Path:
+    """
+    Get the default content hash cache path.
+
+    Returns:
+        Path inside the project's database directory
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    database_dir = project_root / "database"
+    database_dir.mkdir(exist_ok=True)
+    return database_dir / "content_hash_cache.db"
+
+
+class ContentHasher:
+    """Finds byte-identical files using size, sampled and full hashes."""
+
+    def __init__(self, cache_path: Optional[str] = None,
+                 sample_bytes: Optional[int] = None,
+                 buffer_bytes: Optional[int] = None):
+        """
+        Initialize the hasher.
+
+        Args:
+            cache_path: Hash cache database path (defaults to database/content_hash_cache.db)
+            sample_bytes: Bytes read from each of the start, middle and end of a file
+            buffer_bytes: Read buffer size for full hashes
+        """
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self.sample_bytes = sample_bytes or config.content_hash_sample_bytes
+        self.buffer_bytes = buffer_bytes or config.content_hash_buffer_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._buffer: Optional[bytearray] = None
+
+        # Counters for reporting (and for checking that reruns hit the cache)
+        self.stats = {'sample_reads': 0, 'full_reads': 0, 'cache_hits': 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path))
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the cache database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def find_identical(self, paths: Iterable[str]) -> List[List[str]]:
+        """
+        Group files whose contents are byte-identical.
+
+        Paths that reach the same file (symlinks, hard links, bind mounts or
+        overlapping share directories) are counted once, under the first path
+        in sorted order, so a file is never reported as a copy of itself.
+
+        Args:
+            paths: Candidate file paths (missing or unreadable files are skipped)
+
+        Returns:
+            Groups of two or more identical files, each sorted by path
+        """
+        # Stage 1: exact size
+        by_size: Dict[int, List[Tuple[str, float]]] = defaultdict(list)
+        seen: Dict[Tuple[int, int], str] = {}
+        for path in sorted(set(str(p) for p in paths)):
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                logger.debug(f"Cannot stat {path}: {e}")
+                continue
+            inode = (stat.st_dev, stat.st_ino)
+            if inode in seen:
+                logger.debug(f"Skipping {path}: same file as {seen[inode]}")
+                continue
+            seen[inode] = path
+            by_size[stat.st_size].append((path, stat.st_mtime))
+
+        identical = []
+        try:
+            for size, files in by_size.items():
+                if len(files) < 2:
+                    continue
+
+                # Stage 2: sampled fingerprint
+                for tied in self._group_by(files, size, full=False):
+                    if size <= 3 * self.sample_bytes:
+                        # The fingerprint already covered every byte
+                        identical.append(tied)
+                        continue
+
+                    # Stage 3: full streaming hash
+                    candidates = [f for f in files if f[0] in tied]
+                    identical.extend(self._group_by(candidates, size, full=True))
+        finally:
+            if self._conn is not None:
+                self._conn.commit()
+
+        identical.sort()
+        return identical
+
+    def _group_by(self, files: List[Tuple[str, float]], size: int,
+                  full: bool) -> List[List[str]]:
+        """Group same-size files by sampled or full hash, keeping ties only."""
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for path, mtime in files:
+            digest = self._hash(path, size, mtime, full)
+            if digest is not None:
+                groups[digest].append(path)
+        return [sorted(group) for group in groups.values() if len(group) > 1]
+
+    def _hash(self, path: str, size: int, mtime: float, full: bool) -> Optional[str]:
+        """Get a cached hash or compute and cache it."""
+        column = 'full_hash' if full else 'sample_hash'
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT size, mtime, sample_bytes, sample_hash, full_hash '
+            'FROM content_hashes WHERE path = ?', (path,)
+        ).fetchone()
+
+        cached_sample = cached_full = None
+        if row is not None and row[0] == size and row[1] == mtime:
+            cached_full = row[4]
+            if row[2] == self.sample_bytes:
+                cached_sample = row[3]
+
+        cached = cached_full if full else cached_sample
+        if cached is not None:
+            self.stats['cache_hits'] += 1
+            return cached
+
+        try:
+            if full or size <= 3 * self.sample_bytes:
+                digest = self._full_digest(path)
+                self.stats['full_reads'] += 1
+            else:
+                digest = self._sample_digest(path, size)
+                self.stats['sample_reads'] += 1
+        except OSError as e:
+            logger.warning(f"Cannot read {path} for hashing: {e}")
+            return None
+
+        if full:
+            cached_full = digest
+        else:
+            cached_sample = digest
+            if size <= 3 * self.sample_bytes:
+                cached_full = digest
+
+        conn.execute(
+            'INSERT OR REPLACE INTO content_hashes '
+            '(path, size, mtime, sample_bytes, sample_hash, full_hash, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (path, size, mtime, self.sample_bytes, cached_sample, cached_full,
+             datetime.now().isoformat())
+        )
+        if full:
+            # Full hashes are expensive; don't lose them to an interrupted run
+            conn.commit()
+
+        logger.debug(f"Hashed {path} ({column})")
+        return digest
+
+    def _read_buffer(self) -> bytearray:
+        """Get the reusable read buffer."""
+        if self._buffer is None:
+            self._buffer = bytearray(max(self.buffer_bytes, self.sample_bytes))
+        return self._buffer
+
+    def _sample_digest(self, path: str, size: int) -> str:
+        """Hash the first, middle and last sample of a file."""
+        digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        digest.update(size.to_bytes(8, 'little'))
+        view = memoryview(self._read_buffer())[:self.sample_bytes]
+        offsets = (0, (size - self.sample_bytes) // 2, size - self.sample_bytes)
+
+        with open(path, 'rb', buffering=0) as f:
+            for offset in offsets:
+                f.seek(offset)
+                filled = 0
+                while filled < self.sample_bytes:
+                    count = f.readinto(view[filled:])
+                    if not count:
+                        break
+                    filled += count
+                digest.update(view[:filled])
+
+        return digest.hexdigest()
+
+    def _full_digest(self, path: str) -> str:
+        """Hash a whole file with large sequential reads."""
+        digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        buffer = self._read_buffer()
+        view = memoryview(buffer)
+
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                count = f.readinto(buffer)
+                if not count:
+                    break
+                digest.update(view[:count])
+
+        return digest.hexdigest()
+
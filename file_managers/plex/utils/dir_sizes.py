@@ -0,0 +1,262 @@
+"""Cached, bottom-up directory size aggregation.
+
+Download scans, small-folder cleanup and TV folder reports each computed folder
+sizes by walking every file again with ``rglob`` plus a ``stat`` per file, and
+the cleanup after a move run walked the same folders once more.  Over CIFS
+every one of those calls is a network round trip.
+
+``DirectorySizeCache`` lists each directory once with ``os.scandir`` and keeps
+its direct files (name and size) and subdirectory names, keyed by the
+directory's path and mtime, in a SQLite cache.  A directory's mtime changes
+whenever an entry is added, removed or renamed in it, so an unchanged mtime
+means the cached listing is still valid and only a single ``stat`` is needed.
+Totals are summed bottom-up from the validated listings on every query, so
+they always reflect the tree as it is now.
+
+Key Features:
+- One ``stat`` per unchanged directory, no per-file calls
+- Only directories whose mtime changed are listed again
+- ``on_move`` (a MoveEngine listener) drops exactly the directories a move touched
+- Usable as a context manager that saves and closes the cache database
+
+Files rewritten in place keep their directory's mtime, so their new size is
+only seen once something else in that directory changes; media files are
+written once, which makes this an acceptable trade.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS directory_listings (
+        path TEXT PRIMARY KEY,
+        mtime REAL NOT NULL,
+        files TEXT NOT NULL,
+        subdirs TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+'''
+
+
+class DirSize(NamedTuple):
+    """Recursive totals for one directory."""
+    size: int        # Bytes in all files below the directory
+    file_count: int  # Files below the directory
+    dir_count: int   # Subdirectories below the directory
+
+
+class _Listing(NamedTuple):
+    """Direct contents of one directory."""
+    mtime: float
+    files: List[Tuple[str, int]]  # (name, size)
+    subdirs: List[str]            # Names
+
+
+def default_cache_path() -> Path:
+    """
+    Get the default directory size cache path.
+
+    Returns:
+        Path inside the project's database directory
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    database_dir = project_root / "database"
+    database_dir.mkdir(exist_ok=True)
+    return database_dir / "dir_size_cache.db"
+
+
+class DirectorySizeCache:
+    """Computes directory sizes from cached, mtime-validated listings."""
+
+    def __init__(self, cache_path: Optional[PathLike] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Cache database path (defaults to database/dir_size_cache.db)
+        """
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._listings: Optional[Dict[str, _Listing]] = None
+        self._dirty: Dict[str, _Listing] = {}
+
+        # Counters for reporting (and for checking that reruns hit the cache)
+        self.stats = {'listed': 0, 'cache_hits': 0}
+
+    def _load(self) -> Dict[str, _Listing]:
+        """Open the cache database and read every stored listing on first use."""
+        if self._listings is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self._listings = {
+                path: _Listing(mtime, [tuple(f) for f in json.loads(files)], json.loads(subdirs))
+                for path, mtime, files, subdirs in self._conn.execute(
+                    'SELECT path, mtime, files, subdirs FROM directory_listings'
+                )
+            }
+        return self._listings
+
+    def _save(self) -> None:
+        """Write listings gathered since the last save."""
+        if not self._dirty or self._conn is None:
+            return
+        now = datetime.now().isoformat()
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO directory_listings (path, mtime, files, subdirs, updated_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            [(path, listing.mtime, json.dumps(listing.files), json.dumps(listing.subdirs), now)
+             for path, listing in self._dirty.items()]
+        )
+        self._conn.commit()
+        self._dirty.clear()
+
+    def close(self) -> None:
+        """Save pending listings and close the cache database."""
+        with self._lock:
+            self._save()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._listings = None
+
+    def __enter__(self) -> 'DirectorySizeCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ===== LISTINGS =====
+
+    def _listing(self, directory: str) -> Optional[_Listing]:
+        """Get a directory's direct contents, listing it only if its mtime changed."""
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError as e:
+            logger.debug(f"Cannot stat directory {directory}: {e}")
+            return None
+
+        listings = self._load()
+        cached = listings.get(directory)
+        if cached is not None and cached.mtime == mtime:
+            self.stats['cache_hits'] += 1
+            return cached
+
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append((entry.name, entry.stat().st_size))
+                    except OSError:
+                        # Skip entries we can't access
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot scan directory {directory}: {e}")
+            return None
+
+        listing = _Listing(mtime, files, sorted(subdirs))
+        listings[directory] = listing
+        self._dirty[directory] = listing
+        self.stats['listed'] += 1
+        return listing
+
+    # ===== QUERIES =====
+
+    def size(self, directory: PathLike) -> DirSize:
+        """
+        Get the recursive size of a directory.
+
+        Args:
+            directory: Directory path (a missing directory has size zero)
+
+        Returns:
+            DirSize totals
+        """
+        with self._lock:
+            try:
+                return self._size(os.path.normpath(str(directory)))
+            finally:
+                self._save()
+
+    def _size(self, directory: str) -> DirSize:
+        """Sum a directory's totals bottom-up from its listing and its children."""
+        listing = self._listing(directory)
+        if listing is None:
+            return DirSize(0, 0, 0)
+
+        size = sum(file_size for _, file_size in listing.files)
+        file_count = len(listing.files)
+        dir_count = len(listing.subdirs)
+        for name in listing.subdirs:
+            child = self._size(os.path.join(directory, name))
+            size += child.size
+            file_count += child.file_count
+            dir_count += child.dir_count
+
+        return DirSize(size, file_count, dir_count)
+
+    def iter_files(self, directory: PathLike) -> Iterator[Tuple[str, int]]:
+        """
+        Iterate over every file below a directory.
+
+        Args:
+            directory: Directory path
+
+        Yields:
+            (file path, size in bytes) tuples
+        """
+        with self._lock:
+            found = []
+            pending = [os.path.normpath(str(directory))]
+            while pending:
+                current = pending.pop()
+                listing = self._listing(current)
+                if listing is None:
+                    continue
+                found.extend((os.path.join(current, name), size) for name, size in listing.files)
+                pending.extend(os.path.join(current, name) for name in reversed(listing.subdirs))
+            self._save()
+        return iter(found)
+
+    # ===== INVALIDATION =====
+
+    def invalidate(self, path: PathLike) -> None:
+        """
+        Forget a directory's listing, so the next query lists it again.
+
+        Args:
+            path: Directory whose contents changed
+        """
+        directory = os.path.normpath(str(path))
+        with self._lock:
+            if self._listings is not None:
+                self._listings.pop(directory, None)
+            self._dirty.pop(directory, None)
+
+    def on_move(self, outcome) -> None:
+        """
+        Update the cache after a move (register with ``MoveEngine.add_listener``).
+
+        Args:
+            outcome: MoveOutcome of the finished move
+        """
+        if not outcome.success:
+            return
+        self.invalidate(os.path.dirname(outcome.source))
+        self.invalidate(os.path.dirname(outcome.target))
@@ -1,11 +1,12 @@
 """Database-based duplicate detection for movies and TV episodes."""
 
-from typing import List, Dict, NamedTuple, Set
+from typing import List, Dict, NamedTuple, Optional, Set
 from collections import defaultdict
 from pathlib import Path
 import re
 
 from .media_database import MediaDatabase, MovieEntry, TVEpisodeEntry
+from .content_hasher import ContentHasher
 from .movie_scanner import normalize_movie_name
 
 
@@ -33,6 +34,7 @@ class MovieDuplicateGroup(NamedTuple):
     normalized_name: str
     files: List[MovieDuplicateFile]
     best_file: MovieDuplicateFile  # Largest file (best quality)
+    identical_files: Optional[List[List[str]]] = None  # Byte-identical paths (when verified)
 
 
 class TVDuplicateGroup(NamedTuple):
@@ -42,76 +44,79 @@ class TVDuplicateGroup(NamedTuple):
     episode: int
     files: List[TVDuplicateFile]
     best_file: TVDuplicateFile  # Largest file (best quality)
+    identical_files: Optional[List[List[str]]] = None  # Byte-identical paths (when verified)
 
 
 class DuplicateDetector:
     """Database-based duplicate detection for movies and TV episodes."""
     
-    def __init__(self, database: MediaDatabase):
+    def __init__(self, database: MediaDatabase, hasher: Optional[ContentHasher] = None):
         """
         Initialize duplicate detector with database.
         
         Args:
             database: MediaDatabase instance to use for detection
+            hasher: Optional ContentHasher for byte-level verification
         """
         self.database = database
+        self.hasher = hasher
     
-    def find_movie_duplicates(self) -> List[MovieDuplicateGroup]:
+    def _identical_files(self, files: List) -> List[List[str]]:
+        """Group the byte-identical files of a duplicate group."""
+        if self.hasher is None:
+            self.hasher = ContentHasher()
+        return self.hasher.find_identical(f.path for f in files)
+    
+    def find_movie_duplicates(self, verify_content: bool = False) -> List[MovieDuplicateGroup]:
         """
         Find duplicate movies using database entries.
         
+        Args:
+            verify_content: Also record which files are byte-identical
+        
         Returns:
             List of MovieDuplicateGroup objects containing duplicates
         """
-        # Get all movies from database
-        all_movies = self.database.get_all_movies()
-        
-        if not all_movies:
-            return []
-        
-        # Group movies by normalized title + year
-        grouped_movies = defaultdict(list)
-        
-        for movie in all_movies:
-            # Create a key combining normalized title and year
-            key = f"{movie.normalized_title}_{movie.year or 'unknown'}"
-            
-            movie_file = MovieDuplicateFile(
-                path=movie.file_path,
-                size=movie.file_size,
-                title=movie.title,
-                year=movie.year or 0,
-                normalized_title=movie.normalized_title
-            )
-            grouped_movies[key].append(movie_file)
-        
-        # Find groups with more than one file (duplicates)
+        # Each bucket of the movie index holds every copy of a title/year
         duplicate_groups = []
-        for key, files in grouped_movies.items():
-            if len(files) > 1:
-                # Sort by file size (descending) to identify best quality
-                files.sort(key=lambda f: f.size, reverse=True)
-                best_file = files[0]  # Largest file
-                
-                # Create normalized name for display
-                normalized_name = f"{files[0].title} ({files[0].year})" if files[0].year else files[0].title
-                
-                duplicate_group = MovieDuplicateGroup(
-                    normalized_name=normalized_name,
-                    files=files,
-                    best_file=best_file
+        for bucket in self.database.get_movie_duplicate_buckets():
+            files = [
+                MovieDuplicateFile(
+                    path=movie.file_path,
+                    size=movie.file_size,
+                    title=movie.title,
+                    year=movie.year or 0,
+                    normalized_title=movie.normalized_title
                 )
-                duplicate_groups.append(duplicate_group)
+                for movie in bucket
+            ]
+            
+            # Sort by file size (descending) to identify best quality
+            files.sort(key=lambda f: f.size, reverse=True)
+            best_file = files[0]  # Largest file
+            
+            # Create normalized name for display
+            normalized_name = f"{files[0].title} ({files[0].year})" if files[0].year else files[0].title
+            
+            duplicate_groups.append(MovieDuplicateGroup(
+                normalized_name=normalized_name,
+                files=files,
+                best_file=best_file,
+                identical_files=self._identical_files(files) if verify_content else None
+            ))
         
         # Sort by normalized name for consistent output
         duplicate_groups.sort(key=lambda g: g.normalized_name)
         
         return duplicate_groups
     
-    def find_tv_duplicates(self) -> List[TVDuplicateGroup]:
+    def find_tv_duplicates(self, verify_content: bool = False) -> List[TVDuplicateGroup]:
         """
         Find duplicate TV episodes using database entries.
         
+        Args:
+            verify_content: Also record which files are byte-identical
+        
         Returns:
             List of TVDuplicateGroup objects containing duplicates
         """
@@ -151,7 +156,8 @@ class DuplicateDetector:
                     season=files[0].season,
                     episode=files[0].episode,
                     files=files,
-                    best_file=best_file
+                    best_file=best_file,
+                    identical_files=self._identical_files(files) if verify_content else None
                 )
                 duplicate_groups.append(duplicate_group)
         
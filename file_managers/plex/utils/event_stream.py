@@ -0,0 +1,242 @@
+"""Structured JSONL event stream for run telemetry.
+
+The reorganizer, mover, OMDB fetcher and metadata enricher used to write
+every per-file decision as free-form text lines, formatted and written
+synchronously from their hot loops, and ``LogAnalyzer`` recovered the data
+with regexes.  ``EventStream`` records typed events instead:
+
+- ``emit`` only stamps the record and puts it on a queue; a background
+  writer thread serializes whatever has accumulated and appends it to
+  ``<prefix>_<session>.events.jsonl`` next to the text log in one write
+- Every record is one JSON object with ``type`` and ``ts`` (epoch seconds)
+  plus the fields of its type (see ``EVENT_FIELDS``)
+- ``read_events`` and ``read_columns`` load a stream back for analysis,
+  the latter as one list per field
+
+A stream opened without a path is disabled and drops every event, so
+components can emit unconditionally.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Event types
+SESSION = 'session'
+CLASSIFICATION = 'classification'
+MOVE = 'move'
+API_CALL = 'api_call'
+CACHE_HIT = 'cache_hit'
+PHASE = 'phase'
+
+# Fields of each event type (besides type and ts); producers may add more
+EVENT_FIELDS: Dict[str, List[str]] = {
+    SESSION: ['session_id', 'status'],
+    CLASSIFICATION: ['filename', 'current_category', 'suggested_category', 'confidence', 'method', 'reasoning'],
+    MOVE: ['source', 'target', 'success', 'size', 'error'],
+    API_CALL: ['api', 'endpoint', 'status', 'seconds'],
+    CACHE_HIT: ['cache', 'key'],
+    PHASE: ['name', 'seconds'],
+}
+
+_STOP = object()
+
+
+class EventStream:
+    """Non-blocking JSONL event writer with a background writer thread."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open a stream.
+
+        Args:
+            path: JSONL file to append to (None disables the stream)
+        """
+        self.path = Path(path) if path else None
+        self._queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._thread = threading.Thread(target=self._write_loop, name=f"events-{self.path.stem}",
+                                            daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether events are being written."""
+        return self._thread is not None
+
+    def emit(self, event_type: str, **fields: Any) -> None:
+        """
+        Queue an event (never blocks on I/O).
+
+        Field values are serialized later on the writer thread, so callers
+        must not mutate them after emitting.
+
+        Args:
+            event_type: Event type (one of the module constants)
+            **fields: Event fields
+        """
+        if self._thread is None:
+            return
+        fields['type'] = event_type
+        fields['ts'] = time.time()
+        self._queue.put(fields)
+
+    def classification(self, filename: str, current_category: str, suggested_category: str,
+                       confidence: float, method: str, reasoning: str = '', **extra: Any) -> None:
+        """Record a classification decision."""
+        self.emit(CLASSIFICATION, filename=filename, current_category=current_category,
+                  suggested_category=suggested_category, confidence=confidence, method=method,
+                  reasoning=reasoning, **extra)
+
+    def move(self, source: str, target: str, success: bool, size: int = 0,
+             error: Optional[str] = None, **extra: Any) -> None:
+        """Record a file or folder move."""
+        self.emit(MOVE, source=source, target=target, success=success, size=size, error=error, **extra)
+
+    def api_call(self, api: str, endpoint: str, status: Any, seconds: float, **extra: Any) -> None:
+        """Record an external API request (status is the HTTP code or an error label)."""
+        self.emit(API_CALL, api=api, endpoint=endpoint, status=status, seconds=seconds, **extra)
+
+    def cache_hit(self, cache: str, key: str, **extra: Any) -> None:
+        """Record a lookup answered from a local cache."""
+        self.emit(CACHE_HIT, cache=cache, key=key, **extra)
+
+    def phase(self, name: str, seconds: float, **extra: Any) -> None:
+        """Record how long a run phase took."""
+        self.emit(PHASE, name=name, seconds=seconds, **extra)
+
+    def _write_loop(self) -> None:
+        """Append queued events in batches until close() (writer thread)."""
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                while True:
+                    batch = [self._queue.get()]
+                    while True:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+
+                    stop = any(record is _STOP for record in batch)
+                    lines = [json.dumps(record, default=str) for record in batch if record is not _STOP]
+                    if lines:
+                        f.write('\n'.join(lines) + '\n')
+                        f.flush()
+                    if stop:
+                        return
+        except OSError as e:
+            logger.error(f"Event stream {self.path} stopped: {e}")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Write everything queued so far and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the writer
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> 'EventStream':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def events_path(logs_dir: Path, prefix: str, session_id: str) -> Path:
+    """
+    Get the event file of a session.
+
+    Args:
+        logs_dir: Logs directory
+        prefix: Component prefix (as used for the text log)
+        session_id: Session ID
+
+    Returns:
+        Path of ``<prefix>_<session>.events.jsonl``
+    """
+    return Path(logs_dir) / f"{prefix}_{session_id}.events.jsonl"
+
+
+def open_event_stream(logs_dir: Path, prefix: str, session_id: str) -> EventStream:
+    """
+    Open a session's event stream (disabled when turned off in config).
+
+    Args:
+        logs_dir: Logs directory
+        prefix: Component prefix (as used for the text log)
+        session_id: Session ID
+
+    Returns:
+        EventStream
+    """
+    if not config.event_stream_enabled:
+        return EventStream()
+    stream = EventStream(events_path(logs_dir, prefix, session_id))
+    stream.emit(SESSION, session_id=session_id, status='started')
+    return stream
+
+
+def read_events(path: Path, types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of an event file.
+
+    Args:
+        path: Event file
+        types: Only yield these event types (default: all)
+
+    Yields:
+        Event dictionaries in file order (a torn last line is skipped)
+    """
+    wanted = set(types) if types else None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if wanted is None or record.get('type') in wanted:
+                yield record
+
+
+def read_columns(path: Path,
+                 fields_by_type: Dict[str, Optional[List[str]]]) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Load event types as columns in one pass over the file.
+
+    Args:
+        path: Event file
+        fields_by_type: Event type -> columns to build (None: ts plus the type's EVENT_FIELDS)
+
+    Returns:
+        Event type -> field -> list of values (None where a record lacks the field)
+    """
+    tables: Dict[str, Dict[str, List[Any]]] = {}
+    for event_type, fields in fields_by_type.items():
+        fields = fields or ['ts'] + EVENT_FIELDS.get(event_type, [])
+        tables[event_type] = {field: [] for field in fields}
+
+    for record in read_events(path, tables):
+        for field, column in tables[record['type']].items():
+            column.append(record.get(field))
+    return tables
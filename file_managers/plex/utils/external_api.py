@@ -1,7 +1,6 @@
 """External API integration for media metadata (TMDB, TVDB)."""
 
 import os
-import requests
 import time
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
@@ -18,6 +17,7 @@ except ImportError:
     pass
 
 from ..config.config import config
+from .http_cache import CachedSession, HTTPResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,13 +55,15 @@ class APIShowDetails:
 class ExternalAPIClient:
     """Client for external media APIs (TMDB, TVDB)."""
     
-    def __init__(self, tmdb_api_key: Optional[str] = None, tvdb_api_key: Optional[str] = None):
+    def __init__(self, tmdb_api_key: Optional[str] = None, tvdb_api_key: Optional[str] = None,
+                 response_cache: Optional[HTTPResponseCache] = None):
         """
         Initialize API client.
         
         Args:
             tmdb_api_key: TMDB API key (optional, will try environment variable)
             tvdb_api_key: TVDB API key (optional, will try environment variable)
+            response_cache: Response cache (default: database/http_cache.db if enabled in config)
         """
         api_config = config.config.get('external_apis', {})
         
@@ -89,6 +91,16 @@ class ExternalAPIClient:
         self.tvdb_jwt_token = None
         self.tvdb_token_expiry = 0
         
+        # Pooled keep-alive session per API, paced by elapsed time, with an
+        # on-disk response cache shared by every process
+        if response_cache is None and config.api_response_cache_enabled:
+            response_cache = HTTPResponseCache()
+        self.response_cache = response_cache
+        self.search_ttl = config.api_search_cache_ttl_hours * 3600
+        self.details_ttl = config.api_details_cache_ttl_hours * 3600
+        self.tmdb_session = CachedSession('tmdb', self.tmdb_delay, self.tmdb_timeout, response_cache)
+        self.tvdb_session = CachedSession('tvdb', self.tvdb_delay, self.tvdb_timeout, response_cache)
+        
         logger.info(f"TMDB API available: {bool(self.tmdb_api_key)}")
         logger.info(f"TVDB API available: {bool(self.tvdb_api_key)}")
     
@@ -181,8 +193,7 @@ class ExternalAPIClient:
         if year:
             params['year'] = year
         
-        response = requests.get(url, params=params, timeout=self.tmdb_timeout)
-        time.sleep(self.tmdb_delay)
+        response = self.tmdb_session.get(url, params=params, ttl=self.search_ttl)
         
         if response.status_code != 200:
             raise Exception(f"TMDB API error: {response.status_code}")
@@ -216,8 +227,7 @@ class ExternalAPIClient:
         if year:
             params['first_air_date_year'] = year
         
-        response = requests.get(url, params=params, timeout=self.tmdb_timeout)
-        time.sleep(self.tmdb_delay)
+        response = self.tmdb_session.get(url, params=params, ttl=self.search_ttl)
         
         if response.status_code != 200:
             raise Exception(f"TMDB API error: {response.status_code}")
@@ -249,6 +259,13 @@ class ExternalAPIClient:
         if self.tvdb_jwt_token and current_time < self.tvdb_token_expiry:
             return self.tvdb_jwt_token
         
+        # Reuse the token saved by an earlier run
+        if self.response_cache:
+            saved = self.response_cache.get_token('tvdb')
+            if saved:
+                self.tvdb_jwt_token, self.tvdb_token_expiry = saved
+                return self.tvdb_jwt_token
+        
         # Get new token
         url = f"{self.tvdb_base_url}/login"
         data = {
@@ -256,14 +273,15 @@ class ExternalAPIClient:
         }
         
         try:
-            response = requests.post(url, json=data, timeout=self.tvdb_timeout)
-            time.sleep(self.tvdb_delay)
+            response = self.tvdb_session.post(url, json_body=data)
             
             if response.status_code == 200:
                 result = response.json()
                 self.tvdb_jwt_token = result.get('data', {}).get('token')
                 # TVDB tokens expire after 1 hour, set expiry for 50 minutes to be safe
                 self.tvdb_token_expiry = current_time + (50 * 60)
+                if self.response_cache and self.tvdb_jwt_token:
+                    self.response_cache.put_token('tvdb', self.tvdb_jwt_token, self.tvdb_token_expiry)
                 return self.tvdb_jwt_token
             else:
                 logger.error(f"TVDB login failed: {response.status_code} - {response.text}")
@@ -274,6 +292,13 @@ class ExternalAPIClient:
             logger.error(f"TVDB login error: {e}")
             return None
 
+    def _forget_tvdb_token(self) -> None:
+        """Drop a token TVDB rejected so the next request logs in again."""
+        self.tvdb_jwt_token = None
+        self.tvdb_token_expiry = 0
+        if self.response_cache:
+            self.response_cache.put_token('tvdb', None)
+
     def _search_tvdb_tv(self, title: str, year: Optional[int] = None) -> List[APIMediaResult]:
         """Search TVDB for TV shows."""
         # Get JWT token for authentication
@@ -292,10 +317,11 @@ class ExternalAPIClient:
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=self.tvdb_timeout)
-        time.sleep(self.tvdb_delay)
+        response = self.tvdb_session.get(url, params=params, headers=headers, ttl=self.search_ttl)
         
         if response.status_code != 200:
+            if response.status_code == 401:
+                self._forget_tvdb_token()
             raise Exception(f"TVDB API error: {response.status_code}")
         
         data = response.json()
@@ -329,8 +355,7 @@ class ExternalAPIClient:
             'language': self.tmdb_config.get('language', 'en-US')
         }
         
-        response = requests.get(url, params=params, timeout=self.tmdb_timeout)
-        time.sleep(self.tmdb_delay)
+        response = self.tmdb_session.get(url, params=params, ttl=self.details_ttl)
         
         if response.status_code != 200:
             return None
@@ -377,10 +402,11 @@ class ExternalAPIClient:
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(url, headers=headers, timeout=self.tvdb_timeout)
-        time.sleep(self.tvdb_delay)
+        response = self.tvdb_session.get(url, headers=headers, ttl=self.details_ttl)
         
         if response.status_code != 200:
+            if response.status_code == 401:
+                self._forget_tvdb_token()
             logger.error(f"TVDB series details failed: {response.status_code}")
             return None
         
@@ -0,0 +1,298 @@
+"""Shared, precompiled filename parser for movie and TV media files.
+
+Movie normalization, TV episode detection, quality/source/codec detection and
+metadata title extraction used to live in separate modules, each running its
+own list of uncompiled patterns one after another.  This module compiles every
+pattern once, merges alternations into combined regexes, and returns a single
+frozen ``ParsedFilename`` per filename.  Results are memoized with a bounded
+LRU cache, so a filename seen by several scanners and detectors in the same run
+is only parsed once.
+
+Key Features:
+- One ``parse_filename`` call yields title, year, show/season/episode,
+  quality, source, codec, version and multi-episode flag
+- Ordered TV patterns merged into one anchored alternation (first match wins)
+- Bounded LRU memoization keyed by filename
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .profiler import profiled
+
+# Maximum number of filenames kept in the parse cache
+PARSE_CACHE_SIZE = 65536
+
+# TV show name patterns - common naming conventions, in priority order.
+# Each pattern captures (show name, season, episode).
+TV_SHOW_PATTERNS = [
+    # Special case: "Show Name S01E01 - S01E01 - ..." (extract only "Show Name")
+    r'(.+?)\s+S\d+E\d+\s*-\s*S(\d+)E(\d+)',
+    # Show.Name.S01E01.Episode.Title.quality.mkv
+    r'(.+?)\.S(\d+)E(\d+)',
+    # Show Name - S01E01 - Episode Title.mkv
+    r'(.+?)\s*-\s*S(\d+)E(\d+)',
+    # Show Name S01E01 Episode Title.mkv
+    r'(.+?)\s+S(\d+)E(\d+)',
+    # Show.Name.1x01.Episode.Title.mkv
+    r'(.+?)\.(\d+)x(\d+)',
+    # Show Name - 1x01 - Episode Title.mkv
+    r'(.+?)\s*-\s*(\d+)x(\d+)',
+    # Show Name 1x01 Episode Title.mkv
+    r'(.+?)\s+(\d+)x(\d+)',
+    # Show Name Season 1 Episode 01.mkv
+    r'(.+?)\s+Season\s+(\d+)\s+Episode\s+(\d+)',
+    # Show Name s1e01.mkv (lowercase)
+    r'(.+?)\s+s(\d+)e(\d+)',
+]
+
+# All TV patterns anchored at the start and merged into a single alternation;
+# alternatives are tried in list order, so the first pattern still wins.
+_TV_RE = re.compile(
+    '^(?:' + '|'.join(f'(?:{pattern})' for pattern in TV_SHOW_PATTERNS) + ')',
+    re.IGNORECASE
+)
+
+# Quality labels (matching ``Quality`` enum values) in priority order
+_QUALITY_PATTERNS = [
+    ('8K', r'\b8k\b|4320p'),
+    ('4K', r'\b4k\b|2160p|\buhd\b'),
+    ('1080p', r'1080p|\bfhd\b'),
+    ('720p', r'720p|\bhd\b'),
+    ('480p', r'480p|\bsd\b'),
+]
+
+# Release sources in priority order
+_SOURCE_PATTERNS = [
+    ('BluRay', r'bluray|blu-ray|bdrip|brrip'),
+    ('WEB-DL', r'web-dl|webdl'),
+    ('WEBRip', r'webrip|web-rip'),
+    ('HDTV', r'hdtv'),
+    ('DVDRip', r'dvdrip|dvd-rip'),
+    ('CAM', r'\bcam(?:rip)?\b'),
+    ('TS', r'\bts\b|telesync'),
+]
+
+# Video codecs (normalized label, pattern)
+_CODEC_PATTERNS = [
+    ('H.265', r'x265|h\.?265|hevc'),
+    ('H.264', r'x264|h\.?264|avc'),
+    ('AV1', r'av1'),
+    ('XviD', r'xvid'),
+    ('DivX', r'divx'),
+]
+
+
+def _labelled_alternation(patterns: List[Tuple[str, str]], word: bool = False) -> re.Pattern:
+    """Merge (label, pattern) pairs into one regex with a named group per label."""
+    groups = []
+    for index, (_, pattern) in enumerate(patterns):
+        if word:
+            pattern = rf'\b(?:{pattern})\b'
+        groups.append(f'(?P<g{index}>{pattern})')
+    return re.compile('|'.join(groups), re.IGNORECASE)
+
+
+_QUALITY_RE = _labelled_alternation(_QUALITY_PATTERNS)
+_SOURCE_RE = _labelled_alternation(_SOURCE_PATTERNS)
+_CODEC_RE = _labelled_alternation(_CODEC_PATTERNS, word=True)
+
+# Patterns for detecting file versions (true duplicates), matched on lowercase names
+VERSION_RE = re.compile(
+    r'_(\d+)\.(?:mkv|mp4|avi)$'      # filename_1.mkv, filename_2.mkv
+    r'|_(\d+)$'                      # filename_1, filename_2
+    r'|\((\d+)\)\.(?:mkv|mp4|avi)$'  # filename(1).mkv, filename(2).mkv
+    r'|\((\d+)\)$'                   # filename(1), filename(2)
+    r'|\.(\d+)\.(?:mkv|mp4|avi)$'    # filename.1.mkv, filename.2.mkv
+)
+
+# Patterns for multi-episode files (should not be duplicates)
+_MULTI_EPISODE_RE = re.compile(
+    r'S\d+E\d+.*S\d+E\d+'   # S01E01-S01E02, S01E01 S01E02
+    r'|E\d+-E\d+'           # E01-E02
+    r'|Episodes?\s+\d+-\d+',  # Episodes 1-2
+    re.IGNORECASE
+)
+
+# Metadata removed when normalizing a movie name for comparison
+_MOVIE_NOISE_RE = re.compile(
+    r'\b(?:720p|1080p|480p|4K|2160p)\b'             # Quality
+    r'|\b(?:BluRay|BRRip|DVDRip|WEBRip|HDTV|CAM|TS)\b'  # Source
+    r'|\b(?:x264|x265|H264|H265|HEVC|DivX|XviD)\b'  # Codec
+    r'|\b(?:AC3|DTS|AAC|MP3)\b'                     # Audio
+    r'|\[.*?\]'                                     # Release group in brackets
+    r'|\{.*?\}'                                     # Release group in braces
+    r'|\.(?:REPACK|PROPER|EXTENDED|UNRATED|DC)\.',  # Release/cut tags
+    re.IGNORECASE
+)
+_TRAILING_GROUP_RE = re.compile(r'-\w+$')  # Release group at end after dash
+_SEPARATORS_RE = re.compile(r'[._]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Metadata removed when extracting a clean title for API lookups
+_TITLE_NOISE_RE = re.compile(
+    r'\b\d{3,4}p\b'                                          # Resolution
+    r'|\b(?:BluRay|WEB-?DL|WEBRip|HDTV|DVDRip|BRRip)\b'      # Source
+    r'|\b(?:x264|x265|H\.?264|H\.?265|HEVC)\b'               # Codec
+    r'|\b(?:AAC|AC3|DTS|DD|DDP)\b'                           # Audio
+    r'|\b(?:5\.1|7\.1|2\.0)\b'                               # Audio channels
+    r'|\b(?:PROPER|REPACK|EXTENDED|UNRATED|DIRECTOR.?S.?CUT)\b'  # Versions
+    r'|\[[^\]]*\]'                                           # Brackets content
+    r'|\([^)]*(?:rip|web|bluray|hdtv)[^)]*\)',               # Parentheses with quality info
+    re.IGNORECASE
+)
+# Title-case fixes applied to normalized show names
+_SHOW_NAME_REPLACEMENTS = {
+    'Tv': 'TV',
+    'Uk': 'UK',
+    'Us': 'US',
+    'Fbi': 'FBI',
+    'Csi': 'CSI',
+    'Ncis': 'NCIS',
+    'Nypd': 'NYPD',
+}
+
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+
+@dataclass(frozen=True)
+class ParsedFilename:
+    """Everything the media tools extract from a single filename."""
+    filename: str                       # Original filename
+    title: str                          # Clean title for metadata lookups
+    normalized_title: str               # Lower-cased title used to compare movies
+    year: Optional[int] = None          # Release year outside quality/bracket noise
+    name_year: Optional[int] = None     # First year anywhere in the raw filename
+    show_name: Optional[str] = None     # Normalized TV show name
+    season: Optional[int] = None        # Season number
+    episode: Optional[int] = None       # Episode number
+    quality: str = "unknown"            # Quality label ("1080p", "4K", ...)
+    source: Optional[str] = None        # Release source ("BluRay", "WEB-DL", ...)
+    codec: Optional[str] = None         # Video codec ("H.264", "H.265", ...)
+    version: Optional[int] = None       # Copy number such as the 2 in "name(2).mkv"
+    is_multi_episode: bool = False      # File holds several episodes
+
+    @property
+    def is_episode(self) -> bool:
+        """True if the filename was recognized as a TV episode."""
+        return self.show_name is not None
+
+
+def normalize_show_name(show_name: str) -> str:
+    """
+    Normalize TV show name for consistent grouping.
+
+    Args:
+        show_name: Raw show name from filename
+
+    Returns:
+        Normalized show name
+    """
+    # Remove common separators and convert to lowercase
+    normalized = show_name.replace('.', ' ').replace('_', ' ').replace('-', ' ')
+
+    # Remove extra whitespace
+    normalized = ' '.join(normalized.split())
+
+    # Convert to title case for consistency
+    normalized = normalized.title()
+
+    # Handle common abbreviations and fixes
+    for old, new in _SHOW_NAME_REPLACEMENTS.items():
+        normalized = normalized.replace(old, new)
+
+    return normalized.strip()
+
+
+def _first_label(regex: re.Pattern, patterns: List[Tuple[str, str]], text: str) -> Optional[str]:
+    """Return the highest-priority label whose pattern occurs in ``text``."""
+    best = None
+    for match in regex.finditer(text):
+        index = int(match.lastgroup[1:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return patterns[best][0] if best is not None else None
+
+
+def _parse_tv(stem: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    """Extract (show name, season, episode) from a filename stem."""
+    match = _TV_RE.search(stem)
+    if not match:
+        return None, None, None
+
+    groups = match.groups()
+    for start in range(0, len(groups), 3):
+        show_name, season, episode = groups[start:start + 3]
+        if show_name is not None:
+            return normalize_show_name(show_name), int(season or 1), int(episode)
+    return None, None, None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+@profiled('parse.filename')
+def parse_filename(filename: str) -> ParsedFilename:
+    """
+    Parse a media filename in a single call.
+
+    Args:
+        filename: File name (a full path works too; only the name is used)
+
+    Returns:
+        Frozen ParsedFilename with every detected attribute
+    """
+    name = Path(filename).name
+    stem = Path(name).stem
+    name_lower = name.lower()
+
+    # Movie comparison key
+    normalized = _MOVIE_NOISE_RE.sub('', stem)
+    normalized = _TRAILING_GROUP_RE.sub('', normalized)
+    normalized = _SEPARATORS_RE.sub(' ', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip().lower()
+
+    # Clean title and year for metadata lookups
+    cleaned = _TITLE_NOISE_RE.sub('', stem)
+    year_match = _YEAR_RE.search(cleaned)
+    year = int(year_match.group(1)) if year_match else None
+    if year_match:
+        cleaned = cleaned.replace(year_match.group(0), '')
+    title = _WHITESPACE_RE.sub(' ', _NON_WORD_RE.sub(' ', cleaned)).strip()
+
+    # Movie scanners key duplicates on a year taken from the raw name, so
+    # "Movie [2010].mkv" still yields 2010 even though brackets are noise above
+    name_year_match = _YEAR_RE.search(name)
+    name_year = int(name_year_match.group(1)) if name_year_match else None
+
+    show_name, season, episode = _parse_tv(stem)
+
+    version_match = VERSION_RE.search(name_lower)
+    version = None
+    if version_match:
+        version = int(next(group for group in version_match.groups() if group is not None))
+
+    return ParsedFilename(
+        filename=name,
+        title=title,
+        normalized_title=normalized,
+        year=year,
+        name_year=name_year,
+        show_name=show_name,
+        season=season,
+        episode=episode,
+        quality=_first_label(_QUALITY_RE, _QUALITY_PATTERNS, name_lower) or "unknown",
+        source=_first_label(_SOURCE_RE, _SOURCE_PATTERNS, name_lower),
+        codec=_first_label(_CODEC_RE, _CODEC_PATTERNS, name_lower),
+        version=version,
+        is_multi_episode=bool(_MULTI_EPISODE_RE.search(name))
+    )
+
+
+def clear_parse_cache() -> None:
+    """Drop all memoized parse results."""
+    parse_filename.cache_clear()
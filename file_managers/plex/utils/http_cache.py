@@ -0,0 +1,317 @@
+"""Pooled, rate-limited and cached HTTP transport for external media APIs.
+
+``ExternalAPIClient`` called bare ``requests.get``/``requests.post`` (a new
+TCP and TLS handshake per call), slept a fixed delay after every request
+(including the last one) and kept the TVDB login token in memory only, so
+every process logged in again.  ``tv missing`` and the media assistant ask
+for the same show details over and over.
+
+``CachedSession`` wraps one keep-alive ``requests.Session`` per API:
+
+- Requests are paced by an ``AdaptiveRateLimiter`` with a one-token bucket,
+  so a call only waits for whatever is left of the interval since the
+  previous one (nothing after the last request of a run)
+- Successful GET responses are stored in ``HTTPResponseCache`` (SQLite),
+  keyed by the normalized request (credentials left out) with a TTL chosen
+  per endpoint by the caller; a fresh entry is returned without any request
+- Login tokens are kept in the same database, so they survive the process
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .profiler import is_enabled, profiled, span
+from .rate_limiter import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that carry credentials, never part of a cache key
+_SECRET_PARAMS = {'api_key', 'apikey', 'token'}
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS http_responses (
+        cache_key TEXT PRIMARY KEY,
+        status INTEGER NOT NULL,
+        body TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS api_tokens (
+        api TEXT PRIMARY KEY,
+        token TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    );
+'''
+
+
+class CachedResponse(NamedTuple):
+    """Response from a CachedSession (mirrors the parts of requests.Response in use)."""
+    status_code: int
+    text: str
+    from_cache: bool
+
+    def json(self) -> Any:
+        """Decode the response body."""
+        return json.loads(self.text)
+
+
+def default_cache_path() -> Path:
+    """
+    Get the default HTTP response cache path.
+
+    Returns:
+        Path inside the project's database directory
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    database_dir = project_root / "database"
+    database_dir.mkdir(exist_ok=True)
+    return database_dir / "http_cache.db"
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the cache key for a request.
+
+    Parameters are sorted and string values are case-folded with whitespace
+    collapsed, so "The Office" and "the  office" share an entry; credentials
+    are left out.
+
+    Args:
+        method: HTTP method
+        url: Request URL without query string
+        params: Query parameters
+
+    Returns:
+        Cache key string
+    """
+    normalized = []
+    for name, value in sorted((params or {}).items()):
+        if name.lower() in _SECRET_PARAMS or value is None:
+            continue
+        if isinstance(value, str):
+            value = ' '.join(value.split()).casefold()
+        normalized.append(f"{name}={value}")
+    return f"{method.upper()} {url.rstrip('/')}?{'&'.join(normalized)}"
+
+
+class HTTPResponseCache:
+    """SQLite store for API responses and login tokens, shared across processes."""
+
+    def __init__(self, cache_path: Optional[Path] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Cache database path (defaults to database/http_cache.db)
+            clock: Wall clock returning seconds (injectable for tests)
+        """
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        # Counters for reporting
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the cache database on first use (lock held)."""
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    @profiled('sqlite.http_cache_get')
+    def get(self, cache_key: str) -> Optional[Tuple[int, str]]:
+        """
+        Get a fresh cached response.
+
+        Args:
+            cache_key: Key from ``request_key``
+
+        Returns:
+            (status, body) or None if missing or expired
+        """
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT status, body FROM http_responses WHERE cache_key = ? AND expires_at > ?',
+                (cache_key, self._clock())
+            ).fetchone()
+            self.stats['hits' if row else 'misses'] += 1
+        return (row[0], row[1]) if row else None
+
+    @profiled('sqlite.http_cache_put')
+    def put(self, cache_key: str, status: int, body: str, ttl: float) -> None:
+        """
+        Store a response.
+
+        Args:
+            cache_key: Key from ``request_key``
+            status: HTTP status code
+            body: Response body
+            ttl: Seconds the response stays fresh
+        """
+        now = self._clock()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO http_responses (cache_key, status, body, fetched_at, expires_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (cache_key, status, body, now, now + ttl)
+            )
+            conn.commit()
+
+    def get_token(self, api: str) -> Optional[Tuple[str, float]]:
+        """
+        Get an unexpired login token.
+
+        Args:
+            api: API name
+
+        Returns:
+            (token, expires_at) or None
+        """
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT token, expires_at FROM api_tokens WHERE api = ? AND expires_at > ?',
+                (api, self._clock())
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put_token(self, api: str, token: Optional[str], expires_at: float = 0.0) -> None:
+        """
+        Store a login token, or forget it when token is None.
+
+        Args:
+            api: API name
+            token: Token (None to delete)
+            expires_at: Expiry as a ``time.time()`` timestamp
+        """
+        with self._lock:
+            conn = self._connection()
+            if token is None:
+                conn.execute('DELETE FROM api_tokens WHERE api = ?', (api,))
+            else:
+                conn.execute('INSERT OR REPLACE INTO api_tokens (api, token, expires_at) VALUES (?, ?, ?)',
+                             (api, token, expires_at))
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired responses.
+
+        Returns:
+            Number of responses deleted
+        """
+        with self._lock:
+            conn = self._connection()
+            deleted = conn.execute('DELETE FROM http_responses WHERE expires_at <= ?',
+                                   (self._clock(),)).rowcount
+            conn.commit()
+        return deleted
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedSession:
+    """Keep-alive session for one API with request pacing and response caching."""
+
+    def __init__(self, name: str, min_interval: float = 0.0, timeout: float = 10,
+                 cache: Optional[HTTPResponseCache] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 retry_statuses: Iterable[int] = (500, 502, 503, 504)):
+        """
+        Initialize the session.
+
+        Args:
+            name: API name (used in logs)
+            min_interval: Seconds between requests (0 disables pacing)
+            timeout: Request timeout in seconds
+            cache: Response cache (None disables caching)
+            rate_limiter: Request limiter (default: one request per min_interval)
+            retry_statuses: Status codes retried with backoff by the transport
+        """
+        self.name = name
+        self.timeout = timeout
+        self.cache = cache
+        if rate_limiter is None and min_interval > 0:
+            rate = 1.0 / min_interval
+            rate_limiter = AdaptiveRateLimiter(rate=rate, min_rate=rate / 8, max_rate=rate)
+        self.rate_limiter = rate_limiter
+
+        self.session = requests.Session()
+        retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=list(retry_statuses),
+                               allowed_methods=["GET"])
+        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one request once the rate limiter allows it."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        with span(f'http.{self.name}') as profile_span:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            if is_enabled():
+                profile_span.add_bytes(len(response.content))
+        if self.rate_limiter:
+            if response.status_code == 429:
+                self.rate_limiter.on_throttle()
+            else:
+                self.rate_limiter.on_success()
+        return response
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, ttl: float = 0) -> CachedResponse:
+        """
+        GET a URL, answering from the cache while a stored response is fresh.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Request headers (not part of the cache key)
+            ttl: Seconds a successful response is cached (0 disables caching)
+
+        Returns:
+            CachedResponse
+        """
+        cache_key = request_key('GET', url, params) if self.cache and ttl > 0 else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.debug(f"{self.name} cache hit: {cache_key}")
+                return CachedResponse(cached[0], cached[1], True)
+
+        response = self._send('GET', url, params=params, headers=headers)
+        if cache_key and response.status_code == 200:
+            self.cache.put(cache_key, response.status_code, response.text, ttl)
+        return CachedResponse(response.status_code, response.text, False)
+
+    def post(self, url: str, json_body: Optional[Dict[str, Any]] = None) -> CachedResponse:
+        """
+        POST a JSON body (never cached).
+
+        Args:
+            url: Request URL
+            json_body: JSON request body
+
+        Returns:
+            CachedResponse
+        """
+        response = self._send('POST', url, json=json_body)
+        return CachedResponse(response.status_code, response.text, False)
@@ -0,0 +1,283 @@
+"""Declarative keyword rules compiled into one Aho-Corasick automaton.
+
+Keyword pre-filters used to be hand-written ``any(pattern in name for pattern
+in [...])`` loops: every list was rescanned for every filename, so the cost
+grew with the number of rules, and the lists were scattered over the
+AutoOrganizer, the reorganization analyzer and the TV duplicate detector.
+
+A rule set maps categories (in priority order) to keyword lists.  The rule
+tables live under ``classification_rules`` in media_config.yaml, with the
+defaults below used for any table the config leaves out.  All keywords of a
+set are compiled into a single Aho-Corasick automaton, so one pass over a
+string reports every matching keyword and category, however many rules
+there are.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..config.config import config
+
+# Default rule tables (overridable per table in media_config.yaml)
+DEFAULT_RULES: Dict[str, Dict[str, List[str]]] = {
+    # AutoOrganizer: filenames classified without AI (MediaType values)
+    'prefilter': {
+        'TV': ['s0', 's1', 's2', 's3', 's4', 's5', 's6', 's7', 's8', 's9', 'season', 'episode'],
+        'DOCUMENTARY': ['documentary', 'docu', 'bbc', 'nat geo', 'national geographic'],
+        'STANDUP': ['standup', 'stand-up', 'comedy special', 'chappelle', 'carlin'],
+    },
+    # Reorganization analyzer: rule-based category of a file
+    'reorganizer': {
+        'documentaries': [
+            'documentary', 'docu', 'documental', 'documentry',
+            'national geographic', 'nat geo', 'natgeo', 'bbc', 'discovery',
+            'nature', 'wildlife', 'planet earth', 'blue planet', 'cosmos',
+            'history channel', 'history.com', 'biography', 'nova', 'frontline',
+            'pbs', 'hbo documentary', 'netflix documentary', 'vice',
+            'smithsonian', 'cnn', 'msnbc documentary',
+            'investigation', 'expose', 'revealed', 'untold story',
+            'behind the scenes', 'making of', 'the real', 'true story',
+            'conspiracy', 'mystery', 'unsolved', 'crime documentary',
+            'science', 'evolution', 'universe', 'space', 'quantum',
+            'climate', 'environment', 'archaeology', 'anthropology',
+        ],
+        'standup': [
+            'standup', 'stand-up', 'stand up', 'comedy special', 'live comedy',
+            'comedy central', 'netflix comedy', 'hbo comedy', 'showtime comedy',
+            'chappelle', 'carlin', 'pryor', 'murphy', 'rock', 'burr', 'hart',
+            'amy schumer', 'tina fey', 'louis ck', 'bill hicks', 'robin williams',
+            'jerry seinfeld', 'kevin hart', 'john mulaney', 'trevor noah',
+            'live at', 'live from', 'sticks and stones', 'killed them softly',
+            'raw', 'delirious', 'bigger and blacker', 'never scared',
+        ],
+        'tv': [
+            's0', 's1', 's2', 's3', 's4', 's5', 's6', 's7', 's8', 's9',
+            'season', 'episode',
+            'e0', 'e1', 'e2', 'e3', 'e4', 'e5', 'e6', 'e7', 'e8', 'e9',
+            '1x0', '2x0', '3x0', '4x0', '5x0', '6x0', '7x0', '8x0', '9x0', '0x0',
+            'part1', 'part2', 'part3', 'part 1', 'part 2', 'part 3',
+        ],
+        'movies': [
+            'cd1', 'cd2', 'disc1', 'disc2',
+            '(19', '(20', ' 19', ' 20', '.19', '.20',
+            'bluray', 'blu-ray', 'dvdrip', 'webrip', 'hdtv', 'hdcam',
+            'ts', 'cam', 'dvdscr', 'bdrip', 'brrip', 'hdtc',
+            '1080p', '720p', '480p', '4k', 'uhd',
+            'x264', 'x265', 'xvid', 'divx',
+            'directors cut', 'extended', 'unrated', 'theatrical',
+            'criterion', 'remastered', 'restored',
+        ],
+    },
+    # Reorganization analyzer: path fragments of a TV folder structure
+    'tv_path_indicators': {
+        'tv': ['season', 'episode', 's01', 's02', 's03', 's04', 's05', 'complete series', 'tv series'],
+    },
+    # TV duplicate detector: whole words that mark different content
+    'content_differentiators': {
+        'differentiator': [
+            'alaska', 'boston', 'dubai', 'tokyo', 'hong kong', 'iceland', 'venice',
+            'transatlantic', 'panama', 'gotthard', 'cooper river', 'oakland',
+            'tunnel', 'bridge', 'airport', 'stadium', 'platform', 'excavator',
+            'dam', 'cable car', 'subway', 'pyramid', 'resort', 'barriers',
+            'part 1', 'part 2', 'part i', 'part ii', 'chapter', 'volume',
+            'disc 1', 'disc 2', 'cd1', 'cd2',
+        ],
+    },
+}
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton finding every occurrence of many keywords in one pass."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to find (matched exactly as given)
+        """
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for keyword in keywords:
+            if keyword:
+                self._add(keyword)
+        self._link()
+
+    def _add(self, keyword: str) -> None:
+        """Add a keyword to the trie."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(len(self.keywords))
+        self.keywords.append(keyword)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge their outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link if link != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Find every keyword occurrence in a text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start offset, keyword index) for each occurrence, by end offset
+        """
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self.keywords
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield end - len(keywords[index]), index
+
+
+class KeywordHit(NamedTuple):
+    """One keyword occurrence."""
+    start: int       # Offset of the keyword in the scanned text
+    keyword: str
+    category: str
+
+
+class KeywordMatches:
+    """Every rule hit found in one scan, queried by category."""
+
+    def __init__(self, hits: List[KeywordHit], rule_set: 'KeywordRuleSet'):
+        self.hits = hits
+        self._rule_set = rule_set
+
+    def __bool__(self) -> bool:
+        return bool(self.hits)
+
+    def categories(self, start: int = 0) -> List[str]:
+        """
+        Get the categories with a hit, in rule priority order.
+
+        Args:
+            start: Only count hits starting at or after this offset
+
+        Returns:
+            List of category names
+        """
+        found = {hit.category for hit in self.hits if hit.start >= start}
+        return [category for category in self._rule_set.categories if category in found]
+
+    def first(self, start: int = 0) -> Optional[str]:
+        """
+        Get the highest-priority category with a hit.
+
+        Args:
+            start: Only count hits starting at or after this offset
+
+        Returns:
+            Category name or None
+        """
+        categories = self.categories(start)
+        return categories[0] if categories else None
+
+    def keywords(self, category: str, start: int = 0) -> List[str]:
+        """
+        Get a category's matching keywords, in the order the rule lists them.
+
+        Args:
+            category: Category name
+            start: Only count hits starting at or after this offset
+
+        Returns:
+            List of keywords
+        """
+        found = {hit.keyword for hit in self.hits if hit.category == category and hit.start >= start}
+        return [keyword for keyword in self._rule_set.rules.get(category, []) if keyword in found]
+
+
+class KeywordRuleSet:
+    """Category -> keywords table evaluated with a single automaton pass."""
+
+    def __init__(self, rules: Dict[str, Iterable[str]], whole_words: bool = False):
+        """
+        Compile a rule table.
+
+        Args:
+            rules: Category -> keywords, in priority order (keywords are lowercased)
+            whole_words: Only match keywords not adjoined by letters or digits
+        """
+        self.rules: Dict[str, List[str]] = {
+            category: [keyword.lower() for keyword in keywords if keyword]
+            for category, keywords in rules.items()
+        }
+        self.categories = list(self.rules)
+        self.whole_words = whole_words
+
+        keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in self.rules.items():
+            for keyword in keywords:
+                categories = keyword_categories.setdefault(keyword, [])
+                if category not in categories:
+                    categories.append(category)
+        self._automaton = KeywordAutomaton(keyword_categories)
+        self._categories_by_index = [keyword_categories[k] for k in self._automaton.keywords]
+
+    def scan(self, text: str) -> KeywordMatches:
+        """
+        Find every rule hit in a text with one pass.
+
+        Args:
+            text: Text to scan (lowercased before matching)
+
+        Returns:
+            KeywordMatches
+        """
+        text = text.lower()
+        keywords = self._automaton.keywords
+        hits = []
+        for start, index in self._automaton.iter_matches(text):
+            keyword = keywords[index]
+            if self.whole_words:
+                end = start + len(keyword)
+                if (start > 0 and text[start - 1].isalnum()) or (end < len(text) and text[end].isalnum()):
+                    continue
+            for category in self._categories_by_index[index]:
+                hits.append(KeywordHit(start, keyword, category))
+        return KeywordMatches(hits, self)
+
+    def all_keywords(self) -> List[str]:
+        """Get every keyword of the rule set."""
+        return list(self._automaton.keywords)
+
+
+def load_rule_set(name: str, whole_words: bool = False) -> KeywordRuleSet:
+    """
+    Compile a rule table from media_config.yaml (or its built-in default).
+
+    Args:
+        name: Table name under ``classification_rules``
+        whole_words: Only match whole words
+
+    Returns:
+        KeywordRuleSet
+    """
+    rules = config.classification_rules.get(name) or DEFAULT_RULES.get(name, {})
+    return KeywordRuleSet(rules, whole_words=whole_words)
@@ -4,14 +4,26 @@ Log Analysis Utility for Media Reorganization
 This module provides tools to analyze the detailed logs generated by the media
 reorganization system for deep insights into performance, classification accuracy,
 and decision patterns.
+
+Sessions that wrote a structured event stream
+(``media_reorganizer_<session>.events.jsonl``) are read from its typed
+records; older sessions fall back to the text log, parsed in a single
+streaming pass (every line goes to all extractors at once).  Either way the
+extracted session data is stored in a small SQLite index next to the logs, so
+repeat analyses and session comparisons read precomputed rows instead of
+rescanning multi-hundred-MB files.
 """
 
 import re
 import json
+import sqlite3
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+
+from .event_stream import CLASSIFICATION, PHASE, SESSION, events_path, read_columns
+
 # Optional dependencies for advanced analysis
 try:
     import pandas as pd
@@ -63,57 +75,621 @@ class SessionAnalysis:
     misplaced_events: List[MisplacedFileEvent]
 
 
+# Log line prefix written by the reorganizer's file handler
+_TIMESTAMP_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Lines after "MISPLACED FILE DETECTED:" that carry the file details
+_MISPLACED_DETAIL_LINES = 6
+
+# Separator around the classification statistics block
+_STATS_SEPARATOR = '=' * 40
+
+# Performance timings: (metric, marker, pattern); the first occurrence wins
+_PERFORMANCE_PATTERNS = [
+    ('database_loading_time', 'Database loaded in', re.compile(r'Database loaded in (\d+\.\d+) seconds')),
+    ('analysis_time', 'Analysis completed in', re.compile(r'Analysis completed in (\d+\.\d+) seconds')),
+    ('report_generation_time', 'Reports generated in', re.compile(r'Reports generated in (\d+\.\d+) seconds')),
+    ('total_time', 'Total analysis time:', re.compile(r'Total analysis time: (\d+\.\d+) seconds')),
+]
+
+# Classification statistics lines: (marker, pattern, (key, type) per group)
+_STATS_PATTERNS = [
+    ('Total Classifications:', re.compile(r'Total Classifications: (\d+)'),
+     [('total_classifications', int)]),
+    ('AI Classifications:', re.compile(r'AI Classifications: (\d+) \(Success: (\d+)\)'),
+     [('ai_calls', int), ('ai_success', int)]),
+    ('API Classifications:', re.compile(r'API Classifications: (\d+) \(Success: (\d+)\)'),
+     [('api_calls', int), ('api_success', int)]),
+    ('Rule-based Classifications:', re.compile(r'Rule-based Classifications: (\d+)'),
+     [('rule_based', int)]),
+    ('AI Success Rate:', re.compile(r'AI Success Rate: (\d+\.\d+)%'), [('ai_success_rate', float)]),
+    ('Average AI Time:', re.compile(r'Average AI Time: (\d+\.\d+)s'), [('avg_ai_time', float)]),
+    ('Average API Time:', re.compile(r'Average API Time: (\d+\.\d+)s'), [('avg_api_time', float)]),
+    ('Average Rule Time:', re.compile(r'Average Rule Time: (\d+\.\d+)s'), [('avg_rule_time', float)]),
+]
+
+_AI_EVENT_RE = re.compile(r'AI classification \(high confidence\): (.+?) -> (\w+) \((\d+\.\d+)\)')
+_MOVE_EVENT_RE = re.compile(r'suggests move: (.+?) from (\w+) to (\w+) \((\d+\.\d+)\)')
+_TOTAL_FILES_RE = re.compile(r'(\d{1,3}(?:,\d{3})*) files')
+_CATEGORIES_RE = re.compile(r'Current: (\w+) -> Suggested: (\w+)')
+_CONFIDENCE_RE = re.compile(r'Confidence: (\d+\.\d+)')
+_FILE_SIZE_RE = re.compile(r'(\d+\.\d+)\s*(\w+)')
+
+_INDEX_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        log_size INTEGER NOT NULL,
+        log_mtime REAL NOT NULL,
+        start_time TEXT,
+        end_time TEXT,
+        total_files INTEGER NOT NULL,
+        misplaced_files INTEGER NOT NULL,
+        misplaced_bytes INTEGER NOT NULL,
+        classification_stats TEXT NOT NULL,
+        performance_metrics TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS classification_events (
+        session_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        filename TEXT NOT NULL,
+        current_category TEXT NOT NULL,
+        method TEXT NOT NULL,
+        suggested_category TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        reasoning TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS misplaced_events (
+        session_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        filename TEXT NOT NULL,
+        current_category TEXT NOT NULL,
+        suggested_category TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        reasoning TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        file_path TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_classification_session ON classification_events(session_id);
+    CREATE INDEX IF NOT EXISTS idx_misplaced_session ON misplaced_events(session_id);
+'''
+
+
+def _parse_file_size(size_text: str) -> int:
+    """Parse file size from human-readable format to bytes."""
+    match = _FILE_SIZE_RE.match(size_text.strip())
+    if match:
+        size_value = float(match.group(1))
+        unit = match.group(2).upper()
+        
+        multipliers = {
+            'B': 1,
+            'KB': 1024,
+            'MB': 1024**2,
+            'GB': 1024**3,
+            'TB': 1024**4
+        }
+        
+        return int(size_value * multipliers.get(unit, 1))
+    
+    return 0
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    """Serialize an optional timestamp for the index."""
+    return value.isoformat() if value else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    """Deserialize an optional timestamp from the index."""
+    return datetime.fromisoformat(value) if value else None
+
+
+class SessionLogParser:
+    """Single-pass parser: each log line is offered to every extractor once."""
+    
+    def __init__(self, session_id: str):
+        """
+        Initialize the parser.
+        
+        Args:
+            session_id: Session the log belongs to
+        """
+        self.session_id = session_id
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
+        self.total_files = 0
+        self.performance_metrics: Dict = {}
+        self.classification_stats: Dict = {}
+        self.classification_events: List[ClassificationEvent] = []
+        self.misplaced_events: List[MisplacedFileEvent] = []
+        
+        # Misplaced blocks still collecting detail lines: [timestamp, details, lines left]
+        self._open_misplaced: List[list] = []
+        # Statistics block: 'pending' after its header, 'open' between separators
+        self._stats_state: Optional[str] = None
+        self._stats_done = False
+    
+    def feed(self, line: str) -> None:
+        """
+        Extract everything a log line contributes.
+        
+        Args:
+            line: One log line (without the newline)
+        """
+        if self._open_misplaced:
+            self._feed_misplaced_details(line)
+        
+        timestamp_match = _TIMESTAMP_RE.match(line)
+        timestamp_text = timestamp_match.group(1) if timestamp_match else None
+        
+        # Session information (later lines win)
+        if "Session Started:" in line:
+            if timestamp_text:
+                self.start_time = datetime.strptime(timestamp_text, _TIMESTAMP_FORMAT)
+        elif "Analysis session completed successfully" in line:
+            if timestamp_text:
+                self.end_time = datetime.strptime(timestamp_text, _TIMESTAMP_FORMAT)
+        elif "Database loaded" in line and "files" in line:
+            match = _TOTAL_FILES_RE.search(line)
+            if match:
+                self.total_files = int(match.group(1).replace(',', ''))
+        
+        # Classification events
+        if timestamp_text and ("suggests move" in line or "high confidence" in line) \
+                and "classification" in line.lower():
+            self._feed_classification_event(line, timestamp_text)
+        
+        # Misplaced file blocks (details arrive on the following lines)
+        if "MISPLACED FILE DETECTED:" in line and timestamp_text:
+            timestamp = datetime.strptime(timestamp_text, _TIMESTAMP_FORMAT)
+            self._open_misplaced.append([timestamp, {}, _MISPLACED_DETAIL_LINES])
+        
+        # Performance timings
+        for metric, marker, pattern in _PERFORMANCE_PATTERNS:
+            if metric not in self.performance_metrics and marker in line:
+                match = pattern.search(line)
+                if match:
+                    self.performance_metrics[metric] = float(match.group(1))
+        
+        # Classification statistics (first block only)
+        if not self._stats_done:
+            self._feed_stats(line)
+    
+    def _feed_classification_event(self, line: str, timestamp_text: str) -> None:
+        """Parse an AI or rule-based classification line."""
+        timestamp = datetime.strptime(timestamp_text, _TIMESTAMP_FORMAT)
+        if "AI classification (high confidence)" in line:
+            match = _AI_EVENT_RE.search(line)
+            if match:
+                self.classification_events.append(ClassificationEvent(
+                    timestamp=timestamp,
+                    filename=match.group(1),
+                    current_category="unknown",  # Not always available in this log line
+                    method="AI",
+                    suggested_category=match.group(2),
+                    confidence=float(match.group(3)),
+                    reasoning="High confidence AI classification"
+                ))
+        elif "suggests move" in line:
+            match = _MOVE_EVENT_RE.search(line)
+            if match:
+                self.classification_events.append(ClassificationEvent(
+                    timestamp=timestamp,
+                    filename=match.group(1),
+                    current_category=match.group(2),
+                    method="Rule-based",
+                    suggested_category=match.group(3),
+                    confidence=float(match.group(4)),
+                    reasoning="Rule-based classification suggests move"
+                ))
+    
+    def _feed_misplaced_details(self, line: str) -> None:
+        """Add a detail line to every open misplaced block and close finished ones."""
+        for block in self._open_misplaced:
+            details = block[1]
+            if "File:" in line:
+                details['filename'] = line.split("File: ")[1].strip()
+            elif "Current:" in line and "Suggested:" in line:
+                match = _CATEGORIES_RE.search(line)
+                if match:
+                    details['current_category'] = match.group(1)
+                    details['suggested_category'] = match.group(2)
+            elif "Confidence:" in line:
+                match = _CONFIDENCE_RE.search(line)
+                if match:
+                    details['confidence'] = float(match.group(1))
+            elif "Reasoning:" in line:
+                details['reasoning'] = line.split("Reasoning: ")[1].strip()
+            elif "Size:" in line:
+                details['file_size'] = _parse_file_size(line.split("Size: ")[1])
+            elif "Path:" in line:
+                details['file_path'] = line.split("Path: ")[1].strip()
+            block[2] -= 1
+        
+        while self._open_misplaced and self._open_misplaced[0][2] == 0:
+            self._close_misplaced(self._open_misplaced.pop(0))
+    
+    def _close_misplaced(self, block: list) -> None:
+        """Record a misplaced block if it has enough data."""
+        timestamp, details, _ = block
+        if all(key in details for key in ['filename', 'current_category', 'suggested_category', 'confidence']):
+            self.misplaced_events.append(MisplacedFileEvent(
+                timestamp=timestamp,
+                filename=details['filename'],
+                current_category=details['current_category'],
+                suggested_category=details['suggested_category'],
+                confidence=details['confidence'],
+                reasoning=details.get('reasoning', ''),
+                file_size=details.get('file_size', 0),
+                file_path=details.get('file_path', '')
+            ))
+    
+    def _feed_stats(self, line: str) -> None:
+        """Track the statistics block and parse the lines inside it."""
+        if self._stats_state is None:
+            if "CLASSIFICATION STATISTICS" in line:
+                self._stats_state = 'pending'
+            return
+        if _STATS_SEPARATOR in line:
+            if self._stats_state == 'pending':
+                self._stats_state = 'open'
+            else:
+                self._stats_done = True
+            return
+        if self._stats_state != 'open':
+            return
+        
+        for marker, pattern, fields in _STATS_PATTERNS:
+            if marker in line:
+                match = pattern.search(line)
+                if match:
+                    for group, (key, cast) in enumerate(fields, 1):
+                        self.classification_stats[key] = cast(match.group(group))
+                break
+    
+    def finish(self) -> SessionAnalysis:
+        """
+        Close open blocks and build the session analysis.
+        
+        Returns:
+            SessionAnalysis
+        """
+        while self._open_misplaced:
+            self._close_misplaced(self._open_misplaced.pop(0))
+        if not self._stats_done:
+            # An unterminated statistics block is not a complete section
+            self.classification_stats = {}
+        
+        duration = self.end_time - self.start_time if self.start_time and self.end_time else timedelta(0)
+        return SessionAnalysis(
+            session_id=self.session_id,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            total_duration=duration,
+            total_files=self.total_files,
+            misplaced_files=len(self.misplaced_events),
+            classification_stats=self.classification_stats,
+            performance_metrics=self.performance_metrics,
+            classification_events=self.classification_events,
+            misplaced_events=self.misplaced_events
+        )
+
+
+class SessionIndex:
+    """SQLite index of parsed sessions, refreshed when a log file changes."""
+    
+    def __init__(self, index_path: Path):
+        """
+        Initialize the index.
+        
+        Args:
+            index_path: Index database path
+        """
+        self.index_path = Path(index_path)
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Open the index database on first use."""
+        if self._conn is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.index_path))
+            self._conn.executescript(_INDEX_SCHEMA)
+        return self._conn
+    
+    def is_current(self, session_id: str, log_size: int, log_mtime: float) -> bool:
+        """
+        Check whether a session is indexed from the log as it is now.
+        
+        Args:
+            session_id: Session ID
+            log_size: Current log size in bytes
+            log_mtime: Current log modification time
+            
+        Returns:
+            True if the indexed copy is up to date
+        """
+        row = self._connection().execute(
+            'SELECT log_size, log_mtime FROM sessions WHERE session_id = ?', (session_id,)
+        ).fetchone()
+        return row is not None and row[0] == log_size and row[1] == log_mtime
+    
+    def contains(self, session_id: str) -> bool:
+        """Check whether a session is indexed at all."""
+        row = self._connection().execute(
+            'SELECT 1 FROM sessions WHERE session_id = ?', (session_id,)
+        ).fetchone()
+        return row is not None
+    
+    def store(self, session: SessionAnalysis, log_size: int, log_mtime: float) -> None:
+        """
+        Replace a session's indexed data.
+        
+        Args:
+            session: Parsed session
+            log_size: Log size in bytes when parsed
+            log_mtime: Log modification time when parsed
+        """
+        conn = self._connection()
+        with conn:
+            for table in ('sessions', 'classification_events', 'misplaced_events'):
+                conn.execute(f'DELETE FROM {table} WHERE session_id = ?', (session.session_id,))
+            conn.execute(
+                'INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (session.session_id, log_size, log_mtime,
+                 _to_text(session.start_time), _to_text(session.end_time),
+                 session.total_files, session.misplaced_files,
+                 sum(event.file_size for event in session.misplaced_events),
+                 json.dumps(session.classification_stats), json.dumps(session.performance_metrics))
+            )
+            conn.executemany(
+                'INSERT INTO classification_events VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(session.session_id, event.timestamp.isoformat(), event.filename, event.current_category,
+                  event.method, event.suggested_category, event.confidence, event.reasoning)
+                 for event in session.classification_events]
+            )
+            conn.executemany(
+                'INSERT INTO misplaced_events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(session.session_id, event.timestamp.isoformat(), event.filename, event.current_category,
+                  event.suggested_category, event.confidence, event.reasoning, event.file_size, event.file_path)
+                 for event in session.misplaced_events]
+            )
+    
+    def load(self, session_id: str) -> Optional[SessionAnalysis]:
+        """
+        Rebuild a session analysis from the index.
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            SessionAnalysis or None if not indexed
+        """
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT start_time, end_time, total_files, misplaced_files, classification_stats, '
+            'performance_metrics FROM sessions WHERE session_id = ?', (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        start_time, end_time = _from_text(row[0]), _from_text(row[1])
+        classification_events = [
+            ClassificationEvent(_from_text(r[0]), r[1], r[2], r[3], r[4], r[5], r[6])
+            for r in conn.execute(
+                'SELECT timestamp, filename, current_category, method, suggested_category, confidence, '
+                'reasoning FROM classification_events WHERE session_id = ? ORDER BY rowid', (session_id,))
+        ]
+        misplaced_events = [
+            MisplacedFileEvent(_from_text(r[0]), r[1], r[2], r[3], r[4], r[5], r[6], r[7])
+            for r in conn.execute(
+                'SELECT timestamp, filename, current_category, suggested_category, confidence, reasoning, '
+                'file_size, file_path FROM misplaced_events WHERE session_id = ? ORDER BY rowid', (session_id,))
+        ]
+        return SessionAnalysis(
+            session_id=session_id,
+            start_time=start_time,
+            end_time=end_time,
+            total_duration=end_time - start_time if start_time and end_time else timedelta(0),
+            total_files=row[2],
+            misplaced_files=row[3],
+            classification_stats=json.loads(row[4]),
+            performance_metrics=json.loads(row[5]),
+            classification_events=classification_events,
+            misplaced_events=misplaced_events
+        )
+    
+    def summaries(self, session_ids: List[str]) -> List[Dict]:
+        """
+        Get per-session aggregates without loading any events.
+        
+        Args:
+            session_ids: Session IDs (result keeps this order; unknown IDs are skipped)
+            
+        Returns:
+            List of summary dictionaries
+        """
+        conn = self._connection()
+        summaries = []
+        for session_id in session_ids:
+            row = conn.execute(
+                'SELECT start_time, end_time, total_files, misplaced_files, misplaced_bytes, '
+                'classification_stats, performance_metrics FROM sessions WHERE session_id = ?', (session_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            start_time, end_time = _from_text(row[0]), _from_text(row[1])
+            summaries.append({
+                'session_id': session_id,
+                'duration': end_time - start_time if start_time and end_time else timedelta(0),
+                'total_files': row[2],
+                'misplaced_files': row[3],
+                'misplaced_bytes': row[4],
+                'classification_stats': json.loads(row[5]),
+                'performance_metrics': json.loads(row[6]),
+            })
+        return summaries
+    
+    def transition_counts(self, session_ids: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Count misplaced files per category transition and session.
+        
+        Args:
+            session_ids: Session IDs
+            
+        Returns:
+            Dictionary of "current → suggested" -> {session_id: count}
+        """
+        if not session_ids:
+            return {}
+        placeholders = ', '.join('?' for _ in session_ids)
+        rows = self._connection().execute(
+            f'SELECT current_category, suggested_category, session_id, COUNT(*) FROM misplaced_events '
+            f'WHERE session_id IN ({placeholders}) '
+            f'GROUP BY current_category, suggested_category, session_id',
+            list(session_ids)
+        ).fetchall()
+        
+        transitions: Dict[str, Dict[str, int]] = {}
+        for current, suggested, session_id, count in rows:
+            transitions.setdefault(f"{current} → {suggested}", {})[session_id] = count
+        return transitions
+    
+    def close(self) -> None:
+        """Close the index database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
 class LogAnalyzer:
     """Analyzes media reorganization logs for insights."""
     
-    def __init__(self, logs_directory: str = "logs"):
-        """Initialize the log analyzer."""
+    def __init__(self, logs_directory: str = "logs", index_path: Optional[str] = None):
+        """
+        Initialize the log analyzer.
+        
+        Args:
+            logs_directory: Directory holding media_reorganizer_<session>.log files
+            index_path: Session index database (defaults to session_index.db in the logs directory)
+        """
         self.logs_dir = Path(logs_directory)
-        self.session_pattern = re.compile(r'media_reorganizer_(\d{8}_\d{6})\.log')
+        self.session_pattern = re.compile(r'media_reorganizer_(\d{8}_\d{6})\.(?:log|events\.jsonl)$')
+        self.index = SessionIndex(Path(index_path) if index_path else self.logs_dir / "session_index.db")
         
     def get_available_sessions(self) -> List[str]:
         """Get list of available session IDs."""
-        sessions = []
+        sessions = set()
         if self.logs_dir.exists():
-            for log_file in self.logs_dir.glob("media_reorganizer_*.log"):
+            for log_file in self.logs_dir.glob("media_reorganizer_*"):
                 match = self.session_pattern.match(log_file.name)
                 if match:
-                    sessions.append(match.group(1))
+                    sessions.add(match.group(1))
         return sorted(sessions, reverse=True)
     
-    def analyze_session(self, session_id: str) -> Optional[SessionAnalysis]:
-        """Analyze a specific session log."""
+    def _ensure_indexed(self, session_id: str) -> Tuple[bool, Optional[SessionAnalysis]]:
+        """
+        Make sure the index holds the session, parsing its log only if it changed.
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            (indexed, analysis) - analysis is set when the log was parsed just now
+        """
+        # Prefer the structured event stream over the text log
+        events_file = events_path(self.logs_dir, "media_reorganizer", session_id)
         log_file = self.logs_dir / f"media_reorganizer_{session_id}.log"
-        if not log_file.exists():
+        source = events_file if events_file.exists() else log_file
+        if not source.exists():
+            if self.index.contains(session_id):
+                return True, None
             print(f"Log file not found: {log_file}")
-            return None
+            return False, None
+        
+        stat = source.stat()
+        if self.index.is_current(session_id, stat.st_size, stat.st_mtime):
+            return True, None
         
         print(f"Analyzing session: {session_id}")
+        if source == events_file:
+            analysis = self.parse_events(events_file, session_id)
+        else:
+            analysis = self.parse_log(log_file, session_id)
+        self.index.store(analysis, stat.st_size, stat.st_mtime)
+        return True, analysis
+    
+    def parse_log(self, log_file: Path, session_id: str) -> SessionAnalysis:
+        """
+        Parse a session log in one streaming pass.
         
+        Args:
+            log_file: Log file path
+            session_id: Session ID
+            
+        Returns:
+            SessionAnalysis
+        """
+        parser = SessionLogParser(session_id)
         with open(log_file, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-        
-        # Parse session metadata
-        session_info = self._parse_session_info(log_content, session_id)
-        
-        # Parse classification events
-        classification_events = self._parse_classification_events(log_content)
-        
-        # Parse misplaced file events
-        misplaced_events = self._parse_misplaced_events(log_content)
-        
-        # Parse performance metrics
-        performance_metrics = self._parse_performance_metrics(log_content)
+            for line in f:
+                parser.feed(line.rstrip('\n'))
+        return parser.finish()
+    
+    def parse_events(self, events_file: Path, session_id: str) -> SessionAnalysis:
+        """
+        Build a session analysis from a reorganizer event stream.
         
-        # Parse classification statistics
-        classification_stats = self._parse_classification_stats(log_content)
+        Args:
+            events_file: Event stream path
+            session_id: Session ID
+            
+        Returns:
+            SessionAnalysis
+        """
+        tables = read_columns(events_file, {
+            SESSION: ['ts', 'status'],
+            PHASE: ['ts', 'name', 'seconds', 'files', 'classification_stats'],
+            CLASSIFICATION: ['ts', 'filename', 'current_category', 'suggested_category', 'confidence',
+                             'method', 'reasoning', 'misplaced', 'file_size', 'file_path'],
+        })
+        
+        session = tables[SESSION]
+        starts = [ts for ts, status in zip(session['ts'], session['status']) if status == 'started']
+        ends = [ts for ts, status in zip(session['ts'], session['status']) if status == 'completed']
+        start_time = datetime.fromtimestamp(starts[-1]) if starts else None
+        end_time = datetime.fromtimestamp(ends[-1]) if ends else None
+        
+        performance_metrics = {}
+        classification_stats = {}
+        total_files = 0
+        phases = tables[PHASE]
+        for name, seconds, files, stats in zip(phases['name'], phases['seconds'], phases['files'],
+                                               phases['classification_stats']):
+            performance_metrics[f"{name}_time"] = seconds
+            if files is not None:
+                total_files = files
+            if stats:
+                classification_stats = stats
+        
+        classification_events = []
+        misplaced_events = []
+        rows = tables[CLASSIFICATION]
+        for ts, filename, current, suggested, confidence, method, reasoning, misplaced, size, path in zip(
+                *rows.values()):
+            timestamp = datetime.fromtimestamp(ts)
+            classification_events.append(ClassificationEvent(
+                timestamp, filename, current, method, suggested, confidence, reasoning or ''))
+            if misplaced:
+                misplaced_events.append(MisplacedFileEvent(
+                    timestamp, filename, current, suggested, confidence, reasoning or '', size or 0, path or ''))
         
         return SessionAnalysis(
             session_id=session_id,
-            start_time=session_info['start_time'],
-            end_time=session_info['end_time'],
-            total_duration=session_info['duration'],
-            total_files=session_info['total_files'],
+            start_time=start_time,
+            end_time=end_time,
+            total_duration=end_time - start_time if start_time and end_time else timedelta(0),
+            total_files=total_files,
             misplaced_files=len(misplaced_events),
             classification_stats=classification_stats,
             performance_metrics=performance_metrics,
@@ -121,239 +697,12 @@ class LogAnalyzer:
             misplaced_events=misplaced_events
         )
     
-    def _parse_session_info(self, log_content: str, session_id: str) -> Dict:
-        """Parse basic session information."""
-        lines = log_content.split('\n')
-        
-        start_time = None
-        end_time = None
-        total_files = 0
-        
-        for line in lines:
-            if "Session Started:" in line:
-                # Extract timestamp from log line
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if timestamp_match:
-                    start_time = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-            
-            elif "Analysis session completed successfully" in line:
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if timestamp_match:
-                    end_time = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-            
-            elif "Database loaded" in line and "files" in line:
-                # Extract total files count
-                match = re.search(r'(\d{1,3}(?:,\d{3})*) files', line)
-                if match:
-                    total_files = int(match.group(1).replace(',', ''))
-        
-        duration = end_time - start_time if start_time and end_time else timedelta(0)
-        
-        return {
-            'start_time': start_time,
-            'end_time': end_time,
-            'duration': duration,
-            'total_files': total_files
-        }
-    
-    def _parse_classification_events(self, log_content: str) -> List[ClassificationEvent]:
-        """Parse individual classification events."""
-        events = []
-        lines = log_content.split('\n')
-        
-        for line in lines:
-            if "classification" in line.lower() and ("suggests move" in line or "high confidence" in line):
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if timestamp_match:
-                    timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-                    
-                    # Parse different classification event types
-                    if "AI classification (high confidence)" in line:
-                        # AI classification event
-                        match = re.search(r'AI classification \(high confidence\): (.+?) -> (\w+) \((\d+\.\d+)\)', line)
-                        if match:
-                            events.append(ClassificationEvent(
-                                timestamp=timestamp,
-                                filename=match.group(1),
-                                current_category="unknown",  # Not always available in this log line
-                                method="AI",
-                                suggested_category=match.group(2),
-                                confidence=float(match.group(3)),
-                                reasoning="High confidence AI classification"
-                            ))
-                    
-                    elif "suggests move" in line:
-                        # Rule-based classification suggesting move
-                        match = re.search(r'suggests move: (.+?) from (\w+) to (\w+) \((\d+\.\d+)\)', line)
-                        if match:
-                            events.append(ClassificationEvent(
-                                timestamp=timestamp,
-                                filename=match.group(1),
-                                current_category=match.group(2),
-                                method="Rule-based",
-                                suggested_category=match.group(3),
-                                confidence=float(match.group(4)),
-                                reasoning="Rule-based classification suggests move"
-                            ))
-        
-        return events
-    
-    def _parse_misplaced_events(self, log_content: str) -> List[MisplacedFileEvent]:
-        """Parse misplaced file detection events."""
-        events = []
-        lines = log_content.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if "MISPLACED FILE DETECTED:" in line:
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if timestamp_match:
-                    timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-                    
-                    # Parse the following lines for file details
-                    event_data = {}
-                    for j in range(1, 7):  # Check next 6 lines for file details
-                        if i + j < len(lines):
-                            detail_line = lines[i + j]
-                            
-                            if "File:" in detail_line:
-                                event_data['filename'] = detail_line.split("File: ")[1].strip()
-                            elif "Current:" in detail_line and "Suggested:" in detail_line:
-                                match = re.search(r'Current: (\w+) -> Suggested: (\w+)', detail_line)
-                                if match:
-                                    event_data['current_category'] = match.group(1)
-                                    event_data['suggested_category'] = match.group(2)
-                            elif "Confidence:" in detail_line:
-                                match = re.search(r'Confidence: (\d+\.\d+)', detail_line)
-                                if match:
-                                    event_data['confidence'] = float(match.group(1))
-                            elif "Reasoning:" in detail_line:
-                                event_data['reasoning'] = detail_line.split("Reasoning: ")[1].strip()
-                            elif "Size:" in detail_line:
-                                size_text = detail_line.split("Size: ")[1].strip()
-                                event_data['file_size'] = self._parse_file_size(size_text)
-                            elif "Path:" in detail_line:
-                                event_data['file_path'] = detail_line.split("Path: ")[1].strip()
-                    
-                    # Create event if we have enough data
-                    if all(key in event_data for key in ['filename', 'current_category', 'suggested_category', 'confidence']):
-                        events.append(MisplacedFileEvent(
-                            timestamp=timestamp,
-                            filename=event_data['filename'],
-                            current_category=event_data['current_category'],
-                            suggested_category=event_data['suggested_category'],
-                            confidence=event_data['confidence'],
-                            reasoning=event_data.get('reasoning', ''),
-                            file_size=event_data.get('file_size', 0),
-                            file_path=event_data.get('file_path', '')
-                        ))
-            i += 1
-        
-        return events
-    
-    def _parse_performance_metrics(self, log_content: str) -> Dict:
-        """Parse performance timing information."""
-        metrics = {}
-        
-        # Database loading time
-        db_match = re.search(r'Database loaded in (\d+\.\d+) seconds', log_content)
-        if db_match:
-            metrics['database_loading_time'] = float(db_match.group(1))
-        
-        # Analysis time
-        analysis_match = re.search(r'Analysis completed in (\d+\.\d+) seconds', log_content)
-        if analysis_match:
-            metrics['analysis_time'] = float(analysis_match.group(1))
-        
-        # Report generation time
-        report_match = re.search(r'Reports generated in (\d+\.\d+) seconds', log_content)
-        if report_match:
-            metrics['report_generation_time'] = float(report_match.group(1))
-        
-        # Total time
-        total_match = re.search(r'Total analysis time: (\d+\.\d+) seconds', log_content)
-        if total_match:
-            metrics['total_time'] = float(total_match.group(1))
-        
-        return metrics
-    
-    def _parse_classification_stats(self, log_content: str) -> Dict:
-        """Parse classification statistics."""
-        stats = {}
-        
-        # Look for the classification statistics section
-        stats_section = re.search(r'CLASSIFICATION STATISTICS.*?={40}(.*?)={40}', log_content, re.DOTALL)
-        if stats_section:
-            stats_text = stats_section.group(1)
-            
-            # Parse individual statistics
-            for line in stats_text.split('\n'):
-                if "Total Classifications:" in line:
-                    match = re.search(r'Total Classifications: (\d+)', line)
-                    if match:
-                        stats['total_classifications'] = int(match.group(1))
-                
-                elif "AI Classifications:" in line:
-                    match = re.search(r'AI Classifications: (\d+) \(Success: (\d+)\)', line)
-                    if match:
-                        stats['ai_calls'] = int(match.group(1))
-                        stats['ai_success'] = int(match.group(2))
-                
-                elif "API Classifications:" in line:
-                    match = re.search(r'API Classifications: (\d+) \(Success: (\d+)\)', line)
-                    if match:
-                        stats['api_calls'] = int(match.group(1))
-                        stats['api_success'] = int(match.group(2))
-                
-                elif "Rule-based Classifications:" in line:
-                    match = re.search(r'Rule-based Classifications: (\d+)', line)
-                    if match:
-                        stats['rule_based'] = int(match.group(1))
-                
-                elif "AI Success Rate:" in line:
-                    match = re.search(r'AI Success Rate: (\d+\.\d+)%', line)
-                    if match:
-                        stats['ai_success_rate'] = float(match.group(1))
-                
-                elif "Average AI Time:" in line:
-                    match = re.search(r'Average AI Time: (\d+\.\d+)s', line)
-                    if match:
-                        stats['avg_ai_time'] = float(match.group(1))
-                
-                elif "Average API Time:" in line:
-                    match = re.search(r'Average API Time: (\d+\.\d+)s', line)
-                    if match:
-                        stats['avg_api_time'] = float(match.group(1))
-                
-                elif "Average Rule Time:" in line:
-                    match = re.search(r'Average Rule Time: (\d+\.\d+)s', line)
-                    if match:
-                        stats['avg_rule_time'] = float(match.group(1))
-        
-        return stats
-    
-    def _parse_file_size(self, size_text: str) -> int:
-        """Parse file size from human-readable format to bytes."""
-        size_text = size_text.strip()
-        
-        # Extract number and unit
-        match = re.match(r'(\d+\.\d+)\s*(\w+)', size_text)
-        if match:
-            size_value = float(match.group(1))
-            unit = match.group(2).upper()
-            
-            multipliers = {
-                'B': 1,
-                'KB': 1024,
-                'MB': 1024**2,
-                'GB': 1024**3,
-                'TB': 1024**4
-            }
-            
-            return int(size_value * multipliers.get(unit, 1))
-        
-        return 0
+    def analyze_session(self, session_id: str) -> Optional[SessionAnalysis]:
+        """Analyze a specific session log (served from the index when unchanged)."""
+        indexed, analysis = self._ensure_indexed(session_id)
+        if not indexed:
+            return None
+        return analysis or self.index.load(session_id)
     
     def generate_analysis_report(self, session: SessionAnalysis, output_file: Optional[str] = None) -> str:
         """Generate a comprehensive analysis report."""
@@ -511,14 +860,11 @@ class LogAnalyzer:
         return report_text
     
     def compare_sessions(self, session_ids: List[str]) -> str:
-        """Compare multiple sessions for trend analysis."""
-        sessions = []
-        for session_id in session_ids:
-            session = self.analyze_session(session_id)
-            if session:
-                sessions.append(session)
+        """Compare multiple sessions for trend analysis (from the session index)."""
+        indexed_ids = [session_id for session_id in session_ids if self._ensure_indexed(session_id)[0]]
+        summaries = self.index.summaries(indexed_ids)
         
-        if not sessions:
+        if not summaries:
             return "No valid sessions found for comparison."
         
         report_lines = []
@@ -530,14 +876,25 @@ class LogAnalyzer:
         report_lines.append(f"{'Session ID':<17} {'Files':<8} {'Misplaced':<10} {'Rate %':<8} {'Duration':<10}")
         report_lines.append("-" * 70)
         
-        for session in sessions:
-            rate = (session.misplaced_files / session.total_files * 100) if session.total_files > 0 else 0
-            duration = str(session.total_duration).split('.')[0]  # Remove microseconds
-            report_lines.append(f"{session.session_id:<17} {session.total_files:<8,} {session.misplaced_files:<10,} {rate:<8.1f} {duration:<10}")
+        for summary in summaries:
+            total_files = summary['total_files']
+            rate = (summary['misplaced_files'] / total_files * 100) if total_files > 0 else 0
+            duration = str(summary['duration']).split('.')[0]  # Remove microseconds
+            report_lines.append(f"{summary['session_id']:<17} {total_files:<8,} {summary['misplaced_files']:<10,} {rate:<8.1f} {duration:<10}")
+        
+        # Category transitions per session
+        transitions = self.index.transition_counts([summary['session_id'] for summary in summaries])
+        if transitions:
+            report_lines.append("")
+            report_lines.append("CATEGORY TRANSITION TRENDS")
+            report_lines.append("-" * 70)
+            for transition, counts in sorted(transitions.items(), key=lambda x: -sum(x[1].values())):
+                per_session = ", ".join(f"{summary['session_id']}: {counts.get(summary['session_id'], 0):,}"
+                                        for summary in summaries)
+                report_lines.append(f"{transition}: {per_session}")
         
         return "\n".join(report_lines)
 
-
 def main():
     """CLI interface for log analysis."""
     analyzer = LogAnalyzer()
@@ -1,4 +1,4 @@
-"""JSON-based media database for fast query performance."""
+"""Media database for fast query performance (JSON or SQLite storage)."""
 
 import json
 import os
@@ -9,12 +9,55 @@ from dataclasses import dataclass, asdict
 import logging
 from datetime import datetime
 
-from .movie_scanner import scan_directory_for_movies, MovieFile
-from .tv_scanner import scan_directory_for_tv_episodes, TVEpisode, group_episodes_by_show
+from .fs_walker import FileEntry
+from .media_store import SQLiteMediaStore, is_sqlite_path
+from .profiler import span
+from .search_index import NgramIndex, SEARCH_CANDIDATE_LIMIT, search_terms
+from .movie_scanner import scan_directory_for_movies, movie_file_from_entry, MovieFile
+from .tv_scanner import (
+    scan_directory_for_tv_episodes, tv_episode_from_entry, TVEpisode, VIDEO_EXTENSIONS
+)
 from ..config.config import config
 
 logger = logging.getLogger(__name__)
 
+# Version 1.1 keys movies by file path and adds the movie_index
+DATABASE_VERSION = "1.1"
+
+# Directories modified this close to the previous scan are always re-listed,
+# because CIFS/SMB mtimes can have coarse (up to 2 second) resolution.
+MTIME_GRANULARITY_SECONDS = 2.0
+
+def default_database_path(backend: str = 'json') -> Path:
+    """
+    Get the default database file path for a storage backend.
+    
+    Args:
+        backend: Storage backend ('json' or 'sqlite')
+        
+    Returns:
+        Path inside the project's database directory
+    """
+    # Store database in database directory
+    project_root = Path(__file__).parent.parent.parent.parent
+    database_dir = project_root / "database"
+    database_dir.mkdir(exist_ok=True)
+    file_name = "media_database.db" if backend == 'sqlite' else "media_database.json"
+    return database_dir / file_name
+
+def movie_index_key(normalized_title: str, year: Optional[int]) -> str:
+    """
+    Build the movie index key for a normalized title and year.
+    
+    Args:
+        normalized_title: Normalized movie title
+        year: Release year, if known
+        
+    Returns:
+        Index key string
+    """
+    return f"{normalized_title}|{year or ''}"
+
 @dataclass
 class DatabaseStats:
     """Statistics about the media database."""
@@ -27,6 +70,25 @@ class DatabaseStats:
     build_time_seconds: float
     directories_scanned: List[str]
 
+@dataclass
+class RefreshDelta:
+    """Changes applied by an incremental database refresh."""
+    movies_added: int = 0
+    movies_removed: int = 0
+    movies_modified: int = 0
+    episodes_added: int = 0
+    episodes_removed: int = 0
+    episodes_modified: int = 0
+    directories_listed: int = 0
+    directories_skipped: int = 0
+    refresh_time_seconds: float = 0.0
+    
+    @property
+    def total_changes(self) -> int:
+        """Total number of added, removed and modified files."""
+        return (self.movies_added + self.movies_removed + self.movies_modified +
+                self.episodes_added + self.episodes_removed + self.episodes_modified)
+
 @dataclass
 class MovieEntry:
     """Movie entry in the database."""
@@ -65,33 +127,65 @@ class TVShowEntry:
     episodes: List[TVEpisodeEntry]
 
 class MediaDatabase:
-    """JSON-based media database for fast media queries."""
+    """Media database for fast media queries, stored as JSON or SQLite."""
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, backend: Optional[str] = None):
         """
         Initialize the media database.
         
         Args:
             db_path: Optional custom path for database file
+            backend: Optional storage backend ('json' or 'sqlite'). Defaults to
+                the database path suffix, then the configured backend.
         """
-        if db_path:
-            self.db_path = Path(db_path)
-        else:
-            # Store database in database directory
-            project_root = Path(__file__).parent.parent.parent.parent
-            database_dir = project_root / "database"
-            database_dir.mkdir(exist_ok=True)
-            self.db_path = database_dir / "media_database.json"
+        if backend is None:
+            if db_path:
+                backend = 'sqlite' if is_sqlite_path(Path(db_path)) else 'json'
+            else:
+                backend = config.media_database_backend
+        self.backend = backend
         
-        self.data: Dict[str, Any] = {}
+        self.db_path = Path(db_path) if db_path else default_database_path(backend)
+        
+        self.store: Optional[SQLiteMediaStore] = None
+        if backend == 'sqlite':
+            self.store = SQLiteMediaStore(self.db_path)
+        
+        self._data: Optional[Dict[str, Any]] = None
+        self._ngram_indexes: Dict[str, NgramIndex] = {}
+        self._movie_title_paths: Optional[Dict[str, List[str]]] = None
         self._load_database()
     
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Full database dictionary (loaded on first access for SQLite)."""
+        if self._data is None:
+            self._data = self.store.load_all()
+            self._build_movie_index()
+            self._build_search_indices()
+            logger.info(f"Loaded media database from {self.db_path}")
+        return self._data
+    
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
+        self._ngram_indexes = {}
+        self._movie_title_paths = None
+    
     def _load_database(self) -> None:
-        """Load database from JSON file."""
+        """Load database from JSON file (SQLite databases are loaded lazily)."""
+        if self.store is not None:
+            if not self.store.exists():
+                logger.info("Database file not found. Starting with empty database.")
+                self.data = self._get_empty_database()
+            return
+        
         if self.db_path.exists():
             try:
-                with open(self.db_path, 'r', encoding='utf-8') as f:
+                with span('db.load') as profile_span, open(self.db_path, 'r', encoding='utf-8') as f:
                     self.data = json.load(f)
+                    profile_span.add_bytes(f.tell())
+                self._upgrade_database()
                 logger.info(f"Loaded media database from {self.db_path}")
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load database: {e}. Starting with empty database.")
@@ -100,10 +194,20 @@ class MediaDatabase:
             logger.info("Database file not found. Starting with empty database.")
             self.data = self._get_empty_database()
     
+    def _upgrade_database(self) -> None:
+        """Upgrade databases that keyed movies by normalized title."""
+        if "movie_index" in self.data:
+            return
+        movies = self.data.get("movies", {})
+        self.data["movies"] = {movie["file_path"]: movie for movie in movies.values()}
+        self._build_movie_index()
+        self.data["version"] = DATABASE_VERSION
+        logger.info("Upgraded media database: movies are now keyed by file path")
+    
     def _get_empty_database(self) -> Dict[str, Any]:
         """Create empty database structure."""
         return {
-            "version": "1.0",
+            "version": DATABASE_VERSION,
             "created_at": datetime.now().isoformat(),
             "stats": {
                 "movies_count": 0,
@@ -115,21 +219,32 @@ class MediaDatabase:
                 "build_time_seconds": 0.0,
                 "directories_scanned": []
             },
-            "movies": {},  # normalized_title: MovieEntry
+            "movies": {},  # file_path: MovieEntry
+            "movie_index": {},  # "normalized_title|year" -> [file_path, ...]
             "tv_shows": {},  # normalized_name: TVShowEntry  
+            "directory_index": {  # directory -> {mtime, child_count, subdirs}
+                "movies": {},
+                "tv": {}
+            },
             "search_index": {
                 "movie_titles": {},  # normalized_title -> original_title
                 "tv_titles": {},     # normalized_name -> original_name
-                "all_titles": {}     # for general search
+                "all_titles": {},    # for general search
+                "movie_terms": {},   # token/trigram -> [normalized_title, ...]
+                "tv_terms": {}       # token/trigram -> [normalized_name, ...]
             }
         }
     
-    def rebuild_database(self, force: bool = False) -> DatabaseStats:
+    def rebuild_database(self, force: bool = False,
+                         movie_directories: Optional[List[str]] = None,
+                         tv_directories: Optional[List[str]] = None) -> DatabaseStats:
         """
         Rebuild the entire media database.
         
         Args:
             force: Force rebuild even if database seems current
+            movie_directories: Movie directories to scan (defaults to config)
+            tv_directories: TV directories to scan (defaults to config)
             
         Returns:
             DatabaseStats with information about the built database
@@ -141,8 +256,8 @@ class MediaDatabase:
         self.data = self._get_empty_database()
         
         # Scan all directories
-        movie_dirs = config.movie_directories
-        tv_dirs = config.tv_directories
+        movie_dirs = config.movie_directories if movie_directories is None else movie_directories
+        tv_dirs = config.tv_directories if tv_directories is None else tv_directories
         all_dirs = movie_dirs + tv_dirs
         
         # Scan movies
@@ -155,17 +270,19 @@ class MediaDatabase:
                 self._add_movies_to_database(movies)
                 logger.info(f"Added {len(movies)} movies from {movie_dir}")
         
-        # Scan TV shows  
+        # Scan TV shows (collected first so shows spanning several
+        # directories end up in a single entry)
         logger.info(f"Scanning {len(tv_dirs)} TV directories...")
-        total_episodes = 0
+        all_episodes = []
         for tv_dir in tv_dirs:
             if os.path.exists(tv_dir):
                 episodes = scan_directory_for_tv_episodes(tv_dir)
-                total_episodes += len(episodes) 
-                self._add_tv_episodes_to_database(episodes)
-                logger.info(f"Added {len(episodes)} TV episodes from {tv_dir}")
+                all_episodes.extend(episodes)
+                logger.info(f"Found {len(episodes)} TV episodes in {tv_dir}")
+        self._add_tv_episodes_to_database(all_episodes)
         
-        # Build search indices
+        # Build movie and search indices
+        self._build_movie_index()
         self._build_search_indices()
         
         # Update stats
@@ -193,64 +310,314 @@ class MediaDatabase:
                 file_name=movie.name,
                 file_size=movie.size,
                 directory=str(movie.path.parent),
-                last_modified=movie.path.stat().st_mtime
+                last_modified=movie.mtime
             )
             
-            # Use normalized title as key for easy lookup
-            self.data["movies"][movie.normalized_name] = asdict(entry)
+            # Key by file path so copies of the same title never collide
+            self.data["movies"][entry.file_path] = asdict(entry)
     
     def _add_tv_episodes_to_database(self, episodes: List[TVEpisode]) -> None:
         """Add TV episodes to the database."""
+        episode_entries = [asdict(self._create_episode_entry(episode)) for episode in episodes]
+        self._store_tv_episode_entries(episode_entries)
+    
+    def _create_episode_entry(self, episode: TVEpisode) -> TVEpisodeEntry:
+        """Create a database entry for a scanned TV episode."""
+        return TVEpisodeEntry(
+            show_name=episode.show_name,
+            normalized_show_name=episode.show_name.lower().strip(),
+            season=episode.season,
+            episode=episode.episode,
+            title=None,  # Could extract from filename in future
+            file_path=str(episode.path),
+            file_name=episode.name,
+            file_size=episode.size,
+            directory=str(episode.path.parent),
+            last_modified=episode.mtime
+        )
+    
+    def _store_tv_episode_entries(self, episode_entries: List[Dict[str, Any]]) -> None:
+        """Group episode entries by show and store the show summaries."""
         # Group episodes by show
-        show_groups = group_episodes_by_show(episodes)
+        show_groups: Dict[str, List[Dict[str, Any]]] = {}
+        for episode_entry in episode_entries:
+            show_groups.setdefault(episode_entry["normalized_show_name"], []).append(episode_entry)
         
-        for show_group in show_groups:
-            show_name = show_group.show_name
-            normalized_name = show_name.lower().strip()
-            
-            # Create episode entries
-            episode_entries = []
-            directories = set()
-            
-            for episode in show_group.episodes:
-                episode_entry = TVEpisodeEntry(
-                    show_name=episode.show_name,
-                    normalized_show_name=normalized_name,
-                    season=episode.season,
-                    episode=episode.episode,
-                    title=None,  # Could extract from filename in future
-                    file_path=str(episode.path),
-                    file_name=episode.name,
-                    file_size=episode.size,
-                    directory=str(episode.path.parent),
-                    last_modified=episode.path.stat().st_mtime
-                )
-                episode_entries.append(episode_entry)
-                directories.add(str(episode.path.parent))
+        for normalized_name, show_episodes in show_groups.items():
+            show_episodes.sort(key=lambda ep: ep["file_path"])
+            directories = set(ep["directory"] for ep in show_episodes)
             
             # Create show entry
             show_entry = TVShowEntry(
-                name=show_name,
+                name=show_episodes[0]["show_name"],
                 normalized_name=normalized_name,
-                total_episodes=len(episode_entries),
-                seasons=sorted(list(set(ep.season for ep in episode_entries))),
-                total_size=sum(ep.file_size for ep in episode_entries),
+                total_episodes=len(show_episodes),
+                seasons=sorted(set(ep["season"] for ep in show_episodes)),
+                total_size=sum(ep["file_size"] for ep in show_episodes),
                 directories=directories,
-                episodes=episode_entries
+                episodes=[]
             )
             
             # Convert to dict for JSON serialization
             show_dict = asdict(show_entry)
-            show_dict["directories"] = list(directories)  # Convert set to list
+            show_dict["directories"] = sorted(directories)  # Convert set to list
+            show_dict["episodes"] = show_episodes
             
             self.data["tv_shows"][normalized_name] = show_dict
     
+    def refresh_database(self) -> RefreshDelta:
+        """
+        Incrementally refresh the database from directory modification times.
+        
+        Directories whose mtime has not changed since the last refresh are not
+        listed again; their files are carried over from the existing entries.
+        Only changed directories are listed, and their files are reconciled
+        against the database as added, removed or modified.  The first refresh
+        after a full rebuild lists everything once to seed the directory index.
+        
+        Returns:
+            RefreshDelta describing the changes applied
+        """
+        start_time = time.time()
+        logger.info("Starting incremental media database refresh...")
+        
+        if not self.data.get("movies") and not self.data.get("tv_shows"):
+            self.data = self._get_empty_database()
+        
+        directory_index = self.data.setdefault("directory_index", {"movies": {}, "tv": {}})
+        last_scan = self.data.get("stats", {}).get("last_updated", "")
+        try:
+            last_scan_time = datetime.fromisoformat(last_scan).timestamp() if last_scan else 0.0
+        except ValueError:
+            last_scan_time = 0.0
+        
+        delta = RefreshDelta()
+        movie_dirs = config.movie_directories
+        tv_dirs = config.tv_directories
+        
+        # Movies
+        existing_movies = self.data["movies"]
+        movie_index, fresh_files, unchanged_dirs = self._refresh_directory_tree(
+            movie_dirs, directory_index.get("movies", {}), last_scan_time, delta
+        )
+        kept, changed, added, removed, modified = self._reconcile_entries(
+            existing_movies, fresh_files, unchanged_dirs
+        )
+        delta.movies_added, delta.movies_removed, delta.movies_modified = added, removed, modified
+        
+        self.data["movies"] = {movie["file_path"]: movie for movie in kept}
+        self._add_movies_to_database([movie_file_from_entry(entry) for entry in changed])
+        
+        # TV episodes (non-episode video files in TV directories are ignored)
+        existing_episodes = {
+            episode["file_path"]: episode
+            for show in self.data["tv_shows"].values()
+            for episode in show["episodes"]
+        }
+        tv_index, fresh_files, unchanged_dirs = self._refresh_directory_tree(
+            tv_dirs, directory_index.get("tv", {}), last_scan_time, delta
+        )
+        fresh_episodes = {}
+        for entry in fresh_files:
+            episode = tv_episode_from_entry(entry)
+            if episode:
+                fresh_episodes[entry.path] = (entry, episode)
+        kept, changed, added, removed, modified = self._reconcile_entries(
+            existing_episodes, [entry for entry, _ in fresh_episodes.values()], unchanged_dirs
+        )
+        delta.episodes_added, delta.episodes_removed, delta.episodes_modified = added, removed, modified
+        
+        episode_entries = list(kept)
+        for entry in changed:
+            episode = fresh_episodes[entry.path][1]
+            episode_entries.append(asdict(self._create_episode_entry(episode)))
+        self.data["tv_shows"] = {}
+        self._store_tv_episode_entries(episode_entries)
+        
+        self.data["directory_index"] = {"movies": movie_index, "tv": tv_index}
+        
+        # Build movie and search indices
+        self._build_movie_index()
+        self._build_search_indices()
+        
+        # Update stats
+        refresh_time = time.time() - start_time
+        delta.refresh_time_seconds = round(refresh_time, 2)
+        stats = self._calculate_stats(movie_dirs + tv_dirs, refresh_time)
+        self.data["stats"] = asdict(stats)
+        self.data["last_refresh"] = asdict(delta)
+        
+        # Save database
+        self._save_database()
+        
+        logger.info(f"Database refresh completed in {refresh_time:.2f} seconds")
+        logger.info(f"Directories listed: {delta.directories_listed}, skipped: {delta.directories_skipped}")
+        logger.info(f"Movies +{delta.movies_added} -{delta.movies_removed} ~{delta.movies_modified}, "
+                    f"Episodes +{delta.episodes_added} -{delta.episodes_removed} ~{delta.episodes_modified}")
+        
+        return delta
+    
+    def _refresh_directory_tree(self, roots: List[str], old_index: Dict[str, Dict[str, Any]],
+                                last_scan_time: float, delta: RefreshDelta):
+        """
+        Walk directory trees, listing only directories that changed.
+        
+        Args:
+            roots: Root directories to walk
+            old_index: Directory index from the previous refresh
+            last_scan_time: Timestamp of the previous scan
+            delta: RefreshDelta to update with directory counters
+            
+        Returns:
+            Tuple of (new directory index, FileEntry list for listed
+            directories, set of unchanged directories)
+        """
+        new_index: Dict[str, Dict[str, Any]] = {}
+        fresh_files: List[FileEntry] = []
+        unchanged_dirs: Set[str] = set()
+        
+        for root in roots:
+            root = os.path.normpath(root)
+            if not os.path.isdir(root):
+                # Unmounted share: keep everything we knew about it
+                logger.warning(f"Directory not available, keeping previous entries: {root}")
+                for directory, info in old_index.items():
+                    if directory == root or directory.startswith(root + os.sep):
+                        new_index[directory] = info
+                        unchanged_dirs.add(directory)
+                continue
+            
+            stack = [root]
+            while stack:
+                directory = stack.pop()
+                old = old_index.get(directory)
+                try:
+                    dir_mtime = os.stat(directory).st_mtime
+                except OSError as e:
+                    self._keep_unreadable_directory(directory, old, e, new_index, unchanged_dirs, stack)
+                    continue
+                
+                if (old and old.get("mtime") == dir_mtime
+                        and last_scan_time - dir_mtime > MTIME_GRANULARITY_SECONDS):
+                    # Listing unchanged: reuse known subdirectories and files
+                    new_index[directory] = old
+                    unchanged_dirs.add(directory)
+                    delta.directories_skipped += 1
+                    stack.extend(os.path.join(directory, name) for name in old.get("subdirs", []))
+                    continue
+                
+                subdirs = []
+                child_count = 0
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            child_count += 1
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.name)
+                                elif (entry.is_file() and
+                                      os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS):
+                                    stat = entry.stat()
+                                    fresh_files.append(FileEntry(
+                                        path=entry.path,
+                                        name=entry.name,
+                                        size=stat.st_size,
+                                        mtime=stat.st_mtime
+                                    ))
+                            except OSError:
+                                continue
+                except OSError as e:
+                    fresh_files = [f for f in fresh_files if os.path.dirname(f.path) != directory]
+                    self._keep_unreadable_directory(directory, old, e, new_index, unchanged_dirs, stack)
+                    continue
+                
+                new_index[directory] = {
+                    "mtime": dir_mtime,
+                    "child_count": child_count,
+                    "subdirs": subdirs
+                }
+                delta.directories_listed += 1
+                stack.extend(os.path.join(directory, name) for name in subdirs)
+        
+        return new_index, fresh_files, unchanged_dirs
+    
+    @staticmethod
+    def _keep_unreadable_directory(directory: str, old: Optional[Dict[str, Any]], error: OSError,
+                                   new_index: Dict[str, Dict[str, Any]], unchanged_dirs: Set[str],
+                                   stack: List[str]) -> None:
+        """
+        Keep the previous listing of a directory that could not be read.
+        
+        A transient error (e.g. a share dropping out) must not turn the
+        directory's files into removals; its known subdirectories are still
+        visited so they are checked on their own.
+        """
+        if isinstance(error, FileNotFoundError):
+            return  # Deleted since its parent was listed: its files are removals
+        logger.warning(f"Cannot read directory {directory}, keeping previous entries: {error}")
+        if old is None:
+            return
+        new_index[directory] = old
+        unchanged_dirs.add(directory)
+        stack.extend(os.path.join(directory, name) for name in old.get("subdirs", []))
+    
+    def _reconcile_entries(self, existing: Dict[str, Dict[str, Any]],
+                           fresh_files: List[FileEntry], unchanged_dirs: Set[str]):
+        """
+        Reconcile freshly listed files against existing database entries.
+        
+        Args:
+            existing: Existing entries keyed by file path
+            fresh_files: Files found in directories that were listed
+            unchanged_dirs: Directories whose existing entries are kept as-is
+            
+        Returns:
+            Tuple of (kept entries, changed FileEntry list, added count,
+            removed count, modified count)
+        """
+        kept = []
+        changed = []
+        added = modified = 0
+        seen = set()
+        
+        for entry in fresh_files:
+            seen.add(entry.path)
+            old = existing.get(entry.path)
+            if old is None:
+                added += 1
+                changed.append(entry)
+            elif old["file_size"] != entry.size or old["last_modified"] != entry.mtime:
+                modified += 1
+                changed.append(entry)
+            else:
+                kept.append(old)
+        
+        removed = 0
+        for file_path, old in existing.items():
+            if file_path in seen:
+                continue
+            if old["directory"] in unchanged_dirs:
+                kept.append(old)
+            else:
+                removed += 1
+        
+        return kept, changed, added, removed, modified
+    
+    def _build_movie_index(self) -> None:
+        """Build the (normalized title, year) -> file paths movie index."""
+        movie_index: Dict[str, List[str]] = {}
+        for file_path in sorted(self.data["movies"]):
+            movie = self.data["movies"][file_path]
+            key = movie_index_key(movie["normalized_title"], movie["year"])
+            movie_index.setdefault(key, []).append(file_path)
+        self.data["movie_index"] = movie_index
+    
     def _build_search_indices(self) -> None:
         """Build search indices for fast lookups."""
         # Movie title index
         movie_titles = {}
-        for normalized_title, movie in self.data["movies"].items():
-            movie_titles[normalized_title] = movie["title"]
+        for movie in self.data["movies"].values():
+            movie_titles[movie["normalized_title"]] = movie["title"]
         
         # TV show title index  
         tv_titles = {}
@@ -262,11 +629,65 @@ class MediaDatabase:
         all_titles.update(movie_titles)
         all_titles.update(tv_titles)
         
+        # Inverted token/trigram indexes for fuzzy search
+        movie_ngrams = NgramIndex.build(movie_titles)
+        tv_ngrams = NgramIndex.build(tv_titles)
+        
         self.data["search_index"] = {
             "movie_titles": movie_titles,
             "tv_titles": tv_titles,
-            "all_titles": all_titles
+            "all_titles": all_titles,
+            "movie_terms": movie_ngrams.postings,
+            "tv_terms": tv_ngrams.postings
         }
+        self._ngram_indexes = {"movie": movie_ngrams, "tv": tv_ngrams}
+        self._movie_title_paths = None
+    
+    def _get_ngram_index(self, media_type: str) -> NgramIndex:
+        """Get the in-memory search index for 'movie' or 'tv' titles."""
+        index = self._ngram_indexes.get(media_type)
+        if index is None:
+            postings = self.data.get("search_index", {}).get(f"{media_type}_terms")
+            if postings is None:
+                # Database saved before the index existed
+                if media_type == "movie":
+                    keys = [movie["normalized_title"] for movie in self.data["movies"].values()]
+                else:
+                    keys = list(self.data["tv_shows"])
+                index = NgramIndex.build(keys)
+            else:
+                index = NgramIndex(postings)
+            self._ngram_indexes[media_type] = index
+        return index
+    
+    def _search_candidates(self, media_type: str, query: str) -> List[str]:
+        """
+        Get candidate title keys for a fuzzy search from the inverted index.
+        
+        Args:
+            media_type: 'movie' or 'tv'
+            query: Normalized search query
+            
+        Returns:
+            Normalized titles sharing the most terms with the query
+        """
+        if self.store is not None and self._data is None:
+            return self.store.search_candidates(media_type, search_terms(query),
+                                                SEARCH_CANDIDATE_LIMIT)
+        return self._get_ngram_index(media_type).candidates(query, SEARCH_CANDIDATE_LIMIT)
+    
+    def _movies_with_title(self, normalized_title: str) -> List[Dict[str, Any]]:
+        """Get every movie file with a normalized title."""
+        if self.store is not None and self._data is None:
+            return self.store.get_movies_by_title(normalized_title)
+        
+        if self._movie_title_paths is None:
+            title_paths: Dict[str, List[str]] = {}
+            for file_path, movie in self.data["movies"].items():
+                title_paths.setdefault(movie["normalized_title"], []).append(file_path)
+            self._movie_title_paths = title_paths
+        movies = self.data["movies"]
+        return [movies[file_path] for file_path in self._movie_title_paths.get(normalized_title, [])]
     
     def _calculate_stats(self, directories: List[str], build_time: float) -> DatabaseStats:
         """Calculate database statistics."""
@@ -296,10 +717,16 @@ class MediaDatabase:
         )
     
     def _save_database(self) -> None:
-        """Save database to JSON file."""
+        """Save database to JSON file, or incrementally to the SQLite store."""
+        if self.store is not None:
+            self.store.save(self.data)
+            logger.info(f"Database saved to {self.db_path}")
+            return
+        
         try:
-            with open(self.db_path, 'w', encoding='utf-8') as f:
+            with span('db.save') as profile_span, open(self.db_path, 'w', encoding='utf-8') as f:
                 json.dump(self.data, f, indent=2, ensure_ascii=False)
+                profile_span.add_bytes(f.tell())
             logger.info(f"Database saved to {self.db_path}")
         except IOError as e:
             logger.error(f"Failed to save database: {e}")
@@ -319,14 +746,16 @@ class MediaDatabase:
         query_normalized = query.lower().strip()
         matches = []
         
-        for normalized_title, movie in self.data["movies"].items():
-            # Calculate similarity score
+        # Score only index candidates, each title once; every copy of a
+        # matching title is returned
+        for normalized_title in self._search_candidates("movie", query_normalized):
             score = self._calculate_similarity(normalized_title, query_normalized)
             if score > 0.15:  # Lower threshold for movie series
-                movie_match = movie.copy()
-                movie_match["confidence"] = score
-                movie_match["media_type"] = "movie"
-                matches.append(movie_match)
+                for movie in self._movies_with_title(normalized_title):
+                    movie_match = movie.copy()
+                    movie_match["confidence"] = score
+                    movie_match["media_type"] = "movie"
+                    matches.append(movie_match)
         
         # Sort by confidence and return top results
         matches.sort(key=lambda x: x["confidence"], reverse=True)
@@ -349,10 +778,13 @@ class MediaDatabase:
         # Use lower threshold for TV searches to handle partial matches
         threshold = 0.3 if len(query_normalized) <= 4 else 0.35
         
-        for normalized_name, show in self.data["tv_shows"].items():
+        for normalized_name in self._search_candidates("tv", query_normalized):
             # Calculate similarity score with enhanced matching
             score = self._calculate_tv_similarity(normalized_name, query_normalized)
             if score > threshold:
+                show = self._get_show(normalized_name)
+                if show is None:
+                    continue
                 show_match = show.copy()
                 show_match["confidence"] = score
                 show_match["media_type"] = "tv"
@@ -374,21 +806,33 @@ class MediaDatabase:
         """
         normalized_name = show_name.lower().strip()
         
-        # Direct lookup first
-        if normalized_name in self.data["tv_shows"]:
+        # Direct lookup first (indexed query when the data is not loaded)
+        if self.store is not None and self._data is None:
+            show = self.store.get_show(normalized_name)
+            if show is not None:
+                return show
+        elif normalized_name in self.data["tv_shows"]:
             return self.data["tv_shows"][normalized_name]
         
         # Fuzzy search as fallback
         matches = self.search_tv_shows(show_name, limit=1)
         if matches:
-            show_name = matches[0]["normalized_name"]
-            return self.data["tv_shows"].get(show_name)
+            return self._get_show(matches[0]["normalized_name"])
         
         return None
     
+    def _get_show(self, normalized_name: str) -> Optional[Dict[str, Any]]:
+        """Get a show by normalized name, without loading SQLite data."""
+        if self.store is not None and self._data is None:
+            return self.store.get_show(normalized_name)
+        return self.data["tv_shows"].get(normalized_name)
+    
     def get_stats(self) -> DatabaseStats:
         """Get database statistics."""
-        stats_dict = self.data.get("stats", {})
+        if self.store is not None and self._data is None:
+            stats_dict = self.store.get_meta("stats") or {}
+        else:
+            stats_dict = self.data.get("stats", {})
         return DatabaseStats(**stats_dict) if stats_dict else DatabaseStats(0, 0, 0, 0, 0, "", 0.0, [])
     
     def is_current(self, max_age_hours: int = 24) -> bool:
@@ -534,6 +978,29 @@ class MediaDatabase:
             movies.append(movie)
         return movies
     
+    def get_movie_duplicate_buckets(self) -> List[List[MovieEntry]]:
+        """
+        Get movies that share a normalized title and year.
+        
+        Reads the multi-entry buckets of the movie index directly (or an
+        indexed GROUP BY query when SQLite data is not loaded).
+        
+        Returns:
+            List of buckets, each holding two or more MovieEntry objects
+        """
+        if self.store is not None and self._data is None:
+            return [
+                [MovieEntry(**movie) for movie in bucket]
+                for bucket in self.store.get_movie_duplicate_buckets()
+            ]
+        
+        movies = self.data["movies"]
+        return [
+            [MovieEntry(**movies[file_path]) for file_path in file_paths]
+            for file_paths in self.data["movie_index"].values()
+            if len(file_paths) > 1
+        ]
+    
     def get_all_tv_episodes(self) -> List[TVEpisodeEntry]:
         """
         Get all TV episodes as TVEpisodeEntry objects.
@@ -7,7 +7,6 @@ of misplaced files to their correct locations with user confirmation.
 
 import os
 import json
-import shutil
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
@@ -15,6 +14,8 @@ from datetime import datetime
 from dataclasses import dataclass
 
 from ..config.config import config
+from .event_stream import EventStream, open_event_stream
+from .move_engine import MoveEngine
 
 
 @dataclass
@@ -43,6 +44,7 @@ class MediaMover:
         self.config = config
         self.dry_run = dry_run
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.events = EventStream()
         self.logger = self._setup_logging()
         
         # Statistics
@@ -61,6 +63,19 @@ class MediaMover:
         self.approved_moves = []
         self.cached_decisions_file = Path(f"cache/move_decisions_{self.session_id}.json")
         
+        # Journaled move executor (cross-share copies run in the background)
+        self.move_engine = MoveEngine()
+        
+    def close(self) -> None:
+        """Flush and close the session's event stream (after the last run)."""
+        self.events.close()
+    
+    def __enter__(self) -> 'MediaMover':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the mover session."""
         # Create logs directory
@@ -97,6 +112,7 @@ class MediaMover:
         logger.addHandler(console_handler)
         
         self.log_file_path = log_file
+        self.events = open_event_stream(logs_dir, "media_mover", self.session_id)
         logger.info("=" * 60)
         logger.info(f"Media Mover Session Started: {self.session_id}")
         logger.info(f"Dry Run Mode: {'ON' if self.dry_run else 'OFF'}")
@@ -161,6 +177,8 @@ class MediaMover:
         # Save cache before execution
         self._save_approved_moves_cache()
         
+        self._resume_interrupted_moves()
+        
         success_count = 0
         failed_count = 0
         
@@ -177,26 +195,56 @@ class MediaMover:
                 self.logger.info(f"Move successful: {operation.source_path} -> {result_msg}")
                 success_count += 1
                 self.stats['moves_completed'] += 1
-                self.stats['total_size_moved'] += operation.file_size
             else:
                 print(f"   ❌ {result_msg}")
                 self.logger.error(f"Move failed: {operation.source_path} - {result_msg}")
                 failed_count += 1
                 self.stats['moves_failed'] += 1
         
+        # Queued cross-share moves were counted as successful when queued
+        for outcome in self._wait_for_queued_moves():
+            if not outcome.success:
+                success_count -= 1
+                failed_count += 1
+                self.stats['moves_completed'] -= 1
+                self.stats['moves_failed'] += 1
+        
         print(f"\n🏆 BATCH EXECUTION COMPLETE")
         print(f"   ✅ Successful: {success_count}")
         print(f"   ❌ Failed: {failed_count}")
         
         if success_count > 0:
-            total_size_gb = sum(op.file_size for op in self.approved_moves if self._move_was_successful(op)) / (1024**3)
+            total_size_gb = self.stats['total_size_moved'] / (1024**3)
             print(f"   💾 Data moved: {total_size_gb:.2f} GB")
     
-    def _move_was_successful(self, operation: MoveOperation) -> bool:
-        """Check if a move operation was successful (for statistics)."""
-        # This is a simple check - in a real implementation, you might want to
-        # track this more precisely during execution
-        return True  # Simplified for now
+    def _resume_interrupted_moves(self) -> None:
+        """Finish moves an interrupted session left in the move journal."""
+        if self.dry_run:
+            return
+        
+        resumed = self.move_engine.resume()
+        if resumed:
+            completed = sum(1 for outcome in resumed if outcome.success)
+            print(f"♻️  Resumed {len(resumed)} interrupted moves ({completed} completed)")
+            self.logger.info(f"Resumed {len(resumed)} interrupted moves ({completed} completed)")
+    
+    def _wait_for_queued_moves(self) -> List:
+        """Wait for queued cross-share moves and report their results."""
+        if self.move_engine.has_pending():
+            print(f"\n⏳ Waiting for queued cross-share moves to finish...")
+        
+        outcomes = self.move_engine.wait()
+        for outcome in outcomes:
+            self.events.move(str(outcome.source), str(outcome.target), outcome.success,
+                             outcome.size, outcome.error, queued=True)
+            if outcome.success:
+                self.stats['total_size_moved'] += outcome.size
+                print(f"   ✅ Copied across shares: {outcome.target}")
+                self.logger.info(f"Move successful: {outcome.source} -> {outcome.target}")
+            else:
+                print(f"   ❌ Cross-share move failed: {outcome.source} - {outcome.error}")
+                self.logger.error(f"Move failed: {outcome.source} - {outcome.error}")
+        return outcomes
     
     def _get_corrected_target_path(self, operation: MoveOperation) -> str:
         """Get corrected target path using proper config mount points."""
@@ -489,32 +537,53 @@ class MediaMover:
             return False
     
     def _perform_move(self, operation: MoveOperation) -> Tuple[bool, str]:
-        """Perform the actual move operation (file or folder)."""
+        """Perform the actual move operation (file or folder) and record its event."""
+        success, result_msg, queued = self._start_move(operation)
+        # Queued moves are recorded once their copy finishes (_wait_for_queued_moves)
+        if not queued:
+            self.events.move(operation.source_path, self._determine_target_file_path(operation), success,
+                             operation.file_size, None if success else result_msg,
+                             dry_run=self.dry_run, detail=result_msg)
+        return success, result_msg
+    
+    def _start_move(self, operation: MoveOperation) -> Tuple[bool, str, bool]:
+        """
+        Start a move operation, waiting for it unless it was queued.
+        
+        Returns:
+            Tuple of (success, message, queued)
+        """
         try:
             # Determine what to move and where
             source_item, target_item, move_type = self._determine_move_operation(operation)
             
-            # Check if target already exists
-            if target_item.exists():
-                return False, f"Target {move_type} already exists: {target_item}"
+            # Check if target already exists (or is the target of a queued move)
+            if self.move_engine.is_target_taken(target_item):
+                return False, f"Target {move_type} already exists: {target_item}", False
             
             if self.dry_run:
                 self.logger.info(f"DRY RUN: Would move {move_type} {source_item} -> {target_item}")
-                return True, f"Dry run - {move_type} move would succeed"
+                self.stats['total_size_moved'] += operation.file_size
+                return True, f"Dry run - {move_type} move would succeed", False
             
             # Perform the actual move
             self.logger.info(f"Moving {move_type}: {source_item} -> {target_item}")
-            shutil.move(str(source_item), str(target_item))
-            
-            # Verify the move succeeded
-            if target_item.exists() and not source_item.exists():
-                self.stats['total_size_moved'] += operation.file_size
-                return True, f"Successfully moved {move_type} to {target_item}"
+            # Folder moves let the engine measure the whole tree
+            size = None if move_type == "folder" else operation.file_size
+            future = self.move_engine.submit(source_item, target_item, size)
+            if not future.done():
+                # Counted in total_size_moved once the copy finishes
+                return True, f"Queued cross-share {move_type} move to {target_item}", True
+            
+            outcome = future.result()
+            if outcome.success:
+                self.stats['total_size_moved'] += outcome.size
+                return True, f"Successfully moved {move_type} to {target_item}", False
             else:
-                return False, f"Move operation failed - {move_type} verification failed"
+                return False, f"Move operation failed - {outcome.error}", False
                 
         except Exception as e:
-            return False, f"Move failed: {e}"
+            return False, f"Move failed: {e}", False
     
     def _determine_target_file_path(self, operation: MoveOperation) -> str:
         """Determine the actual target path for display purposes."""
@@ -685,6 +754,8 @@ class MediaMover:
                     print("❌ Execution cancelled")
                     return False
             
+            self._resume_interrupted_moves()
+            
             # Recreate move operations from cache
             cached_moves = cache_data.get('approved_moves', [])
             success_count = 0
@@ -710,26 +781,34 @@ class MediaMover:
                 try:
                     if self.dry_run:
                         print(f"   🌫️ DRY RUN: Would move {move_type}")
+                        self.events.move(str(source_path), str(target_path), True, dry_run=True)
                         success_count += 1
                     else:
-                        # Create target directory if needed
-                        target_dir = target_path.parent
-                        target_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        # Perform the move
-                        shutil.move(str(source_path), str(target_path))
+                        # Perform the move (creates the target directory if needed)
+                        future = self.move_engine.submit(source_path, target_path)
                         
-                        if target_path.exists():
+                        if not future.done():
+                            print(f"   📤 Queued cross-share {move_type} move")
+                            success_count += 1
+                        elif future.result().success:
                             print(f"   ✅ Successfully moved {move_type}")
+                            self.events.move(str(source_path), str(target_path), True, future.result().size)
                             success_count += 1
                         else:
-                            print(f"   ❌ Move failed - target not found")
+                            print(f"   ❌ Move failed - {future.result().error}")
+                            self.events.move(str(source_path), str(target_path), False,
+                                             error=future.result().error)
                             failed_count += 1
                             
                 except Exception as e:
                     print(f"   ❌ Move failed: {e}")
                     failed_count += 1
             
+            for outcome in self._wait_for_queued_moves():
+                if not outcome.success:
+                    success_count -= 1
+                    failed_count += 1
+            
             print(f"\n🏆 CACHE EXECUTION COMPLETE")
             print(f"   ✅ Successful: {success_count}")
             print(f"   ❌ Failed: {failed_count}")
@@ -801,9 +880,11 @@ def main():
         
         return 0
     elif args.execute_cache:
-        success = mover.execute_cached_moves(args.execute_cache)
+        with mover:
+            success = mover.execute_cached_moves(args.execute_cache)
     elif args.report:
-        success = mover.run_interactive_moves(args.report)
+        with mover:
+            success = mover.run_interactive_moves(args.report)
     else:
         parser.print_help()
         return 1
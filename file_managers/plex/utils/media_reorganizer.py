@@ -6,16 +6,31 @@ rule-based classification and generates actionable reports.
 """
 
 import os
+import re
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
 from ..config.config import config
+from .event_stream import EventStream, SESSION, open_event_stream
 from .external_api import ExternalAPIClient
+from .filename_parser import parse_filename
+from .fs_walker import walk_files
+from .keyword_rules import load_rule_set
+from .media_database import MediaDatabase, default_database_path
+from .profiler import span
+
+# TV episode patterns matched against filenames
+_TV_EPISODE_PATTERNS = [
+    re.compile(r'[Ss]\d{1,2}[Ee]\d{1,2}', re.IGNORECASE),           # S01E01, s1e2, etc.
+    re.compile(r'Season\s*\d+.*Episode\s*\d+', re.IGNORECASE),    # Season 1 Episode 1
+    re.compile(r'\d{1,2}x\d{1,2}', re.IGNORECASE),                  # 1x01, 12x05, etc.
+]
 
 
 @dataclass
@@ -78,18 +93,22 @@ class MediaReorganizationAnalyzer:
         self.limit_files = limit_files
         self.misplaced_files: List[MisplacedFile] = []
         self.all_files: List[MediaFile] = []
-        self.database_path = Path(__file__).parent.parent.parent.parent / 'database' / 'media_database.json'
+        self.database_path = default_database_path(config.media_database_backend)
         self.media_database = None
+        self._metadata_cache = None  # Opened on first use
         
-        # Initialize logging
+        # Initialize logging (per-file decisions go to the event stream,
+        # or to the text log when the stream is turned off)
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.events = EventStream()
         self.logger = self._setup_logging()
         
         # Performance tracking
         self.start_time = time.time()
         self.classification_stats = {
             'cache_hits': 0,
-            'ai_calls': 0,
+            'ai_calls': 0,       # Unique titles sent to the AI classifier
+            'ai_requests': 0,    # Batch requests made
             'ai_success': 0,
             'tv_pattern_detection': 0,
             'unclassified': 0,
@@ -99,6 +118,10 @@ class MediaReorganizationAnalyzer:
         # Video file extensions to consider
         self.video_extensions = {'.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
         
+        # Keyword rules, each compiled into one automaton
+        self.rule_keywords = load_rule_set('reorganizer')
+        self.tv_path_keywords = load_rule_set('tv_path_indicators')
+        
         # Log initialization
         self.logger.info("="*60)
         self.logger.info(f"Media Reorganization Analysis Session Started: {self.session_id}")
@@ -171,8 +194,28 @@ class MediaReorganizationAnalyzer:
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
         
+        # Structured events (classifications, cache hits, phase timings)
+        self.events = open_event_stream(logs_dir, "media_reorganizer", self.session_id)
+        
         return logger
     
+    def _classification_summary(self) -> Dict:
+        """Summarize classification statistics (keys as read by LogAnalyzer)."""
+        stats = self.classification_stats
+        summary = {
+            'total_classifications': stats['cache_hits'] + stats['ai_calls'] + stats['tv_pattern_detection'] + stats['unclassified'],
+            'cache_hits': stats['cache_hits'],
+            'tv_pattern_detection': stats['tv_pattern_detection'],
+            'ai_calls': stats['ai_calls'],
+            'ai_success': stats['ai_success'],
+            'ai_requests': stats['ai_requests'],
+            'unclassified': stats['unclassified'],
+        }
+        if stats['ai_calls'] > 0:
+            summary['ai_success_rate'] = (stats['ai_success'] / stats['ai_calls']) * 100
+            summary['avg_ai_time'] = stats['ai_time'] / stats['ai_calls']
+        return summary
+    
     def _log_classification_stats(self) -> None:
         """Log detailed classification statistics."""
         stats = self.classification_stats
@@ -191,7 +234,8 @@ class MediaReorganizationAnalyzer:
             ai_success_rate = (stats['ai_success'] / stats['ai_calls']) * 100
             avg_ai_time = stats['ai_time'] / stats['ai_calls']
             self.logger.info(f"AI Success Rate: {ai_success_rate:.1f}%")
-            self.logger.info(f"Average AI Time: {avg_ai_time:.3f}s per file")
+            self.logger.info(f"AI Requests: {stats['ai_requests']} batches")
+            self.logger.info(f"Average AI Time: {avg_ai_time:.3f}s per title")
         
         if stats['tv_pattern_detection'] > 0:
             self.logger.info(f"TV Pattern Detection: {stats['tv_pattern_detection']} episodes classified by pattern matching")
@@ -218,6 +262,7 @@ class MediaReorganizationAnalyzer:
                 return 1
             database_time = time.time() - database_start
             self.logger.info(f"Database loaded in {database_time:.2f} seconds: {len(self.all_files):,} files")
+            self.events.phase('database_loading', database_time, files=len(self.all_files))
             
             if not self.all_files:
                 print("❌ No media files found to analyze")
@@ -235,10 +280,13 @@ class MediaReorganizationAnalyzer:
             
             self.logger.info(f"Analysis completed in {analysis_time:.2f} seconds: {len(self.misplaced_files)} misplaced files")
             self._log_classification_stats()
+            self.events.phase('analysis', analysis_time, misplaced=len(self.misplaced_files),
+                              classification_stats=self._classification_summary())
             
             if not self.misplaced_files:
                 print("✅ No misplaced files detected!")
                 self.logger.info("No misplaced files detected")
+                self.events.emit(SESSION, session_id=self.session_id, status='completed')
                 return 0
                 
             print(f"⚠️  Found {len(self.misplaced_files)} potentially misplaced files")
@@ -250,6 +298,7 @@ class MediaReorganizationAnalyzer:
             report_paths = self._generate_reports()
             report_time = time.time() - report_start
             self.logger.info(f"Reports generated in {report_time:.2f} seconds")
+            self.events.phase('report_generation', report_time)
             
             print(f"✅ Analysis complete!")
             for report_type, path in report_paths.items():
@@ -264,18 +313,25 @@ class MediaReorganizationAnalyzer:
             total_time = time.time() - self.start_time
             self.logger.info(f"Total analysis time: {total_time:.2f} seconds")
             self.logger.info("Analysis session completed successfully")
+            self.events.phase('total', total_time)
+            self.events.emit(SESSION, session_id=self.session_id, status='completed')
             
             # Print log file path
             log_file_path = Path("logs") / f"media_reorganizer_{self.session_id}.log"
             print(f"\n📄 Full session log: {log_file_path.absolute()}")
             self.logger.info(f"Session log file: {log_file_path.absolute()}")
+            if self.events.enabled:
+                print(f"📄 Session events: {self.events.path.absolute()}")
             
             return 0
             
         except Exception as e:
             print(f"❌ Analysis failed: {e}")
             self.logger.error(f"Analysis failed: {e}", exc_info=True)
+            self.events.emit(SESSION, session_id=self.session_id, status='failed', error=str(e))
             return 1
+        finally:
+            self.events.close()
     
     def _load_media_database(self) -> bool:
         """Load media files from the existing database."""
@@ -290,8 +346,7 @@ class MediaReorganizationAnalyzer:
                 print("   Please run: python -m file_managers.plex.cli.media_database_cli --rebuild")
                 return False
                 
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                self.media_database = json.load(f)
+            self.media_database = MediaDatabase(str(self.database_path)).data
                 
             # Convert database entries to MediaFile objects
             self.all_files = []
@@ -350,27 +405,18 @@ class MediaReorganizationAnalyzer:
     def _scan_directory(self, directory: str, category: str) -> List[MediaFile]:
         """Scan a single directory for media files."""
         files = []
-        directory_path = Path(directory)
         
-        try:
-            for file_path in directory_path.rglob("*"):
-                if (file_path.is_file() and 
-                    file_path.suffix.lower() in self.video_extensions):
-                    
-                    try:
-                        size = file_path.stat().st_size
-                        files.append(MediaFile(
-                            path=file_path,
-                            name=file_path.name,
-                            size=size,
-                            category=category
-                        ))
-                    except (OSError, IOError):
-                        # Skip files we can't access
-                        continue
-                        
-        except (OSError, IOError) as e:
-            print(f"⚠️  Warning: Could not access {directory}: {e}")
+        if not os.path.isdir(directory):
+            print(f"⚠️  Warning: Could not access {directory}")
+            return files
+        
+        for entry in walk_files([directory], self.video_extensions):
+            files.append(MediaFile(
+                path=Path(entry.path),
+                name=entry.name,
+                size=entry.size,
+                category=category
+            ))
             
         return files
     
@@ -420,126 +466,157 @@ class MediaReorganizationAnalyzer:
         
         return misplaced
     
-    
-    def _classify_file_unified(self, file: MediaFile) -> Tuple[str, float, str, str]:
-        """Strict two-step classification: Database Cache → AI → Unclassified."""
-        filename = file.name
-        
-        self.logger.debug(f"Classifying file: {filename} (Current category: {file.category})")
-        
-        # STEP 1: Check TV/Movie database cache ONLY
-        cached_result = self._check_metadata_cache(file)
-        if cached_result:
-            category, confidence, reasoning = cached_result
-            self.classification_stats['cache_hits'] += 1
-            print(f"   🎯 DB CACHE: {filename} -> {category} (confidence: {confidence:.2f})")
-            self.logger.info(f"DB CACHE HIT: {filename} -> {category} (confidence: {confidence:.2f}) | {reasoning}")
-            return category, confidence, f"Database Cache: {reasoning}", "cache_hits"
-        
-        # STEP 1.5: Smart TV Episode Detection (skip individual episode AI processing)
-        tv_show_result = self._check_tv_episode_pattern(file)
-        if tv_show_result:
-            category, confidence, reasoning = tv_show_result
-            self.classification_stats['tv_pattern_detection'] += 1
-            print(f"   📺 TV PATTERN: {filename} -> {category} (confidence: {confidence:.2f})")
-            self.logger.info(f"TV PATTERN DETECTED: {filename} -> {category} (confidence: {confidence:.2f}) | {reasoning}")
-            return category, confidence, f"TV Pattern: {reasoning}", "tv_pattern_detection"
-        
-        # STEP 2: AI classification for items not in database cache (skip TV episodes)
-        if self.ai_classifier:
-            ai_start = time.time()
-            self.classification_stats['ai_calls'] += 1
-            try:
-                print(f"   🤖 AI LLM: Processing {filename}...")
-                self.logger.debug(f"AI LLM processing: {filename}")
-                ai_result = self.ai_classifier.classify_single(filename)
-                ai_time = time.time() - ai_start
-                self.classification_stats['ai_time'] += ai_time
-                
-                if ai_result:
-                    self.classification_stats['ai_success'] += 1
-                    category, confidence, reasoning = self._parse_ai_result(ai_result, file)
-                    
-                    # Accept any AI result (no confidence threshold)
-                    print(f"   ✅ AI LLM: {filename} -> {category} (confidence: {confidence:.2f})")
-                    self.logger.info(f"AI LLM CLASSIFIED: {filename} -> {category} (confidence: {confidence:.2f}) | {reasoning}")
-                    return category, confidence, f"AI LLM: {reasoning}", "ai_classifications"
-                else:
-                    print(f"   ⚠️  AI LLM: No result for {filename}")
-                    self.logger.warning(f"AI LLM returned no result for: {filename}")
-            except Exception as e:
-                ai_time = time.time() - ai_start
-                self.classification_stats['ai_time'] += ai_time
-                print(f"   ❌ AI LLM: Failed for {filename} - {e}")
-                self.logger.error(f"AI LLM failed for {filename}: {e}")
-        
-        # STEP 3: Mark as unclassified (no rule-based fallback)
-        print(f"   ❓ UNCLASSIFIED: {filename} (staying in {file.category})")
-        self.logger.info(f"UNCLASSIFIED: {filename} - keeping in current category {file.category}")
-        self.classification_stats['unclassified'] = self.classification_stats.get('unclassified', 0) + 1
-        
-        # Return current category with low confidence to indicate it's unclassified
-        return file.category, 0.1, "Unclassified - no database match or AI result", "unclassified"
-    
-    def _check_metadata_cache(self, file: MediaFile) -> Optional[Tuple[str, float, str]]:
-        """Check metadata enrichment cache for verified classification."""
-        try:
-            # Initialize metadata cache if not already done
-            if not hasattr(self, '_metadata_cache'):
-                from .metadata_enrichment import MetadataCache
-                self._metadata_cache = MetadataCache()
-            
-            # Extract title and year from filename
-            from .metadata_enrichment import MetadataEnricher
-            enricher = MetadataEnricher()
-            title, year = enricher.extract_title_and_year(file.name)
-            
-            # Check cache
-            cached_metadata = self._metadata_cache.get_metadata(title, year)
-            if cached_metadata:
-                # Map metadata type to our categories
-                media_type = cached_metadata.media_type
-                confidence = cached_metadata.confidence
-                reasoning = f"TMDB verified: {', '.join(cached_metadata.genres)}"
-                
-                self.logger.debug(f"Cache hit for {title} ({year}): {media_type} (confidence: {confidence:.2f})")
-                return media_type, confidence, reasoning
-                
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Metadata cache check failed for {file.name}: {e}")
-            return None
+    def _get_metadata_cache(self):
+        """Get the metadata enrichment cache shared by every lookup."""
+        if self._metadata_cache is None:
+            from .metadata_enrichment import MetadataCache
+            self._metadata_cache = MetadataCache()
+        return self._metadata_cache
     
     def _check_tv_episode_pattern(self, file: MediaFile) -> Optional[Tuple[str, float, str]]:
         """Check if file matches TV episode patterns to avoid individual AI processing."""
-        import re
         filename = file.name
         
-        # TV episode patterns to match
-        tv_patterns = [
-            r'[Ss]\d{1,2}[Ee]\d{1,2}',  # S01E01, s1e2, etc.
-            r'Season\s*\d+.*Episode\s*\d+',  # Season 1 Episode 1
-            r'\d{1,2}x\d{1,2}',  # 1x01, 12x05, etc.
-        ]
-        
         # Check if filename matches TV episode patterns
-        for pattern in tv_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                self.logger.debug(f"TV episode pattern detected in {filename}: {pattern}")
-                return "TV", 0.9, f"TV episode pattern detected: {pattern}"
+        for pattern in _TV_EPISODE_PATTERNS:
+            if pattern.search(filename):
+                self.logger.debug(f"TV episode pattern detected in {filename}: {pattern.pattern}")
+                return "TV", 0.9, f"TV episode pattern detected: {pattern.pattern}"
         
         # Check if file is in a TV-like directory structure
-        path_parts = str(file.path).lower()
-        tv_indicators = ['season', 'episode', 's01', 's02', 's03', 's04', 's05', 'complete series', 'tv series']
-        
-        for indicator in tv_indicators:
-            if indicator in path_parts:
-                self.logger.debug(f"TV directory structure detected for {filename}: {indicator}")
-                return "TV", 0.8, f"TV directory structure: contains '{indicator}'"
+        indicators = self.tv_path_keywords.scan(str(file.path)).keywords('tv')
+        if indicators:
+            self.logger.debug(f"TV directory structure detected for {filename}: {indicators[0]}")
+            return "TV", 0.8, f"TV directory structure: contains '{indicators[0]}'"
         
         return None
     
+    def _classify_all_files(self) -> List[Tuple[str, float, str, str]]:
+        """
+        Classify every file in two passes.
+        
+        Pass one resolves what it can cheaply: one bulk query against the
+        metadata cache, then TV episode patterns.  Pass two groups the
+        remaining files by extracted title and sends only the unique titles
+        to the AI classifier, in concurrent batches; each answer fans back out
+        to every file of its title.
+        
+        Returns:
+            (category, confidence, reasoning, method) per file, in all_files order
+        """
+        files = self.all_files
+        results: List[Optional[Tuple[str, float, str, str]]] = [None] * len(files)
+        
+        # PASS 1a: metadata cache, one query for all titles
+        parsed = [parse_filename(file.name) for file in files]
+        title_keys = [None] * len(files)
+        cached = {}
+        try:
+            cache = self._get_metadata_cache()
+            title_keys = [cache.title_key(p.title, p.year) if p.title else None for p in parsed]
+            cached = cache.get_metadata_bulk(list({key for key in title_keys if key}))
+        except Exception as e:
+            self.logger.debug(f"Metadata cache lookup failed: {e}")
+        
+        unresolved: Dict[str, List[int]] = {}
+        for i, file in enumerate(files):
+            metadata = cached.get(title_keys[i])
+            if metadata:
+                reasoning = f"TMDB verified: {', '.join(metadata.genres)}"
+                self.classification_stats['cache_hits'] += 1
+                self.events.cache_hit('metadata', title_keys[i], filename=file.name)
+                if not self.events.enabled:
+                    self.logger.info(f"DB CACHE HIT: {file.name} -> {metadata.media_type} (confidence: {metadata.confidence:.2f}) | {reasoning}")
+                results[i] = (metadata.media_type, metadata.confidence, f"Database Cache: {reasoning}", "cache_hits")
+                continue
+            
+            # PASS 1b: TV episode patterns (episodes never go to the AI)
+            tv_show_result = self._check_tv_episode_pattern(file)
+            if tv_show_result:
+                category, confidence, reasoning = tv_show_result
+                self.classification_stats['tv_pattern_detection'] += 1
+                if not self.events.enabled:
+                    self.logger.info(f"TV PATTERN DETECTED: {file.name} -> {category} (confidence: {confidence:.2f}) | {reasoning}")
+                results[i] = (category, confidence, f"TV Pattern: {reasoning}", "tv_pattern_detection")
+                continue
+            
+            # Files of the same title share one AI answer
+            unresolved.setdefault(title_keys[i] or file.name.lower(), []).append(i)
+        
+        resolved = len(files) - sum(len(indices) for indices in unresolved.values())
+        print(f"   🎯 Pass 1: {resolved} files resolved by cache and TV patterns, "
+              f"{len(unresolved)} unique titles left")
+        
+        # PASS 2: AI classification of the unique titles
+        if unresolved and self.ai_classifier:
+            self._classify_titles_with_ai(unresolved, results)
+        
+        # Anything still open stays where it is (no rule-based fallback)
+        for i, file in enumerate(files):
+            if results[i] is None:
+                if not self.events.enabled:
+                    self.logger.info(f"UNCLASSIFIED: {file.name} - keeping in current category {file.category}")
+                self.classification_stats['unclassified'] += 1
+                results[i] = (file.category, 0.1, "Unclassified - no database match or AI result", "unclassified")
+        
+        return results
+    
+    def _classify_titles_with_ai(self, unresolved: Dict[str, List[int]],
+                                 results: List[Optional[Tuple[str, float, str, str]]]) -> None:
+        """
+        Classify one representative file per title in concurrent AI batches.
+        
+        Args:
+            unresolved: Title key -> indices into all_files of the files with that title
+            results: Per-file results, filled in for every file of a classified title
+        """
+        titles = list(unresolved)
+        batch_size = max(1, config.reorganization_ai_batch_size)
+        batches = [titles[start:start + batch_size] for start in range(0, len(titles), batch_size)]
+        workers = max(1, min(config.reorganization_ai_workers, len(batches)))
+        
+        file_count = sum(len(indices) for indices in unresolved.values())
+        print(f"   🤖 AI LLM: {len(titles)} unique titles for {file_count} files "
+              f"({len(batches)} requests, {workers} at a time)")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reorg-ai") as executor:
+            futures = {
+                executor.submit(self._classify_ai_batch,
+                                [self.all_files[unresolved[title][0]].name for title in batch]): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                batch_results, elapsed = future.result()
+                self.classification_stats['ai_requests'] += 1
+                self.classification_stats['ai_calls'] += len(batch)
+                self.classification_stats['ai_time'] += elapsed
+                
+                for title, ai_result in zip(batch, batch_results):
+                    if not ai_result:
+                        self.logger.warning(f"AI LLM returned no result for: {self.all_files[unresolved[title][0]].name}")
+                        continue
+                    self.classification_stats['ai_success'] += 1
+                    for index in unresolved[title]:
+                        file = self.all_files[index]
+                        category, confidence, reasoning = self._parse_ai_result(ai_result, file)
+                        if not self.events.enabled:
+                            self.logger.info(f"AI LLM CLASSIFIED: {file.name} -> {category} (confidence: {confidence:.2f}) | {reasoning}")
+                        results[index] = (category, confidence, f"AI LLM: {reasoning}", "ai_classifications")
+    
+    def _classify_ai_batch(self, filenames: List[str]) -> Tuple[List[Optional[dict]], float]:
+        """Classify one batch of already-deduped filenames (runs on a worker thread)."""
+        start = time.time()
+        try:
+            with span('ai.batch'):
+                results = self.ai_classifier.classify_batch(filenames, group_by_title=False)
+        except Exception as e:
+            self.logger.error(f"AI LLM batch of {len(filenames)} titles failed: {e}")
+            results = []
+        results = list(results or [])
+        results += [None] * (len(filenames) - len(results))
+        return results[:len(filenames)], time.time() - start
+    
     def _analyze_with_unified_workflow(self) -> List[MisplacedFile]:
         """Unified workflow: metadata cache → AI → rule-based fallback."""
         misplaced = []
@@ -551,12 +628,9 @@ class MediaReorganizationAnalyzer:
             'total_processed': 0
         }
         
-        # Process all files with unified classification
-        for i, file in enumerate(self.all_files):
-            if (i + 1) % 100 == 0:  # Progress indicator
-                print(f"   📊 Processed {i + 1}/{len(self.all_files)} files...")
-                
-            suggested_category, confidence, reasoning, method_used = self._classify_file_unified(file)
+        # Classify all files (cache and TV patterns first, then AI per unique title)
+        classifications = self._classify_all_files()
+        for file, (suggested_category, confidence, reasoning, method_used) in zip(self.all_files, classifications):
             processing_stats['total_processed'] += 1
             processing_stats[method_used] += 1
             
@@ -574,14 +648,21 @@ class MediaReorganizationAnalyzer:
                 )
                 misplaced.append(misplaced_file)
                 
-                # Log misplaced file details for actionable reporting
-                self.logger.info(f"MISPLACED FILE: {file.name}")
-                self.logger.info(f"  Source: {file.path}")
-                self.logger.info(f"  Current: {file.category} → Suggested: {suggested_category}")
-                self.logger.info(f"  Target: {suggested_path}")
-                self.logger.info(f"  Confidence: {confidence:.2f} | Method: {method_used}")
-                self.logger.info(f"  Reasoning: {reasoning}")
-                self.logger.info(f"  Size: {self._format_file_size(file.size)}")
+                # Record misplaced file details for actionable reporting
+                self.events.classification(file.name, file.category, suggested_category, confidence,
+                                           method_used, reasoning, misplaced=True, file_size=file.size,
+                                           file_path=str(file.path), target=suggested_path)
+                if not self.events.enabled:
+                    self.logger.info(f"MISPLACED FILE: {file.name}")
+                    self.logger.info(f"  Source: {file.path}")
+                    self.logger.info(f"  Current: {file.category} → Suggested: {suggested_category}")
+                    self.logger.info(f"  Target: {suggested_path}")
+                    self.logger.info(f"  Confidence: {confidence:.2f} | Method: {method_used}")
+                    self.logger.info(f"  Reasoning: {reasoning}")
+                    self.logger.info(f"  Size: {self._format_file_size(file.size)}")
+            else:
+                self.events.classification(file.name, file.category, suggested_category, confidence,
+                                           method_used, reasoning)
         
         # Log processing summary
         self.logger.info(f"📊 UNIFIED WORKFLOW SUMMARY:")
@@ -694,109 +775,31 @@ class MediaReorganizationAnalyzer:
             return suggested_category, confidence, reasoning
     
     def _classify_file_rule_based(self, file: MediaFile) -> str:
-        """Classify file using enhanced rule-based patterns."""
+        """Classify file using the 'reorganizer' keyword rules."""
         filename = file.name.lower()
         path_str = str(file.path).lower()
         
-        # Enhanced documentary patterns (check first as they're more specific)
-        documentary_patterns = [
-            # Explicit documentary indicators
-            'documentary', 'docu', 'documental', 'documentry',
-            
-            # Educational/nature content
-            'national geographic', 'nat geo', 'natgeo', 'bbc', 'discovery',
-            'nature', 'wildlife', 'planet earth', 'blue planet', 'cosmos',
-            'history channel', 'history.com', 'biography', 'nova', 'frontline',
-            
-            # Documentary series/channels
-            'pbs', 'hbo documentary', 'netflix documentary', 'vice',
-            'smithsonian', 'cnn', 'msnbc documentary',
-            
-            # Common documentary keywords
-            'investigation', 'expose', 'revealed', 'untold story',
-            'behind the scenes', 'making of', 'the real', 'true story',
-            'conspiracy', 'mystery', 'unsolved', 'crime documentary',
-            
-            # Science/educational
-            'science', 'evolution', 'universe', 'space', 'quantum',
-            'climate', 'environment', 'archaeology', 'anthropology'
-        ]
-        
-        # Stand-up comedy patterns (check before TV patterns)
-        standup_patterns = [
-            'standup', 'stand-up', 'stand up', 'comedy special', 'live comedy',
-            'comedy central', 'netflix comedy', 'hbo comedy', 'showtime comedy',
-            
-            # Famous comedians (helps identify their specials)
-            'chappelle', 'carlin', 'pryor', 'murphy', 'rock', 'burr', 'hart',
-            'amy schumer', 'tina fey', 'louis ck', 'bill hicks', 'robin williams',
-            'jerry seinfeld', 'kevin hart', 'john mulaney', 'trevor noah',
-            
-            # Common special titles
-            'live at', 'live from', 'sticks and stones', 'killed them softly',
-            'raw', 'delirious', 'bigger and blacker', 'never scared'
-        ]
-        
-        # Enhanced TV episode patterns
-        tv_patterns = [
-            # Season/Episode formats
-            's0', 's1', 's2', 's3', 's4', 's5', 's6', 's7', 's8', 's9',  # S##
-            'season', 'episode',
-            'e0', 'e1', 'e2', 'e3', 'e4', 'e5', 'e6', 'e7', 'e8', 'e9',  # E##
-            
-            # Episode format variations  
-            '1x0', '2x0', '3x0', '4x0', '5x0', '6x0', '7x0', '8x0', '9x0',  # ##x##
-            '0x0',  # Special episodes
-            
-            # Common TV show indicators (but exclude movie parts)
-            'part1', 'part2', 'part3', 'part 1', 'part 2', 'part 3',
-        ]
+        # One automaton pass over the path; hits from name_start on are in the filename
+        matches = self.rule_keywords.scan(path_str)
+        name_start = len(path_str) - len(filename)
         
-        # Enhanced movie patterns 
-        movie_patterns = [
-            # Year indicators
-            '(19', '(20',  # (1995), (2020)
-            ' 19', ' 20',  # Space before year
-            '.19', '.20',  # Dot before year
-            
-            # Quality/release indicators
-            'bluray', 'blu-ray', 'dvdrip', 'webrip', 'hdtv', 'hdcam',
-            'ts', 'cam', 'dvdscr', 'bdrip', 'brrip', 'hdtc',
-            '1080p', '720p', '480p', '4k', 'uhd',
-            'x264', 'x265', 'xvid', 'divx',
-            
-            # Movie-specific terms
-            'directors cut', 'extended', 'unrated', 'theatrical',
-            'criterion', 'remastered', 'restored'
-        ]
-        
-        # Check for documentaries first (most specific)
-        for pattern in documentary_patterns:
-            if pattern in filename or pattern in path_str:
-                return "documentaries"
-        
-        # Check for stand-up comedy second
-        for pattern in standup_patterns:
-            if pattern in filename or pattern in path_str:
-                return "standup"
+        # Documentaries first (most specific), then stand-up, anywhere in the path
+        if matches.keywords('documentaries'):
+            return "documentaries"
+        if matches.keywords('standup'):
+            return "standup"
         
-        # Check for TV patterns (more specific than movies)
-        for pattern in tv_patterns:
-            if pattern in filename:
-                return "tv"
+        # TV patterns in the filename (more specific than movies)
+        if matches.keywords('tv', name_start):
+            return "tv"
         
         # Check path for TV show structure (folders like "Show Name/Season 01/")
         if '/season' in path_str or 'season ' in path_str:
             return "tv"
-            
-        # Check for multi-part movie files (these are movies, not TV)
-        if any(term in filename for term in ['cd1', 'cd2', 'disc1', 'disc2', 'part1', 'part2']) and not any(term in filename for term in tv_patterns):
-            return "movies"
         
-        # Check if it looks like a movie
-        for pattern in movie_patterns:
-            if pattern in filename:
-                return "movies"
+        # Movie patterns in the filename (multi-part markers like cd1/disc1 included)
+        if matches.keywords('movies', name_start):
+            return "movies"
         
         # Special case: If file is in a folder named after a movie year pattern
         parent_folder = file.path.parent.name.lower()
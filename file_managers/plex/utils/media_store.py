@@ -0,0 +1,544 @@
+"""SQLite storage backend for the media database.
+
+The JSON backend parses and rewrites the entire library on every load and
+save.  This store keeps the same data in SQLite tables so a single show or
+title can be looked up without reading the rest of the library, and saves only
+write the rows that actually changed.
+
+Key Features:
+- Tables for movies, TV shows, TV episodes, the refresh directory index and
+  the token/trigram search index
+- Indexes on normalized title/year, show/season/episode and directory
+- Transactional, incremental saves (unchanged rows are never rewritten)
+- One-shot migration from the existing JSON database
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .profiler import profiled
+from .search_index import NgramIndex
+
+logger = logging.getLogger(__name__)
+
+# File suffixes that select the SQLite backend when passed as a database path
+SQLITE_SUFFIXES = {'.db', '.sqlite', '.sqlite3'}
+
+MOVIE_COLUMNS = (
+    'file_path', 'title', 'normalized_title', 'year', 'file_name',
+    'file_size', 'directory', 'last_modified'
+)
+EPISODE_COLUMNS = (
+    'file_path', 'show_name', 'normalized_show_name', 'season', 'episode',
+    'title', 'file_name', 'file_size', 'directory', 'last_modified'
+)
+SHOW_COLUMNS = (
+    'normalized_name', 'name', 'total_episodes', 'seasons', 'total_size', 'directories'
+)
+DIRECTORY_COLUMNS = ('media_type', 'path', 'mtime', 'child_count', 'subdirs')
+SEARCH_TERM_COLUMNS = ('media_type', 'term', 'title_key')
+
+# Top-level database keys stored as JSON values in the meta table
+META_KEYS = ('version', 'created_at', 'stats', 'last_refresh')
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL  -- JSON value
+    );
+
+    CREATE TABLE IF NOT EXISTS movies (
+        file_path TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        normalized_title TEXT NOT NULL,
+        year INTEGER,
+        file_name TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        directory TEXT NOT NULL,
+        last_modified REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_movies_title_year ON movies (normalized_title, year);
+    CREATE INDEX IF NOT EXISTS idx_movies_directory ON movies (directory);
+
+    CREATE TABLE IF NOT EXISTS tv_shows (
+        normalized_name TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        total_episodes INTEGER NOT NULL,
+        seasons TEXT NOT NULL,  -- JSON array
+        total_size INTEGER NOT NULL,
+        directories TEXT NOT NULL  -- JSON array
+    );
+
+    CREATE TABLE IF NOT EXISTS tv_episodes (
+        file_path TEXT PRIMARY KEY,
+        show_name TEXT NOT NULL,
+        normalized_show_name TEXT NOT NULL,
+        season INTEGER NOT NULL,
+        episode INTEGER NOT NULL,
+        title TEXT,
+        file_name TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        directory TEXT NOT NULL,
+        last_modified REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_episodes_show_season_episode
+        ON tv_episodes (normalized_show_name, season, episode);
+    CREATE INDEX IF NOT EXISTS idx_episodes_directory ON tv_episodes (directory);
+
+    CREATE TABLE IF NOT EXISTS directory_index (
+        media_type TEXT NOT NULL,
+        path TEXT NOT NULL,
+        mtime REAL NOT NULL,
+        child_count INTEGER NOT NULL,
+        subdirs TEXT NOT NULL,  -- JSON array
+        PRIMARY KEY (media_type, path)
+    );
+
+    CREATE TABLE IF NOT EXISTS search_terms (
+        media_type TEXT NOT NULL,  -- 'movie' or 'tv'
+        term TEXT NOT NULL,        -- token or trigram
+        title_key TEXT NOT NULL,   -- normalized title or show name
+        PRIMARY KEY (media_type, term, title_key)
+    ) WITHOUT ROWID;
+'''
+
+
+def is_sqlite_path(path: Path) -> bool:
+    """Return True if a database path should use the SQLite backend."""
+    return Path(path).suffix.lower() in SQLITE_SUFFIXES
+
+
+class SQLiteMediaStore:
+    """SQLite storage for the media database dictionary layout."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the store.  The file is created on the first write.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        # Rows as last loaded or saved: table -> {primary key: row tuple}
+        self._stored_rows: Dict[str, Dict[Any, tuple]] = {}
+
+    def exists(self) -> bool:
+        """Check whether the database file exists."""
+        return self.db_path.exists()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the connection and create the schema on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # Point lookups
+
+    @profiled('sqlite.get_meta')
+    def get_meta(self, key: str) -> Any:
+        """
+        Get a top-level value such as ``stats``.
+
+        Args:
+            key: Meta key
+
+        Returns:
+            Decoded value, or None if not stored
+        """
+        if not self.exists():
+            return None
+        row = self._connection().execute(
+            'SELECT value FROM meta WHERE key = ?', (key,)
+        ).fetchone()
+        return json.loads(row['value']) if row else None
+
+    @profiled('sqlite.get_show')
+    def get_show(self, normalized_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a TV show with all of its episodes.
+
+        Args:
+            normalized_name: Normalized show name
+
+        Returns:
+            Show dictionary in the JSON database layout, or None
+        """
+        if not self.exists():
+            return None
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT * FROM tv_shows WHERE normalized_name = ?', (normalized_name,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        show = self._show_from_row(row)
+        show['episodes'] = [
+            dict(episode) for episode in conn.execute(
+                'SELECT * FROM tv_episodes WHERE normalized_show_name = ? '
+                'ORDER BY season, episode', (normalized_name,)
+            )
+        ]
+        return show
+
+    @profiled('sqlite.get_show_summaries')
+    def get_show_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every TV show without loading any episodes.
+
+        Returns:
+            Dictionary of normalized name -> show summary
+        """
+        if not self.exists():
+            return {}
+        return {
+            row['normalized_name']: self._show_from_row(row)
+            for row in self._connection().execute('SELECT * FROM tv_shows')
+        }
+
+    @profiled('sqlite.get_movies_by_title')
+    def get_movies_by_title(self, normalized_title: str) -> List[Dict[str, Any]]:
+        """
+        Get all movie files with a normalized title.
+
+        Args:
+            normalized_title: Normalized movie title
+
+        Returns:
+            List of movie dictionaries
+        """
+        if not self.exists():
+            return []
+        return [
+            dict(row) for row in self._connection().execute(
+                'SELECT * FROM movies WHERE normalized_title = ?', (normalized_title,)
+            )
+        ]
+
+    @profiled('sqlite.get_movie_duplicate_buckets')
+    def get_movie_duplicate_buckets(self) -> List[List[Dict[str, Any]]]:
+        """
+        Get movies that share a normalized title and year.
+
+        Returns:
+            List of buckets, each holding two or more movie dictionaries
+        """
+        if not self.exists():
+            return []
+        buckets: Dict[Tuple[str, Any], List[Dict[str, Any]]] = {}
+        for row in self._connection().execute(
+            'SELECT movies.* FROM movies JOIN ('
+            '    SELECT normalized_title, year FROM movies'
+            '    GROUP BY normalized_title, year HAVING COUNT(*) > 1'
+            ') AS dup ON movies.normalized_title = dup.normalized_title'
+            '    AND movies.year IS dup.year '
+            'ORDER BY movies.file_path'
+        ):
+            buckets.setdefault((row['normalized_title'], row['year']), []).append(dict(row))
+        return list(buckets.values())
+
+    @profiled('sqlite.search_candidates')
+    def search_candidates(self, media_type: str, terms: Iterable[str],
+                          limit: int) -> List[str]:
+        """
+        Get title keys sharing the most search terms with a query.
+
+        Args:
+            media_type: 'movie' or 'tv'
+            terms: Query terms from ``search_index.search_terms``
+            limit: Maximum number of candidates
+
+        Returns:
+            Title keys ordered by the number of shared terms (most first)
+        """
+        terms = list(terms)
+        if not terms or not self.exists():
+            return []
+        placeholders = ', '.join('?' for _ in terms)
+        rows = self._connection().execute(
+            f'SELECT title_key FROM search_terms '
+            f'WHERE media_type = ? AND term IN ({placeholders}) '
+            f'GROUP BY title_key ORDER BY COUNT(*) DESC, title_key LIMIT ?',
+            [media_type] + terms + [limit]
+        )
+        return [row['title_key'] for row in rows]
+
+    @profiled('sqlite.get_episodes')
+    def get_episodes(self, normalized_show_name: str, season: int,
+                     episode: int) -> List[Dict[str, Any]]:
+        """
+        Get all files for a single episode of a show.
+
+        Args:
+            normalized_show_name: Normalized show name
+            season: Season number
+            episode: Episode number
+
+        Returns:
+            List of episode dictionaries
+        """
+        if not self.exists():
+            return []
+        return [
+            dict(row) for row in self._connection().execute(
+                'SELECT * FROM tv_episodes WHERE normalized_show_name = ? '
+                'AND season = ? AND episode = ?',
+                (normalized_show_name, season, episode)
+            )
+        ]
+
+    # Whole-database load and save
+
+    @profiled('sqlite.load_all')
+    def load_all(self) -> Dict[str, Any]:
+        """
+        Load the whole database in the JSON database layout.
+
+        Returns:
+            Database dictionary (without the derived search index)
+        """
+        conn = self._connection()
+        data: Dict[str, Any] = {}
+        for row in conn.execute('SELECT key, value FROM meta'):
+            data[row['key']] = json.loads(row['value'])
+
+        stored: Dict[str, Dict[Any, tuple]] = {
+            'movies': {}, 'tv_shows': {}, 'tv_episodes': {}, 'directory_index': {}
+        }
+
+        data['movies'] = {}
+        for row in conn.execute('SELECT * FROM movies ORDER BY file_path'):
+            data['movies'][row['file_path']] = dict(row)
+            stored['movies'][row['file_path']] = tuple(row)
+
+        data['tv_shows'] = {}
+        for row in conn.execute('SELECT * FROM tv_shows'):
+            show = self._show_from_row(row)
+            show['episodes'] = []
+            data['tv_shows'][row['normalized_name']] = show
+            stored['tv_shows'][row['normalized_name']] = tuple(row)
+        for row in conn.execute('SELECT * FROM tv_episodes ORDER BY file_path'):
+            show = data['tv_shows'].get(row['normalized_show_name'])
+            if show is not None:
+                show['episodes'].append(dict(row))
+            stored['tv_episodes'][row['file_path']] = tuple(row)
+
+        data['directory_index'] = {'movies': {}, 'tv': {}}
+        for row in conn.execute('SELECT * FROM directory_index'):
+            data['directory_index'].setdefault(row['media_type'], {})[row['path']] = {
+                'mtime': row['mtime'],
+                'child_count': row['child_count'],
+                'subdirs': json.loads(row['subdirs'])
+            }
+            stored['directory_index'][(row['media_type'], row['path'])] = tuple(row)
+
+        self._stored_rows.update(stored)
+        return data
+
+    @profiled('sqlite.save')
+    def save(self, data: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Save the database dictionary in a single transaction.
+
+        Rows are compared against the rows this store last loaded or saved
+        (tables not seen yet are read once): only new or changed rows are
+        upserted and rows no longer present are deleted.
+
+        Args:
+            data: Database dictionary in the JSON database layout
+
+        Returns:
+            Dictionary of table name -> number of rows written or deleted
+        """
+        movie_rows = {
+            movie['file_path']: tuple(movie.get(column) for column in MOVIE_COLUMNS)
+            for movie in data.get('movies', {}).values()
+        }
+
+        show_rows = {}
+        episode_rows = {}
+        for normalized_name, show in data.get('tv_shows', {}).items():
+            show_rows[normalized_name] = (
+                normalized_name, show['name'], show['total_episodes'],
+                json.dumps(show['seasons']), show['total_size'],
+                json.dumps(sorted(show['directories']))
+            )
+            for episode in show.get('episodes', []):
+                episode_rows[episode['file_path']] = tuple(
+                    episode.get(column) for column in EPISODE_COLUMNS
+                )
+
+        directory_rows = {}
+        for media_type, index in data.get('directory_index', {}).items():
+            for path, info in index.items():
+                directory_rows[(media_type, path)] = (
+                    media_type, path, info['mtime'], info['child_count'],
+                    json.dumps(info['subdirs'])
+                )
+
+        search_index = data.get('search_index', {})
+        term_rows = {}
+        for media_type in ('movie', 'tv'):
+            for term, keys in search_index.get(f'{media_type}_terms', {}).items():
+                for key in keys:
+                    term_rows[(media_type, term, key)] = (media_type, term, key)
+
+        tables = {
+            'movies': movie_rows,
+            'tv_shows': show_rows,
+            'tv_episodes': episode_rows,
+            'directory_index': directory_rows,
+            'search_terms': term_rows,
+        }
+
+        conn = self._connection()
+        changes = {}
+        try:
+            with conn:
+                changes['movies'] = self._sync_table(
+                    conn, 'movies', MOVIE_COLUMNS, ('file_path',), movie_rows)
+                changes['tv_shows'] = self._sync_table(
+                    conn, 'tv_shows', SHOW_COLUMNS, ('normalized_name',), show_rows)
+                changes['tv_episodes'] = self._sync_table(
+                    conn, 'tv_episodes', EPISODE_COLUMNS, ('file_path',), episode_rows)
+                changes['directory_index'] = self._sync_table(
+                    conn, 'directory_index', DIRECTORY_COLUMNS, ('media_type', 'path'),
+                    directory_rows)
+                changes['search_terms'] = self._sync_table(
+                    conn, 'search_terms', SEARCH_TERM_COLUMNS,
+                    ('media_type', 'term', 'title_key'), term_rows)
+
+                conn.execute('DELETE FROM meta')
+                conn.executemany(
+                    'INSERT INTO meta (key, value) VALUES (?, ?)',
+                    [(key, json.dumps(data[key])) for key in META_KEYS if key in data]
+                )
+        except sqlite3.Error as e:
+            # The table no longer matches what we remember; read it again next time
+            self._stored_rows.clear()
+            logger.error(f"Failed to save media database, changes rolled back: {e}")
+            raise
+
+        self._stored_rows.update(tables)
+        logger.debug(f"SQLite media database rows written: {changes}")
+        return changes
+
+    def _sync_table(self, conn: sqlite3.Connection, table: str, columns: Tuple[str, ...],
+                    key_columns: Tuple[str, ...], rows: Dict[Any, tuple]) -> int:
+        """
+        Make a table match ``rows``, writing only the differences.
+
+        The differences are taken against the rows last loaded or saved by
+        this store; a table without such a record is read in full first.
+
+        Args:
+            conn: Open connection (inside a transaction)
+            table: Table name
+            columns: Column names in row tuple order
+            key_columns: Primary key column names
+            rows: Desired rows keyed by primary key (a tuple for composite keys)
+
+        Returns:
+            Number of rows upserted or deleted
+        """
+        key_indexes = [columns.index(column) for column in key_columns]
+
+        def row_key(row):
+            if len(key_indexes) == 1:
+                return row[key_indexes[0]]
+            return tuple(row[i] for i in key_indexes)
+
+        existing = self._stored_rows.get(table)
+        if existing is None:
+            existing = {}
+            for row in conn.execute(f"SELECT {', '.join(columns)} FROM {table}"):
+                row = tuple(row)
+                existing[row_key(row)] = row
+
+        upserts = [row for key, row in rows.items() if existing.get(key) != row]
+        deletes = [key for key in existing if key not in rows]
+
+        if upserts:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                upserts
+            )
+        if deletes:
+            where = ' AND '.join(f"{column} = ?" for column in key_columns)
+            conn.executemany(
+                f"DELETE FROM {table} WHERE {where}",
+                [key if isinstance(key, tuple) else (key,) for key in deletes]
+            )
+
+        return len(upserts) + len(deletes)
+
+    @staticmethod
+    def _show_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a tv_shows row to the JSON database show layout."""
+        show = dict(row)
+        show['seasons'] = json.loads(show['seasons'])
+        show['directories'] = json.loads(show['directories'])
+        return show
+
+
+def migrate_json_to_sqlite(json_path: Path, sqlite_path: Path) -> Dict[str, int]:
+    """
+    One-shot migration of a JSON media database into a SQLite store.
+
+    Args:
+        json_path: Existing JSON database file
+        sqlite_path: SQLite database file to create or update
+
+    Returns:
+        Dictionary with migrated movie, show, episode and directory counts
+
+    Raises:
+        FileNotFoundError: If the JSON database does not exist
+    """
+    json_path = Path(json_path)
+    if not json_path.exists():
+        raise FileNotFoundError(f"JSON media database not found: {json_path}")
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    # Databases saved before the search index existed have no postings;
+    # build them so searches on the SQLite store find titles straight away
+    search_index = data.setdefault('search_index', {})
+    if 'movie_terms' not in search_index:
+        search_index['movie_terms'] = NgramIndex.build(
+            movie['normalized_title'] for movie in data.get('movies', {}).values()
+        ).postings
+    if 'tv_terms' not in search_index:
+        search_index['tv_terms'] = NgramIndex.build(data.get('tv_shows', {})).postings
+
+    store = SQLiteMediaStore(sqlite_path)
+    try:
+        store.save(data)
+    finally:
+        store.close()
+
+    tv_shows = data.get('tv_shows', {})
+    counts = {
+        'movies': len(data.get('movies', {})),
+        'tv_shows': len(tv_shows),
+        'tv_episodes': sum(len(show.get('episodes', [])) for show in tv_shows.values()),
+        'directories': sum(len(index) for index in data.get('directory_index', {}).values())
+    }
+    logger.info(f"Migrated {json_path} to {sqlite_path}: {counts}")
+    return counts
@@ -9,9 +9,11 @@ accuracy and avoid repeated API calls.
 import os
 import json
 import sqlite3
-import time
 import logging
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
@@ -37,6 +39,26 @@ except ImportError:
                     os.environ[key] = value
 
 from ..config.config import config
+from .event_stream import EventStream, open_event_stream
+from .filename_parser import parse_filename
+from .media_database import MediaDatabase, default_database_path
+from .profiler import is_enabled, profiled, span
+from .rate_limiter import AdaptiveRateLimiter
+
+# Lookup outcomes recorded in the enrichment checkpoint
+FOUND = "found"
+NOT_FOUND = "not_found"
+ERROR = "error"
+
+METADATA_MAX_AGE = timedelta(days=30)  # Cached metadata older than this is refreshed
+NOT_FOUND_RETRY = timedelta(days=30)   # Titles TMDB did not know are skipped this long
+CHECKPOINT_EVERY = 25                  # Results written per transaction
+THROTTLE_RETRIES = 3                   # HTTP 429 answers retried after the limiter slows down
+
+_METADATA_COLUMNS = (
+    "title, year, tmdb_id, tvdb_id, media_type, genres, overview, runtime, status, "
+    "original_language, popularity, vote_average, api_source, last_updated, confidence"
+)
 
 
 @dataclass
@@ -74,8 +96,11 @@ class MediaMetadata:
 class MetadataCache:
     """SQLite-based cache for metadata."""
     
-    def __init__(self, cache_file: str = "metadata_cache.db"):
-        self.cache_path = Path(__file__).parent.parent.parent.parent / 'database' / cache_file
+    def __init__(self, cache_file: str = "metadata_cache.db", cache_path: Optional[str] = None):
+        if cache_path:
+            self.cache_path = Path(cache_path)
+        else:
+            self.cache_path = Path(__file__).parent.parent.parent.parent / 'database' / cache_file
         self.cache_path.parent.mkdir(exist_ok=True)
         self._init_database()
     
@@ -111,10 +136,25 @@ class MetadataCache:
             CREATE INDEX IF NOT EXISTS idx_title_year 
             ON metadata_cache (title, year)
         ''')
-        
+
+        # Outcome of every lookup, so an interrupted run resumes where it
+        # stopped and titles TMDB does not know are not searched every run
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS enrichment_checkpoint (
+                title_key TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                year INTEGER,
+                status TEXT NOT NULL,  -- found, not_found, error
+                error TEXT,
+                attempts INTEGER DEFAULT 1,
+                attempted_at TEXT NOT NULL
+            )
+        ''')
+
         conn.commit()
         conn.close()
     
+    @profiled('sqlite.metadata_get')
     def get_metadata(self, title: str, year: Optional[int] = None) -> Optional[MediaMetadata]:
         """Get cached metadata for a title."""
         title_key = self._create_key(title, year)
@@ -122,61 +162,145 @@ class MetadataCache:
         conn = sqlite3.connect(str(self.cache_path))
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT title, year, tmdb_id, tvdb_id, media_type, genres, overview,
-                   runtime, status, original_language, popularity, vote_average,
-                   api_source, last_updated, confidence
+        cursor.execute(f'''
+            SELECT {_METADATA_COLUMNS}
             FROM metadata_cache WHERE title_key = ?
         ''', (title_key,))
-        
+
         row = cursor.fetchone()
         conn.close()
-        
+
         if row:
-            return MediaMetadata(
-                title=row[0],
-                year=row[1],
-                tmdb_id=row[2],
-                tvdb_id=row[3],
-                media_type=row[4],
-                genres=json.loads(row[5]) if row[5] else [],
-                overview=row[6] or "",
-                runtime=row[7],
-                status=row[8] or "",
-                original_language=row[9] or "",
-                popularity=row[10] or 0.0,
-                vote_average=row[11] or 0.0,
-                api_source=row[12] or "",
-                last_updated=datetime.fromisoformat(row[13]),
-                confidence=row[14] or 0.0
-            )
+            return self._row_to_metadata(row)
         return None
-    
+
+    @profiled('sqlite.metadata_get_bulk')
+    def get_metadata_bulk(self, title_keys: List[str]) -> Dict[str, MediaMetadata]:
+        """
+        Get cached metadata for many titles with a single query.
+
+        Args:
+            title_keys: Keys from ``title_key``
+
+        Returns:
+            Dictionary mapping title key to MediaMetadata (missing keys are omitted)
+        """
+        if not title_keys:
+            return {}
+
+        conn = sqlite3.connect(str(self.cache_path))
+        try:
+            conn.execute('CREATE TEMP TABLE lookup_keys (title_key TEXT PRIMARY KEY)')
+            conn.executemany('INSERT OR IGNORE INTO lookup_keys VALUES (?)', [(k,) for k in title_keys])
+            rows = conn.execute(f'''
+                SELECT c.title_key, {_METADATA_COLUMNS} FROM metadata_cache c
+                JOIN lookup_keys k ON c.title_key = k.title_key
+            ''').fetchall()
+        finally:
+            conn.close()
+
+        return {row[0]: self._row_to_metadata(row[1:]) for row in rows}
+
+    @profiled('sqlite.metadata_checkpoints')
+    def get_checkpoints(self, title_keys: List[str]) -> Dict[str, Tuple[str, datetime]]:
+        """
+        Get the last lookup outcome for many titles with a single query.
+
+        Args:
+            title_keys: Keys from ``title_key``
+
+        Returns:
+            Dictionary mapping title key to (status, attempted_at)
+        """
+        if not title_keys:
+            return {}
+
+        conn = sqlite3.connect(str(self.cache_path))
+        try:
+            conn.execute('CREATE TEMP TABLE lookup_keys (title_key TEXT PRIMARY KEY)')
+            conn.executemany('INSERT OR IGNORE INTO lookup_keys VALUES (?)', [(k,) for k in title_keys])
+            rows = conn.execute('''
+                SELECT c.title_key, c.status, c.attempted_at FROM enrichment_checkpoint c
+                JOIN lookup_keys k ON c.title_key = k.title_key
+            ''').fetchall()
+        finally:
+            conn.close()
+
+        return {title_key: (status, datetime.fromisoformat(attempted_at))
+                for title_key, status, attempted_at in rows}
+
     def store_metadata(self, metadata: MediaMetadata, raw_response: Dict = None):
         """Store metadata in cache."""
-        title_key = self._create_key(metadata.title, metadata.year)
-        
+        self.save_batch([(metadata, raw_response)], [])
+
+    @profiled('sqlite.metadata_save_batch')
+    def save_batch(self, found: List[Tuple[MediaMetadata, Optional[Dict]]],
+                   attempts: List[Tuple[str, str, Optional[int], str, Optional[str]]]) -> None:
+        """
+        Store a batch of enrichment results in one transaction.
+
+        Args:
+            found: (metadata, raw API response) pairs to cache
+            attempts: (title key, title, year, status, error) checkpoint rows
+        """
+        if not found and not attempts:
+            return
+
+        now = datetime.now().isoformat()
         conn = sqlite3.connect(str(self.cache_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO metadata_cache 
-            (title_key, title, year, tmdb_id, tvdb_id, media_type, genres, overview,
-             runtime, status, original_language, popularity, vote_average,
-             api_source, last_updated, confidence, raw_response)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            title_key, metadata.title, metadata.year, metadata.tmdb_id, metadata.tvdb_id,
-            metadata.media_type, json.dumps(metadata.genres), metadata.overview,
-            metadata.runtime, metadata.status, metadata.original_language,
-            metadata.popularity, metadata.vote_average, metadata.api_source,
-            metadata.last_updated.isoformat(), metadata.confidence,
-            json.dumps(raw_response) if raw_response else None
-        ))
-        
-        conn.commit()
-        conn.close()
-    
+        try:
+            conn.executemany('''
+                INSERT OR REPLACE INTO metadata_cache
+                (title_key, title, year, tmdb_id, tvdb_id, media_type, genres, overview,
+                 runtime, status, original_language, popularity, vote_average,
+                 api_source, last_updated, confidence, raw_response)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(
+                self._create_key(metadata.title, metadata.year), metadata.title, metadata.year,
+                metadata.tmdb_id, metadata.tvdb_id,
+                metadata.media_type, json.dumps(metadata.genres), metadata.overview,
+                metadata.runtime, metadata.status, metadata.original_language,
+                metadata.popularity, metadata.vote_average, metadata.api_source,
+                metadata.last_updated.isoformat(), metadata.confidence,
+                json.dumps(raw_response) if raw_response else None
+            ) for metadata, raw_response in found])
+            conn.executemany('''
+                INSERT INTO enrichment_checkpoint
+                (title_key, title, year, status, error, attempts, attempted_at)
+                VALUES (?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(title_key) DO UPDATE SET
+                    status = excluded.status, error = excluded.error,
+                    attempts = attempts + 1, attempted_at = excluded.attempted_at
+            ''', [(title_key, title, year, status, error, now)
+                  for title_key, title, year, status, error in attempts])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _row_to_metadata(self, row: Tuple) -> MediaMetadata:
+        """Build MediaMetadata from a row of _METADATA_COLUMNS."""
+        return MediaMetadata(
+            title=row[0],
+            year=row[1],
+            tmdb_id=row[2],
+            tvdb_id=row[3],
+            media_type=row[4],
+            genres=json.loads(row[5]) if row[5] else [],
+            overview=row[6] or "",
+            runtime=row[7],
+            status=row[8] or "",
+            original_language=row[9] or "",
+            popularity=row[10] or 0.0,
+            vote_average=row[11] or 0.0,
+            api_source=row[12] or "",
+            last_updated=datetime.fromisoformat(row[13]),
+            confidence=row[14] or 0.0
+        )
+
+    def title_key(self, title: str, year: Optional[int]) -> str:
+        """Get the cache key for a title (public wrapper for bulk lookups)."""
+        return self._create_key(title, year)
+
     def _create_key(self, title: str, year: Optional[int]) -> str:
         """Create a normalized key for title lookup."""
         # Normalize title: lowercase, remove special chars, collapse whitespace
@@ -210,44 +334,81 @@ class MetadataCache:
 class APIClient:
     """Enhanced API client with retry logic and rate limiting."""
     
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None,
+                 rate_limiters: Optional[Dict[str, AdaptiveRateLimiter]] = None):
+        """
+        Initialize the client.
+
+        Args:
+            workers: Threads sharing this client (sizes the connection pool)
+            rate_limiters: Per-API limiters (default: the API rates from config)
+        """
         self.tmdb_api_key = os.getenv('TMDB_API_KEY')
         self.tvdb_api_key = os.getenv('TVDB_API_KEY')
+        self.workers = max(1, workers or config.metadata_enrichment_workers)
         self.session = self._create_session()
-        self.last_request_time = {}
-        self.request_delay = 0.25  # 250ms between requests
-        
+        self.events = EventStream()  # Set by the enricher to record API calls
+
+        # One token bucket per API, shared by every worker thread
+        self.rate_limiters = rate_limiters or {
+            api_name: AdaptiveRateLimiter(rate=rate, min_rate=min(1.0, rate), max_rate=rate,
+                                          capacity=self.workers)
+            for api_name, rate in (('tmdb', config.tmdb_requests_per_second),
+                                   ('tvdb', config.tvdb_requests_per_second))
+        }
+
     def _create_session(self) -> requests.Session:
         """Create a session with retry strategy."""
         session = requests.Session()
         
-        # Retry strategy for rate limiting and temporary failures
+        # Retry strategy for temporary failures (429 is left to the rate limiter)
         retry_strategy = Retry(
             total=5,
             backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled connection per worker thread
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.workers)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
-        
+
         return session
-    
+
     def _rate_limit(self, api_name: str):
-        """Implement rate limiting."""
-        now = time.time()
-        if api_name in self.last_request_time:
-            time_since_last = now - self.last_request_time[api_name]
-            if time_since_last < self.request_delay:
-                sleep_time = self.request_delay - time_since_last
-                time.sleep(sleep_time)
-        
-        self.last_request_time[api_name] = time.time()
-    
+        """Wait for a request slot under the API's shared rate limit."""
+        self.rate_limiters[api_name].acquire()
+
+    def _get(self, api_name: str, endpoint: str, url: str, params: Dict) -> requests.Response:
+        """
+        Send a GET request (the caller has taken a rate limit slot) and record it in the event stream.
+
+        An HTTP 429 lowers the API's shared rate and the request is sent
+        again, up to THROTTLE_RETRIES times; the last response is returned.
+        """
+        rate_limiter = self.rate_limiters[api_name]
+        for attempt in range(THROTTLE_RETRIES + 1):
+            if attempt:
+                self._rate_limit(api_name)
+            start = time.time()
+            try:
+                with span(f'http.{api_name}') as profile_span:
+                    response = self.session.get(url, params=params, timeout=10)
+                    if is_enabled():
+                        profile_span.add_bytes(len(response.content))
+            except requests.RequestException as e:
+                self.events.api_call(api_name, endpoint, 'error', time.time() - start, error=str(e))
+                raise
+            self.events.api_call(api_name, endpoint, response.status_code, time.time() - start)
+            if response.status_code != 429:
+                rate_limiter.on_success()
+                return response
+            rate_limiter.on_throttle()
+        return response
+
     def search_tmdb_movie(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
-        """Search for a movie on TMDB."""
+        """Search for a movie on TMDB (None if there is no match; request errors are raised)."""
         if not self.tmdb_api_key:
             return None
         
@@ -264,7 +425,7 @@ class APIClient:
             params['year'] = year
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get('tmdb', 'search/movie', url, params)
             response.raise_for_status()
             data = response.json()
             
@@ -274,11 +435,12 @@ class APIClient:
                 
         except requests.RequestException as e:
             logging.error(f"TMDB movie search failed for '{title}': {e}")
+            raise
         
         return None
     
     def search_tmdb_tv(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
-        """Search for a TV show on TMDB."""
+        """Search for a TV show on TMDB (None if there is no match; request errors are raised)."""
         if not self.tmdb_api_key:
             return None
         
@@ -295,7 +457,7 @@ class APIClient:
             params['first_air_date_year'] = year
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get('tmdb', 'search/tv', url, params)
             response.raise_for_status()
             data = response.json()
             
@@ -304,6 +466,7 @@ class APIClient:
                 
         except requests.RequestException as e:
             logging.error(f"TMDB TV search failed for '{title}': {e}")
+            raise
         
         return None
     
@@ -318,12 +481,13 @@ class APIClient:
         params = {'api_key': self.tmdb_api_key}
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get('tmdb', 'movie', url, params)
             response.raise_for_status()
             return response.json()
             
         except requests.RequestException as e:
             logging.error(f"TMDB movie details failed for ID {movie_id}: {e}")
+            raise
         
         return None
 
@@ -331,11 +495,24 @@ class APIClient:
 class MetadataEnricher:
     """Main metadata enrichment orchestrator."""
     
-    def __init__(self):
-        self.cache = MetadataCache()
-        self.api_client = APIClient()
+    def __init__(self, cache: Optional[MetadataCache] = None, api_client: Optional[APIClient] = None,
+                 workers: Optional[int] = None):
+        """
+        Initialize the enricher.
+
+        Args:
+            cache: Metadata cache (defaults to database/metadata_cache.db)
+            api_client: API client (default: one sized for the worker pool)
+            workers: Titles looked up concurrently (default from config)
+        """
+        self.workers = max(1, workers or config.metadata_enrichment_workers)
+        self.cache = cache or MetadataCache()
+        self.api_client = api_client or APIClient(workers=self.workers)
+        self.events = EventStream()
         self.logger = self._setup_logging()
-        self.database_path = Path(__file__).parent.parent.parent.parent / 'database' / 'media_database.json'
+        if isinstance(self.api_client, APIClient):
+            self.api_client.events = self.events
+        self.database_path = default_database_path(config.media_database_backend)
         
     def _setup_logging(self) -> logging.Logger:
         """Set up logging for the enrichment process."""
@@ -372,6 +549,9 @@ class MetadataEnricher:
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
         
+        # Structured events (API calls, cache hits, phase timings)
+        self.events = open_event_stream(logs_dir, "metadata_enrichment", session_id)
+        
         return logger
     
     def load_media_database(self) -> Dict:
@@ -381,46 +561,15 @@ class MetadataEnricher:
             return {}
         
         try:
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return MediaDatabase(str(self.database_path)).data
         except Exception as e:
             self.logger.error(f"Failed to load media database: {e}")
             return {}
     
     def extract_title_and_year(self, filename: str) -> Tuple[str, Optional[int]]:
         """Extract clean title and year from filename."""
-        # Remove file extension
-        name = Path(filename).stem
-        
-        # Common patterns to remove
-        patterns_to_remove = [
-            r'\b\d{3,4}p\b',  # Resolution (720p, 1080p, etc.)
-            r'\b(BluRay|WEB-?DL|WEBRip|HDTV|DVDRip|BRRip)\b',  # Source
-            r'\b(x264|x265|H\.?264|H\.?265|HEVC)\b',  # Codec
-            r'\b(AAC|AC3|DTS|DD|DDP)\b',  # Audio
-            r'\b(5\.1|7\.1|2\.0)\b',  # Audio channels
-            r'\b(PROPER|REPACK|EXTENDED|UNRATED|DIRECTOR.?S.?CUT)\b',  # Versions
-            r'\[[^\]]*\]',  # Brackets content
-            r'\([^)]*(?:rip|web|bluray|hdtv)[^)]*\)',  # Parentheses with quality info
-        ]
-        
-        cleaned = name
-        for pattern in patterns_to_remove:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Extract year (4 digits, typically 1900-2099)
-        year_match = re.search(r'\b(19\d{2}|20\d{2})\b', cleaned)
-        year = int(year_match.group(1)) if year_match else None
-        
-        # Remove year from title
-        if year_match:
-            cleaned = cleaned.replace(year_match.group(0), '')
-        
-        # Clean up title
-        title = re.sub(r'[^\w\s]', ' ', cleaned)  # Replace special chars with spaces
-        title = re.sub(r'\s+', ' ', title).strip()  # Collapse whitespace
-        
-        return title, year
+        parsed = parse_filename(filename)
+        return parsed.title, parsed.year
     
     def classify_media_type(self, tmdb_data: Dict, search_type: str) -> Tuple[str, float]:
         """Classify media type based on TMDB data."""
@@ -498,12 +647,31 @@ class MetadataEnricher:
         """Enrich a single title with metadata."""
         # Check cache first
         cached = self.cache.get_metadata(title, year)
-        if cached and (datetime.now() - cached.last_updated).days < 30:
-            self.logger.debug(f"Using cached metadata for {title} ({year})")
+        if cached and datetime.now() - cached.last_updated < METADATA_MAX_AGE:
+            self.events.cache_hit('metadata', self.cache.title_key(title, year))
             return cached
-        
-        self.logger.info(f"Enriching: {title} ({year})")
-        
+
+        try:
+            result = self._lookup_title(title, year)
+        except requests.RequestException:
+            return None
+        if result:
+            metadata, raw_response = result
+            self.cache.store_metadata(metadata, raw_response)
+            return metadata
+        return None
+
+    def _lookup_title(self, title: str, year: Optional[int] = None) -> Optional[Tuple[MediaMetadata, Dict]]:
+        """
+        Look a title up on TMDB without touching the cache (safe to call from worker threads).
+
+        Args:
+            title: Title to look up
+            year: Optional release year
+
+        Returns:
+            (metadata, raw API response) or None if TMDB has no match
+        """
         # Clean title for API search
         clean_title = self._clean_title_for_search(title)
         if clean_title != title:
@@ -537,9 +705,7 @@ class MetadataEnricher:
                 confidence=confidence
             )
             
-            self.cache.store_metadata(metadata, movie_data)
-            self.logger.info(f"✓ Enriched {title} as {media_type} (confidence: {confidence:.2f})")
-            return metadata
+            return metadata, movie_data
         
         # Try TV search if movie search failed
         tv_data = self.api_client.search_tmdb_tv(clean_title, year)
@@ -564,16 +730,32 @@ class MetadataEnricher:
                 confidence=confidence
             )
             
-            self.cache.store_metadata(metadata, tv_data)
-            self.logger.info(f"✓ Enriched {title} as {media_type} (confidence: {confidence:.2f})")
-            return metadata
+            return metadata, tv_data
         
-        self.logger.warning(f"✗ No metadata found for {title} ({year})")
         return None
     
     def enrich_database(self, limit: Optional[int] = None, skip_cached: bool = True) -> Dict:
-        """Enrich all titles in the media database."""
+        """
+        Enrich all titles in the media database.
+
+        Runs as a staged pipeline: every title (each movie and one entry per
+        TV show) is probed against the cache and the enrichment checkpoint
+        with one query each, the remaining titles are looked up concurrently
+        under the per-API rate limits, and results are written in batches of
+        CHECKPOINT_EVERY.  Titles TMDB did not know are skipped for
+        NOT_FOUND_RETRY, so rerunning after a crash or Ctrl-C continues where
+        the last run stopped.
+
+        Args:
+            limit: Maximum number of titles to process
+            skip_cached: Skip titles with cached metadata or a recent miss; if
+                False, only metadata older than METADATA_MAX_AGE is looked up again
+
+        Returns:
+            Enrichment stats dictionary
+        """
         self.logger.info("Starting metadata enrichment process")
+        enrichment_start = time.time()
         
         database = self.load_media_database()
         if not database:
@@ -585,6 +767,7 @@ class MetadataEnricher:
             'cache_hits': 0,
             'failed_enrichments': 0,
             'skipped': 0,
+            'known_misses': 0,
             'movies_not_found': [],
             'tv_not_found': [],
             'movies_found': [],
@@ -592,169 +775,91 @@ class MetadataEnricher:
             'classification_changes': []
         }
         
-        # Process movies
-        movies_dict = database.get('movies', {})
-        movies = list(movies_dict.values())
-        self.logger.info(f"Processing {len(movies)} movies")
+        # Stage 1: collect titles and probe the cache and checkpoint in bulk
+        items = self._collect_enrichment_items(database, stats)
+        title_keys = list(items)
+        cached = self.cache.get_metadata_bulk(title_keys)
+        checkpoints = self.cache.get_checkpoints(title_keys) if skip_cached else {}
+        now = datetime.now()
         
-        for i, movie in enumerate(movies):
-            if limit and stats['total_processed'] >= limit:
-                break
-            
-            # Get the filename to extract title and year
-            filename = movie.get('file_name') or movie.get('title', '')
-            if not filename:
-                self.logger.warning(f"Skipping movie with no filename: {movie}")
-                stats['failed_enrichments'] += 1
-                stats['total_processed'] += 1
+        to_fetch = []
+        for title_key in title_keys:
+            if title_key in cached and skip_cached:
+                stats['cache_hits'] += 1
+                stats['skipped'] += 1
+                self.events.cache_hit('metadata', title_key)
                 continue
-                
-            title, year = self.extract_title_and_year(filename)
-            
-            if skip_cached and self.cache.get_metadata(title, year):
+            if title_key in cached and now - cached[title_key].last_updated < METADATA_MAX_AGE:
+                # Still fresh: reuse it as enrich_title would instead of calling the API
                 stats['cache_hits'] += 1
+                stats['total_processed'] += 1
+                self.events.cache_hit('metadata', title_key)
+                self._record_found(stats, items[title_key], cached[title_key])
+                continue
+            status, attempted_at = checkpoints.get(title_key, (None, None))
+            if status == NOT_FOUND and now - attempted_at < NOT_FOUND_RETRY:
+                stats['known_misses'] += 1
                 stats['skipped'] += 1
                 continue
-            
-            try:
-                metadata = self.enrich_title(title, year)
-                if metadata:
-                    stats['successful_enrichments'] += 1
-                    
-                    # Track found movies with details
-                    movie_info = {
-                        'title': title,
-                        'year': year,
-                        'filename': filename,
-                        'file_path': movie.get('file_path', ''),
-                        'original_category': 'movies',
-                        'enriched_type': metadata.media_type,
-                        'confidence': metadata.confidence,
-                        'genres': metadata.genres,
-                        'tmdb_id': metadata.tmdb_id
-                    }
-                    stats['movies_found'].append(movie_info)
-                    
-                    # Track classification changes
-                    if metadata.media_type != 'movies':
-                        change_info = {
-                            'title': title,
-                            'year': year,
-                            'filename': filename,
-                            'from': 'movies',
-                            'to': metadata.media_type,
-                            'confidence': metadata.confidence,
-                            'reasoning': f"TMDB classification: {', '.join(metadata.genres)}"
-                        }
-                        stats['classification_changes'].append(change_info)
-                        self.logger.info(f"🔄 Classification change: {title} ({year}) movies → {metadata.media_type} (confidence: {metadata.confidence:.2f})")
-                else:
-                    stats['failed_enrichments'] += 1
-                    
-                    # Track movies not found in TMDB
-                    not_found_info = {
-                        'title': title,
-                        'year': year,
-                        'filename': filename,
-                        'file_path': movie.get('file_path', ''),
-                        'original_category': 'movies'
-                    }
-                    stats['movies_not_found'].append(not_found_info)
-                    self.logger.warning(f"❌ Not found in TMDB: {title} ({year})")
+            to_fetch.append(title_key)
+        
+        if limit:
+            to_fetch = to_fetch[:max(0, limit - stats['total_processed'])]
+        
+        self.logger.info(f"💾 {stats['cache_hits']} cached, ⏭️  {stats['known_misses']} known misses, "
+                         f"🌐 {len(to_fetch)} to look up with {self.workers} workers")
+        
+        # Stage 2: look titles up concurrently; stage 3: write results in batches
+        found: List[Tuple[MediaMetadata, Dict]] = []
+        attempts: List[Tuple[str, str, Optional[int], str, Optional[str]]] = []
+        
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="enrich")
+        futures: Dict[Future, str] = {}
+        try:
+            futures = {
+                executor.submit(self._lookup_title, items[title_key]['title'], items[title_key]['year']): title_key
+                for title_key in to_fetch
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                title_key = futures[future]
+                item = items[title_key]
+                title, year = item['title'], item['year']
                 
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error enriching '{title}' ({year}): {e}")
+                    stats['failed_enrichments'] += 1
+                    attempts.append((title_key, title, year, ERROR, str(e)))
+                else:
+                    if result:
+                        metadata, raw_response = result
+                        found.append((metadata, raw_response))
+                        attempts.append((title_key, title, year, FOUND, None))
+                        self._record_found(stats, item, metadata)
+                    else:
+                        attempts.append((title_key, title, year, NOT_FOUND, None))
+                        self._record_not_found(stats, item)
                 stats['total_processed'] += 1
                 
                 # Progress update
-                if (i + 1) % 10 == 0:
-                    self.logger.info(f"📊 Progress: {i + 1}/{len(movies)} movies processed")
+                if done % 10 == 0:
+                    self.logger.info(f"📊 Progress: {done}/{len(futures)} titles looked up")
                 
-            except Exception as e:
-                self.logger.error(f"Error enriching '{title}' ({year}): {e}")
-                self.logger.debug(f"Movie data structure: {movie}")
-                stats['failed_enrichments'] += 1
-                stats['total_processed'] += 1
-        
-        # Process TV shows (sample a few episodes per show)
-        tv_shows_dict = database.get('tv_shows', {})
-        if tv_shows_dict:
-            self.logger.info(f"Processing TV shows from {len(tv_shows_dict)} shows")
-            
-            # Process a sample of TV shows (take first episode from each show)
-            tv_processed = 0
-            for show_name, show_data in tv_shows_dict.items():
-                if limit and stats['total_processed'] >= limit:
-                    break
-                
-                # Get first episode to represent the show
-                episodes = show_data.get('episodes', [])
-                if episodes:
-                    episode = episodes[0]
-                    filename = episode.get('file_name') or episode.get('title', '')
-                    if filename:
-                        title, year = self.extract_title_and_year(show_name)
-                        
-                        if skip_cached and self.cache.get_metadata(title, year):
-                            stats['cache_hits'] += 1
-                            stats['skipped'] += 1
-                            continue
-                        
-                        try:
-                            metadata = self.enrich_title(title, year)
-                            if metadata:
-                                stats['successful_enrichments'] += 1
-                                
-                                # Track found TV shows
-                                tv_info = {
-                                    'title': title,
-                                    'year': year,
-                                    'show_name': show_name,
-                                    'original_category': 'tv',
-                                    'enriched_type': metadata.media_type,
-                                    'confidence': metadata.confidence,
-                                    'genres': metadata.genres,
-                                    'tmdb_id': metadata.tmdb_id,
-                                    'episode_count': len(episodes)
-                                }
-                                stats['tv_found'].append(tv_info)
-                                
-                                # Track classification changes for TV
-                                if metadata.media_type != 'tv':
-                                    change_info = {
-                                        'title': title,
-                                        'year': year,
-                                        'show_name': show_name,
-                                        'from': 'tv',
-                                        'to': metadata.media_type,
-                                        'confidence': metadata.confidence,
-                                        'reasoning': f"TMDB classification: {', '.join(metadata.genres)}"
-                                    }
-                                    stats['classification_changes'].append(change_info)
-                                    self.logger.info(f"🔄 TV Classification change: {title} ({year}) tv → {metadata.media_type} (confidence: {metadata.confidence:.2f})")
-                            else:
-                                stats['failed_enrichments'] += 1
-                                
-                                # Track TV shows not found
-                                not_found_info = {
-                                    'title': title,
-                                    'year': year,
-                                    'show_name': show_name,
-                                    'original_category': 'tv',
-                                    'episode_count': len(episodes)
-                                }
-                                stats['tv_not_found'].append(not_found_info)
-                                self.logger.warning(f"❌ TV show not found in TMDB: {title} ({year})")
-                            
-                            stats['total_processed'] += 1
-                            tv_processed += 1
-                            
-                            # Progress update for TV
-                            if tv_processed % 5 == 0:
-                                self.logger.info(f"📺 TV Progress: {tv_processed} shows processed")
-                                
-                        except Exception as e:
-                            self.logger.error(f"Error enriching TV show '{title}' ({year}): {e}")
-                            stats['failed_enrichments'] += 1
-                            stats['total_processed'] += 1
+                # Checkpoint so an interrupted run resumes from here
+                if len(attempts) >= CHECKPOINT_EVERY:
+                    self.cache.save_batch(found, attempts)
+                    found, attempts = [], []
+        finally:
+            # Drop queued lookups (shutdown's cancel_futures needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.cache.save_batch(found, attempts)
+        
+        self.events.phase('enrichment', time.time() - enrichment_start, titles=len(title_keys),
+                          looked_up=len(to_fetch), cache_hits=stats['cache_hits'],
+                          successful=stats['successful_enrichments'], failed=stats['failed_enrichments'])
         
         # Generate summary report
         self._generate_enrichment_summary(stats)
@@ -767,6 +872,130 @@ class MetadataEnricher:
         
         return stats
     
+    def _collect_enrichment_items(self, database: Dict, stats: Dict) -> Dict[str, Dict]:
+        """
+        Collect the titles to enrich: every movie and one entry per TV show.
+        
+        Args:
+            database: Loaded media database
+            stats: Enrichment stats (files without a name and repeated titles are counted)
+            
+        Returns:
+            Dictionary mapping cache key to item details, in database order
+        """
+        items: Dict[str, Dict] = {}
+        
+        movies = list(database.get('movies', {}).values())
+        self.logger.info(f"Processing {len(movies)} movies")
+        for movie in movies:
+            # Get the filename to extract title and year
+            filename = movie.get('file_name') or movie.get('title', '')
+            if not filename:
+                self.logger.warning(f"Skipping movie with no filename: {movie}")
+                stats['failed_enrichments'] += 1
+                stats['total_processed'] += 1
+                continue
+            
+            title, year = self.extract_title_and_year(filename)
+            title_key = self.cache.title_key(title, year)
+            if title_key in items:
+                # Another file of the same title shares its lookup
+                stats['cache_hits'] += 1
+                stats['skipped'] += 1
+                continue
+            items[title_key] = {
+                'kind': 'movies', 'title': title, 'year': year,
+                'filename': filename, 'file_path': movie.get('file_path', '')
+            }
+        
+        # TV shows are represented by the show name (one lookup per show)
+        tv_shows_dict = database.get('tv_shows', {})
+        if tv_shows_dict:
+            self.logger.info(f"Processing TV shows from {len(tv_shows_dict)} shows")
+        for show_name, show_data in tv_shows_dict.items():
+            episodes = show_data.get('episodes', [])
+            if not episodes or not (episodes[0].get('file_name') or episodes[0].get('title')):
+                continue
+            
+            title, year = self.extract_title_and_year(show_name)
+            title_key = self.cache.title_key(title, year)
+            if title_key in items:
+                stats['cache_hits'] += 1
+                stats['skipped'] += 1
+                continue
+            items[title_key] = {
+                'kind': 'tv', 'title': title, 'year': year,
+                'show_name': show_name, 'episode_count': len(episodes)
+            }
+        
+        return items
+    
+    def _record_found(self, stats: Dict, item: Dict, metadata: MediaMetadata) -> None:
+        """Add a successful lookup to the enrichment stats."""
+        title, year, kind = item['title'], item['year'], item['kind']
+        stats['successful_enrichments'] += 1
+        self.events.classification(title, kind, metadata.media_type, metadata.confidence, 'tmdb',
+                                   f"TMDB classification: {', '.join(metadata.genres)}", year=year)
+        if not self.events.enabled:
+            self.logger.info(f"✓ Enriched {title} as {metadata.media_type} (confidence: {metadata.confidence:.2f})")
+        
+        found_info = {
+            'title': title,
+            'year': year,
+            'original_category': kind,
+            'enriched_type': metadata.media_type,
+            'confidence': metadata.confidence,
+            'genres': metadata.genres,
+            'tmdb_id': metadata.tmdb_id
+        }
+        change_info = {
+            'title': title,
+            'year': year,
+            'from': kind,
+            'to': metadata.media_type,
+            'confidence': metadata.confidence,
+            'reasoning': f"TMDB classification: {', '.join(metadata.genres)}"
+        }
+        if kind == 'movies':
+            found_info.update(filename=item['filename'], file_path=item['file_path'])
+            change_info['filename'] = item['filename']
+            stats['movies_found'].append(found_info)
+        else:
+            found_info.update(show_name=item['show_name'], episode_count=item['episode_count'])
+            change_info['show_name'] = item['show_name']
+            stats['tv_found'].append(found_info)
+        
+        # Track classification changes
+        if metadata.media_type != kind:
+            stats['classification_changes'].append(change_info)
+            label = "Classification change" if kind == 'movies' else "TV Classification change"
+            self.logger.info(f"🔄 {label}: {title} ({year}) {kind} → {metadata.media_type} (confidence: {metadata.confidence:.2f})")
+    
+    def _record_not_found(self, stats: Dict, item: Dict) -> None:
+        """Add a title TMDB did not find to the enrichment stats."""
+        title, year = item['title'], item['year']
+        stats['failed_enrichments'] += 1
+        self.events.classification(title, item['kind'], None, 0.0, 'tmdb', "Not found in TMDB", year=year)
+        
+        if item['kind'] == 'movies':
+            stats['movies_not_found'].append({
+                'title': title,
+                'year': year,
+                'filename': item['filename'],
+                'file_path': item['file_path'],
+                'original_category': 'movies'
+            })
+            self.logger.warning(f"❌ Not found in TMDB: {title} ({year})")
+        else:
+            stats['tv_not_found'].append({
+                'title': title,
+                'year': year,
+                'show_name': item['show_name'],
+                'original_category': 'tv',
+                'episode_count': item['episode_count']
+            })
+            self.logger.warning(f"❌ TV show not found in TMDB: {title} ({year})")
+    
     def _generate_enrichment_summary(self, stats: Dict) -> None:
         """Generate comprehensive summary of enrichment results."""
         self.logger.info("=" * 80)
@@ -0,0 +1,409 @@
+"""Journaled, resumable move executor shared by the media movers.
+
+Every mover used to call ``shutil.move`` one file at a time.  Across NAS shares
+that is a full copy plus delete, so a season pack blocked the whole run one
+episode at a time, and an interrupted run left no record of what had already
+been moved.  This engine:
+
+1. Appends each planned operation to a write-ahead journal (fsync'd) before
+   touching the filesystem
+2. Runs same-filesystem moves immediately as atomic renames
+3. Runs cross-filesystem moves on a bounded thread pool with one lane per
+   destination volume, copying to a hidden ``.partial`` name first, renaming
+   it into place, and only then deleting the source
+4. Replays unfinished journal entries on restart (``resume``)
+
+Key Features:
+- ``submit`` returns a ``Future``; renames come back already resolved
+- Pending targets are reserved so callers can avoid name collisions
+- A copy interrupted at any point is either redone or finished on resume
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Union
+
+from .profiler import span
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Journal event names
+PLANNED = 'planned'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class MoveOutcome(NamedTuple):
+    """Result of one move operation."""
+    op_id: str
+    source: str
+    target: str
+    success: bool
+    error: Optional[str] = None
+    size: int = 0
+    copied: bool = False  # True for cross-filesystem copies
+
+
+def default_journal_path() -> Path:
+    """
+    Get the default move journal path.
+
+    Returns:
+        Path inside the project's database directory
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    database_dir = project_root / "database"
+    database_dir.mkdir(exist_ok=True)
+    return database_dir / "move_journal.jsonl"
+
+
+def path_size(path: PathLike) -> int:
+    """Get the size of a file, or the total size of the files under a folder."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    continue
+        return total
+    return os.lstat(path).st_size
+
+
+def partial_path(target: PathLike) -> Path:
+    """Get the hidden temporary name a cross-filesystem copy is written to."""
+    target = Path(target)
+    return target.parent / f".{target.name}.partial"
+
+
+class MoveEngine:
+    """Executes file and folder moves through an append-only journal."""
+
+    def __init__(self, journal_path: Optional[PathLike] = None,
+                 workers_per_volume: Optional[int] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            journal_path: Journal file (defaults to database/move_journal.jsonl)
+            workers_per_volume: Concurrent copies per destination volume
+        """
+        if workers_per_volume is None:
+            from ..config.config import config
+            workers_per_volume = config.move_workers_per_volume
+
+        self.journal_path = Path(journal_path) if journal_path else default_journal_path()
+        self.workers_per_volume = max(1, workers_per_volume)
+        self._lock = threading.Lock()
+        self._lanes: Dict[int, ThreadPoolExecutor] = {}
+        self._pending: List[Future] = []
+        self._reserved: Set[str] = set()
+        self._listeners: List[Callable[[MoveOutcome], None]] = []
+
+    def add_listener(self, listener: Callable[[MoveOutcome], None]) -> None:
+        """
+        Register a callback run with the outcome of every finished move.
+
+        Listeners run on the thread that finished the move (a lane thread for
+        cross-filesystem copies).
+
+        Args:
+            listener: Callable taking a MoveOutcome
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[MoveOutcome], None]) -> None:
+        """
+        Unregister a callback added with ``add_listener`` (no-op if absent).
+
+        Args:
+            listener: The registered callable
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    # ===== JOURNAL =====
+
+    def _append(self, record: Dict) -> None:
+        """Append one record to the journal and flush it to disk."""
+        record['ts'] = datetime.now().isoformat()
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        with self._lock:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'ab+') as f:
+                # Never glue a record onto a line torn by an earlier crash
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def unfinished_operations(self) -> List[Dict]:
+        """
+        Read planned operations that never reached a final state.
+
+        Returns:
+            Planned records (op, source, target, size) in journal order
+        """
+        if not self.journal_path.exists():
+            return []
+
+        planned: Dict[str, Dict] = {}
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    continue
+                if record.get('event') == PLANNED:
+                    planned[record['op']] = record
+                else:
+                    planned.pop(record.get('op'), None)
+        return list(planned.values())
+
+    # ===== SUBMISSION =====
+
+    def is_target_taken(self, target: PathLike) -> bool:
+        """
+        Check whether a target path exists or is reserved by a pending move.
+
+        Args:
+            target: Candidate target path
+
+        Returns:
+            True if the path cannot be used as a new move target
+        """
+        with self._lock:
+            if str(target) in self._reserved:
+                return True
+        return os.path.lexists(target)
+
+    def submit(self, source: PathLike, target: PathLike,
+               size: Optional[int] = None) -> "Future[MoveOutcome]":
+        """
+        Journal and start a move of a file or folder.
+
+        Same-filesystem moves complete before this returns; cross-filesystem
+        moves are queued on the destination volume's lane.
+
+        Args:
+            source: File or folder to move
+            target: Full destination path (its parent is created if missing)
+            size: Optional size in bytes (defaults to the file or folder tree size)
+
+        Returns:
+            Future resolving to the MoveOutcome
+        """
+        return self._submit(uuid.uuid4().hex[:12], str(source), str(target), size, journal=True)
+
+    def _submit(self, op_id: str, source: str, target: str,
+                size: Optional[int], journal: bool) -> "Future[MoveOutcome]":
+        """Start a move, optionally writing its planned record first."""
+        if size is None:
+            try:
+                size = path_size(source)
+            except OSError:
+                size = 0
+
+        if journal and self.is_target_taken(target):
+            return self._resolved(MoveOutcome(op_id, source, target, False,
+                                              f"Target already exists: {target}", size))
+
+        try:
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+            volume = os.stat(Path(target).parent).st_dev
+            same_volume = os.stat(source).st_dev == volume
+        except OSError as e:
+            return self._resolved(MoveOutcome(op_id, source, target, False, str(e), size))
+
+        if journal:
+            self._append({'event': PLANNED, 'op': op_id, 'source': source,
+                          'target': target, 'size': size})
+
+        if same_volume:
+            return self._resolved(self._rename(op_id, source, target, size))
+
+        with self._lock:
+            self._reserved.add(target)
+            lane = self._lanes.get(volume)
+            if lane is None:
+                lane = self._lanes[volume] = ThreadPoolExecutor(
+                    max_workers=self.workers_per_volume,
+                    thread_name_prefix=f"move-lane-{volume}"
+                )
+            future = lane.submit(self._copy, op_id, source, target, size)
+            self._pending.append(future)
+        return future
+
+    @staticmethod
+    def _resolved(outcome: MoveOutcome) -> "Future[MoveOutcome]":
+        """Wrap an outcome in an already-completed Future."""
+        future: Future = Future()
+        future.set_result(outcome)
+        return future
+
+    def has_pending(self) -> bool:
+        """Check whether any cross-filesystem moves are still queued or running."""
+        with self._lock:
+            return any(not future.done() for future in self._pending)
+
+    def wait(self) -> List[MoveOutcome]:
+        """
+        Wait for every queued move to finish.
+
+        Returns:
+            Outcomes of the queued moves submitted since the last wait
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return [future.result() for future in pending]
+
+    def shutdown(self) -> List[MoveOutcome]:
+        """Wait for queued moves and stop the lane threads."""
+        outcomes = self.wait()
+        with self._lock:
+            lanes, self._lanes = self._lanes, {}
+        for lane in lanes.values():
+            lane.shutdown(wait=True)
+        return outcomes
+
+    # ===== EXECUTION =====
+
+    def _rename(self, op_id: str, source: str, target: str, size: int) -> MoveOutcome:
+        """Move within one filesystem with an atomic rename."""
+        try:
+            with span('move.rename'):
+                os.rename(source, target)
+        except OSError as e:
+            return self._finish(MoveOutcome(op_id, source, target, False, str(e), size))
+        return self._finish(MoveOutcome(op_id, source, target, True, None, size))
+
+    def _copy(self, op_id: str, source: str, target: str, size: int) -> MoveOutcome:
+        """Move across filesystems: copy to a partial name, rename, delete source."""
+        partial = partial_path(target)
+        try:
+            with span('move.copy', size):
+                self._remove(partial)
+                if os.path.isdir(source):
+                    shutil.copytree(source, partial)
+                else:
+                    shutil.copy2(source, partial)
+                os.rename(partial, target)
+                self._remove(source)
+            outcome = MoveOutcome(op_id, source, target, True, None, size, copied=True)
+        except OSError as e:
+            self._remove(partial)
+            outcome = MoveOutcome(op_id, source, target, False, str(e), size, copied=True)
+        return self._finish(outcome)
+
+    def _finish(self, outcome: MoveOutcome) -> MoveOutcome:
+        """Journal the final state of an operation and release its target."""
+        record = {'event': DONE if outcome.success else FAILED, 'op': outcome.op_id}
+        if outcome.error:
+            record['error'] = outcome.error
+        self._append(record)
+        with self._lock:
+            self._reserved.discard(outcome.target)
+        if outcome.success:
+            logger.info(f"Moved {outcome.source} -> {outcome.target}")
+        else:
+            logger.error(f"Move failed {outcome.source} -> {outcome.target}: {outcome.error}")
+        for listener in list(self._listeners):
+            try:
+                listener(outcome)
+            except Exception as e:
+                logger.warning(f"Move listener failed for {outcome.op_id}: {e}")
+        return outcome
+
+    @staticmethod
+    def _remove(path: PathLike) -> None:
+        """Delete a file or folder if it exists."""
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        elif os.path.lexists(path):
+            os.remove(path)
+
+    # ===== RECOVERY =====
+
+    def resume(self) -> List[MoveOutcome]:
+        """
+        Finish or redo the operations an interrupted run left in the journal.
+
+        Partial copies are rolled into place only after a completed rename, so
+        an existing target of the journaled size with a surviving source means
+        just the source deletion was lost.  A target of any other size is not
+        this operation's copy; the source is kept and the operation fails.
+        Anything else is copied again from scratch.
+
+        Returns:
+            Outcomes of the recovered operations
+        """
+        outcomes = []
+        redone = []
+        for record in self.unfinished_operations():
+            op_id, source, target = record['op'], record['source'], record['target']
+            size = record.get('size', 0)
+            source_exists = os.path.lexists(source)
+            target_exists = os.path.lexists(target)
+
+            if target_exists:
+                try:
+                    if source_exists:
+                        target_size = path_size(target)
+                        if target_size != size:
+                            outcomes.append(self._finish(MoveOutcome(
+                                op_id, source, target, False,
+                                f"Target is {target_size} bytes, expected {size}; source kept", size
+                            )))
+                            continue
+                        self._remove(source)
+                    outcomes.append(self._finish(MoveOutcome(op_id, source, target, True, None, size)))
+                except OSError as e:
+                    outcomes.append(self._finish(MoveOutcome(op_id, source, target, False, str(e), size)))
+            elif source_exists:
+                try:
+                    self._remove(partial_path(target))
+                except OSError:
+                    pass
+                redone.append(self._submit(op_id, source, target, size, journal=False))
+            else:
+                outcomes.append(self._finish(MoveOutcome(
+                    op_id, source, target, False, "Source and target both missing", size
+                )))
+
+        outcomes.extend(future.result() for future in redone)
+        with self._lock:
+            self._pending = [f for f in self._pending if f not in redone]
+
+        if outcomes:
+            logger.info(f"Resumed {len(outcomes)} interrupted moves from {self.journal_path}")
+        self._compact()
+        return outcomes
+
+    def _compact(self) -> None:
+        """Drop finished operations from the journal."""
+        unfinished = self.unfinished_operations()
+        with self._lock:
+            if not self.journal_path.exists():
+                return
+            temp_path = self.journal_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in unfinished:
+                    f.write(json.dumps(record) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.journal_path)
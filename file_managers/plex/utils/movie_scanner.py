@@ -1,12 +1,14 @@
 """Movie duplicate detection utilities."""
 
 import os
-import re
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 from collections import defaultdict
 
 from ..config.config import config
+from .filename_parser import parse_filename
+from .fs_walker import FileEntry, walk_files
+from .content_hasher import ContentHasher
 
 # Get movie directories from config
 MOVIE_DIRECTORIES = config.movie_directories
@@ -19,6 +21,7 @@ class MovieFile(NamedTuple):
     normalized_name: str
     size: int
     year: str
+    mtime: float = 0.0  # Last modification time (from the directory walk)
 
 
 class DuplicateGroup(NamedTuple):
@@ -26,6 +29,7 @@ class DuplicateGroup(NamedTuple):
     normalized_name: str
     files: List[MovieFile]
     best_file: MovieFile  # The file to keep (largest/best quality)
+    identical_files: Optional[List[List[str]]] = None  # Byte-identical paths (when verified)
 
 
 def normalize_movie_name(filename: str) -> str:
@@ -35,42 +39,13 @@ def normalize_movie_name(filename: str) -> str:
     Removes quality indicators, release groups, and other metadata
     to focus on the actual movie title.
     """
-    # Remove file extension
-    name = Path(filename).stem
-    
-    # Common patterns to remove
-    patterns_to_remove = [
-        r'\b(720p|1080p|480p|4K|2160p)\b',  # Quality
-        r'\b(BluRay|BRRip|DVDRip|WEBRip|HDTV|CAM|TS)\b',  # Source
-        r'\b(x264|x265|H264|H265|HEVC|DivX|XviD)\b',  # Codec
-        r'\b(AC3|DTS|AAC|MP3)\b',  # Audio
-        r'\[(.*?)\]',  # Release group in brackets
-        r'\{(.*?)\}',  # Release group in braces
-        r'-\w+$',  # Release group at end after dash
-        r'\.REPACK\.',  # Repack indicator
-        r'\.PROPER\.',  # Proper release indicator
-        r'\.EXTENDED\.',  # Extended cut
-        r'\.UNRATED\.',  # Unrated version
-        r'\.DC\.',  # Director's cut
-    ]
-    
-    # Apply removal patterns
-    for pattern in patterns_to_remove:
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-    
-    # Replace dots, underscores, and multiple spaces with single space
-    name = re.sub(r'[._]+', ' ', name)
-    name = re.sub(r'\s+', ' ', name)
-    
-    # Remove leading/trailing whitespace and convert to lowercase
-    return name.strip().lower()
+    return parse_filename(filename).normalized_title
 
 
 def extract_year_from_filename(filename: str) -> str:
     """Extract year from movie filename."""
-    # Look for 4-digit year pattern
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', filename)
-    return year_match.group(1) if year_match else ""
+    year = parse_filename(filename).name_year
+    return str(year) if year else ""
 
 
 def scan_directory_for_movies(directory_path: str) -> List[MovieFile]:
@@ -86,28 +61,25 @@ def scan_directory_for_movies(directory_path: str) -> List[MovieFile]:
     if not directory.exists():
         raise FileNotFoundError(f"Directory not found: {directory_path}")
     
-    for file_path in directory.rglob('*'):
-        if file_path.is_file() and file_path.suffix.lower() in movie_extensions:
-            try:
-                size = file_path.stat().st_size
-                name = file_path.name
-                normalized_name = normalize_movie_name(name)
-                year = extract_year_from_filename(name)
-                
-                movies.append(MovieFile(
-                    path=file_path,
-                    name=name,
-                    normalized_name=normalized_name,
-                    size=size,
-                    year=year
-                ))
-            except (OSError, PermissionError):
-                # Skip files we can't access
-                continue
+    for entry in walk_files([directory_path], movie_extensions):
+        movies.append(movie_file_from_entry(entry))
     
     return movies
 
 
+def movie_file_from_entry(entry: FileEntry) -> MovieFile:
+    """Build a MovieFile from a directory walk record."""
+    parsed = parse_filename(entry.name)
+    return MovieFile(
+        path=Path(entry.path),
+        name=entry.name,
+        normalized_name=parsed.normalized_title,
+        size=entry.size,
+        year=str(parsed.name_year) if parsed.name_year else "",
+        mtime=entry.mtime
+    )
+
+
 def find_duplicate_movies_in_static_paths() -> List[DuplicateGroup]:
     """
     Find duplicate movies in the predefined static directory paths.
@@ -131,12 +103,14 @@ def find_duplicate_movies_custom(directory_paths: List[str]) -> List[DuplicateGr
     return find_duplicate_movies(directory_paths)
 
 
-def find_duplicate_movies(directory_paths: List[str]) -> List[DuplicateGroup]:
+def find_duplicate_movies(directory_paths: List[str],
+                          verify_content: bool = False) -> List[DuplicateGroup]:
     """
     Find duplicate movies across multiple directories.
     
     Args:
         directory_paths: List of directory paths to scan
+        verify_content: Also record which files are byte-identical
         
     Returns:
         List of DuplicateGroup objects containing duplicate movies
@@ -161,18 +135,27 @@ def find_duplicate_movies(directory_paths: List[str]) -> List[DuplicateGroup]:
     
     # Find groups with duplicates
     duplicates = []
+    hasher = ContentHasher() if verify_content else None
     for normalized_name, movies in movie_groups.items():
         if len(movies) > 1:
             # Sort by size to find largest (best quality)
             movies_sorted = sorted(movies, key=lambda x: x.size, reverse=True)
             best_file = movies_sorted[0]  # Largest file = best quality
             
+            identical_files = None
+            if hasher is not None:
+                identical_files = hasher.find_identical(m.path for m in movies)
+            
             duplicates.append(DuplicateGroup(
                 normalized_name=normalized_name,
                 files=movies,
-                best_file=best_file
+                best_file=best_file,
+                identical_files=identical_files
             ))
     
+    if hasher is not None:
+        hasher.close()
+    
     return duplicates
 
 
@@ -220,6 +203,9 @@ def print_duplicate_report(duplicates: List[DuplicateGroup]) -> None:
             if movie.year:
                 print(f"         📅 Year: {movie.year}")
         
+        for paths in group.identical_files or []:
+            print(f"   🔒 Byte-identical copies: {', '.join(Path(p).name for p in paths)}")
+        
         print(f"\n   ✅ Recommended action: Keep {group.best_file.name}")
         print(f"      📂 Location: {group.best_file.path.parent}")
         print(f"      💿 Space saved by removing duplicates: {format_file_size(group_wasted)}")
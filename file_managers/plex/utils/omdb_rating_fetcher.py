@@ -3,15 +3,23 @@ OMDB Rating Fetcher - Fetch movie ratings and build database for quality managem
 
 This utility fetches ratings from OMDB API for movies in the collection and stores
 them in a local database for future operations like deleting badly rated movies.
+
+Bulk fetches resolve cached ratings in one query, then request the misses on a
+bounded thread pool sharing one pooled session and one token bucket set to the
+API plan. Titles OMDB does not know and failed lookups are stored with a
+retry-after time, and results are saved in small batches as they arrive, so an
+interrupted fetch resumes where it stopped.
 """
 
 import os
 import json
 import sqlite3
+import threading
 import time
 import logging
 import re
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
@@ -35,6 +43,31 @@ except ImportError:
                     os.environ[key] = value
 
 from ..config.config import config
+from .event_stream import EventStream, open_event_stream
+from .rate_limiter import AdaptiveRateLimiter
+
+# Lookup outcomes
+FOUND = 'found'
+NOT_FOUND = 'not_found'
+ERROR = 'error'
+LIMITED = 'limited'  # Plan quota reached (or still throttled after retries)
+THROTTLED = 'throttled'  # HTTP 429; retried once the rate limiter slows down
+
+# HTTP 429 answers retried per title before it is left for the next run
+THROTTLE_RETRIES = 3
+
+# Cached ratings older than this are fetched again
+RATING_MAX_AGE = timedelta(days=30)
+
+# Results saved per database write during bulk fetches
+CHECKPOINT_EVERY = 25
+
+# Event stream of each session (fetchers started in the same second share it)
+_session_streams: Dict[str, EventStream] = {}
+
+_RATING_COLUMNS = ['title_key', 'title', 'year', 'imdb_id', 'imdb_rating', 'rotten_tomatoes',
+                   'metacritic', 'omdb_plot', 'omdb_genre', 'omdb_director', 'omdb_runtime',
+                   'file_path', 'file_size', 'last_updated', 'api_source']
 
 
 @dataclass
@@ -110,8 +143,11 @@ class MovieRating:
 class OMDBRatingDatabase:
     """SQLite database for movie ratings."""
     
-    def __init__(self, db_file: str = "movie_ratings.db"):
-        self.db_path = Path(__file__).parent.parent.parent.parent / 'database' / db_file
+    def __init__(self, db_file: str = "movie_ratings.db", db_path: Optional[str] = None):
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            self.db_path = Path(__file__).parent.parent.parent.parent / 'database' / db_file
         self.db_path.parent.mkdir(exist_ok=True)
         self._init_database()
     
@@ -145,6 +181,20 @@ class OMDBRatingDatabase:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_quality_score ON movie_ratings(imdb_rating, rotten_tomatoes, metacritic)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_last_updated ON movie_ratings(last_updated)')
         
+        # Titles OMDB did not find (or failed to answer), skipped until retry_after
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS rating_misses (
+                title_key TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                year INTEGER,
+                reason TEXT NOT NULL,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 1,
+                last_attempt TEXT NOT NULL,
+                retry_after TEXT NOT NULL
+            )
+        ''')
+        
         conn.commit()
         conn.close()
     
@@ -200,6 +250,110 @@ class OMDBRatingDatabase:
         conn.commit()
         conn.close()
     
+    def get_ratings_bulk(self, title_keys: List[str]) -> Dict[str, MovieRating]:
+        """
+        Get stored ratings for many titles with a single query.
+        
+        Args:
+            title_keys: Keys from ``title_key``
+            
+        Returns:
+            Dictionary mapping title key to MovieRating (missing keys are omitted)
+        """
+        if not title_keys:
+            return {}
+        
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.execute('CREATE TEMP TABLE lookup_keys (title_key TEXT PRIMARY KEY)')
+            conn.executemany('INSERT OR IGNORE INTO lookup_keys VALUES (?)', [(k,) for k in title_keys])
+            rows = conn.execute('''
+                SELECT r.* FROM movie_ratings r JOIN lookup_keys k ON r.title_key = k.title_key
+            ''').fetchall()
+        finally:
+            conn.close()
+        
+        ratings = {}
+        for row in rows:
+            data = dict(zip(_RATING_COLUMNS, row))
+            title_key = data.pop('title_key')
+            data['last_updated'] = datetime.fromisoformat(data['last_updated'])
+            ratings[title_key] = MovieRating(**data)
+        return ratings
+    
+    def get_pending_misses(self, title_keys: List[str]) -> Dict[str, datetime]:
+        """
+        Get titles that failed recently and should not be looked up yet.
+        
+        Args:
+            title_keys: Keys from ``title_key``
+            
+        Returns:
+            Dictionary mapping title key to its retry-after time (future times only)
+        """
+        if not title_keys:
+            return {}
+        
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.execute('CREATE TEMP TABLE lookup_keys (title_key TEXT PRIMARY KEY)')
+            conn.executemany('INSERT OR IGNORE INTO lookup_keys VALUES (?)', [(k,) for k in title_keys])
+            rows = conn.execute('''
+                SELECT m.title_key, m.retry_after FROM rating_misses m
+                JOIN lookup_keys k ON m.title_key = k.title_key
+                WHERE m.retry_after > ?
+            ''', (datetime.now().isoformat(),)).fetchall()
+        finally:
+            conn.close()
+        
+        return {title_key: datetime.fromisoformat(retry_after) for title_key, retry_after in rows}
+    
+    def save_results(self, ratings: List[Tuple[str, MovieRating]],
+                     misses: List[Tuple[str, str, Optional[int], str, Optional[str], datetime]]) -> None:
+        """
+        Save a batch of fetch results in one transaction.
+        
+        Results are keyed by the requested title, so later lookups of the same
+        filename find them even when OMDB returns a different spelling.
+        
+        Args:
+            ratings: (title key, rating) pairs found (any earlier miss is cleared)
+            misses: (title key, title, year, reason, error, retry_after) for titles not rated
+        """
+        if not ratings and not misses:
+            return
+        
+        now = datetime.now().isoformat()
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.executemany('''
+                INSERT OR REPLACE INTO movie_ratings 
+                (title_key, title, year, imdb_id, imdb_rating, rotten_tomatoes, metacritic,
+                 omdb_plot, omdb_genre, omdb_director, omdb_runtime, file_path, file_size, 
+                 last_updated, api_source)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(
+                title_key, rating.title, rating.year, rating.imdb_id, rating.imdb_rating,
+                rating.rotten_tomatoes, rating.metacritic, rating.omdb_plot, rating.omdb_genre,
+                rating.omdb_director, rating.omdb_runtime, rating.file_path, rating.file_size,
+                rating.last_updated.isoformat(), rating.api_source
+            ) for title_key, rating in ratings])
+            conn.executemany('DELETE FROM rating_misses WHERE title_key = ?',
+                             [(title_key,) for title_key, _ in ratings])
+            conn.executemany('''
+                INSERT INTO rating_misses
+                (title_key, title, year, reason, error, attempts, last_attempt, retry_after)
+                VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(title_key) DO UPDATE SET
+                    reason = excluded.reason, error = excluded.error,
+                    attempts = attempts + 1, last_attempt = excluded.last_attempt,
+                    retry_after = excluded.retry_after
+            ''', [(title_key, title, year, reason, error, now, retry_after.isoformat())
+                  for title_key, title, year, reason, error, retry_after in misses])
+            conn.commit()
+        finally:
+            conn.close()
+    
     def get_badly_rated_movies(self, imdb_threshold: float = 5.0, rt_threshold: int = 30, 
                              meta_threshold: int = 40) -> List[MovieRating]:
         """Get all badly rated movies."""
@@ -256,6 +410,10 @@ class OMDBRatingDatabase:
             'database_path': str(self.db_path)
         }
     
+    def title_key(self, title: str, year: Optional[int]) -> str:
+        """Get the database key for a title and year."""
+        return self._generate_title_key(title, year)
+    
     def _generate_title_key(self, title: str, year: Optional[int]) -> str:
         """Generate unique key for title and year."""
         clean_title = re.sub(r'[^\w\s]', '', title.lower()).strip()
@@ -266,44 +424,75 @@ class OMDBRatingDatabase:
 class OMDBRatingFetcher:
     """Fetches movie ratings from OMDB API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, database: Optional[OMDBRatingDatabase] = None,
+                 workers: Optional[int] = None, rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        """
+        Initialize the fetcher.
+        
+        Args:
+            api_key: OMDB API key (defaults to the OMDB_API_KEY environment variable)
+            database: Ratings database (defaults to database/movie_ratings.db)
+            workers: Concurrent requests in bulk fetches (default from config)
+            rate_limiter: Shared request limiter (default: the plan rate from config)
+        """
         self.api_key = api_key or os.getenv('OMDB_API_KEY', '42df6e0e')
         self.base_url = "http://www.omdbapi.com/"
         self.session = requests.Session()
-        self.database = OMDBRatingDatabase()
+        self.database = database or OMDBRatingDatabase()
+        self.workers = max(1, workers or config.omdb_workers)
         
-        # Setup session with retry strategy
+        # Setup session with retry strategy (one pooled connection per worker).
+        # 429 is left out so throttling reaches the rate limiter.
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.workers)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 0.1  # 10 requests per second max
+        requests_per_second = config.omdb_requests_per_second
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            rate=requests_per_second,
+            min_rate=min(1.0, requests_per_second),
+            max_rate=requests_per_second,
+            capacity=self.workers
+        )
         
-        # Setup logging
+        # Setup logging (per-request records go to the event stream)
+        self.events = EventStream()
         self.logger = self._setup_logging()
         
         # Stats
+        self._stats_lock = threading.Lock()
         self.stats = {
             'api_calls': 0,
             'successful_fetches': 0,
             'failed_fetches': 0,
             'cache_hits': 0,
-            'rate_limited': 0
+            'rate_limited': 0,
+            'skipped_misses': 0
         }
     
+    def _count(self, stat: str) -> None:
+        """Increment a stats counter (called from worker threads)."""
+        with self._stats_lock:
+            self.stats[stat] += 1
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the rating fetcher."""
         session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         logger = logging.getLogger(f"omdb_rating_fetcher_{session_id}")
         
         if logger.handlers:
+            # Another fetcher started this second and already logs to the file;
+            # write to the same session's event stream
+            self.log_file_path = Path("logs") / f"omdb_rating_fetcher_{session_id}.log"
+            self.events = _session_streams.get(session_id, self.events)
             return logger
         
         logger.setLevel(logging.INFO)
@@ -326,6 +515,8 @@ class OMDBRatingFetcher:
         logger.addHandler(file_handler)
         
         self.log_file_path = log_file
+        self.events = open_event_stream(logs_dir, "omdb_rating_fetcher", session_id)
+        _session_streams[session_id] = self.events
         logger.info("=" * 60)
         logger.info(f"OMDB Rating Fetcher Session Started: {session_id}")
         logger.info(f"API Key: {self.api_key[:8]}..." if self.api_key else "No API key")
@@ -369,13 +560,24 @@ class OMDBRatingFetcher:
         cached = self.database.get_rating(title, year)
         if cached:
             # Check if cache is recent (less than 30 days old)
-            if datetime.now() - cached.last_updated < timedelta(days=30):
-                self.stats['cache_hits'] += 1
-                self.logger.debug(f"Cache hit for {title} ({year})")
+            if datetime.now() - cached.last_updated < RATING_MAX_AGE:
+                self._count('cache_hits')
+                self.events.cache_hit('omdb_ratings', self.database.title_key(title, year))
                 return cached
         
         self._rate_limit()
-        self.stats['api_calls'] += 1
+        status, rating, _ = self._query_omdb(title, year, imdb_id)
+        return rating if status == FOUND else None
+    
+    def _query_omdb(self, title: str, year: Optional[int] = None,
+                    imdb_id: Optional[str] = None) -> Tuple[str, Optional[MovieRating], Optional[str]]:
+        """
+        Request one title from OMDB (the caller handles pacing).
+        
+        Returns:
+            (status, rating, error) where status is FOUND, NOT_FOUND, ERROR, LIMITED or THROTTLED
+        """
+        self._count('api_calls')
         
         # Prepare API parameters
         params = {'apikey': self.api_key}
@@ -387,90 +589,146 @@ class OMDBRatingFetcher:
             if year:
                 params['y'] = str(year)
         
+        start = time.time()
         try:
-            self.logger.debug(f"API request for {title} ({year})")
             response = self.session.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+            self.events.api_call('omdb', 'title', response.status_code, time.time() - start,
+                                 title=title, year=year)
+            if response.status_code == 429:
+                self._count('rate_limited')
+                return THROTTLED, None, "HTTP 429"
             
-            data = response.json()
+            try:
+                data = response.json()
+            except ValueError:
+                response.raise_for_status()
+                raise
             
             if data.get('Response') == 'False':
-                self.logger.warning(f"OMDB API returned error for {title}: {data.get('Error')}")
-                self.stats['failed_fetches'] += 1
-                return None
-            
-            # Parse rating data
-            imdb_rating = None
-            if data.get('imdbRating') and data['imdbRating'] != 'N/A':
-                try:
-                    imdb_rating = float(data['imdbRating'])
-                except ValueError:
-                    pass
+                error = data.get('Error') or 'Unknown error'
+                self.logger.warning(f"OMDB API returned error for {title}: {error}")
+                self._count('failed_fetches')
+                if 'limit' in error.lower():
+                    self._count('rate_limited')
+                    return LIMITED, None, error
+                if 'not found' in error.lower():
+                    return NOT_FOUND, None, error
+                return ERROR, None, error
             
-            rotten_tomatoes = None
-            metacritic = None
-            
-            # Parse Ratings array
-            for rating in data.get('Ratings', []):
-                source = rating.get('Source', '')
-                value = rating.get('Value', '')
-                
-                if 'Rotten Tomatoes' in source and '%' in value:
-                    try:
-                        rotten_tomatoes = int(value.replace('%', ''))
-                    except ValueError:
-                        pass
-                elif 'Metacritic' in source and '/' in value:
-                    try:
-                        metacritic = int(value.split('/')[0])
-                    except ValueError:
-                        pass
-            
-            rating_obj = MovieRating(
-                title=data.get('Title', title),
-                year=int(data.get('Year', year or 0)) if data.get('Year') and data['Year'] != 'N/A' else year,
-                imdb_id=data.get('imdbID'),
-                imdb_rating=imdb_rating,
-                rotten_tomatoes=rotten_tomatoes,
-                metacritic=metacritic,
-                omdb_plot=data.get('Plot') if data.get('Plot') != 'N/A' else None,
-                omdb_genre=data.get('Genre') if data.get('Genre') != 'N/A' else None,
-                omdb_director=data.get('Director') if data.get('Director') != 'N/A' else None,
-                omdb_runtime=data.get('Runtime') if data.get('Runtime') != 'N/A' else None,
-                file_path="",  # Will be set by caller
-                file_size=0,   # Will be set by caller
-                last_updated=datetime.now()
-            )
+            response.raise_for_status()
+            rating_obj = self._parse_rating(data, title, year)
             
-            self.stats['successful_fetches'] += 1
-            self.logger.info(f"Successfully fetched rating for {title}: IMDB={imdb_rating}, RT={rotten_tomatoes}%, Meta={metacritic}")
+            self._count('successful_fetches')
+            if not self.events.enabled:
+                self.logger.info(f"Successfully fetched rating for {title}: IMDB={rating_obj.imdb_rating}, RT={rating_obj.rotten_tomatoes}%, Meta={rating_obj.metacritic}")
             
-            return rating_obj
+            return FOUND, rating_obj, None
             
         except requests.exceptions.RequestException as e:
+            self.events.api_call('omdb', 'title', 'error', time.time() - start, title=title, year=year,
+                                 error=str(e))
             self.logger.error(f"API request failed for {title}: {e}")
-            self.stats['failed_fetches'] += 1
-            return None
+            self._count('failed_fetches')
+            return ERROR, None, str(e)
         except Exception as e:
             self.logger.error(f"Error processing rating for {title}: {e}")
-            self.stats['failed_fetches'] += 1
-            return None
+            self._count('failed_fetches')
+            return ERROR, None, str(e)
+    
+    def _parse_rating(self, data: Dict[str, Any], title: str, year: Optional[int]) -> MovieRating:
+        """Build a MovieRating from an OMDB response."""
+        imdb_rating = None
+        if data.get('imdbRating') and data['imdbRating'] != 'N/A':
+            try:
+                imdb_rating = float(data['imdbRating'])
+            except ValueError:
+                pass
+        
+        rotten_tomatoes = None
+        metacritic = None
+        
+        # Parse Ratings array
+        for rating in data.get('Ratings', []):
+            source = rating.get('Source', '')
+            value = rating.get('Value', '')
+            
+            if 'Rotten Tomatoes' in source and '%' in value:
+                try:
+                    rotten_tomatoes = int(value.replace('%', ''))
+                except ValueError:
+                    pass
+            elif 'Metacritic' in source and '/' in value:
+                try:
+                    metacritic = int(value.split('/')[0])
+                except ValueError:
+                    pass
+        
+        return MovieRating(
+            title=data.get('Title', title),
+            year=int(data.get('Year', year or 0)) if data.get('Year') and data['Year'] != 'N/A' else year,
+            imdb_id=data.get('imdbID'),
+            imdb_rating=imdb_rating,
+            rotten_tomatoes=rotten_tomatoes,
+            metacritic=metacritic,
+            omdb_plot=data.get('Plot') if data.get('Plot') != 'N/A' else None,
+            omdb_genre=data.get('Genre') if data.get('Genre') != 'N/A' else None,
+            omdb_director=data.get('Director') if data.get('Director') != 'N/A' else None,
+            omdb_runtime=data.get('Runtime') if data.get('Runtime') != 'N/A' else None,
+            file_path="",  # Will be set by caller
+            file_size=0,   # Will be set by caller
+            last_updated=datetime.now()
+        )
+    
+    def _fetch_limited(self, title: str, year: Optional[int],
+                       quota_exhausted: threading.Event) -> Tuple[str, Optional[MovieRating], Optional[str]]:
+        """Request one title through the shared token bucket (worker thread)."""
+        if quota_exhausted.is_set():
+            return LIMITED, None, "Skipped after the API limit was reached"
+        
+        for _ in range(THROTTLE_RETRIES + 1):
+            self.rate_limiter.acquire()
+            status, rating, error = self._query_omdb(title, year)
+            if status != THROTTLED:
+                break
+            # Slow every worker down and try the title again
+            self.rate_limiter.on_throttle()
+        
+        if status == THROTTLED:
+            return LIMITED, None, error
+        if status == LIMITED:
+            self.rate_limiter.on_throttle()
+            # The daily quota is spent; stop submitting
+            quota_exhausted.set()
+        else:
+            self.rate_limiter.on_success()
+        return status, rating, error
     
     def fetch_ratings_for_movies(self, movie_files: List[Dict[str, Any]], progress_callback=None) -> Dict[str, Any]:
-        """Fetch ratings for a list of movie files."""
+        """
+        Fetch ratings for a list of movie files.
+        
+        Fresh cached ratings are resolved in one query and titles that recently
+        failed are skipped; the rest are fetched concurrently under the plan's
+        rate limit and saved every CHECKPOINT_EVERY results, so rerunning an
+        interrupted fetch continues where it stopped.
+        
+        Args:
+            movie_files: Movie dictionaries with file_name, file_path and file_size
+            progress_callback: Optional callback(current, total, filename)
+            
+        Returns:
+            Summary dictionary with counts, stats and the log file path
+        """
         total_movies = len(movie_files)
         processed = 0
+        fetch_start = time.time()
         
         self.logger.info(f"Starting rating fetch for {total_movies} movies")
         
-        for i, movie in enumerate(movie_files):
-            if progress_callback:
-                progress_callback(i + 1, total_movies, movie.get('file_name', 'Unknown'))
-            
+        # Parse every filename once; files of the same title share one request
+        wanted: Dict[str, Dict[str, Any]] = {}
+        for movie in movie_files:
             filename = movie.get('file_name', '')
-            file_path = movie.get('file_path', '')
-            file_size = movie.get('file_size', 0)
-            
             if not filename:
                 continue
             
@@ -480,24 +738,85 @@ class OMDBRatingFetcher:
                 self.logger.warning(f"Could not extract title from: {filename}")
                 continue
             
-            # Fetch rating
-            rating = self.fetch_rating(title, year)
-            
-            if rating:
-                # Set file info
-                rating.file_path = file_path
-                rating.file_size = file_size
+            title_key = self.database.title_key(title, year)
+            entry = wanted.setdefault(title_key, {
+                'title': title, 'year': year, 'file_name': filename, 'files': 0,
+                'file_path': movie.get('file_path', ''), 'file_size': movie.get('file_size', 0)
+            })
+            entry['files'] += 1
+        
+        # Resolve cache hits and recent misses up front
+        cached = self.database.get_ratings_bulk(list(wanted))
+        now = datetime.now()
+        to_fetch = []
+        for title_key, movie in wanted.items():
+            rating = cached.get(title_key)
+            if rating and now - rating.last_updated < RATING_MAX_AGE:
+                self._count('cache_hits')
+                self.events.cache_hit('omdb_ratings', title_key)
+                processed += movie['files']
+            else:
+                to_fetch.append(title_key)
+        
+        pending_misses = self.database.get_pending_misses(to_fetch)
+        for _ in pending_misses:
+            self._count('skipped_misses')
+        to_fetch = [title_key for title_key in to_fetch if title_key not in pending_misses]
+        
+        print(f"   💾 {len(wanted) - len(to_fetch) - len(pending_misses)} cached, "
+              f"⏭️  {len(pending_misses)} skipped until retry, 🌐 {len(to_fetch)} to fetch")
+        
+        not_found_retry = timedelta(days=config.omdb_not_found_retry_days)
+        error_retry = timedelta(minutes=config.omdb_error_retry_minutes)
+        quota_exhausted = threading.Event()
+        found: List[Tuple[str, MovieRating]] = []
+        misses: List[Tuple[str, str, Optional[int], str, Optional[str], datetime]] = []
+        limited = 0
+        
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="omdb")
+        futures: Dict[Future, str] = {}
+        try:
+            futures = {
+                executor.submit(self._fetch_limited, wanted[title_key]['title'],
+                                wanted[title_key]['year'], quota_exhausted): title_key
+                for title_key in to_fetch
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                title_key = futures[future]
+                movie = wanted[title_key]
+                title, year = movie['title'], movie['year']
+                if progress_callback:
+                    progress_callback(done, len(futures), movie['file_name'])
                 
-                # Save to database
-                self.database.save_rating(rating)
-                processed += 1
+                status, rating, error = future.result()
+                if status == FOUND:
+                    # Set file info
+                    rating.file_path = movie['file_path']
+                    rating.file_size = movie['file_size']
+                    found.append((title_key, rating))
+                    processed += movie['files']
+                    print(f"   ✅ {title} ({year}): IMDB={rating.imdb_rating or 'N/A'}, RT={rating.rotten_tomatoes or 'N/A'}%, Meta={rating.metacritic or 'N/A'}")
+                elif status == LIMITED:
+                    # Not attempted (or refused): fetched again on the next run
+                    limited += 1
+                else:
+                    retry_after = datetime.now() + (not_found_retry if status == NOT_FOUND else error_retry)
+                    misses.append((title_key, title, year, status, error, retry_after))
+                    print(f"   ❌ {title} ({year}): No rating found")
                 
-                print(f"   ✅ {title} ({year}): IMDB={rating.imdb_rating or 'N/A'}, RT={rating.rotten_tomatoes or 'N/A'}%, Meta={rating.metacritic or 'N/A'}")
-            else:
-                print(f"   ❌ {title} ({year}): No rating found")
-            
-            # Small delay to be nice to the API
-            time.sleep(0.1)
+                # Checkpoint so an interrupted fetch resumes from here
+                if len(found) + len(misses) >= CHECKPOINT_EVERY:
+                    self.database.save_results(found, misses)
+                    found, misses = [], []
+        finally:
+            # Drop queued lookups (shutdown's cancel_futures needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.database.save_results(found, misses)
+        
+        if limited:
+            print(f"   ⚠️  OMDB API limit reached; {limited} titles left for the next run")
         
         # Generate summary
         summary = {
@@ -507,6 +826,8 @@ class OMDBRatingFetcher:
             'stats': self.stats.copy(),
             'log_file': str(self.log_file_path)
         }
+        self.events.phase('rating_fetch', time.time() - fetch_start, movies=total_movies, processed=processed,
+                          stats=self.stats.copy())
         
         self.logger.info(f"Rating fetch completed: {processed}/{total_movies} movies processed ({summary['success_rate']:.1f}% success rate)")
         self.logger.info(f"API Stats: {self.stats['api_calls']} calls, {self.stats['successful_fetches']} successful, {self.stats['cache_hits']} cache hits")
@@ -71,13 +71,16 @@ class OpenAIClassifier:
             print(f"❌ OpenAI API test failed: {e}")
             self.client = None
     
-    def classify_batch(self, filenames: List[str], max_retries: int = 3) -> List[Optional[Dict]]:
+    def classify_batch(self, filenames: List[str], max_retries: int = 3,
+                       group_by_title: bool = True) -> List[Optional[Dict]]:
         """
         Classify multiple files in a single batch request for efficiency.
         
         Args:
             filenames: List of filenames to classify
             max_retries: Maximum number of retry attempts
+            group_by_title: Send one request per title group (False: one request
+                for all filenames, for callers that already deduped titles)
             
         Returns:
             List of classification dictionaries with category, confidence, reasoning
@@ -87,7 +90,10 @@ class OpenAIClassifier:
             return [None] * len(filenames)
         
         # Group filenames by likely titles for better batching
-        grouped_files = self._group_files_by_title(filenames)
+        if group_by_title:
+            grouped_files = self._group_files_by_title(filenames)
+        else:
+            grouped_files = {f"{len(filenames)} titles": list(filenames)}
         
         all_results = []
         
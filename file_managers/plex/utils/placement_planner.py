@@ -0,0 +1,101 @@
+"""Batch placement planner for pending media moves.
+
+New shows and movies used to be placed one item at a time: the first share
+with room (or the best of a fixed weighting of free space, show count and
+config order) won, without looking at the rest of the batch.  That spread one
+new show's episodes over several shares, sent files across the network when a
+same-volume rename was available, and let early items fill a share so later
+ones failed with "insufficient space" halfway through a run.
+
+``plan_placements`` assigns the whole batch at once:
+
+1. Items sharing a group (a show) form one unit and go to one share
+2. Units with a single allowed destination (existing show folders) are
+   booked first, then the rest largest first (first-fit decreasing)
+3. Each unit goes to the allowed share that fits it (free space minus a
+   safety margin, net of everything already planned on that volume) with the
+   fewest bytes crossing volumes, then the earliest in config order;
+   same-volume renames need no free space at all
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from .space_ledger import SpaceLedger
+
+
+class PlacementItem(NamedTuple):
+    """One pending file or folder to place."""
+    key: str                      # Unique id (usually the source path)
+    size: int
+    source: str                   # Source path (decides same-volume renames)
+    candidates: List[str]         # Allowed destination directories, preferred first
+    group: Optional[str] = None   # Items sharing a group are placed together
+
+
+class PlacementPlan(NamedTuple):
+    """Destinations chosen for a batch of items."""
+    assignments: Dict[str, str]   # Item key -> destination directory
+    unplaced: List[str]           # Keys of items no destination had room for
+    rename_bytes: int             # Bytes moved by same-volume renames
+    copy_bytes: int               # Bytes copied across volumes
+
+
+def plan_placements(items: Iterable[PlacementItem], ledger: SpaceLedger,
+                    safety_margin: int = 0) -> PlacementPlan:
+    """
+    Choose a destination for every item in a batch.
+
+    Args:
+        items: Pending items
+        ledger: Ledger providing each volume's free space
+        safety_margin: Bytes that must stay free on every volume
+
+    Returns:
+        PlacementPlan (the ledger itself is not modified)
+    """
+    units: Dict[str, List[PlacementItem]] = {}
+    for item in items:
+        units.setdefault(item.group if item.group else f"item:{item.key}", []).append(item)
+
+    def unit_order(members: List[PlacementItem]):
+        fixed = all(len(member.candidates) == 1 for member in members)
+        return (not fixed, -sum(member.size for member in members))
+
+    planned: Dict[int, int] = {}
+    assignments: Dict[str, str] = {}
+    unplaced: List[str] = []
+    rename_bytes = copy_bytes = 0
+
+    for members in sorted(units.values(), key=unit_order):
+        unit_size = sum(member.size for member in members)
+        # A group can only use destinations allowed for every member
+        candidates = [c for c in members[0].candidates
+                      if all(c in member.candidates for member in members[1:])]
+
+        best = None
+        for priority, candidate in enumerate(candidates):
+            volume = ledger.volume_of(candidate)
+            free = ledger.free_bytes(candidate)
+            if volume is None or free is None:
+                continue
+            # Only bytes arriving from another volume use up free space
+            crossing = sum(member.size for member in members
+                           if ledger.volume_of(member.source) != volume)
+            if crossing and free - planned.get(volume, 0) - safety_margin < crossing:
+                continue
+            rank = (crossing, priority)
+            if best is None or rank < best[0]:
+                best = (rank, candidate, volume)
+
+        if best is None:
+            unplaced.extend(member.key for member in members)
+            continue
+
+        (crossing, _), candidate, volume = best
+        planned[volume] = planned.get(volume, 0) + crossing
+        copy_bytes += crossing
+        rename_bytes += unit_size - crossing
+        for member in members:
+            assignments[member.key] = candidate
+
+    return PlacementPlan(assignments, unplaced, rename_bytes, copy_bytes)
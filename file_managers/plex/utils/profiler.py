@@ -0,0 +1,327 @@
+"""Lightweight span profiler for CLI runs.
+
+Long runs (nightly reorganizer passes, database rebuilds, enrichment) mix
+directory walking, SQLite, HTTP, AI batches and file moves, and nothing
+reported where the time went.  Hot paths wrap their work in named spans:
+
+- ``span(name)`` is a context manager; ``profiled(name)`` decorates a function
+- Each span adds its wall time, one call and optional bytes to a per-name
+  total (spans on worker threads overlap, so totals can exceed the run time)
+- ``report()`` formats a per-span table plus totals per kind, where the kind
+  is the name's first dotted component (``fs``, ``sqlite``, ``http`` ...)
+- An optional dump records either a cProfile of the main thread (``.prof``
+  files, for ``pstats``/snakeviz) or sampled stacks of every thread in
+  collapsed format (any other suffix, for ``flamegraph.pl``/speedscope)
+
+Profiling is off by default.  While disabled, ``span`` returns a shared no-op
+object and ``profiled`` functions call straight through, so instrumented
+code costs one global check per call.
+"""
+
+import cProfile
+import functools
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable)
+
+# Seconds between stack samples for collapsed-stack dumps
+SAMPLE_INTERVAL = 0.005
+
+
+@dataclass
+class SpanStats:
+    """Accumulated totals of one span name."""
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    bytes: int = 0
+
+
+class _NullSpan:
+    """Span returned while profiling is disabled."""
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def add_bytes(self, nbytes: int) -> None:
+        return None
+
+
+class _Span:
+    """Span that records its wall time when it exits."""
+    __slots__ = ('name', 'bytes', 'start')
+
+    def __init__(self, name: str, nbytes: int):
+        self.name = name
+        self.bytes = nbytes
+        self.start = 0.0
+
+    def __enter__(self) -> '_Span':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _record(self.name, time.perf_counter() - self.start, self.bytes)
+
+    def add_bytes(self, nbytes: int) -> None:
+        """Count bytes read, written or transferred inside the span."""
+        self.bytes += nbytes
+
+
+_NULL_SPAN = _NullSpan()
+_enabled = False
+_lock = threading.Lock()
+_stats: Dict[str, SpanStats] = {}
+_started = 0.0
+_dump_path: Optional[Path] = None
+_cprofile: Optional[cProfile.Profile] = None
+_sampler: Optional['_StackSampler'] = None
+
+
+def _record(name: str, seconds: float, nbytes: int) -> None:
+    """Add one finished span to its totals."""
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = SpanStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.bytes += nbytes
+        if seconds > stats.max_seconds:
+            stats.max_seconds = seconds
+
+
+def span(name: str, nbytes: int = 0) -> Union[_Span, _NullSpan]:
+    """
+    Time a block of code.
+
+    Args:
+        name: Span name (``kind.detail``, e.g. ``sqlite.save``)
+        nbytes: Bytes handled by the block, if known up front (more can be
+            added with ``add_bytes``)
+
+    Returns:
+        Context manager (a shared no-op while profiling is disabled)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, nbytes)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """
+    Decorate a function so each call is recorded as a span.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, 0):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def is_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _enabled
+
+
+class _StackSampler:
+    """Background thread that counts the stacks of every thread."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler-sampler', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: Path) -> None:
+        """Write stacks in collapsed format (``frame;frame;frame count``)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def enable(dump_path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Start recording spans (clears previous totals).
+
+    Args:
+        dump_path: Optional dump file; ``.prof`` writes a cProfile of the main
+            thread, any other suffix writes collapsed stacks of all threads
+    """
+    global _enabled, _started, _dump_path, _cprofile, _sampler
+    reset()
+    _dump_path = Path(dump_path) if dump_path else None
+    if _dump_path is not None:
+        if _dump_path.suffix == '.prof':
+            _cprofile = cProfile.Profile()
+            _cprofile.enable()
+        else:
+            _sampler = _StackSampler()
+            _sampler.start()
+    _started = time.perf_counter()
+    _enabled = True
+
+
+def disable() -> Optional[Path]:
+    """
+    Stop recording spans and write the dump, if one was requested.
+
+    Returns:
+        Path of the written dump, or None
+    """
+    global _enabled, _cprofile, _sampler
+    _enabled = False
+    written = None
+    try:
+        if _cprofile is not None:
+            _cprofile.disable()
+            _cprofile.dump_stats(str(_dump_path))
+            written = _dump_path
+        elif _sampler is not None:
+            _sampler.stop()
+            _sampler.write(_dump_path)
+            written = _dump_path
+    except OSError as e:
+        logger.error(f"Could not write profile dump {_dump_path}: {e}")
+    finally:
+        _cprofile = None
+        _sampler = None
+    return written
+
+
+def reset() -> None:
+    """Clear the recorded totals."""
+    global _started
+    with _lock:
+        _stats.clear()
+    _started = time.perf_counter()
+
+
+def snapshot() -> Dict[str, SpanStats]:
+    """
+    Get a copy of the totals recorded so far.
+
+    Returns:
+        Span name -> SpanStats
+    """
+    with _lock:
+        return {name: SpanStats(s.calls, s.seconds, s.max_seconds, s.bytes) for name, s in _stats.items()}
+
+
+def _format_bytes(nbytes: int) -> str:
+    """Format a byte count for the report."""
+    if not nbytes:
+        return '-'
+    size = float(nbytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def report(wall_seconds: Optional[float] = None) -> str:
+    """
+    Format the recorded totals as a table.
+
+    Args:
+        wall_seconds: Run wall time (default: time since ``enable``)
+
+    Returns:
+        Report text
+    """
+    if wall_seconds is None:
+        wall_seconds = time.perf_counter() - _started
+    stats = snapshot()
+
+    lines = [f"⏱️  PROFILE ({wall_seconds:.2f}s wall)",
+             f"{'Span':<32} {'Calls':>8} {'Total s':>9} {'Mean ms':>9} {'Max ms':>9} {'Bytes':>10}",
+             '-' * 82]
+    for name, s in sorted(stats.items(), key=lambda item: item[1].seconds, reverse=True):
+        lines.append(f"{name:<32} {s.calls:>8,} {s.seconds:>9.2f} {s.seconds / s.calls * 1000:>9.2f} "
+                     f"{s.max_seconds * 1000:>9.2f} {_format_bytes(s.bytes):>10}")
+    if not stats:
+        lines.append("(no spans recorded)")
+
+    kinds: Dict[str, SpanStats] = {}
+    for name, s in stats.items():
+        kind = kinds.setdefault(name.split('.', 1)[0], SpanStats())
+        kind.calls += s.calls
+        kind.seconds += s.seconds
+        kind.bytes += s.bytes
+    if kinds:
+        lines += ['', 'By kind (worker-thread spans overlap, so totals can exceed wall time):']
+        for kind, s in sorted(kinds.items(), key=lambda item: item[1].seconds, reverse=True):
+            share = s.seconds / wall_seconds * 100 if wall_seconds else 0.0
+            lines.append(f"  {kind:<12} {s.seconds:>9.2f}s {share:>6.1f}%  {s.calls:>8,} calls  "
+                         f"{_format_bytes(s.bytes):>10}")
+    return '\n'.join(lines)
+
+
+@contextmanager
+def profile_run(active: bool, dump_path: Optional[Union[str, Path]] = None) -> Iterator[None]:
+    """
+    Profile a CLI command and print the report to stderr when it ends.
+
+    Args:
+        active: Whether profiling was requested (otherwise this does nothing)
+        dump_path: Optional cProfile/collapsed-stack dump file
+    """
+    if not active:
+        yield
+        return
+    enable(dump_path)
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - _started
+        written = disable()
+        print('\n' + report(wall), file=sys.stderr)
+        if written:
+            print(f"📄 Profile dump saved: {written}", file=sys.stderr)
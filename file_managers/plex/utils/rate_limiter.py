@@ -0,0 +1,84 @@
+"""Thread-safe token-bucket rate limiter with AIMD rate adaptation.
+
+Callers used to pace remote APIs with fixed sleeps between requests, which
+wastes time when the service is not throttling and is still too fast when it
+is.  This limiter hands out tokens at a rate that grows additively after each
+successful request and is cut multiplicatively whenever the service reports
+throttling (additive-increase / multiplicative-decrease, as in TCP congestion
+control), so concurrent workers converge on the highest rate the service
+accepts.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class AdaptiveRateLimiter:
+    """Token bucket shared by worker threads, adapting its rate to throttling."""
+
+    def __init__(self, rate: float, min_rate: float = 0.1,
+                 max_rate: Optional[float] = None, capacity: float = 1.0,
+                 increase: float = 0.1, decrease_factor: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Initial rate in tokens (requests) per second
+            min_rate: Lowest rate reached by repeated throttling
+            max_rate: Highest rate reached by repeated successes (default: rate)
+            capacity: Maximum burst size in tokens
+            increase: Rate added after each successful request
+            decrease_factor: Factor applied to the rate on throttling
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.rate = max(min_rate, min(rate, self.max_rate))
+        self.capacity = max(1.0, capacity)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+        # Counters for reporting
+        self.throttle_count = 0
+        self.success_count = 0
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update (lock held)."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        with self._lock:
+            self.success_count += 1
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> None:
+        """Multiplicatively decrease the rate and drain the bucket."""
+        with self._lock:
+            self.throttle_count += 1
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0.0
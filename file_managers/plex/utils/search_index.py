@@ -0,0 +1,92 @@
+"""Inverted trigram and token index for fuzzy media title search.
+
+Fuzzy title search used to compute a similarity score against every title in
+the library for every query.  This index maps each word token and each
+character trigram to the titles that contain it, so a query only touches the
+titles that share at least one term with it.  The best-overlapping candidates
+are then scored with the existing similarity functions.
+
+The similarity functions used by the media tools need a shared word or a
+shared substring to score above zero.  For queries of three or more
+characters both imply a shared token or trigram, so only titles that could
+not have matched are left out of the candidate set.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+# Number of best-overlapping candidates handed to the similarity functions
+SEARCH_CANDIDATE_LIMIT = 200
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+
+def search_terms(text: str) -> Set[str]:
+    """
+    Get the index terms for a title or query.
+
+    Terms are word tokens (prefixed ``w:``) and character trigrams of the
+    space-padded text (prefixed ``t:``), after lower-casing and replacing
+    punctuation with spaces.
+
+    Args:
+        text: Title or search query
+
+    Returns:
+        Set of index terms
+    """
+    normalized = _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+    if not normalized:
+        return set()
+
+    terms = {f"w:{token}" for token in normalized.split()}
+    padded = f" {normalized} "
+    terms.update(f"t:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+    return terms
+
+
+class NgramIndex:
+    """In-memory inverted index from search terms to title keys."""
+
+    def __init__(self, postings: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            postings: Optional persisted postings (term -> list of keys)
+        """
+        self.postings: Dict[str, List[str]] = postings or {}
+
+    @classmethod
+    def build(cls, keys: Iterable[str]) -> "NgramIndex":
+        """
+        Build an index over title keys.
+
+        Args:
+            keys: Normalized titles to index
+
+        Returns:
+            Populated NgramIndex
+        """
+        postings: Dict[str, List[str]] = {}
+        for key in sorted(set(keys)):
+            for term in search_terms(key):
+                postings.setdefault(term, []).append(key)
+        return cls(postings)
+
+    def candidates(self, query: str, limit: int = SEARCH_CANDIDATE_LIMIT) -> List[str]:
+        """
+        Get the keys sharing the most terms with a query.
+
+        Args:
+            query: Search query
+            limit: Maximum number of candidates
+
+        Returns:
+            Keys ordered by the number of shared terms (most first)
+        """
+        counts: Counter = Counter()
+        for term in search_terms(query):
+            counts.update(self.postings.get(term, ()))
+        return [key for key, _ in counts.most_common(limit)]
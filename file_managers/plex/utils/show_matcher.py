@@ -0,0 +1,162 @@
+"""Blocked fuzzy matcher for show names.
+
+Matching a loose episode to an existing show folder used to score the episode's
+show name against every known show (and every spelling variation of it) with
+``difflib``, once per episode, which makes resolving a large backlog quadratic.
+``ShowNameMatcher`` is built once per scan:
+
+1. Every show's name variations are normalized (lower-cased) up front
+2. The variations are indexed by word token and character trigram
+   (``NgramIndex``), so a query only touches shows sharing terms with it
+3. Only that shortlist is scored, with a length-bounded longest-common-
+   subsequence ratio that gives up early when a pair cannot reach the threshold
+
+The score is ``2 * LCS / (len(a) + len(b))``, the same scale as
+``difflib.SequenceMatcher.ratio``, so existing thresholds keep their meaning.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .search_index import SEARCH_CANDIDATE_LIMIT, NgramIndex
+
+
+def _char_masks(text: str) -> Dict[str, int]:
+    """Get the bit mask of positions for each character of a text."""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _lcs_length(a: str, masks: Dict[str, int], b: str) -> int:
+    """Longest common subsequence length (bit-parallel, masks built from ``a``)."""
+    full = (1 << len(a)) - 1
+    row = full
+    for char in b:
+        matched = row & masks.get(char, 0)
+        row = ((row + matched) | (row - matched)) & full
+    return len(a) - bin(row).count('1')
+
+
+def name_similarity(a: str, b: str, min_score: float = 0.0) -> float:
+    """
+    Score how similar two names are.
+
+    Args:
+        a: First name
+        b: Second name
+        min_score: Scores below this are not computed exactly (0.0 is returned)
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    return _bounded_similarity(a, _char_masks(a), b, min_score)
+
+
+def _bounded_similarity(a: str, masks: Dict[str, int], b: str, min_score: float) -> float:
+    """Similarity of ``a`` and ``b``, or 0.0 if it cannot reach ``min_score``."""
+    total = len(a) + len(b)
+    if total == 0:
+        return 1.0
+    # Even a full overlap of the shorter name cannot reach the threshold
+    if 2 * min(len(a), len(b)) < min_score * total:
+        return 0.0
+    score = 2 * _lcs_length(a, masks, b) / total
+    return score if score >= min_score else 0.0
+
+
+class ShowNameMatcher:
+    """Fuzzy show-name lookup over a fixed set of shows."""
+
+    def __init__(self, entries: Iterable[Tuple[Any, Iterable[str]]],
+                 threshold: float = 0.8,
+                 candidate_limit: int = SEARCH_CANDIDATE_LIMIT,
+                 index: Optional[NgramIndex] = None):
+        """
+        Initialize the matcher.
+
+        Args:
+            entries: (item, name variations) pairs; items are returned by lookups
+            threshold: Default minimum similarity for ``match``
+            candidate_limit: Maximum names scored per query
+            index: Optional prebuilt index whose keys are the lower-cased names
+        """
+        self.threshold = threshold
+        self.candidate_limit = candidate_limit
+        self._items: List[Any] = []
+        self._name_items: Dict[str, List[int]] = {}
+
+        for item, names in entries:
+            item_id = len(self._items)
+            self._items.append(item)
+            for name in {name.lower().strip() for name in names}:
+                if name:
+                    self._name_items.setdefault(name, []).append(item_id)
+
+        self.index = index if index is not None and index.postings else NgramIndex.build(self._name_items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def exact(self, query: str) -> List[Any]:
+        """
+        Get the items with a name variation equal to the query.
+
+        Args:
+            query: Show name (compared lower-cased)
+
+        Returns:
+            Items in the order they were added
+        """
+        return [self._items[i] for i in self._name_items.get(query.lower().strip(), ())]
+
+    def _candidate_names(self, query: str) -> List[str]:
+        """Get the names sharing the most index terms with a query."""
+        return [name for name in self.index.candidates(query, self.candidate_limit)
+                if name in self._name_items]
+
+    def candidates(self, query: str) -> List[Any]:
+        """
+        Get the shortlist of items that could match a query.
+
+        Args:
+            query: Show name
+
+        Returns:
+            Items sharing index terms with the query, in the order they were added
+        """
+        item_ids = set()
+        for name in self._candidate_names(query):
+            item_ids.update(self._name_items[name])
+        return [self._items[i] for i in sorted(item_ids)]
+
+    def match(self, query: str, threshold: Optional[float] = None) -> List[Tuple[Any, float]]:
+        """
+        Find the items whose names are similar to a query.
+
+        Args:
+            query: Show name
+            threshold: Minimum similarity (defaults to the matcher's threshold)
+
+        Returns:
+            List of (item, similarity) tuples, best first, one per item
+        """
+        if threshold is None:
+            threshold = self.threshold
+        query = query.lower().strip()
+        masks = _char_masks(query)
+
+        best: Dict[int, float] = {i: 1.0 for i in self._name_items.get(query, ())}
+        for name in self._candidate_names(query):
+            item_ids = [i for i in self._name_items[name] if best.get(i, 0.0) < 1.0]
+            if not item_ids:
+                continue
+            score = _bounded_similarity(query, masks, name, threshold)
+            if score <= 0.0 and threshold > 0.0:
+                continue
+            for item_id in item_ids:
+                if score > best.get(item_id, -1.0):
+                    best[item_id] = score
+
+        ranked = sorted(best.items(), key=lambda entry: (-entry[1], entry[0]))
+        return [(self._items[i], score) for i, score in ranked if score >= threshold]
@@ -0,0 +1,180 @@
+"""Per-volume free-space ledger for placement decisions.
+
+Placement code used to call ``shutil.disk_usage`` at every decision point:
+once per file and directory attempt, once per candidate destination and once
+per new show.  On CIFS shares each call is a slow round trip, and none of them
+knew about the bytes already promised to earlier moves in the same run, so many
+large files could all be planned onto a share that only had room for a few.
+
+``SpaceLedger`` maps each path to the device it lives on, measures every
+device once, and keeps a running account:
+
+- ``reserve`` sets bytes aside on the target volume as a move is planned
+  (moves within one volume are renames and reserve nothing)
+- ``release`` returns a reservation when its move fails, or books the bytes as
+  used (and frees them on the source volume) when it succeeds
+- ``free_bytes`` / ``has_room`` answer from the measurement minus reservations
+"""
+
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class Reservation(NamedTuple):
+    """Bytes set aside on a volume for one planned move."""
+    volume: int
+    size: int
+    source_volume: Optional[int] = None
+
+
+class SpaceLedger:
+    """Tracks free space per volume, net of the bytes planned moves will use."""
+
+    def __init__(self, disk_usage: Callable = shutil.disk_usage):
+        """
+        Initialize the ledger.
+
+        Args:
+            disk_usage: Function returning an object with a ``free`` attribute
+                for a path (injectable for tests)
+        """
+        self._disk_usage = disk_usage
+        self._lock = threading.Lock()
+        self._volumes: Dict[str, Optional[int]] = {}   # path -> device id
+        self._free: Dict[int, int] = {}                # device id -> measured free bytes
+        self._reserved: Dict[int, int] = {}            # device id -> reserved bytes
+
+    def volume_of(self, path: PathLike) -> Optional[int]:
+        """
+        Get the device a path lives on.
+
+        Paths that do not exist yet (new show or season folders) resolve to
+        their nearest existing parent.
+
+        Args:
+            path: File or directory path
+
+        Returns:
+            Device id, or None if no part of the path is accessible
+        """
+        key = str(path)
+        with self._lock:
+            if key in self._volumes:
+                return self._volumes[key]
+
+        volume = None
+        current = Path(path)
+        while True:
+            try:
+                volume = os.stat(current).st_dev
+                break
+            except OSError:
+                if current.parent == current:
+                    break
+                current = current.parent
+
+        with self._lock:
+            self._volumes[key] = volume
+        return volume
+
+    def free_bytes(self, path: PathLike) -> Optional[int]:
+        """
+        Get the free space on a path's volume after reservations.
+
+        Args:
+            path: File or directory path
+
+        Returns:
+            Free bytes not yet promised to planned moves, or None if unknown
+        """
+        volume = self.volume_of(path)
+        if volume is None:
+            return None
+
+        with self._lock:
+            measured = self._free.get(volume)
+        if measured is None:
+            try:
+                measured = self._disk_usage(path).free
+            except OSError as e:
+                logger.warning(f"Cannot read free space for {path}: {e}")
+                return None
+            with self._lock:
+                measured = self._free.setdefault(volume, measured)
+
+        with self._lock:
+            return measured - self._reserved.get(volume, 0)
+
+    def has_room(self, path: PathLike, size: int, buffer: int = 0) -> bool:
+        """
+        Check whether a path's volume can take a file.
+
+        Args:
+            path: Destination path
+            size: Bytes to place
+            buffer: Extra bytes that must stay free
+
+        Returns:
+            True if the volume has room (False if its space is unknown)
+        """
+        free = self.free_bytes(path)
+        return free is not None and free >= size + buffer
+
+    def reserve(self, target: PathLike, size: int,
+                source: Optional[PathLike] = None) -> Optional[Reservation]:
+        """
+        Set bytes aside on a target volume for a planned move.
+
+        Args:
+            target: Destination path
+            size: Bytes the move will write
+            source: Source path (a move within one volume reserves nothing)
+
+        Returns:
+            Reservation to pass to ``release``, or None if nothing was reserved
+        """
+        volume = self.volume_of(target)
+        source_volume = self.volume_of(source) if source is not None else None
+        if volume is None or size <= 0 or source_volume == volume:
+            return None
+
+        # Make sure the volume is measured before bytes are counted against it
+        self.free_bytes(target)
+        with self._lock:
+            self._reserved[volume] = self._reserved.get(volume, 0) + size
+        return Reservation(volume, size, source_volume)
+
+    def release(self, reservation: Optional[Reservation], completed: bool = True) -> None:
+        """
+        Settle a reservation once its move has finished.
+
+        Args:
+            reservation: Reservation returned by ``reserve`` (None is ignored)
+            completed: True if the bytes were written (they stay used on the
+                target and are freed on the source); False to give them back
+        """
+        if reservation is None:
+            return
+
+        with self._lock:
+            self._reserved[reservation.volume] = max(
+                0, self._reserved.get(reservation.volume, 0) - reservation.size
+            )
+            if completed:
+                if reservation.volume in self._free:
+                    self._free[reservation.volume] -= reservation.size
+                if reservation.source_volume in self._free:
+                    self._free[reservation.source_volume] += reservation.size
+
+    def refresh(self) -> None:
+        """Forget measurements so the next query reads each volume again."""
+        with self._lock:
+            self._free.clear()
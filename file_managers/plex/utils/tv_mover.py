@@ -13,6 +13,9 @@ from .tv_scanner import (
     format_file_size,
     normalize_show_name
 )
+from .dir_sizes import DirectorySizeCache
+from .move_engine import MoveEngine
+from .show_matcher import ShowNameMatcher
 from ..config.config import config
 
 # Get TV directories from config
@@ -77,30 +80,50 @@ def _enhanced_normalize_show_name(show_name: str) -> str:
     return normalized
 
 
-def _find_best_matching_show_folder(episode_show_name: str, existing_folders: Dict[str, Path]) -> Optional[Path]:
+def _build_show_folder_matcher(existing_folders: Dict[str, Path]) -> ShowNameMatcher:
+    """
+    Index existing show folders for repeated lookups.
+    
+    Args:
+        existing_folders: Dictionary of existing show folders
+        
+    Returns:
+        Matcher over the folder keys (by their normalized names)
+    """
+    return ShowNameMatcher(
+        (folder_key, [_enhanced_normalize_show_name(folder_key)]) for folder_key in existing_folders
+    )
+
+
+def _find_best_matching_show_folder(episode_show_name: str, existing_folders: Dict[str, Path],
+                                    matcher: Optional[ShowNameMatcher] = None) -> Optional[Path]:
     """
     Find the best matching existing show folder using fuzzy matching.
     
     Args:
         episode_show_name: Show name extracted from episode filename
         existing_folders: Dictionary of existing show folders
+        matcher: Matcher built from existing_folders (built here if not given)
         
     Returns:
         Path to best matching folder, or None if no good match found
     """
+    if matcher is None:
+        matcher = _build_show_folder_matcher(existing_folders)
     episode_normalized = _enhanced_normalize_show_name(episode_show_name)
     
     # First try exact match
-    for folder_key, folder_path in existing_folders.items():
-        if _enhanced_normalize_show_name(folder_key) == episode_normalized:
-            return folder_path
+    for folder_key in matcher.exact(episode_normalized):
+        return existing_folders[folder_key]
     
     # Then try fuzzy matching - look for folder names that contain the episode show name
-    # or vice versa (handles "Mobland" folder matching "MobLand S01E01" episode)
+    # or vice versa (handles "Mobland" folder matching "MobLand S01E01" episode).
+    # Only folders sharing a word or trigram with the episode name can score.
     best_match = None
     best_score = 0
     
-    for folder_key, folder_path in existing_folders.items():
+    for folder_key in matcher.candidates(episode_normalized):
+        folder_path = existing_folders[folder_key]
         folder_normalized = _enhanced_normalize_show_name(folder_key)
         
         # Calculate similarity score
@@ -317,17 +340,23 @@ def find_loose_episodes(directory: str) -> List[Tuple[Path, str, int, int]]:
     return loose_episodes
 
 
-def find_small_folders(directory: str, max_size_mb: int = None) -> List[SmallFolder]:
+def find_small_folders(directory: str, max_size_mb: int = None,
+                       dir_sizes: Optional[DirectorySizeCache] = None) -> List[SmallFolder]:
     """
     Find folders smaller than the specified size.
     
     Args:
         directory: Path to TV directory to scan
         max_size_mb: Maximum folder size in MB (default: from config)
+        dir_sizes: Optional shared directory size cache
         
     Returns:
         List of SmallFolder objects
     """
+    if dir_sizes is None:
+        with DirectorySizeCache() as dir_sizes:
+            return find_small_folders(directory, max_size_mb, dir_sizes)
+    
     small_folders = []
     directory_path = Path(directory)
     
@@ -342,24 +371,15 @@ def find_small_folders(directory: str, max_size_mb: int = None) -> List[SmallFol
         for item in directory_path.iterdir():
             if item.is_dir():
                 try:
-                    # Calculate folder size recursively
-                    folder_size = 0
-                    file_count = 0
-                    
-                    for file_path in item.rglob('*'):
-                        if file_path.is_file():
-                            try:
-                                folder_size += file_path.stat().st_size
-                                file_count += 1
-                            except (OSError, PermissionError):
-                                continue
+                    # Folder size from the cached bottom-up totals
+                    totals = dir_sizes.size(item)
                     
                     # Only consider folders smaller than max_size
-                    if folder_size < max_size_bytes:
+                    if totals.size < max_size_bytes:
                         small_folder = SmallFolder(
                             path=item,
-                            size=folder_size,
-                            file_count=file_count
+                            size=totals.size,
+                            file_count=totals.file_count
                         )
                         small_folders.append(small_folder)
                         
@@ -393,6 +413,13 @@ def analyze_tv_moves(directories: List[str], find_small_folders_flag: bool = Fal
     total_episodes = 0
     total_size = 0
     
+    # Find small folders if requested (one size cache for every directory)
+    if find_small_folders_flag:
+        with DirectorySizeCache() as dir_sizes:
+            for directory in directories:
+                if Path(directory).exists():
+                    all_small_folders.extend(find_small_folders(directory, max_size_mb, dir_sizes))
+    
     for directory in directories:
         if not Path(directory).exists():
             continue
@@ -400,11 +427,7 @@ def analyze_tv_moves(directories: List[str], find_small_folders_flag: bool = Fal
         # Find existing show folders
         existing_folders = find_existing_show_folders(directory)
         all_existing_folders.update(existing_folders)
-        
-        # Find small folders if requested
-        if find_small_folders_flag:
-            small_folders = find_small_folders(directory, max_size_mb)
-            all_small_folders.extend(small_folders)
+        folder_matcher = _build_show_folder_matcher(all_existing_folders)
         
         # Find loose episodes
         loose_episodes = find_loose_episodes(directory)
@@ -419,7 +442,7 @@ def analyze_tv_moves(directories: List[str], find_small_folders_flag: bool = Fal
             total_size += file_size
             
             # Use enhanced matching to find existing show folder
-            best_match_folder = _find_best_matching_show_folder(show_name, all_existing_folders)
+            best_match_folder = _find_best_matching_show_folder(show_name, all_existing_folders, folder_matcher)
             
             if best_match_folder:
                 # Move to existing show folder (with enhanced matching)
@@ -661,7 +684,8 @@ def delete_small_folders(small_folders: List[SmallFolder]) -> Tuple[int, int]:
     return success_count, error_count
 
 
-def find_empty_or_small_folders_after_moves(moves: List[EpisodeMove], directories: List[str], max_size_mb: int = None) -> List[SmallFolder]:
+def find_empty_or_small_folders_after_moves(moves: List[EpisodeMove], directories: List[str], max_size_mb: int = None,
+                                            dir_sizes: Optional[DirectorySizeCache] = None) -> List[SmallFolder]:
     """
     Find folders that became empty or small after moving episodes.
     
@@ -669,10 +693,15 @@ def find_empty_or_small_folders_after_moves(moves: List[EpisodeMove], directorie
         moves: List of moves that were performed
         directories: List of directories to check
         max_size_mb: Maximum folder size in MB to consider for deletion (default: from config)
+        dir_sizes: Optional shared directory size cache (kept current by the move engine)
         
     Returns:
         List of SmallFolder objects that should be deleted
     """
+    if dir_sizes is None:
+        with DirectorySizeCache() as dir_sizes:
+            return find_empty_or_small_folders_after_moves(moves, directories, max_size_mb, dir_sizes)
+    
     folders_to_check = set()
     
     if max_size_mb is None:
@@ -705,24 +734,15 @@ def find_empty_or_small_folders_after_moves(moves: List[EpisodeMove], directorie
             continue
             
         try:
-            # Calculate current folder size
-            folder_size = 0
-            file_count = 0
-            
-            for file_path in folder_path.rglob('*'):
-                if file_path.is_file():
-                    try:
-                        folder_size += file_path.stat().st_size
-                        file_count += 1
-                    except (OSError, PermissionError):
-                        continue
+            # Current folder size (only folders the moves touched are listed again)
+            totals = dir_sizes.size(folder_path)
             
             # Consider folder for deletion if it's empty or smaller than threshold
-            if folder_size < max_size_bytes:
+            if totals.size < max_size_bytes:
                 small_folder = SmallFolder(
                     path=folder_path,
-                    size=folder_size,
-                    file_count=file_count
+                    size=totals.size,
+                    file_count=totals.file_count
                 )
                 small_folders.append(small_folder)
                 
@@ -732,14 +752,20 @@ def find_empty_or_small_folders_after_moves(moves: List[EpisodeMove], directorie
     return small_folders
 
 
-def execute_moves(analysis: TVMoveAnalysis, delete_small: bool = False, directories: List[str] = None) -> bool:
+def execute_moves(analysis: TVMoveAnalysis, delete_small: bool = False, directories: List[str] = None,
+                  move_engine: Optional[MoveEngine] = None) -> bool:
     """
     Execute the planned TV episode moves and automatically clean up empty/small folders.
     
+    Moves within one share are instant renames; moves across shares are
+    copied in the background, one lane per destination volume, and every
+    move is journaled so an interrupted run is finished on the next one.
+    
     Args:
         analysis: TVMoveAnalysis with moves to execute
         delete_small: Whether to delete pre-existing small folders
         directories: List of TV directories (for cleanup after moves)
+        move_engine: Optional MoveEngine (defaults to the shared journal)
         
     Returns:
         True if all operations completed successfully, False otherwise
@@ -754,161 +780,200 @@ def execute_moves(analysis: TVMoveAnalysis, delete_small: bool = False, director
     success_count = 0
     error_count = 0
     
-    # Create new folders first
-    if analysis.new_folders_needed:
-        print(f"\n📁 Creating {len(analysis.new_folders_needed)} new show folders...")
-        logger.info(f"Creating {len(analysis.new_folders_needed)} new folders")
-        
-        for i, folder_name in enumerate(analysis.new_folders_needed, 1):
-            # Find the directory where this folder should be created
-            folder_moves = [m for m in analysis.moves if m.target_path.parent.name == folder_name]
-            if folder_moves:
-                target_folder = folder_moves[0].target_path.parent
-                try:
-                    target_folder.mkdir(parents=True, exist_ok=True)
-                    print(f"   [{i}/{len(analysis.new_folders_needed)}] ✅ Created: {target_folder}")
-                    logger.info(f"Created folder: {target_folder}")
-                except Exception as e:
-                    print(f"   [{i}/{len(analysis.new_folders_needed)}] ❌ Failed: {target_folder} - {e}")
-                    logger.error(f"Failed to create folder {target_folder}: {e}")
-                    error_count += 1
-                    continue
+    move_engine = move_engine or MoveEngine()
     
-    # Execute moves with detailed progress tracking
-    if analysis.moves:
-        print(f"\n📺 Moving {len(analysis.moves)} TV episodes...")
-        logger.info(f"Starting move execution for {len(analysis.moves)} episodes")
+    # Folder sizes for the cleanup below, updated as each move finishes
+    # (the listener is removed again so a reused engine doesn't collect caches)
+    dir_sizes = DirectorySizeCache()
+    move_engine.add_listener(dir_sizes.on_move)
+    
+    try:
+        # Finish moves an interrupted run left in the journal
+        resumed = move_engine.resume()
+        if resumed:
+            completed = sum(1 for outcome in resumed if outcome.success)
+            print(f"♻️  Resumed {len(resumed)} interrupted moves ({completed} completed)")
+            logger.info(f"Resumed {len(resumed)} interrupted moves ({completed} completed)")
         
-        # Group moves by show for better progress display
-        from collections import defaultdict
-        moves_by_show = defaultdict(list)
-        for move in analysis.moves:
-            moves_by_show[move.show_name].append(move)
+        # Create new folders first
+        if analysis.new_folders_needed:
+            print(f"\n📁 Creating {len(analysis.new_folders_needed)} new show folders...")
+            logger.info(f"Creating {len(analysis.new_folders_needed)} new folders")
+            
+            for i, folder_name in enumerate(analysis.new_folders_needed, 1):
+                # Find the directory where this folder should be created
+                folder_moves = [m for m in analysis.moves if m.target_path.parent.name == folder_name]
+                if folder_moves:
+                    target_folder = folder_moves[0].target_path.parent
+                    try:
+                        target_folder.mkdir(parents=True, exist_ok=True)
+                        print(f"   [{i}/{len(analysis.new_folders_needed)}] ✅ Created: {target_folder}")
+                        logger.info(f"Created folder: {target_folder}")
+                    except Exception as e:
+                        print(f"   [{i}/{len(analysis.new_folders_needed)}] ❌ Failed: {target_folder} - {e}")
+                        logger.error(f"Failed to create folder {target_folder}: {e}")
+                        error_count += 1
+                        continue
         
-        for show_name, show_moves in moves_by_show.items():
-            print(f"\n🎬 Processing: {show_name} ({len(show_moves)} episodes)")
-            logger.info(f"Processing show: {show_name} - {len(show_moves)} episodes")
+        # Execute moves with detailed progress tracking
+        if analysis.moves:
+            print(f"\n📺 Moving {len(analysis.moves)} TV episodes...")
+            logger.info(f"Starting move execution for {len(analysis.moves)} episodes")
+            
+            # Group moves by show for better progress display
+            from collections import defaultdict
+            moves_by_show = defaultdict(list)
+            for move in analysis.moves:
+                moves_by_show[move.show_name].append(move)
             
-            for j, move in enumerate(show_moves, 1):
-                episode_info = f"S{move.season:02d}E{move.episode:02d}"
-                print(f"   [{j}/{len(show_moves)}] {episode_info} - {move.source_path.name}")
-                print(f"      FROM: {move.source_path.parent}")
-                print(f"      TO:   {move.target_path.parent}")
+            for show_name, show_moves in moves_by_show.items():
+                print(f"\n🎬 Processing: {show_name} ({len(show_moves)} episodes)")
+                logger.info(f"Processing show: {show_name} - {len(show_moves)} episodes")
                 
-                try:
-                    # Ensure target directory exists
-                    move.target_path.parent.mkdir(parents=True, exist_ok=True)
+                for j, move in enumerate(show_moves, 1):
+                    episode_info = f"S{move.season:02d}E{move.episode:02d}"
+                    print(f"   [{j}/{len(show_moves)}] {episode_info} - {move.source_path.name}")
+                    print(f"      FROM: {move.source_path.parent}")
+                    print(f"      TO:   {move.target_path.parent}")
                     
-                    # Check if target file already exists
-                    if move.target_path.exists():
-                        print(f"      ⚠️  Target exists, creating unique name...")
-                        logger.warning(f"Target file exists: {move.target_path}")
-                        # Create unique name by adding number
-                        base_name = move.target_path.stem
-                        extension = move.target_path.suffix
-                        counter = 1
-                        original_target = move.target_path
-                        while move.target_path.exists():
-                            new_name = f"{base_name}_{counter}{extension}"
-                            move = move._replace(target_path=move.target_path.parent / new_name)
-                            counter += 1
-                        print(f"      📝 New name: {move.target_path.name}")
-                        logger.info(f"Using unique name: {move.target_path.name}")
-                    
-                    # Perform the move
-                    file_size = move.source_path.stat().st_size
-                    shutil.move(str(move.source_path), str(move.target_path))
-                    print(f"      ✅ Moved ({format_file_size(file_size)})")
-                    logger.info(f"Successfully moved: {move.source_path} -> {move.target_path}")
-                    success_count += 1
-                    
-                except Exception as e:
-                    print(f"      ❌ Failed: {e}")
-                    logger.error(f"Failed to move {move.source_path}: {e}")
-                    error_count += 1
-    
-    print(f"\n📊 MOVE RESULTS:")
-    print(f"   ✅ Successful moves: {success_count}")
-    print(f"   ❌ Failed moves: {error_count}")
-    print(f"   📋 Total processed: {len(analysis.moves)}")
-    
-    if success_count > 0:
-        moved_size = sum(move.size for move in analysis.moves)
-        print(f"   💾 Data organized: {format_file_size(moved_size)}")
-    
-    logger.info(f"Move results: {success_count} success, {error_count} failed")
-    
-    # Delete pre-existing small folders if requested
-    delete_success = 0
-    delete_errors = 0
-    if delete_small and analysis.small_folders:
-        print(f"\n🗑️  CLEANING PRE-EXISTING SMALL FOLDERS...")
-        logger.info(f"Cleaning {len(analysis.small_folders)} small folders")
-        delete_success, delete_errors = delete_small_folders(analysis.small_folders)
-        print(f"\n📊 SMALL FOLDER CLEANUP RESULTS:")
-        print(f"   ✅ Successful deletions: {delete_success}")
-        print(f"   ❌ Failed deletions: {delete_errors}")
-        print(f"   📋 Total processed: {len(analysis.small_folders)}")
-        logger.info(f"Small folder cleanup: {delete_success} success, {delete_errors} failed")
-    
-    # Automatically clean up folders that became empty/small after moves
-    cleanup_success = 0
-    cleanup_errors = 0
-    if analysis.moves and directories:
-        print(f"\n🧹 CLEANING UP EMPTY/SMALL FOLDERS AFTER MOVES...")
-        print("=" * 70)
-        logger.info("Starting post-move cleanup")
+                    try:
+                        # Ensure target directory exists
+                        move.target_path.parent.mkdir(parents=True, exist_ok=True)
+                        
+                        # Check if target file already exists (or is the target of a queued move)
+                        if move_engine.is_target_taken(move.target_path):
+                            print(f"      ⚠️  Target exists, creating unique name...")
+                            logger.warning(f"Target file exists: {move.target_path}")
+                            # Create unique name by adding number
+                            base_name = move.target_path.stem
+                            extension = move.target_path.suffix
+                            counter = 1
+                            original_target = move.target_path
+                            while move_engine.is_target_taken(move.target_path):
+                                new_name = f"{base_name}_{counter}{extension}"
+                                move = move._replace(target_path=move.target_path.parent / new_name)
+                                counter += 1
+                            print(f"      📝 New name: {move.target_path.name}")
+                            logger.info(f"Using unique name: {move.target_path.name}")
+                        
+                        # Perform the move
+                        file_size = move.source_path.stat().st_size
+                        future = move_engine.submit(move.source_path, move.target_path, file_size)
+                        if not future.done():
+                            print(f"      📤 Queued cross-share copy ({format_file_size(file_size)})")
+                            logger.info(f"Queued cross-share move: {move.source_path} -> {move.target_path}")
+                            continue
+                        
+                        outcome = future.result()
+                        if not outcome.success:
+                            raise OSError(outcome.error)
+                        print(f"      ✅ Moved ({format_file_size(file_size)})")
+                        logger.info(f"Successfully moved: {move.source_path} -> {move.target_path}")
+                        success_count += 1
+                        
+                    except Exception as e:
+                        print(f"      ❌ Failed: {e}")
+                        logger.error(f"Failed to move {move.source_path}: {e}")
+                        error_count += 1
         
-        # Find folders that became empty or small after the moves
-        folders_to_cleanup = find_empty_or_small_folders_after_moves(analysis.moves, directories)
+        # Wait for queued cross-share copies before reporting or cleaning up
+        if move_engine.has_pending():
+            print(f"\n⏳ Waiting for queued cross-share moves to finish...")
+        for outcome in move_engine.wait():
+            if outcome.success:
+                print(f"   ✅ Copied: {Path(outcome.target).name} ({format_file_size(outcome.size)})")
+                logger.info(f"Successfully moved: {outcome.source} -> {outcome.target}")
+                success_count += 1
+            else:
+                print(f"   ❌ Failed: {Path(outcome.source).name} - {outcome.error}")
+                logger.error(f"Failed to move {outcome.source}: {outcome.error}")
+                error_count += 1
+        
+        print(f"\n📊 MOVE RESULTS:")
+        print(f"   ✅ Successful moves: {success_count}")
+        print(f"   ❌ Failed moves: {error_count}")
+        print(f"   📋 Total processed: {len(analysis.moves)}")
+        
+        if success_count > 0:
+            moved_size = sum(move.size for move in analysis.moves)
+            print(f"   💾 Data organized: {format_file_size(moved_size)}")
+        
+        logger.info(f"Move results: {success_count} success, {error_count} failed")
         
-        if folders_to_cleanup:
-            print(f"📂 Found {len(folders_to_cleanup)} folders to clean up:")
-            logger.info(f"Found {len(folders_to_cleanup)} folders for cleanup")
+        # Delete pre-existing small folders if requested
+        delete_success = 0
+        delete_errors = 0
+        if delete_small and analysis.small_folders:
+            print(f"\n🗑️  CLEANING PRE-EXISTING SMALL FOLDERS...")
+            logger.info(f"Cleaning {len(analysis.small_folders)} small folders")
+            delete_success, delete_errors = delete_small_folders(analysis.small_folders)
+            print(f"\n📊 SMALL FOLDER CLEANUP RESULTS:")
+            print(f"   ✅ Successful deletions: {delete_success}")
+            print(f"   ❌ Failed deletions: {delete_errors}")
+            print(f"   📋 Total processed: {len(analysis.small_folders)}")
+            logger.info(f"Small folder cleanup: {delete_success} success, {delete_errors} failed")
+        
+        # Automatically clean up folders that became empty/small after moves
+        cleanup_success = 0
+        cleanup_errors = 0
+        if analysis.moves and directories:
+            print(f"\n🧹 CLEANING UP EMPTY/SMALL FOLDERS AFTER MOVES...")
+            print("=" * 70)
+            logger.info("Starting post-move cleanup")
             
-            for folder in folders_to_cleanup:
-                if folder.size == 0:
-                    print(f"   📭 {folder.path.name} (EMPTY)")
-                    logger.debug(f"Empty folder for cleanup: {folder.path}")
-                else:
-                    print(f"   📁 {folder.path.name} ({format_file_size(folder.size)}, {folder.file_count} files)")
-                    logger.debug(f"Small folder for cleanup: {folder.path} - {folder.size} bytes")
+            # Find folders that became empty or small after the moves
+            folders_to_cleanup = find_empty_or_small_folders_after_moves(analysis.moves, directories, dir_sizes=dir_sizes)
             
-            cleanup_success, cleanup_errors = delete_small_folders(folders_to_cleanup)
-            print(f"\n📊 POST-MOVE CLEANUP RESULTS:")
-            print(f"   ✅ Successful cleanups: {cleanup_success}")
-            print(f"   ❌ Failed cleanups: {cleanup_errors}")
-            print(f"   📋 Total processed: {len(folders_to_cleanup)}")
-            logger.info(f"Post-move cleanup: {cleanup_success} success, {cleanup_errors} failed")
+            if folders_to_cleanup:
+                print(f"📂 Found {len(folders_to_cleanup)} folders to clean up:")
+                logger.info(f"Found {len(folders_to_cleanup)} folders for cleanup")
+                
+                for folder in folders_to_cleanup:
+                    if folder.size == 0:
+                        print(f"   📭 {folder.path.name} (EMPTY)")
+                        logger.debug(f"Empty folder for cleanup: {folder.path}")
+                    else:
+                        print(f"   📁 {folder.path.name} ({format_file_size(folder.size)}, {folder.file_count} files)")
+                        logger.debug(f"Small folder for cleanup: {folder.path} - {folder.size} bytes")
+                
+                cleanup_success, cleanup_errors = delete_small_folders(folders_to_cleanup)
+                print(f"\n📊 POST-MOVE CLEANUP RESULTS:")
+                print(f"   ✅ Successful cleanups: {cleanup_success}")
+                print(f"   ❌ Failed cleanups: {cleanup_errors}")
+                print(f"   📋 Total processed: {len(folders_to_cleanup)}")
+                logger.info(f"Post-move cleanup: {cleanup_success} success, {cleanup_errors} failed")
+            else:
+                print("✅ No folders need cleanup - source directories still contain content.")
+                logger.info("No post-move cleanup needed")
+        
+        # Final summary
+        total_success = success_count + delete_success + cleanup_success
+        total_errors = error_count + delete_errors + cleanup_errors
+        
+        print(f"\n🎉 TV ORGANIZATION COMPLETE!")
+        print("=" * 70)
+        print(f"📊 FINAL SUMMARY:")
+        print(f"   📺 Episodes moved: {success_count}")
+        if delete_success > 0:
+            print(f"   🗑️  Small folders cleaned: {delete_success}")
+        if cleanup_success > 0:
+            print(f"   🧹 Post-move cleanup: {cleanup_success}")
+        print(f"   ✅ Total successful operations: {total_success}")
+        if total_errors > 0:
+            print(f"   ❌ Total errors: {total_errors}")
+        print("=" * 70)
+        
+        if total_errors == 0:
+            print("🎊 ALL OPERATIONS COMPLETED SUCCESSFULLY!")
+            logger.info("TV organization completed successfully - no errors")
         else:
-            print("✅ No folders need cleanup - source directories still contain content.")
-            logger.info("No post-move cleanup needed")
-    
-    # Final summary
-    total_success = success_count + delete_success + cleanup_success
-    total_errors = error_count + delete_errors + cleanup_errors
-    
-    print(f"\n🎉 TV ORGANIZATION COMPLETE!")
-    print("=" * 70)
-    print(f"📊 FINAL SUMMARY:")
-    print(f"   📺 Episodes moved: {success_count}")
-    if delete_success > 0:
-        print(f"   🗑️  Small folders cleaned: {delete_success}")
-    if cleanup_success > 0:
-        print(f"   🧹 Post-move cleanup: {cleanup_success}")
-    print(f"   ✅ Total successful operations: {total_success}")
-    if total_errors > 0:
-        print(f"   ❌ Total errors: {total_errors}")
-    print("=" * 70)
-    
-    if total_errors == 0:
-        print("🎊 ALL OPERATIONS COMPLETED SUCCESSFULLY!")
-        logger.info("TV organization completed successfully - no errors")
-    else:
-        print(f"⚠️  COMPLETED WITH {total_errors} ERRORS - check log for details")
-        logger.warning(f"TV organization completed with {total_errors} errors")
-    
-    return error_count == 0 and delete_errors == 0 and cleanup_errors == 0
+            print(f"⚠️  COMPLETED WITH {total_errors} ERRORS - check log for details")
+            logger.warning(f"TV organization completed with {total_errors} errors")
+        
+        return error_count == 0 and delete_errors == 0 and cleanup_errors == 0
+    finally:
+        move_engine.remove_listener(dir_sizes.on_move)
+        dir_sizes.close()
 
 
 def main() -> None:
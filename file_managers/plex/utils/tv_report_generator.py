@@ -4,8 +4,9 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from .dir_sizes import DirectorySizeCache
 from .tv_scanner import (
     TVShowGroup,
     TVEpisode,
@@ -39,64 +40,72 @@ def analyze_existing_tv_folders(directories: List[str]) -> Dict[str, Dict]:
     """
     folder_analysis = {}
     
-    for directory in directories:
-        directory_path = Path(directory)
-        if not directory_path.exists():
-            folder_analysis[directory] = {"error": "Directory not found"}
-            continue
-        
-        folder_stats = {
-            "total_folders": 0,
-            "total_size": 0,
-            "folders": [],
-            "loose_files": []
-        }
-        
-        try:
-            # Analyze direct subdirectories (assumed to be show folders)
-            for item in directory_path.iterdir():
-                if item.is_dir():
-                    folder_info = analyze_show_folder(item)
-                    folder_stats["folders"].append(folder_info)
-                    folder_stats["total_folders"] += 1
-                    folder_stats["total_size"] += folder_info["size"]
-                elif item.is_file() and item.suffix.lower() in {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}:
-                    # Loose video files at root level
-                    try:
-                        file_size = item.stat().st_size
-                        folder_stats["loose_files"].append({
-                            "name": item.name,
-                            "size": file_size,
-                            "formatted_size": format_file_size(file_size),
-                            "path": str(item)
-                        })
-                        folder_stats["total_size"] += file_size
-                    except (OSError, IOError):
-                        pass
-                        
-        except Exception as e:
-            folder_analysis[directory] = {"error": str(e)}
-            continue
-        
-        # Sort folders by size (largest first)
-        folder_stats["folders"].sort(key=lambda x: x["size"], reverse=True)
-        folder_stats["loose_files"].sort(key=lambda x: x["size"], reverse=True)
-        
-        folder_analysis[directory] = folder_stats
+    with DirectorySizeCache() as dir_sizes:
+        for directory in directories:
+            directory_path = Path(directory)
+            if not directory_path.exists():
+                folder_analysis[directory] = {"error": "Directory not found"}
+                continue
+            
+            folder_stats = {
+                "total_folders": 0,
+                "total_size": 0,
+                "folders": [],
+                "loose_files": []
+            }
+            
+            try:
+                # Analyze direct subdirectories (assumed to be show folders)
+                for item in directory_path.iterdir():
+                    if item.is_dir():
+                        folder_info = analyze_show_folder(item, dir_sizes)
+                        folder_stats["folders"].append(folder_info)
+                        folder_stats["total_folders"] += 1
+                        folder_stats["total_size"] += folder_info["size"]
+                    elif item.is_file() and item.suffix.lower() in {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}:
+                        # Loose video files at root level
+                        try:
+                            file_size = item.stat().st_size
+                            folder_stats["loose_files"].append({
+                                "name": item.name,
+                                "size": file_size,
+                                "formatted_size": format_file_size(file_size),
+                                "path": str(item)
+                            })
+                            folder_stats["total_size"] += file_size
+                        except (OSError, IOError):
+                            pass
+                            
+            except Exception as e:
+                folder_analysis[directory] = {"error": str(e)}
+                continue
+            
+            # Sort folders by size (largest first)
+            folder_stats["folders"].sort(key=lambda x: x["size"], reverse=True)
+            folder_stats["loose_files"].sort(key=lambda x: x["size"], reverse=True)
+            
+            folder_analysis[directory] = folder_stats
     
     return folder_analysis
 
 
-def analyze_show_folder(folder_path: Path) -> Dict:
+def analyze_show_folder(folder_path: Path, dir_sizes: Optional[DirectorySizeCache] = None) -> Dict:
     """
     Analyze a single TV show folder.
     
     Args:
         folder_path: Path to the TV show folder
+        dir_sizes: Optional shared directory size cache
         
     Returns:
         Dictionary with folder analysis
     """
+    from .tv_scanner import extract_tv_info_from_filename
+    
+    if dir_sizes is None:
+        with DirectorySizeCache() as dir_sizes:
+            return analyze_show_folder(folder_path, dir_sizes)
+    
     folder_info = {
         "name": folder_path.name,
         "path": str(folder_path),
@@ -109,36 +118,31 @@ def analyze_show_folder(folder_path: Path) -> Dict:
     }
     
     try:
-        # Recursively analyze all files in the folder
-        for file_path in folder_path.rglob('*'):
-            if file_path.is_file():
-                try:
-                    file_size = file_path.stat().st_size
-                    folder_info["size"] += file_size
-                    folder_info["file_count"] += 1
-                    
-                    # Check if it's a video file
-                    if file_path.suffix.lower() in {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}:
-                        folder_info["video_files"] += 1
-                        
-                        # Try to extract episode information
-                        from .tv_scanner import extract_tv_info_from_filename
-                        tv_info = extract_tv_info_from_filename(file_path.name)
-                        if tv_info:
-                            show_name, season, episode = tv_info
-                            folder_info["seasons"].add(season)
-                            folder_info["episodes"].append({
-                                "filename": file_path.name,
-                                "season": season,
-                                "episode": episode,
-                                "size": file_size,
-                                "relative_path": str(file_path.relative_to(folder_path))
-                            })
+        # Totals and file listings come from the cached directory listings
+        totals = dir_sizes.size(folder_path)
+        folder_info["size"] = totals.size
+        folder_info["file_count"] = totals.file_count
+        folder_info["subdirectories"] = totals.dir_count
+        
+        for file_path, file_size in dir_sizes.iter_files(folder_path):
+            file_path = Path(file_path)
+            
+            # Check if it's a video file
+            if file_path.suffix.lower() in {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}:
+                folder_info["video_files"] += 1
                 
-                except (OSError, IOError):
-                    pass
-            elif file_path.is_dir() and file_path != folder_path:
-                folder_info["subdirectories"] += 1
+                # Try to extract episode information
+                tv_info = extract_tv_info_from_filename(file_path.name)
+                if tv_info:
+                    show_name, season, episode = tv_info
+                    folder_info["seasons"].add(season)
+                    folder_info["episodes"].append({
+                        "filename": file_path.name,
+                        "season": season,
+                        "episode": episode,
+                        "size": file_size,
+                        "relative_path": str(file_path.relative_to(folder_path))
+                    })
     
     except Exception:
         pass
@@ -1,11 +1,12 @@
 """TV show scanner utilities for detecting and organizing TV episodes."""
 
-import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from ..config.config import config
+from .filename_parser import TV_SHOW_PATTERNS, normalize_show_name, parse_filename
+from .fs_walker import FileEntry, walk_files
 
 # Get TV directories from config
 TV_DIRECTORIES = config.tv_directories
@@ -18,29 +19,6 @@ TV_DIRECTORIES = config.tv_directories
 # Get video extensions from config
 VIDEO_EXTENSIONS = config.video_extensions_set
 
-# TV show name patterns - common naming conventions
-TV_SHOW_PATTERNS = [
-    # Special case: "Show Name S01E01 - S01E01 - ..." (extract only "Show Name")
-    r'^(.+?)\s+S\d+E\d+\s*-\s*S(\d+)E(\d+)',
-    # Show.Name.S01E01.Episode.Title.quality.mkv
-    r'^(.+?)\.S(\d+)E(\d+)',
-    # Show Name - S01E01 - Episode Title.mkv  
-    r'^(.+?)\s*-\s*S(\d+)E(\d+)',
-    # Show Name S01E01 Episode Title.mkv
-    r'^(.+?)\s+S(\d+)E(\d+)',
-    # Show.Name.1x01.Episode.Title.mkv
-    r'^(.+?)\.(\d+)x(\d+)',
-    # Show Name - 1x01 - Episode Title.mkv
-    r'^(.+?)\s*-\s*(\d+)x(\d+)',
-    # Show Name 1x01 Episode Title.mkv
-    r'^(.+?)\s+(\d+)x(\d+)',
-    # Show Name Season 1 Episode 01.mkv
-    r'^(.+?)\s+Season\s+(\d+)\s+Episode\s+(\d+)',
-    # Show Name s1e01.mkv (lowercase)
-    r'^(.+?)\s+s(\d+)e(\d+)',
-]
-
-
 class TVEpisode(NamedTuple):
     """Represents a TV episode file with metadata."""
     name: str                    # Original filename
@@ -50,6 +28,7 @@ class TVEpisode(NamedTuple):
     path: Path                  # Full file path
     size: int                   # File size in bytes
     suggested_folder: str       # Suggested destination folder name
+    mtime: float = 0.0          # Last modification time
 
 
 class TVShowGroup(NamedTuple):
@@ -61,45 +40,9 @@ class TVShowGroup(NamedTuple):
     episode_count: int          # Total number of episodes
 
 
-def normalize_show_name(show_name: str) -> str:
-    """
-    Normalize TV show name for consistent grouping.
-    
-    Args:
-        show_name: Raw show name from filename
-        
-    Returns:
-        Normalized show name
-    """
-    # Remove common separators and convert to lowercase
-    normalized = show_name.replace('.', ' ').replace('_', ' ').replace('-', ' ')
-    
-    # Remove extra whitespace
-    normalized = ' '.join(normalized.split())
-    
-    # Convert to title case for consistency
-    normalized = normalized.title()
-    
-    # Handle common abbreviations and fixes
-    replacements = {
-        'Tv': 'TV',
-        'Uk': 'UK',
-        'Us': 'US',
-        'Fbi': 'FBI',
-        'Csi': 'CSI',
-        'Ncis': 'NCIS',
-        'Nypd': 'NYPD',
-    }
-    
-    for old, new in replacements.items():
-        normalized = normalized.replace(old, new)
-    
-    return normalized.strip()
-
-
 def extract_tv_info_from_filename(filename: str) -> Optional[Tuple[str, int, int]]:
     """
-    Extract TV show information from filename using regex patterns.
+    Extract TV show information from filename using the shared parser.
     
     Args:
         filename: The filename to analyze
@@ -107,22 +50,11 @@ def extract_tv_info_from_filename(filename: str) -> Optional[Tuple[str, int, int
     Returns:
         Tuple of (show_name, season, episode) or None if not detected
     """
-    # Remove file extension for cleaner matching
-    name_without_ext = Path(filename).stem
-    
-    for pattern in TV_SHOW_PATTERNS:
-        match = re.search(pattern, name_without_ext, re.IGNORECASE)
-        if match:
-            show_name = match.group(1)
-            season = int(match.group(2))
-            episode = int(match.group(3))
-            
-            # Clean up show name
-            show_name = normalize_show_name(show_name)
-            
-            return show_name, season, episode
+    parsed = parse_filename(filename)
+    if not parsed.is_episode:
+        return None
     
-    return None
+    return parsed.show_name, parsed.season, parsed.episode
 
 
 def is_video_file(file_path: Path) -> bool:
@@ -147,40 +79,43 @@ def scan_directory_for_tv_episodes(directory: str) -> List[TVEpisode]:
         return episodes
     
     # Recursively find all video files
-    for file_path in directory_path.rglob('*'):
-        if not file_path.is_file() or not is_video_file(file_path):
-            continue
-        
-        # Extract TV show information
-        tv_info = extract_tv_info_from_filename(file_path.name)
-        if not tv_info:
-            continue
-        
-        show_name, season, episode = tv_info
-        
-        try:
-            file_size = file_path.stat().st_size
-        except (OSError, IOError):
-            continue
-        
-        # Create suggested folder name (same as normalized show name)
-        suggested_folder = show_name
-        
-        episode_obj = TVEpisode(
-            name=file_path.name,
-            show_name=show_name,
-            season=season,
-            episode=episode,
-            path=file_path,
-            size=file_size,
-            suggested_folder=suggested_folder
-        )
-        
-        episodes.append(episode_obj)
+    for entry in walk_files([directory], VIDEO_EXTENSIONS):
+        episode_obj = tv_episode_from_entry(entry)
+        if episode_obj:
+            episodes.append(episode_obj)
     
     return episodes
 
 
+def tv_episode_from_entry(entry: FileEntry) -> Optional[TVEpisode]:
+    """
+    Build a TVEpisode from a directory walk record.
+    
+    Args:
+        entry: FileEntry produced by the filesystem walker
+        
+    Returns:
+        TVEpisode, or None if the filename is not a recognizable episode
+    """
+    # Extract TV show information
+    tv_info = extract_tv_info_from_filename(entry.name)
+    if not tv_info:
+        return None
+    
+    show_name, season, episode = tv_info
+    
+    return TVEpisode(
+        name=entry.name,
+        show_name=show_name,
+        season=season,
+        episode=episode,
+        path=Path(entry.path),
+        size=entry.size,
+        suggested_folder=show_name,  # Same as normalized show name
+        mtime=entry.mtime
+    )
+
+
 def group_episodes_by_show(episodes: List[TVEpisode]) -> List[TVShowGroup]:
     """
     Group episodes by TV show name.
@@ -21,6 +21,7 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\n\n⏹️  Enrichment cancelled by user")
+        print("💾 Finished lookups were saved; run again to resume")
         sys.exit(0)
     except Exception as e:
         print(f"\n❌ Error: {e}")
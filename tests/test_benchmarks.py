@@ -0,0 +1,53 @@
+"""Tests for the synthetic library generator and benchmark suite."""
+
+import os
+
+from file_managers.plex.benchmarks import (
+    compare_results,
+    generate_library,
+    run_benchmarks,
+)
+from file_managers.plex.benchmarks.library import allocated_bytes
+
+
+def _files(root):
+    return sorted((os.path.relpath(os.path.join(dirpath, name), root), os.path.getsize(os.path.join(dirpath, name)))
+                  for dirpath, _, names in os.walk(root) for name in names if name != "manifest.json")
+
+
+def test_libraries_are_reproducible_sparse_and_reused(tmp_path):
+    """Test that a seed and size always give the same sparse tree."""
+    first = generate_library(tmp_path / "a", 400, seed=7)
+    second = generate_library(tmp_path / "b", 400, seed=7)
+
+    files = _files(tmp_path / "a")
+    assert files == _files(tmp_path / "b")
+    assert len(files) == first.total_files == 400
+    assert first.duplicate_movies and first.duplicate_episodes and first.loose_episodes
+    assert sum(size for _, size in files) > 100 * 1024**3
+    assert allocated_bytes(tmp_path / "a") < 1024**2
+    generate_library(tmp_path / "c", 400, seed=8)
+    assert _files(tmp_path / "c") != files
+
+    (tmp_path / "a" / "marker").write_text("kept")
+    assert generate_library(tmp_path / "a", 400, seed=7) == first
+    assert (tmp_path / "a" / "marker").exists()
+    assert second.show_names == first.show_names
+
+
+def test_run_and_compare_flag_only_real_regressions(tmp_path):
+    """Test that every benchmark reports and slowdowns above threshold are flagged."""
+    document = run_benchmarks([300], workdir=tmp_path, seed=3)
+    results = document["results"]["300"]
+    assert set(results) == {"find_duplicate_movies", "rebuild_database", "search_tv_shows",
+                            "tv_duplicates_scan", "tv_detect_duplicates", "path_resolver_scan",
+                            "resolve_episode_paths"}
+    assert results["rebuild_database"]["items"] == 300
+    assert results["tv_duplicates_scan"]["items"] == results["path_resolver_scan"]["items"]
+
+    baseline = {"results": {"1000": {"rebuild_database": {"seconds": 1.0}, "search_tv_shows": {"seconds": 0.01},
+                                     "tv_detect_duplicates": {"seconds": 0.5}}}}
+    current = {"results": {"1000": {"rebuild_database": {"seconds": 1.5}, "search_tv_shows": {"seconds": 0.04},
+                                    "tv_detect_duplicates": {"seconds": 0.55}, "new_benchmark": {"seconds": 9.0}}}}
+    regressions = compare_results(current, baseline, threshold=0.25)
+    assert [(r.size, r.benchmark, r.ratio) for r in regressions] == [("1000", "rebuild_database", 1.5)]
@@ -0,0 +1,51 @@
+"""Tests for the classification database."""
+
+import pytest
+
+from file_managers.plex.media_autoorganizer.classification_db import (
+    ClassificationDatabase,
+)
+
+
+def test_bulk_lookup_and_read_through_cache(tmp_path):
+    """Test that bulk lookups return stored rows and cache misses too."""
+    db_path = tmp_path / "classifications.db"
+    database = ClassificationDatabase(db_path)
+    database.store_batch_classifications([
+        ("Heat.1995.mkv", "MOVIE", "AI-Batch", 0.8),
+        ("Show.S01E01.mkv", "TV", "Rule-based", 0.8),
+    ])
+
+    fresh = ClassificationDatabase(db_path)
+    results = fresh.get_classifications_bulk(["Heat.1995.mkv", "Show.S01E01.mkv", "Unknown.mkv"])
+
+    assert results == {
+        "Heat.1995.mkv": ("MOVIE", "AI-Batch", 0.8),
+        "Show.S01E01.mkv": ("TV", "Rule-based", 0.8),
+    }
+    # Later lookups (including the miss) are answered from memory
+    fresh._conn.execute("DELETE FROM classifications")
+    assert fresh.get_classification("Heat.1995.mkv") == ("MOVIE", "AI-Batch", 0.8)
+    assert fresh.get_classification("Unknown.mkv") is None
+
+
+def test_batch_writes_commit_once_and_roll_back_on_error(tmp_path):
+    """Test that batched writes are visible only after the batch commits."""
+    db_path = tmp_path / "classifications.db"
+    database = ClassificationDatabase(db_path)
+    reader = ClassificationDatabase(db_path)
+
+    with database.batch_writes():
+        database.store_classification("A.mkv", "MOVIE", "CSV", 0.7)
+        database.store_classification("B.mkv", "TV", "CSV", 0.7)
+        assert reader.get_classifications_bulk(["A.mkv"]) == {}
+
+    assert ClassificationDatabase(db_path).get_stats()["total"] == 2
+
+    with pytest.raises(RuntimeError):
+        with database.batch_writes():
+            database.store_classification("C.mkv", "MOVIE", "CSV", 0.7)
+            raise RuntimeError("interrupted")
+
+    assert database.get_classification("C.mkv") is None
+    assert database.get_stats()["total"] == 2
@@ -0,0 +1,71 @@
+"""Tests for the concurrent AI classification pipeline."""
+
+import io
+import json
+import re
+import threading
+
+from botocore.exceptions import ClientError
+
+from file_managers.plex.media_autoorganizer.ai_classifier import BedrockClassifier
+from file_managers.plex.media_autoorganizer.classification_db import (
+    ClassificationDatabase,
+)
+from file_managers.plex.media_autoorganizer.classification_pipeline import (
+    ClassificationPipeline,
+    plan_batches,
+)
+from file_managers.plex.utils.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeBedrockClient:
+    """Local stand-in for the bedrock-runtime client."""
+
+    def __init__(self, throttle_first: int = 0):
+        self.throttles_left = throttle_first
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def invoke_model(self, body, modelId, accept, contentType):
+        with self.lock:
+            self.calls += 1
+            if self.throttles_left:
+                self.throttles_left -= 1
+                raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}},
+                                  "InvokeModel")
+
+        request = json.loads(body)
+        prompt = request["messages"][0]["content"] if "messages" in request else request["prompt"]
+        filenames = re.findall(r"^\d+\. (.+)$", prompt, re.MULTILINE)
+        answer = json.dumps([
+            {"filename": name, "type": "TV" if "S01" in name else "MOVIE"} for name in filenames
+        ])
+        payload = {"content": [{"text": answer}]} if "messages" in request else {"generation": answer}
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+def test_plan_batches_respects_size_and_token_budget():
+    """Test that batches never exceed the file cap or the token budget."""
+    filenames = [f"Movie.{i}.2020.1080p.mkv" for i in range(7)]
+
+    assert [len(b) for b in plan_batches(filenames, 3, 10_000)] == [3, 3, 1]
+    assert all(len(b) == 1 for b in plan_batches(filenames, 10, 1))
+    assert sorted(i for b in plan_batches(filenames, 4, 60) for i in b) == list(range(7))
+
+
+def test_pipeline_streams_results_and_backs_off_on_throttling(tmp_path):
+    """Test that every file is classified and stored despite throttling."""
+    client = FakeBedrockClient(throttle_first=2)
+    database = ClassificationDatabase(tmp_path / "classifications.db")
+    limiter = AdaptiveRateLimiter(rate=1000.0, min_rate=1.0, max_rate=1000.0, capacity=4)
+    pipeline = ClassificationPipeline(BedrockClassifier(client=client), database=database,
+                                      workers=4, max_batch_size=5, rate_limiter=limiter)
+    filenames = [f"Show.S01E{i:02d}.mkv" for i in range(10)] + [f"Film.{i}.mkv" for i in range(10)]
+
+    batches = list(pipeline.run(filenames))
+
+    assert sorted(i for batch in batches for i in batch.indices) == list(range(20))
+    assert limiter.throttle_count == 2
+    assert client.calls == 4 + 2
+    assert database.get_classification("Show.S01E03.mkv") == ("TV", "AI-Batch", 0.8)
+    assert database.get_classification("Film.7.mkv")[0] == "MOVIE"
@@ -0,0 +1,40 @@
+"""Tests for lazy command loading in plex-cli."""
+
+import subprocess
+import sys
+
+from file_managers.cli.personal_cli import PlexCLI
+
+
+def test_only_the_selected_group_gets_its_argument_tree(capsys):
+    """Test group selection and that every group still parses when run."""
+    cli = PlexCLI()
+    registry = cli.registry
+    assert registry.selected_group(["--profile-dump", "tv", "-v", "movies", "search", "x"]) == "movies"
+    assert registry.selected_group(["-i"]) is None
+    assert registry.selected_group(["nonsense", "files"]) is None
+    assert registry.selected_group(["--profile", "--profile-d", "out.txt", "config"]) == "config"
+    assert registry.selected_group(["--profile-dump=out.txt", "--verb", "tv"]) == "tv"
+
+    parser = cli._create_parser(["movies", "search", "Heat"])
+    groups = parser._subparsers._group_actions[0].choices
+    assert list(groups) == ["files", "movies", "tv", "media", "config"]
+    assert groups["movies"]._subparsers is not None
+    assert groups["files"]._subparsers is None
+    assert parser.parse_args(["movies", "search", "Heat"]).movies_command == "search"
+
+    assert cli.run(["config", "paths"]) == 0
+    assert cli.parser.parse_args(["config", "show"]).config_command == "show"
+    assert "Movie Paths" in capsys.readouterr().out
+
+
+def test_cli_and_ai_modules_do_not_import_the_aws_sdk():
+    """Test that boto3 is only imported once a Bedrock client is created."""
+    code = ("import sys\n"
+            "from file_managers.cli.personal_cli import PlexCLI\n"
+            "assert PlexCLI().run(['config', 'show']) == 0\n"
+            "import file_managers.plex.media_autoorganizer.organizer\n"
+            "import file_managers.plex.utils.ai_query_processor\n"
+            "print('boto3' in sys.modules, 'file_managers.plex.utils.media_database' in sys.modules)\n")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == "False False"
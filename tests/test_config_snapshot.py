@@ -0,0 +1,52 @@
+"""Tests for the precomputed MediaConfig snapshot."""
+
+import os
+import shutil
+
+import pytest
+
+from file_managers.plex.config.config import MediaConfig, compile_snapshot, config
+
+
+def test_snapshot_is_immutable_and_precomputed():
+    """Test compiled lookups and that the snapshot cannot be mutated."""
+    snapshot = compile_snapshot({
+        "settings": {"video_extensions": [".MKV", ".mp4"]},
+        "tv": {"directories": [{"path": "/mnt/b/TV", "priority": 2}, {"path": "/mnt/a/TV", "priority": 1}]},
+        "nas": {"shares": [{"name": "media", "mount_path": "/mnt/a"}, {"name": "tv", "mount_path": "/mnt/a/TV"}]},
+    })
+    assert snapshot.video_extensions == {".mkv", ".mp4"}
+    assert snapshot.is_video_file("/x/Show.S01E01.MKV") and not snapshot.is_video_file("/x/notes.txt")
+    assert snapshot.directories_for("tv") == snapshot.directories_for("TV") == ("/mnt/b/TV", "/mnt/a/TV")
+    assert snapshot.directories_by_priority["TV"] == ("/mnt/a/TV", "/mnt/b/TV")
+    assert snapshot.directories_for("MOVIE") == () and snapshot.directories_for("podcast") == ()
+    assert snapshot.share_for_path("/mnt/a/TV/Show") == "tv"
+    assert snapshot.share_for_path("/mnt/a/Movies") == "media"
+    assert snapshot.share_for_path("/mnt/ab") is None
+
+    with pytest.raises(AttributeError):
+        snapshot.video_extensions = frozenset()
+    with pytest.raises(TypeError):
+        snapshot.directories_by_media_type["TV"] = ()
+    assert config.video_extensions_set is config.video_extensions_set is config.snapshot.video_extensions
+
+
+def test_reload_only_recompiles_when_the_file_changes(tmp_path, monkeypatch):
+    """Test that reload() checks the file stamp and swaps in a new snapshot."""
+    config_file = tmp_path / "media_config.yaml"
+    shutil.copy(config.config_file, config_file)
+    monkeypatch.setattr(MediaConfig, "config_file", property(lambda self: config_file))
+    try:
+        assert config.reload(force=True)
+        before = config.snapshot
+        assert not config.reload()
+        assert config.snapshot is before
+
+        with open(config_file, "a", encoding="utf-8") as f:
+            f.write("\n# edited\n")
+        os.utime(config_file, ns=(1, 1))
+        assert config.reload()
+        assert config.snapshot is not before and config.snapshot == before
+    finally:
+        monkeypatch.undo()
+        config.reload(force=True)
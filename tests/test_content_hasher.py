@@ -0,0 +1,105 @@
+"""Tests for byte-level duplicate verification."""
+
+from file_managers.plex.tv_organizer.core.duplicate_detector import DuplicateDetector
+from file_managers.plex.utils.content_hasher import ContentHasher
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_find_identical_uses_size_sample_and_full_hash(tmp_path):
+    """Test that only byte-identical files are grouped, even when samples tie."""
+    base = bytes(range(256)) * 64  # 16 KiB
+    changed_middle = bytearray(base)
+    changed_middle[len(base) // 2 + 3000] ^= 0xFF  # Outside every 1 KiB sample
+
+    original = _write(tmp_path / "a.mkv", base)
+    copy = _write(tmp_path / "b.mkv", base)
+    near = _write(tmp_path / "c.mkv", bytes(changed_middle))
+    other_size = _write(tmp_path / "d.mkv", base + b"x")
+
+    hasher = ContentHasher(str(tmp_path / "cache.db"), sample_bytes=1024, buffer_bytes=4096)
+    groups = hasher.find_identical([original, copy, near, other_size])
+
+    assert groups == [[original, copy]]
+    assert hasher.stats["sample_reads"] == 3  # The different size is never read
+    assert hasher.stats["full_reads"] == 3
+
+
+def test_rerun_reads_nothing_until_file_changes(tmp_path):
+    """Test that cached hashes are reused until size or mtime change."""
+    data = b"episode" * 1000
+    first = _write(tmp_path / "a.mkv", data)
+    second = _write(tmp_path / "b.mkv", data)
+    cache = str(tmp_path / "cache.db")
+
+    ContentHasher(cache, sample_bytes=1024).find_identical([first, second])
+
+    rerun = ContentHasher(cache, sample_bytes=1024)
+    assert rerun.find_identical([first, second]) == [[first, second]]
+    assert rerun.stats["sample_reads"] == rerun.stats["full_reads"] == 0
+
+    _write(tmp_path / "b.mkv", b"EPISODE" * 1000)
+    changed = ContentHasher(cache, sample_bytes=1024)
+    assert changed.find_identical([first, second]) == []
+    assert changed.stats["sample_reads"] == 1  # Only the changed file is reread
+
+
+def test_verified_copies_bypass_deletion_confidence(tmp_path):
+    """Test that byte-identical same-quality copies become deletable."""
+    data = b"x" * 4096
+    _write(tmp_path / "Show.S01E01.720p.mkv", data)
+    (tmp_path / "Season 1").mkdir()
+    _write(tmp_path / "Season 1" / "Show.S01E01.720p.mkv", data)
+
+    unverified = DuplicateDetector([str(tmp_path)])
+    unverified.scan_all_directories()
+    unverified.detect_duplicates()
+    assert unverified.create_deletion_plan().operations == []
+
+    hasher = ContentHasher(str(tmp_path / "cache.db"), sample_bytes=1024)
+    detector = DuplicateDetector([str(tmp_path)], verify_content=True, hasher=hasher)
+    detector.scan_all_directories()
+    groups = detector.detect_duplicates()
+
+    assert len(groups) == 1
+    assert groups[0].metadata["content_identical"] is True
+    plan = detector.create_deletion_plan()
+    assert len(plan.operations) == 1
+    assert plan.operations[0].reason == "Byte-identical copy of kept file"
+
+
+def test_aliases_of_one_file_are_never_copies(tmp_path):
+    """Test that a symlinked path to the kept file is not verified or deleted."""
+    data = b"x" * 4096
+    original = _write(tmp_path / "Show.S01E01.720p.mkv", data)
+    (tmp_path / "Season 1").mkdir()
+    (tmp_path / "Season 1" / "Show.S01E01.720p.mkv").symlink_to(original)
+
+    hasher = ContentHasher(str(tmp_path / "cache.db"), sample_bytes=1024)
+    assert hasher.find_identical([original, str(tmp_path / "Season 1" / "Show.S01E01.720p.mkv")]) == []
+
+    detector = DuplicateDetector([str(tmp_path)], verify_content=True, hasher=hasher)
+    detector.scan_all_directories()
+    detector.detect_duplicates()
+    assert detector.create_deletion_plan(min_confidence_score=0.0).operations == []
+
+
+def test_identical_copies_do_not_delete_a_multi_episode_file(tmp_path):
+    """Test that only the keeper's identical copies go when other names differ."""
+    data = b"x" * 4096
+    _write(tmp_path / "Show.S01E01.1080p.WEB-DL.mkv", data)
+    _write(tmp_path / "Show.S01E01.1080p.WEB-DL(1).mkv", data)
+    _write(tmp_path / "Show.S01E01-E02.720p.HDTV.mkv", b"y" * 8192)
+
+    hasher = ContentHasher(str(tmp_path / "cache.db"), sample_bytes=1024)
+    detector = DuplicateDetector([str(tmp_path)], verify_content=True, hasher=hasher)
+    detector.scan_all_directories()
+    detector.detect_duplicates()
+    plan = detector.create_deletion_plan(min_confidence_score=0.0)
+
+    deleted = [op.episode.filename for op in plan.operations]
+    assert len(deleted) == 1
+    assert "E02" not in deleted[0]
@@ -0,0 +1,92 @@
+"""Tests for the cached directory size aggregator."""
+
+import os
+
+from file_managers.plex.media_autoorganizer.organizer import AutoOrganizer
+from file_managers.plex.utils import dir_sizes
+from file_managers.plex.utils.dir_sizes import DirectorySizeCache, DirSize
+from file_managers.plex.utils.move_engine import MoveEngine
+from file_managers.plex.utils.tv_mover import TVMoveAnalysis, execute_moves
+
+
+def _make_show(root):
+    """Create a small show folder with two seasons."""
+    show = root / "Show"
+    (show / "Season 1").mkdir(parents=True)
+    (show / "Season 2").mkdir()
+    (show / "Season 1" / "Show.S01E01.mkv").write_bytes(b"x" * 100)
+    (show / "Season 1" / "Show.S01E02.mkv").write_bytes(b"x" * 50)
+    (show / "Season 2" / "Show.S02E01.mkv").write_bytes(b"x" * 25)
+    (show / "poster.jpg").write_bytes(b"x" * 5)
+    return show
+
+
+def test_sizes_are_aggregated_and_reruns_only_stat_directories(tmp_path, monkeypatch):
+    """Test bottom-up totals and that a second run lists nothing again."""
+    show = _make_show(tmp_path / "tv")
+    cache_path = tmp_path / "dir_sizes.db"
+
+    first = DirectorySizeCache(cache_path)
+    assert first.size(show) == DirSize(180, 4, 2)
+    assert first.stats["listed"] == 3
+    first.close()
+
+    def no_scandir(path):
+        raise AssertionError(f"listed {path} again")
+
+    monkeypatch.setattr(os, "scandir", no_scandir)
+    second = DirectorySizeCache(cache_path)
+    assert second.size(show) == DirSize(180, 4, 2)
+    assert sorted(size for _, size in second.iter_files(show / "Season 1")) == [50, 100]
+
+
+def test_move_listener_updates_only_the_touched_folders(tmp_path):
+    """Test that a move through the engine is reflected in the cached totals."""
+    show = _make_show(tmp_path / "tv")
+    cache = DirectorySizeCache(tmp_path / "dir_sizes.db")
+    engine = MoveEngine(tmp_path / "journal.jsonl")
+    engine.add_listener(cache.on_move)
+    assert cache.size(show).size == 180
+    listed = cache.stats["listed"]
+
+    engine.submit(show / "Season 1" / "Show.S01E01.mkv", show / "Season 2" / "Show.S01E01.mkv")
+
+    assert cache.size(show / "Season 1") == DirSize(50, 1, 0)
+    assert cache.size(show) == DirSize(180, 4, 2)
+    assert cache.stats["listed"] == listed + 2
+
+
+def test_totals_follow_changes_made_outside_the_engine(tmp_path):
+    """Test that a repeated query sees a file added without a move listener."""
+    show = _make_show(tmp_path / "tv")
+    with DirectorySizeCache(tmp_path / "dir_sizes.db") as cache:
+        assert cache.size(show).size == 180
+        (show / "Season 2" / "Show.S02E02.mkv").write_bytes(b"x" * 20)
+        os.utime(show / "Season 2", (0, 12345))
+
+        assert cache.size(show) == DirSize(200, 5, 2)
+
+
+def test_execute_moves_leaves_no_listener_on_a_reused_engine(tmp_path, monkeypatch):
+    """Test that each run unregisters and closes its size cache."""
+    monkeypatch.setattr(dir_sizes, "default_cache_path", lambda: tmp_path / "dir_sizes.db")
+    engine = MoveEngine(tmp_path / "journal.jsonl")
+    analysis = TVMoveAnalysis([], {}, [], [], 0, 0)
+
+    assert execute_moves(analysis, move_engine=engine)
+    assert execute_moves(analysis, move_engine=engine)
+    assert engine._listeners == []
+
+
+def test_organizer_close_detaches_its_size_cache(tmp_path):
+    """Test that closing the organizer unregisters and closes its size cache."""
+    organizer = AutoOrganizer.__new__(AutoOrganizer)
+    organizer.move_engine = MoveEngine(tmp_path / "journal.jsonl")
+    organizer.dir_sizes = DirectorySizeCache(tmp_path / "dir_sizes.db")
+    organizer.move_engine.add_listener(organizer.dir_sizes.on_move)
+
+    with organizer:
+        assert organizer.dir_sizes.size(tmp_path).size >= 0
+
+    assert organizer.move_engine._listeners == []
+    assert organizer.dir_sizes._conn is None
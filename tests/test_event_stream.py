@@ -0,0 +1,147 @@
+"""Tests for the structured JSONL event stream."""
+
+import json
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+
+from file_managers.plex.utils import media_reorganizer
+from file_managers.plex.utils.event_stream import (
+    API_CALL,
+    MOVE,
+    EventStream,
+    read_columns,
+    read_events,
+)
+from file_managers.plex.utils.log_analyzer import LogAnalyzer
+from file_managers.plex.utils.media_mover import MediaMover, MoveOperation
+from file_managers.plex.utils.media_reorganizer import (
+    MediaFile,
+    MediaReorganizationAnalyzer,
+)
+from file_managers.plex.utils.metadata_enrichment import MetadataCache
+from file_managers.plex.utils.move_engine import MoveOutcome
+
+
+def test_events_from_many_threads_are_all_written_on_close(tmp_path):
+    """Test that emit never loses records and columns line up."""
+    stream = EventStream(tmp_path / "run.events.jsonl")
+
+    def worker(n):
+        for i in range(200):
+            stream.api_call("tmdb", "search/movie", 200, 0.01, worker=n, i=i)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stream.move("/a.mkv", "/b/a.mkv", True, 42)
+    stream.close()
+    stream.move("/late.mkv", "/b/late.mkv", True)  # Dropped after close
+
+    tables = read_columns(stream.path, {API_CALL: None, MOVE: ["source", "size"]})
+    assert len(tables[API_CALL]["ts"]) == 800
+    assert set(tables[API_CALL]["status"]) == {200}
+    assert tables[MOVE] == {"source": ["/a.mkv"], "size": [42]}
+
+    disabled = EventStream()
+    disabled.move("/a.mkv", "/b/a.mkv", True)
+    disabled.close()
+    assert not disabled.enabled
+
+
+def test_log_analyzer_reads_reorganizer_events(tmp_path, monkeypatch):
+    """Test that a reorganizer session is analyzed from its events, not its text log."""
+    monkeypatch.chdir(tmp_path)
+    analyzer = MediaReorganizationAnalyzer(use_external_apis=False)
+    analyzer._metadata_cache = MetadataCache(cache_path=str(tmp_path / "metadata.db"))
+    analyzer.all_files = [MediaFile(Path("/media/movies/Show.S01E01.mkv"), "Show.S01E01.mkv", 2048, "movies"),
+                          MediaFile(Path("/media/movies/Heat.1995.mkv"), "Heat.1995.mkv", 1024, "movies")]
+    analyzer.events.phase("database_loading", 0.5, files=2)
+    misplaced = analyzer._analyze_with_unified_workflow()
+    analyzer.events.phase("analysis", 1.25, classification_stats=analyzer._classification_summary())
+    analyzer.events.close()
+
+    assert not any("MISPLACED FILE" in line for line in
+                   Path(f"logs/media_reorganizer_{analyzer.session_id}.log").read_text().splitlines())
+    assert [record["type"] for record in read_events(analyzer.events.path)][0] == "session"
+
+    session = LogAnalyzer("logs").analyze_session(analyzer.session_id)
+    assert session.total_files == 2
+    assert session.performance_metrics == {"database_loading_time": 0.5, "analysis_time": 1.25}
+    assert session.classification_stats["tv_pattern_detection"] == 1
+    assert [event.method for event in session.classification_events] == ["tv_pattern_detection", "unclassified"]
+    assert len(misplaced) == session.misplaced_files == 1
+    assert (session.misplaced_events[0].file_size, session.misplaced_events[0].suggested_category) == (2048, "TV")
+
+
+def test_reorganizer_keeps_text_lines_when_events_are_disabled(tmp_path, monkeypatch):
+    """Test that per-file decisions reach the text log without an event stream."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(media_reorganizer, "open_event_stream", lambda *args: EventStream())
+    analyzer = MediaReorganizationAnalyzer(use_external_apis=False)
+    analyzer._metadata_cache = MetadataCache(cache_path=str(tmp_path / "metadata.db"))
+    analyzer.all_files = [MediaFile(Path("/media/movies/Show.S01E01.mkv"), "Show.S01E01.mkv", 2048, "movies")]
+    analyzer._analyze_with_unified_workflow()
+
+    log = Path(f"logs/media_reorganizer_{analyzer.session_id}.log").read_text()
+    assert "TV PATTERN DETECTED: Show.S01E01.mkv" in log
+    assert "MISPLACED FILE: Show.S01E01.mkv" in log
+
+
+def test_mover_records_every_run_until_closed(tmp_path, monkeypatch):
+    """Test that a second run on the same mover still writes its move events."""
+    monkeypatch.chdir(tmp_path)
+    cache_file = tmp_path / "decisions.json"
+    cache_file.write_text(json.dumps({"approved_moves": [
+        {"source_path": str(cache_file), "target_path": str(tmp_path / "moved.json"), "move_type": "file"}
+    ]}))
+
+    with MediaMover(dry_run=True) as mover:
+        assert mover.execute_cached_moves(str(cache_file))
+        assert mover.execute_cached_moves(str(cache_file))
+
+    assert len(read_columns(mover.events.path, {MOVE: ["source"]})[MOVE]["source"]) == 2
+
+
+class QueuingEngine:
+    """Move engine stub that queues every move and fails it on wait."""
+
+    def __init__(self):
+        self.queued = []
+
+    def resume(self):
+        return []
+
+    def is_target_taken(self, target):
+        return False
+
+    def submit(self, source, target, size=None):
+        self.queued.append(MoveOutcome("1", str(source), str(target), False, "share went away"))
+        return Future()
+
+    def has_pending(self):
+        return bool(self.queued)
+
+    def wait(self):
+        outcomes, self.queued = self.queued, []
+        return outcomes
+
+
+def test_queued_move_is_recorded_once_with_its_final_outcome(tmp_path, monkeypatch):
+    """Test that a queued cross-share move emits only its finished result."""
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "Heat.1995.mkv"
+    source.write_text("m")
+
+    with MediaMover(dry_run=False) as mover:
+        mover.events = EventStream(tmp_path / "moves.events.jsonl")
+        mover.move_engine = QueuingEngine()
+        mover.approved_moves = [MoveOperation(str(source), str(tmp_path / "Movies"), "tv", "movies",
+                                              0.9, "year in name", 1, "1 B")]
+        mover._execute_approved_moves()
+
+    moves = read_columns(mover.events.path, {MOVE: ["success", "queued"]})[MOVE]
+    assert moves == {"success": [False], "queued": [True]}
+    assert mover.stats["moves_failed"] == 1
@@ -0,0 +1,80 @@
+"""Tests for the shared filename parser."""
+
+from file_managers.plex.utils.filename_parser import parse_filename
+from file_managers.plex.utils.movie_scanner import (
+    extract_year_from_filename,
+    normalize_movie_name,
+)
+from file_managers.plex.utils.tv_scanner import extract_tv_info_from_filename
+
+
+def test_movie_filename():
+    """Test title, year and release attributes of a movie filename."""
+    parsed = parse_filename("The.Matrix.1999.1080p.BluRay.x264-GRP.mkv")
+
+    assert parsed.normalized_title == "the matrix 1999"
+    assert parse_filename("The.Matrix.1999.1080p.BluRay.x264.mkv").title == "The Matrix"
+    assert parsed.year == 1999
+    assert parsed.quality == "1080p"
+    assert parsed.source == "BluRay"
+    assert parsed.codec == "H.264"
+    assert not parsed.is_episode
+    assert normalize_movie_name("The.Matrix.1999.1080p.BluRay.x264-GRP.mkv") == "the matrix 1999"
+
+
+def test_tv_patterns_keep_priority_order():
+    """Test that the merged TV regex returns the same match as the ordered list."""
+    assert extract_tv_info_from_filename("Breaking.Bad.S01E01.720p.HDTV.mkv") == ("Breaking Bad", 1, 1)
+    assert extract_tv_info_from_filename("Show Name S01E01 - S01E02 - Double.mkv") == ("Show Name", 1, 2)
+    assert extract_tv_info_from_filename("Friends 1x05 The One.avi") == ("Friends", 1, 5)
+    assert extract_tv_info_from_filename("Show Name Season 2 Episode 03.mkv") == ("Show Name", 2, 3)
+    assert extract_tv_info_from_filename("Alien.1979.1080p.mkv") is None
+
+
+def test_year_in_brackets_is_kept_for_movies():
+    """Test that a bracketed year still reaches the movie scanner."""
+    assert extract_year_from_filename("Movie [2010].mkv") == "2010"
+    assert extract_year_from_filename("Movie.2010.1080p.mkv") == "2010"
+    assert extract_year_from_filename("Movie.mkv") == ""
+
+
+def test_autoorganizer_tv_info():
+    """Test underscore separators and trailing years in autoorganizer names."""
+    # The autoorganizer package imports the AWS SDK on load
+    from file_managers.plex.media_autoorganizer.media_database import MediaDatabase
+
+    extract_tv_info = MediaDatabase.extract_tv_info
+    assert extract_tv_info(None, "Show_Name_S01E01.mkv") == ("Show Name", 1, 1)
+    assert extract_tv_info(None, "Show (2023) S01E01.mkv") == ("Show", 1, 1)
+
+    # Anime-style numbering is only recognized by the autoorganizer
+    anime = "[SubsPlease] Frieren - 05 (1080p) [ABC123].mkv"
+    assert extract_tv_info(None, anime) == ("Frieren", 1, 5)
+    assert extract_tv_info(None, "[Group] Show - 12 [Season 2].mkv") == ("Show", 2, 12)
+    assert not parse_filename(anime).is_episode
+    for movie in ("[YTS.MX] Dune - 2021 [1080p].mp4",
+                  "[TGx] Oppenheimer - 2023 - 2160p.mkv",
+                  "[Group] Title - 1 of 2.mkv",
+                  "[Group] Title - 720p.mkv"):
+        assert extract_tv_info(None, movie) == (None, None, None), movie
+
+
+def test_movies_with_group_tags_are_not_episodes():
+    """Test that bracketed release groups and years never parse as episodes."""
+    for name in ("[YTS.MX] Dune - 2021 [1080p].mp4",
+                 "[TGx] Oppenheimer - 2023 - 2160p.mkv",
+                 "[Group] Title - 1 of 2.mkv"):
+        assert not parse_filename(name).is_episode, name
+        assert extract_tv_info_from_filename(name) is None, name
+
+
+def test_multi_episode_and_version_flags():
+    """Test multi-episode and version detection."""
+    assert parse_filename("Show.S01E01-E02.mkv").is_multi_episode
+    assert parse_filename("Show.S01E01(2).mkv").version == 2
+    assert parse_filename("Tuesday.Night.mkv").quality == "unknown"
+
+
+def test_results_are_memoized():
+    """Test that repeated parses return the cached frozen result."""
+    assert parse_filename("Some.Movie.2004.mkv") is parse_filename("Some.Movie.2004.mkv")
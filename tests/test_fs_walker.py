@@ -0,0 +1,83 @@
+"""Tests for the parallel filesystem walker."""
+
+import tempfile
+from pathlib import Path
+
+from file_managers.plex.utils.fs_walker import (
+    FileEntry,
+    scan_files,
+    share_for_path,
+    walk_files,
+)
+
+
+def _make_tree(root: Path) -> None:
+    """Create a small nested directory tree."""
+    files = {
+        "Show A/Season 1/Show.A.S01E01.mkv": "a" * 10,
+        "Show A/Season 1/Show.A.S01E02.mkv": "a" * 20,
+        "Show B/Show.B.S02E05.mp4": "b" * 30,
+        "Show B/notes.txt": "text",
+        "Movie 2020.avi": "m" * 40,
+    }
+    for rel_path, content in files.items():
+        full_path = root / rel_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+
+
+def test_walk_files_finds_all_files():
+    """Test that every file in the tree is reported with size and mtime."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        _make_tree(root)
+
+        entries = list(walk_files([temp_dir], workers_per_share=3))
+
+        assert len(entries) == 5
+        for entry in entries:
+            assert isinstance(entry, FileEntry)
+            assert entry.size == Path(entry.path).stat().st_size
+            assert entry.mtime > 0
+
+
+def test_walk_files_extension_filter():
+    """Test that only files with the requested extensions are returned."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_tree(Path(temp_dir))
+
+        entries = scan_files(temp_dir, {'.mkv', '.mp4'}, workers_per_share=2)
+
+        names = [entry.name for entry in entries]
+        assert [entry.path for entry in entries] == sorted(entry.path for entry in entries)
+        assert set(names) == {"Show.A.S01E01.mkv", "Show.A.S01E02.mkv", "Show.B.S02E05.mp4"}
+        assert all(entry.suffix in ('.mkv', '.mp4') for entry in entries)
+
+
+def test_walk_files_missing_root():
+    """Test that missing roots are skipped rather than raising."""
+    assert list(walk_files(["/nonexistent/directory"], workers_per_share=1)) == []
+
+
+def test_walk_files_early_stop():
+    """Test that the consumer can stop iterating early."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_tree(Path(temp_dir))
+
+        walker = walk_files([temp_dir], workers_per_share=2)
+        first = next(walker)
+        walker.close()
+
+        assert isinstance(first, FileEntry)
+
+
+def test_share_for_path():
+    """Test mapping paths onto configured NAS shares."""
+    shares = [
+        {"name": "plex", "mount_path": "/mnt/qnap/plex"},
+        {"name": "Media", "mount_path": "/mnt/qnap/Media"},
+    ]
+
+    assert share_for_path("/mnt/qnap/plex/Movie/", shares) == "plex"
+    assert share_for_path("/mnt/qnap/Media/TV", shares) == "Media"
+    assert share_for_path("/mnt/qnap/Mediaextra", shares) == "/mnt/qnap/Mediaextra"
@@ -0,0 +1,83 @@
+"""Tests for the cached external API transport."""
+
+import json
+
+from file_managers.plex.utils.external_api import ExternalAPIClient
+from file_managers.plex.utils.http_cache import HTTPResponseCache, request_key
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.status_code = status_code
+        self.text = json.dumps(data)
+
+
+class FakeSession:
+    """Records requests and answers them from a routing function."""
+
+    def __init__(self, route):
+        self.route = route
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url))
+        return self.route(method, url, kwargs)
+
+
+SHOW = {"id": 1396, "name": "Breaking Bad", "status": "Ended",
+        "seasons": [{"season_number": n, "episode_count": 8} for n in range(6)]}
+
+
+def _client(cache_path):
+    client = ExternalAPIClient(tmdb_api_key="tmdb-key", tvdb_api_key="tvdb-key",
+                               response_cache=HTTPResponseCache(cache_path))
+    client.tmdb_session.session = FakeSession(lambda method, url, kwargs: FakeResponse(SHOW))
+    return client
+
+
+def test_show_details_are_served_from_disk_in_a_new_process(tmp_path):
+    """Test that repeated details lookups make one request across clients."""
+    first = _client(tmp_path / "http.db")
+    assert first.get_tv_show_details(1396).total_seasons == 5
+    assert first.get_tv_show_details(1396).total_seasons == 5
+
+    second = _client(tmp_path / "http.db")
+    details = second.get_tv_show_details(1396)
+
+    assert len(first.tmdb_session.session.calls) == 1
+    assert second.tmdb_session.session.calls == []
+    assert details.title == "Breaking Bad"
+
+
+def test_search_keys_ignore_credentials_case_and_spacing():
+    """Test request normalization for cache keys."""
+    url = "https://api.themoviedb.org/3/search/tv"
+    assert (request_key("GET", url, {"api_key": "a", "query": "The  Office"})
+            == request_key("get", url + "/", {"query": "the office", "api_key": "b"}))
+    assert request_key("GET", url, {"query": "The Office", "first_air_date_year": 2005}) != \
+        request_key("GET", url, {"query": "The Office"})
+
+
+def test_tvdb_token_is_reused_until_rejected(tmp_path):
+    """Test that a saved TVDB token skips the login and a 401 forgets it."""
+    logins = []
+
+    def route(method, url, kwargs):
+        if url.endswith("/login"):
+            logins.append(url)
+            return FakeResponse({"data": {"token": f"jwt-{len(logins)}"}})
+        if "/series/" in url:
+            return FakeResponse({}, 401)
+        return FakeResponse({"data": []})
+
+    first = _client(tmp_path / "http.db")
+    first.tvdb_session.session = FakeSession(route)
+    first._search_tvdb_tv("Dark")
+
+    second = _client(tmp_path / "http.db")
+    second.tvdb_session.session = FakeSession(route)
+    assert second._get_tvdb_jwt_token() == "jwt-1"
+    assert len(logins) == 1
+
+    assert second.get_tv_show_details(999, api_source="tvdb") is None
+    assert second._get_tvdb_jwt_token() == "jwt-2"
@@ -0,0 +1,54 @@
+"""Tests for the Aho-Corasick keyword rule engine."""
+
+from pathlib import Path
+
+from file_managers.plex.tv_organizer.core.duplicate_detector import DuplicateDetector
+from file_managers.plex.utils.keyword_rules import KeywordAutomaton, KeywordRuleSet
+from file_managers.plex.utils.media_reorganizer import (
+    MediaFile,
+    MediaReorganizationAnalyzer,
+)
+
+
+def test_one_pass_reports_every_keyword_and_category():
+    """Test overlapping matches, rule priority and offset filtering."""
+    automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+    found = sorted((start, automaton.keywords[index]) for start, index in automaton.iter_matches("ushers"))
+    assert found == [(1, "she"), (2, "he"), (2, "hers")]
+
+    rules = KeywordRuleSet({"TV": ["s0", "season"], "DOCUMENTARY": ["docu", "bbc"]})
+    matches = rules.scan("/Docu/BBC.Planet.S01E01.mkv")
+    assert matches.categories() == ["TV", "DOCUMENTARY"]
+    assert matches.keywords("DOCUMENTARY") == ["docu", "bbc"]
+    assert matches.keywords("DOCUMENTARY", start=6) == ["bbc"]
+    assert rules.scan("Heat.1995.mkv").first() is None
+
+
+def test_whole_word_differentiators_include_multiword_terms():
+    """Test that the duplicate detector sees phrases like 'hong kong'."""
+    rules = KeywordRuleSet({"differentiator": ["dam", "hong kong", "airport"]}, whole_words=True)
+    assert rules.scan("megastructures hong kong airport").keywords("differentiator") == ["hong kong", "airport"]
+    assert not rules.scan("storm damage")
+
+    detector = DuplicateDetector(tv_directories=[])
+    assert detector._has_content_differences([
+        "Megastructures.S01E01.Hong.Kong.Airport.mkv", "Megastructures.S01E01.Airport.mkv"])
+    assert not detector._has_content_differences(["Show.S01E01.Cable.Car.mkv", "Show.S01E01.Cable.Car_1.mkv"])
+
+
+def test_reorganizer_rules_keep_path_and_filename_scopes(tmp_path, monkeypatch):
+    """Test that tv/movie keywords only count in the filename."""
+    monkeypatch.chdir(tmp_path)
+    analyzer = MediaReorganizationAnalyzer(use_external_apis=False)
+
+    def classify(path):
+        path = Path(path)
+        return analyzer._classify_file_rule_based(MediaFile(path, path.name, 1, "movies"))
+
+    assert classify("/media/BBC Collection/Heat.1995.mkv") == "documentaries"
+    assert classify("/media/s01 extras/Heat.1995.mkv") == "movies"
+    assert classify("/media/movies/Heat.S01E01.mkv") == "tv"
+    assert classify("/media/movies/Heat.cd1.mkv") == "movies"
+    assert analyzer._check_tv_episode_pattern(
+        MediaFile(Path("/media/tv/Show/Season 2/pilot.mkv"), "pilot.mkv", 1, "tv"))[2] == \
+        "TV directory structure: contains 'season'"
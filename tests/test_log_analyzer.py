@@ -0,0 +1,61 @@
+"""Tests for the streaming log analyzer and its session index."""
+
+from datetime import timedelta
+
+from file_managers.plex.utils.log_analyzer import LogAnalyzer
+
+PREFIX = "2025-06-22 23:45:{:02d} - media_reorganizer - INFO - "
+
+
+def _write_log(logs_dir, session_id, misplaced):
+    lines = ["Media Reorganization Analysis Session Started: " + session_id,
+             "Database loaded in 1.50 seconds - 1,204 files"]
+    for name, current, suggested in misplaced:
+        lines += ["Rule-based classification suggests move: "
+                  f"{name} from {current} to {suggested} (0.85)",
+                  "MISPLACED FILE DETECTED:", f"  File: {name}",
+                  f"  Current: {current} -> Suggested: {suggested}", "  Confidence: 0.85",
+                  "  Reasoning: keyword", "  Size: 1.50 GB", f"  Path: /media/{current}/{name}"]
+    lines += ["=" * 40, "CLASSIFICATION STATISTICS", "=" * 40,
+              "Total Classifications: 1204", "AI Classifications: 10 (Success: 9)",
+              "AI Success Rate: 90.0%", "=" * 40,
+              "Analysis completed in 12.25 seconds", "Analysis session completed successfully"]
+    log_file = logs_dir / f"media_reorganizer_{session_id}.log"
+    log_file.write_text("\n".join(PREFIX.format(i) + line for i, line in enumerate(lines)) + "\n",
+                        encoding="utf-8")
+    return log_file
+
+
+def test_single_pass_extracts_every_section(tmp_path):
+    """Test session info, events, metrics and statistics from one pass."""
+    _write_log(tmp_path, "20250622_234510", [("Cosmos.mkv", "movies", "documentaries")])
+
+    session = LogAnalyzer(str(tmp_path)).analyze_session("20250622_234510")
+
+    assert session.total_files == 1204
+    assert session.total_duration == timedelta(seconds=18)
+    assert session.performance_metrics == {"database_loading_time": 1.5, "analysis_time": 12.25}
+    assert session.classification_stats == {"total_classifications": 1204, "ai_calls": 10,
+                                             "ai_success": 9, "ai_success_rate": 90.0}
+    assert [event.suggested_category for event in session.classification_events] == ["documentaries"]
+    event = session.misplaced_events[0]
+    assert (event.filename, event.file_size, event.file_path) == (
+        "Cosmos.mkv", int(1.5 * 1024**3), "/media/movies/Cosmos.mkv")
+
+
+def test_unchanged_logs_are_served_from_the_index(tmp_path, monkeypatch):
+    """Test that repeat analyses and comparisons do not reread the logs."""
+    _write_log(tmp_path, "20250622_234510", [("Cosmos.mkv", "movies", "documentaries")])
+    log_file = _write_log(tmp_path, "20250623_101500", [("Cosmos.mkv", "movies", "documentaries"),
+                                                        ("Raw.mkv", "movies", "standup")])
+    first = LogAnalyzer(str(tmp_path))
+    first.compare_sessions(["20250622_234510", "20250623_101500"])
+
+    second = LogAnalyzer(str(tmp_path))
+    monkeypatch.setattr(second, "parse_log", lambda *args: (_ for _ in ()).throw(AssertionError("reparsed")))
+    log_file.unlink()
+    report = second.compare_sessions(["20250622_234510", "20250623_101500"])
+
+    assert "20250623_101500   1,204    2" in report
+    assert "movies → documentaries: 20250622_234510: 1, 20250623_101500: 1" in report
+    assert second.analyze_session("20250623_101500").misplaced_events[1].filename == "Raw.mkv"
@@ -0,0 +1,131 @@
+"""Tests for the JSON media database."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from file_managers.plex.config.config import config
+from file_managers.plex.utils.media_database import MediaDatabase
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Create a small movie/TV library and point the config at it."""
+    movies = tmp_path / "movies"
+    tv = tmp_path / "tv"
+    (movies / "Inception (2010)").mkdir(parents=True)
+    (tv / "Show A" / "Season 1").mkdir(parents=True)
+    (movies / "The.Matrix.1999.1080p.mkv").write_text("m" * 10)
+    (movies / "Inception (2010)" / "Inception.2010.mkv").write_text("m" * 20)
+    (tv / "Show A" / "Season 1" / "Show.A.S01E01.mkv").write_text("e" * 5)
+
+    monkeypatch.setitem(config.config["movies"], "directories", [{"path": str(movies) + "/"}])
+    monkeypatch.setitem(config.config["tv"], "directories", [{"path": str(tv)}])
+    return tmp_path
+
+
+def _backdate(root: Path) -> None:
+    """Move directory mtimes into the past so refreshes can skip them."""
+    past = time.time() - 3600
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (past, past))
+
+
+def test_refresh_matches_rebuild(library):
+    """Test that seeding the directory index changes nothing."""
+    database = MediaDatabase(str(library / "db.json"))
+    stats = database.rebuild_database()
+    _backdate(library)
+
+    delta = database.refresh_database()
+
+    assert delta.total_changes == 0
+    assert delta.directories_listed == 5
+    assert database.get_stats().movies_count == stats.movies_count
+    assert database.get_stats().tv_episodes_count == stats.tv_episodes_count
+
+
+def test_refresh_skips_unchanged_and_reconciles_changes(library):
+    """Test that only changed directories are listed and reconciled."""
+    database = MediaDatabase(str(library / "db.json"))
+    database.rebuild_database()
+    _backdate(library)
+    database.refresh_database()
+
+    season_dir = library / "tv" / "Show A" / "Season 1"
+    (season_dir / "Show.A.S01E02.mkv").write_text("e" * 6)
+    os.remove(library / "movies" / "Inception (2010)" / "Inception.2010.mkv")
+
+    delta = MediaDatabase(str(library / "db.json")).refresh_database()
+
+    assert delta.episodes_added == 1
+    assert delta.movies_removed == 1
+    assert delta.movies_added == 0
+    assert delta.directories_listed == 2
+    assert delta.directories_skipped == 3
+
+    reloaded = MediaDatabase(str(library / "db.json"))
+    assert reloaded.get_stats().movies_count == 1
+    assert reloaded.data["tv_shows"]["show a"]["total_episodes"] == 2
+
+
+def test_unreadable_directory_keeps_its_previous_entries(library, monkeypatch):
+    """Test that a failed listing is not reconciled as removed files."""
+    database = MediaDatabase(str(library / "db.json"))
+    database.rebuild_database()
+    _backdate(library)
+    database.refresh_database()
+    season_dir = library / "tv" / "Show A" / "Season 1"
+    assert database.data["directory_index"]["tv"][str(season_dir)]["child_count"] == 1
+
+    (season_dir / "Show.A.S01E02.mkv").write_text("e" * 6)
+    real_scandir = os.scandir
+
+    def flaky_scandir(path):
+        if str(path) == str(season_dir):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", flaky_scandir)
+    delta = MediaDatabase(str(library / "db.json")).refresh_database()
+
+    assert delta.episodes_removed == 0
+    reloaded = MediaDatabase(str(library / "db.json"))
+    assert reloaded.data["tv_shows"]["show a"]["total_episodes"] == 1
+
+
+def test_movie_copies_are_kept_and_indexed(library):
+    """Test that two copies of a title are both stored and found as duplicates."""
+    from file_managers.plex.utils.duplicate_detector import DuplicateDetector
+
+    copy_dir = library / "movies" / "Inception Copy"
+    copy_dir.mkdir()
+    (copy_dir / "Inception.2010.mkv").write_text("m" * 30)
+
+    database = MediaDatabase(str(library / "db.json"))
+    stats = database.rebuild_database()
+
+    assert stats.movies_count == 3
+    groups = DuplicateDetector(database).find_movie_duplicates()
+    assert len(groups) == 1
+    assert groups[0].best_file.size == 30
+    assert len(groups[0].files) == 2
+
+
+def test_legacy_title_keyed_database_is_upgraded(library):
+    """Test that databases keyed by normalized title load keyed by path."""
+    import json
+
+    database = MediaDatabase(str(library / "db.json"))
+    database.rebuild_database()
+    legacy = dict(database.data)
+    legacy["movies"] = {movie["normalized_title"]: movie for movie in legacy["movies"].values()}
+    del legacy["movie_index"]
+    (library / "db.json").write_text(json.dumps(legacy))
+
+    reloaded = MediaDatabase(str(library / "db.json"))
+
+    assert set(reloaded.data["movies"]) == set(database.data["movies"])
+    assert reloaded.data["movie_index"] == database.data["movie_index"]
@@ -0,0 +1,65 @@
+"""Tests for the two-pass classification in the reorganization analyzer."""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from file_managers.plex.utils.media_reorganizer import (
+    MediaFile,
+    MediaReorganizationAnalyzer,
+)
+from file_managers.plex.utils.metadata_enrichment import MediaMetadata, MetadataCache
+
+
+class FakeClassifier:
+    """Classifies by keyword and records every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def classify_batch(self, filenames, group_by_title=True):
+        with self.lock:
+            self.batches.append(list(filenames))
+        return [{"category": "documentary" if "earth" in name.lower() else "standup",
+                 "confidence": 0.9, "reasoning": "fake"} for name in filenames]
+
+
+def _analyzer(tmp_path, monkeypatch, names):
+    monkeypatch.chdir(tmp_path)
+    analyzer = MediaReorganizationAnalyzer(use_external_apis=False)
+    analyzer.ai_classifier = FakeClassifier()
+    analyzer._metadata_cache = MetadataCache(cache_path=str(tmp_path / "metadata.db"))
+    analyzer.all_files = [MediaFile(Path("/media/movies") / name, name, 1, "movies") for name in names]
+    return analyzer
+
+
+def test_cache_and_tv_patterns_resolve_first_and_ai_answers_fan_out(tmp_path, monkeypatch):
+    """Test that the AI sees one file per unknown title and every file gets the answer."""
+    analyzer = _analyzer(tmp_path, monkeypatch, [
+        "Heat.1995.1080p.mkv", "Show.S01E01.mkv",
+        "Planet.Earth.2006.1080p.mkv", "Planet Earth (2006).mp4", "Comic.Live.2019.mkv",
+    ])
+    analyzer._metadata_cache.store_metadata(MediaMetadata(
+        title="Heat", year=1995, tmdb_id=949, tvdb_id=None, media_type="movies", genres=["Crime"],
+        overview="", runtime=None, status="", original_language="en", popularity=0.0,
+        vote_average=0.0, api_source="tmdb", last_updated=datetime.now(), confidence=0.85))
+
+    results = analyzer._classify_all_files()
+
+    assert [method for _, _, _, method in results] == [
+        "cache_hits", "tv_pattern_detection", "ai_classifications", "ai_classifications", "ai_classifications"]
+    assert [category for category, _, _, _ in results[2:]] == ["documentaries", "documentaries", "standup"]
+    assert sum(len(batch) for batch in analyzer.ai_classifier.batches) == 2
+
+
+def test_unique_titles_are_sent_in_batches(tmp_path, monkeypatch):
+    """Test that many unknown titles are split into batch requests."""
+    analyzer = _analyzer(tmp_path, monkeypatch, [f"Special.Number.{i}.2010.mkv" for i in range(60)])
+
+    results = analyzer._classify_all_files()
+
+    batches = analyzer.ai_classifier.batches
+    assert sorted(len(batch) for batch in batches) == [10, 25, 25]
+    assert analyzer.classification_stats["ai_requests"] == 3
+    assert {category for category, _, _, _ in results} == {"standup"}
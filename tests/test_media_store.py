@@ -0,0 +1,125 @@
+"""Tests for the SQLite media database backend."""
+
+import pytest
+
+from file_managers.plex.config.config import config
+from file_managers.plex.utils.media_database import MediaDatabase
+from file_managers.plex.utils.media_store import (
+    SQLiteMediaStore,
+    migrate_json_to_sqlite,
+)
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Create a small movie/TV library and point the config at it."""
+    movies = tmp_path / "movies"
+    tv = tmp_path / "tv"
+    (tv / "Show A" / "Season 1").mkdir(parents=True)
+    movies.mkdir()
+    (movies / "The.Matrix.1999.1080p.mkv").write_text("m" * 10)
+    (tv / "Show A" / "Season 1" / "Show.A.S01E01.mkv").write_text("e" * 5)
+    (tv / "Show A" / "Season 1" / "Show.A.S01E02.mkv").write_text("e" * 6)
+
+    monkeypatch.setitem(config.config["movies"], "directories", [{"path": str(movies)}])
+    monkeypatch.setitem(config.config["tv"], "directories", [{"path": str(tv)}])
+    return tmp_path
+
+
+def test_sqlite_backend_matches_json(library):
+    """Test that both backends store and return the same library."""
+    json_db = MediaDatabase(str(library / "db.json"))
+    json_db.rebuild_database()
+    sqlite_db = MediaDatabase(str(library / "db.sqlite"))
+    assert sqlite_db.backend == "sqlite"
+    sqlite_db.rebuild_database()
+
+    reloaded = MediaDatabase(str(library / "db.sqlite"))
+    assert reloaded.get_stats().tv_episodes_count == 2
+    assert reloaded.get_tv_show_details("Show A")["total_episodes"] == 2
+    assert reloaded._data is None  # point lookups did not load the library
+
+    assert reloaded.data["movies"] == json_db.data["movies"]
+    assert reloaded.data["tv_shows"] == json_db.data["tv_shows"]
+
+
+def test_sqlite_save_is_incremental(library):
+    """Test that saves only write changed rows."""
+    database = MediaDatabase(str(library / "db.sqlite"))
+    database.rebuild_database()
+    store = SQLiteMediaStore(library / "db.sqlite")
+
+    assert store.save(database.data)["tv_episodes"] == 0
+
+    del database.data["movies"][str(library / "movies" / "The.Matrix.1999.1080p.mkv")]
+    changes = store.save(database.data)
+    assert changes["movies"] == 1
+    assert changes["tv_episodes"] == 0
+    assert store.get_movies_by_title("the matrix 1999") == []
+    assert len(store.get_episodes("show a", 1, 2)) == 1
+
+
+def test_sqlite_save_writes_dirty_rows_without_reading_tables(library):
+    """Test that saves diff against the rows last loaded or saved."""
+    MediaDatabase(str(library / "db.sqlite")).rebuild_database()
+    database = MediaDatabase(str(library / "db.sqlite"))
+    database.data  # load_all records the stored rows
+    store = database.store
+    statements = []
+    store._connection().set_trace_callback(statements.append)
+
+    matrix = str(library / "movies" / "The.Matrix.1999.1080p.mkv")
+    database.data["movies"][matrix]["year"] = 2000
+    first = store.save(database.data)
+    second = store.save(database.data)
+
+    assert first["movies"] == 1 and second["movies"] == 0
+    reads = [sql for sql in statements if sql.startswith("SELECT")]
+    assert not any("FROM movies" in sql or "FROM tv_episodes" in sql for sql in reads)
+    assert len(reads) == 1  # search_terms, once, since load_all does not read it
+    assert store.get_movies_by_title("the matrix 1999")[0]["year"] == 2000
+
+
+def test_migrate_json_to_sqlite(library):
+    """Test the one-shot JSON migration."""
+    json_db = MediaDatabase(str(library / "db.json"))
+    json_db.rebuild_database()
+
+    counts = migrate_json_to_sqlite(library / "db.json", library / "db.sqlite")
+
+    assert counts["movies"] == 1
+    assert counts["tv_episodes"] == 2
+    migrated = MediaDatabase(str(library / "db.sqlite"))
+    assert migrated.get_stats().movies_count == 1
+    assert migrated.data["tv_shows"] == json_db.data["tv_shows"]
+
+
+def test_migrated_pre_index_database_is_searchable(library):
+    """Test that migrating a JSON database without postings builds them."""
+    json_db = MediaDatabase(str(library / "db.json"))
+    json_db.rebuild_database()
+    del json_db.data["search_index"]["movie_terms"]
+    del json_db.data["search_index"]["tv_terms"]
+    json_db._save_database()
+
+    migrate_json_to_sqlite(library / "db.json", library / "db.sqlite")
+
+    migrated = MediaDatabase(str(library / "db.sqlite"))
+    assert migrated.search_tv_shows("Show A")[0]["name"] == "Show A"
+    assert migrated.search_movies("Matrix")
+    assert migrated._data is None
+
+
+def test_sqlite_movie_duplicate_buckets(library):
+    """Test that duplicate buckets come from an indexed query."""
+    copy_dir = library / "movies" / "Copy"
+    copy_dir.mkdir()
+    (copy_dir / "The.Matrix.1999.mkv").write_text("m" * 30)
+    MediaDatabase(str(library / "db.sqlite")).rebuild_database()
+
+    database = MediaDatabase(str(library / "db.sqlite"))
+    buckets = database.get_movie_duplicate_buckets()
+
+    assert database._data is None
+    assert len(buckets) == 1
+    assert sorted(movie.file_size for movie in buckets[0]) == [10, 30]
@@ -0,0 +1,148 @@
+"""Tests for the staged metadata enrichment pipeline."""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+import requests
+
+from file_managers.plex.utils.metadata_enrichment import (
+    METADATA_MAX_AGE,
+    APIClient,
+    MetadataCache,
+    MetadataEnricher,
+)
+from file_managers.plex.utils.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeAPIClient:
+    """Answers TMDB movie searches from a fixed catalogue."""
+
+    def __init__(self, catalogue, fail=(), interrupt=()):
+        self.catalogue = catalogue
+        self.fail = set(fail)
+        self.interrupt = set(interrupt)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def search_tmdb_movie(self, title, year=None):
+        with self.lock:
+            self.calls.append(title)
+        if title in self.interrupt:
+            raise KeyboardInterrupt
+        if title in self.fail:
+            raise requests.ConnectionError("connection reset")
+        if title in self.catalogue:
+            return {"id": self.catalogue[title], "title": title, "genres": [{"name": "Drama"}]}
+        return None
+
+    def get_tmdb_movie_details(self, movie_id):
+        return None
+
+    def search_tmdb_tv(self, title, year=None):
+        return None
+
+
+def _enricher(tmp_path, monkeypatch, api_client, workers=4):
+    monkeypatch.setattr(MetadataEnricher, "_setup_logging", lambda self: logging.getLogger("enrich-test"))
+    monkeypatch.setattr(MetadataEnricher, "_save_enrichment_results", lambda self, stats: None)
+    return MetadataEnricher(cache=MetadataCache(cache_path=str(tmp_path / "metadata.db")),
+                            api_client=api_client, workers=workers)
+
+
+def _database(*names):
+    return {"movies": {name: {"file_name": name, "file_path": f"/movies/{name}"} for name in names}}
+
+
+def test_reruns_skip_cached_titles_and_known_misses(tmp_path, monkeypatch):
+    """Test that only failed lookups are retried on the next run."""
+    database = _database("Heat.1995.mkv", "Heat (1995).mp4", "Unknown.Film.2001.mkv", "Ronin.1998.mkv")
+    catalogue = {"Heat": 949, "Ronin": 8195}
+
+    first = _enricher(tmp_path, monkeypatch, FakeAPIClient(catalogue, fail={"Ronin"}))
+    first.load_media_database = lambda: database
+    stats = first.enrich_database()
+
+    assert sorted(first.api_client.calls) == ["Heat", "Ronin", "Unknown Film"]
+    assert stats["successful_enrichments"] == 1 and stats["failed_enrichments"] == 2
+
+    second = _enricher(tmp_path, monkeypatch, FakeAPIClient(catalogue))
+    second.load_media_database = lambda: database
+    stats = second.enrich_database()
+
+    assert second.api_client.calls == ["Ronin"]
+    assert stats["known_misses"] == 1
+    assert [movie["title"] for movie in stats["movies_found"]] == ["Ronin"]
+
+
+def test_interrupted_run_keeps_finished_lookups(tmp_path, monkeypatch):
+    """Test that Ctrl-C saves finished results and the rerun resumes after them."""
+    names = [f"Film.{i}.2000.mkv" for i in range(6)]
+    catalogue = {f"Film {i}": i + 1 for i in range(6)}
+
+    first = _enricher(tmp_path, monkeypatch, FakeAPIClient(catalogue, interrupt={"Film 3"}), workers=1)
+    first.load_media_database = lambda: _database(*names)
+    with pytest.raises(KeyboardInterrupt):
+        first.enrich_database()
+
+    cache = first.cache
+    stored = cache.get_metadata_bulk([cache.title_key(f"Film {i}", 2000) for i in range(6)])
+    assert sorted(metadata.title for metadata in stored.values()) == ["Film 0", "Film 1", "Film 2"]
+
+    second = _enricher(tmp_path, monkeypatch, FakeAPIClient(catalogue), workers=1)
+    second.load_media_database = lambda: _database(*names)
+    stats = second.enrich_database()
+
+    assert "Film 0" not in second.api_client.calls
+    assert stats["successful_enrichments"] == len(second.api_client.calls)
+    assert stats["cache_hits"] + stats["successful_enrichments"] == 6
+
+
+def test_forced_run_refetches_only_stale_metadata(tmp_path, monkeypatch):
+    """Test that skip_cached=False still reuses metadata younger than the max age."""
+    database = _database("Heat.1995.mkv", "Ronin.1998.mkv")
+    catalogue = {"Heat": 949, "Ronin": 8195}
+    first = _enricher(tmp_path, monkeypatch, FakeAPIClient(catalogue))
+    first.load_media_database = lambda: database
+    first.enrich_database()
+    with sqlite3.connect(str(first.cache.cache_path)) as conn:
+        conn.execute("UPDATE metadata_cache SET last_updated = ? WHERE title_key = ?",
+                     ((datetime.now() - METADATA_MAX_AGE * 2).isoformat(),
+                      first.cache.title_key("Ronin", 1998)))
+
+    forced = _enricher(tmp_path, monkeypatch, FakeAPIClient(catalogue))
+    forced.load_media_database = lambda: database
+    stats = forced.enrich_database(skip_cached=False)
+
+    assert forced.api_client.calls == ["Ronin"]
+    assert stats["cache_hits"] == 1
+    assert sorted(movie["title"] for movie in stats["movies_found"]) == ["Heat", "Ronin"]
+
+
+class ThrottlingSession:
+    """Answers 429 for the first ``throttled`` requests, then an empty search result."""
+
+    def __init__(self, throttled):
+        self.throttled = throttled
+        self.calls = 0
+
+    def get(self, url, params, timeout):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 429 if self.calls <= self.throttled else 200
+        response._content = b'{"results": []}'
+        return response
+
+
+def test_throttled_requests_slow_the_limiter_and_retry(monkeypatch):
+    """Test that an HTTP 429 reaches the rate limiter and the request is sent again."""
+    monkeypatch.setenv("TMDB_API_KEY", "test")
+    limiter = AdaptiveRateLimiter(rate=1000.0, min_rate=1.0)
+    client = APIClient(workers=1, rate_limiters={"tmdb": limiter})
+    client.session = ThrottlingSession(throttled=1)
+
+    assert client.search_tmdb_movie("Heat") is None
+    assert client.session.calls == 2
+    assert limiter.throttle_count == 1 and limiter.success_count == 1
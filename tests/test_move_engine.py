@@ -0,0 +1,89 @@
+"""Tests for the journaled move engine."""
+
+import json
+import os
+
+from file_managers.plex.utils.move_engine import MoveEngine, partial_path
+
+
+def _fake_other_volume(monkeypatch, volume_root):
+    """Make paths under volume_root report a different st_dev."""
+    real_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        st = real_stat(path, *args, **kwargs)
+        if str(path).startswith(str(volume_root)):
+            fields = list(tuple(st))
+            fields[2] = st.st_dev + 1
+            return os.stat_result(fields)
+        return st
+
+    monkeypatch.setattr(os, "stat", fake_stat)
+
+
+def test_same_volume_renames_immediately_and_cross_volume_copies_in_lanes(tmp_path, monkeypatch):
+    """Test that renames resolve at submit and copies finish on wait."""
+    source_dir = tmp_path / "downloads"
+    other_share = tmp_path / "share2"
+    source_dir.mkdir()
+    other_share.mkdir()
+    (source_dir / "a.mkv").write_text("a")
+    (source_dir / "b.mkv").write_text("b")
+    season = source_dir / "Season 1"
+    season.mkdir()
+    (season / "e1.mkv").write_text("e1")
+    (season / "e2.mkv").write_text("e2")
+    _fake_other_volume(monkeypatch, other_share)
+
+    engine = MoveEngine(tmp_path / "journal.jsonl", workers_per_volume=2)
+    renamed = engine.submit(source_dir / "a.mkv", tmp_path / "local" / "a.mkv")
+    copied = engine.submit(source_dir / "b.mkv", other_share / "b.mkv")
+    folder = engine.submit(season, other_share / "Show" / "Season 1")
+
+    assert renamed.done() and renamed.result().success
+    assert engine.is_target_taken(other_share / "b.mkv") or copied.done()
+    outcomes = engine.shutdown()
+
+    assert [o.success for o in outcomes] == [True, True]
+    assert (other_share / "b.mkv").read_text() == "b"
+    assert (other_share / "Show" / "Season 1" / "e1.mkv").read_text() == "e1"
+    assert folder.result().size == 4
+    assert not (source_dir / "b.mkv").exists() and not season.exists()
+    assert engine.unfinished_operations() == []
+
+
+def test_resume_finishes_or_redoes_interrupted_moves(tmp_path):
+    """Test recovery of a lost source delete, a torn copy, a foreign target and a vanished op."""
+    journal = tmp_path / "journal.jsonl"
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    # Copy renamed into place but the source delete was lost
+    (tmp_path / "done.mkv").write_text("done")
+    (dest / "done.mkv").write_text("done")
+    # Copy interrupted halfway through
+    (tmp_path / "torn.mkv").write_text("torn")
+    partial_path(dest / "torn.mkv").write_text("to")
+    # Target already held a different file before the move was planned
+    (tmp_path / "clash.mkv").write_text("clash")
+    (dest / "clash.mkv").write_text("other file")
+    records = [
+        {"event": "planned", "op": "1", "source": str(tmp_path / "done.mkv"), "target": str(dest / "done.mkv"),
+         "size": 4},
+        {"event": "planned", "op": "2", "source": str(tmp_path / "torn.mkv"), "target": str(dest / "torn.mkv"),
+         "size": 4},
+        {"event": "planned", "op": "3", "source": str(tmp_path / "gone.mkv"), "target": str(dest / "gone.mkv")},
+        {"event": "planned", "op": "5", "source": str(tmp_path / "clash.mkv"), "target": str(dest / "clash.mkv"),
+         "size": 5},
+        {"event": "planned", "op": "4", "source": "x", "target": "y"},
+        {"event": "done", "op": "4"},
+    ]
+    journal.write_text("".join(json.dumps(r) + "\n" for r in records) + '{"event": "pla')
+
+    outcomes = MoveEngine(journal).resume()
+
+    assert {o.op_id: o.success for o in outcomes} == {"1": True, "2": True, "3": False, "5": False}
+    assert not (tmp_path / "done.mkv").exists()
+    assert (tmp_path / "clash.mkv").read_text() == "clash"
+    assert (dest / "torn.mkv").read_text() == "torn"
+    assert not partial_path(dest / "torn.mkv").exists()
+    assert journal.read_text() == ""
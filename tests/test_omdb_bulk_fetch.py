@@ -0,0 +1,109 @@
+"""Tests for the bulk OMDB rating fetch."""
+
+import threading
+
+from file_managers.plex.utils.omdb_rating_fetcher import (
+    OMDBRatingDatabase,
+    OMDBRatingFetcher,
+)
+from file_managers.plex.utils.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Answers OMDB title queries from a fixed catalogue."""
+
+    def __init__(self, catalogue, limit=None, throttled=()):
+        self.catalogue = catalogue
+        self.limit = limit
+        self.throttled = set(throttled)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        with self.lock:
+            self.calls.append(params["t"])
+            if self.limit is not None and len(self.calls) > self.limit:
+                return FakeResponse({"Response": "False", "Error": "Request limit reached!"}, 401)
+            if params["t"] in self.throttled:
+                self.throttled.discard(params["t"])
+                return FakeResponse({}, 429)
+        data = self.catalogue.get(params["t"])
+        if data is None:
+            return FakeResponse({"Response": "False", "Error": "Movie not found!"})
+        return FakeResponse(dict(data, Response="True"))
+
+
+def _fetcher(tmp_path, session):
+    fetcher = OMDBRatingFetcher(api_key="test", database=OMDBRatingDatabase(db_path=tmp_path / "ratings.db"),
+                                workers=4, rate_limiter=AdaptiveRateLimiter(rate=1000.0, capacity=4))
+    fetcher.session = session
+    return fetcher
+
+
+def _movies(*names):
+    return [{"file_name": name, "file_path": f"/movies/{name}", "file_size": 1} for name in names]
+
+
+def test_reruns_use_cached_ratings_and_remembered_misses(tmp_path, monkeypatch):
+    """Test that found and not-found titles are both skipped on the next run."""
+    monkeypatch.chdir(tmp_path)
+    catalogue = {"Heat": {"Title": "Heat", "Year": "1995", "imdbRating": "8.3", "Ratings": []}}
+    movies = _movies("Heat.1995.1080p.mkv", "Heat (1995).mp4", "Unknown.Film.2001.mkv")
+
+    first = _fetcher(tmp_path, FakeSession(catalogue))
+    summary = first.fetch_ratings_for_movies(movies)
+
+    assert sorted(first.session.calls) == ["Heat", "Unknown Film"]
+    assert summary["processed"] == 2
+
+    second = _fetcher(tmp_path, FakeSession(catalogue))
+    summary = second.fetch_ratings_for_movies(movies)
+
+    assert second.session.calls == []
+    assert summary["processed"] == 2
+    assert second.stats["cache_hits"] == 1 and second.stats["skipped_misses"] == 1
+
+
+def test_titles_left_by_the_api_limit_are_fetched_next_run(tmp_path, monkeypatch):
+    """Test that hitting the plan limit stops the run without recording misses."""
+    monkeypatch.chdir(tmp_path)
+    catalogue = {f"Film {i}": {"Title": f"Film {i}", "Year": "2000", "imdbRating": "7.0"} for i in range(6)}
+    movies = _movies(*(f"Film.{i}.2000.mkv" for i in range(6)))
+
+    first = _fetcher(tmp_path, FakeSession(catalogue, limit=2))
+    first.fetch_ratings_for_movies(movies)
+    database = first.database
+    stored = database.get_ratings_bulk([database.title_key(f"Film {i}", 2000) for i in range(6)])
+
+    second = _fetcher(tmp_path, FakeSession(catalogue))
+    summary = second.fetch_ratings_for_movies(movies)
+
+    assert len(stored) == 2
+    assert len(second.session.calls) == 4
+    assert summary["processed"] == 6
+
+
+def test_throttled_titles_slow_the_limiter_and_are_retried(tmp_path, monkeypatch):
+    """Test that an HTTP 429 lowers the rate and retries without stopping the run."""
+    monkeypatch.chdir(tmp_path)
+    catalogue = {f"Film {i}": {"Title": f"Film {i}", "Year": "2000", "imdbRating": "7.0"} for i in range(4)}
+    movies = _movies(*(f"Film.{i}.2000.mkv" for i in range(4)))
+
+    fetcher = _fetcher(tmp_path, FakeSession(catalogue, throttled={"Film 1"}))
+    summary = fetcher.fetch_ratings_for_movies(movies)
+
+    assert summary["processed"] == 4
+    assert fetcher.session.calls.count("Film 1") == 2
+    assert fetcher.rate_limiter.throttle_count == 1
@@ -0,0 +1,72 @@
+"""Tests for the batch placement planner."""
+
+import os
+from types import SimpleNamespace
+
+from file_managers.plex.utils.placement_planner import PlacementItem, plan_placements
+from file_managers.plex.utils.space_ledger import SpaceLedger
+
+
+def _volumes(monkeypatch, *roots):
+    """Give each root directory its own fake st_dev."""
+    real_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        st = real_stat(path, *args, **kwargs)
+        for offset, root in enumerate(roots, 1):
+            if str(path).startswith(str(root)):
+                fields = list(tuple(st))
+                fields[2] = st.st_dev + offset
+                return os.stat_result(fields)
+        return st
+
+    monkeypatch.setattr(os, "stat", fake_stat)
+
+
+def _ledger(free_by_root):
+    """Build a ledger whose disk_usage reports per-root free space."""
+    def disk_usage(path):
+        for root, free in free_by_root.items():
+            if str(path).startswith(str(root)):
+                return SimpleNamespace(free=free)
+        return SimpleNamespace(free=0)
+    return SpaceLedger(disk_usage=disk_usage)
+
+
+def test_shows_stay_together_and_later_items_see_earlier_bookings(tmp_path, monkeypatch):
+    """Test grouping, capacity accounting across the batch and unplaceable items."""
+    downloads, tv1, tv2 = tmp_path / "downloads", tmp_path / "tv1", tmp_path / "tv2"
+    for path in (downloads, tv1, tv2):
+        path.mkdir()
+    _volumes(monkeypatch, tv1, tv2)
+    ledger = _ledger({tv1: 1_000, tv2: 1_000})
+    shares = [str(tv1), str(tv2)]
+
+    items = [PlacementItem(f"show-a-{i}", 300, str(downloads / f"a{i}.mkv"), shares, "show a")
+             for i in range(3)]
+    items += [PlacementItem("show-b-0", 400, str(downloads / "b0.mkv"), shares, "show b")]
+    items += [PlacementItem("huge", 5_000, str(downloads / "huge.mkv"), shares)]
+
+    plan = plan_placements(items, ledger, safety_margin=50)
+
+    assert {plan.assignments[f"show-a-{i}"] for i in range(3)} == {str(tv1)}
+    assert plan.assignments["show-b-0"] == str(tv2)
+    assert plan.unplaced == ["huge"]
+    assert plan.copy_bytes == 1_300 and plan.rename_bytes == 0
+
+
+def test_same_volume_rename_is_preferred_and_needs_no_space(tmp_path, monkeypatch):
+    """Test that a full share on the source volume still wins over a copy."""
+    tv1, tv2 = tmp_path / "tv1", tmp_path / "tv2"
+    (tv1 / "incoming").mkdir(parents=True)
+    tv2.mkdir()
+    _volumes(monkeypatch, tv1, tv2)
+    ledger = _ledger({tv1: 0, tv2: 10_000})
+
+    plan = plan_placements(
+        [PlacementItem("ep", 700, str(tv1 / "incoming" / "ep.mkv"), [str(tv2), str(tv1)], "show")],
+        ledger
+    )
+
+    assert plan.assignments == {"ep": str(tv1)}
+    assert plan.rename_bytes == 700 and plan.copy_bytes == 0
@@ -0,0 +1,59 @@
+"""Tests for the span profiler."""
+
+import threading
+import time
+
+from file_managers.plex.utils import profiler
+from file_managers.plex.utils.filename_parser import parse_filename
+from file_managers.plex.utils.move_engine import MoveEngine
+
+
+def test_spans_are_free_when_disabled_and_aggregate_across_threads():
+    """Test the no-op path, then totals from concurrent spans."""
+    profiler.disable()
+    assert profiler.span("fs.scandir") is profiler.span("http.tmdb")
+    with profiler.span("fs.scandir") as span:
+        span.add_bytes(10)
+    assert profiler.snapshot() == {}
+
+    profiler.enable()
+    try:
+        def worker():
+            for _ in range(50):
+                with profiler.span("http.tmdb", 100):
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        parse_filename(f"Profiled.Title.{time.time_ns()}.2019.mkv")
+    finally:
+        profiler.disable()
+
+    stats = profiler.snapshot()
+    assert (stats["http.tmdb"].calls, stats["http.tmdb"].bytes) == (200, 20000)
+    assert stats["parse.filename"].calls == 1
+    report = profiler.report(1.0)
+    assert "http.tmdb" in report and "19.5 KB" in report
+    assert "  http " in report and "  parse " in report
+
+
+def test_profile_run_prints_report_and_writes_collapsed_stacks(tmp_path, capsys):
+    """Test the CLI wrapper with moves recorded and a collapsed-stack dump."""
+    source = tmp_path / "a.mkv"
+    source.write_bytes(b"x" * 64)
+    dump = tmp_path / "run.folded"
+
+    with profiler.profile_run(True, dump):
+        engine = MoveEngine(journal_path=tmp_path / "journal.jsonl")
+        assert engine.submit(source, tmp_path / "movies" / "a.mkv").result().success
+        time.sleep(0.05)
+
+    err = capsys.readouterr().err
+    assert "PROFILE" in err and "move.rename" in err and "Profile dump saved" in err
+    lines = dump.read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("MainThread;" in line for line in lines)
+    assert not profiler.is_enabled()
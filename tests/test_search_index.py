@@ -0,0 +1,41 @@
+"""Tests for the inverted trigram/token search index."""
+
+from file_managers.plex.config.config import config
+from file_managers.plex.utils.media_database import MediaDatabase
+from file_managers.plex.utils.search_index import NgramIndex
+
+
+def test_candidates_rank_by_shared_terms():
+    """Test that candidates share terms with the query, best overlap first."""
+    index = NgramIndex.build(["the office", "vikings", "the king of queens", "friends"])
+
+    candidates = index.candidates("kin")
+
+    assert "vikings" in candidates
+    assert "the king of queens" in candidates
+    assert "friends" not in candidates
+    assert index.candidates("the office")[0] == "the office"
+
+
+def test_search_uses_index_for_both_backends(tmp_path, monkeypatch):
+    """Test that JSON and lazily loaded SQLite searches return the same matches."""
+    movies = tmp_path / "movies"
+    tv = tmp_path / "tv"
+    movies.mkdir()
+    tv.mkdir()
+    for name in ["John.Wick.2014.mkv", "John.Wick.Chapter.2.2017.mkv", "Heat.1995.mkv"]:
+        (movies / name).write_text("m")
+    for name in ["Vikings.S01E01.mkv", "The.Office.S01E01.mkv"]:
+        (tv / name).write_text("e")
+    monkeypatch.setitem(config.config["movies"], "directories", [{"path": str(movies)}])
+    monkeypatch.setitem(config.config["tv"], "directories", [{"path": str(tv)}])
+
+    for db_name in ["db.json", "db.sqlite"]:
+        MediaDatabase(str(tmp_path / db_name)).rebuild_database()
+        database = MediaDatabase(str(tmp_path / db_name))
+
+        movie_titles = [movie["normalized_title"] for movie in database.search_movies("john wick")]
+        assert movie_titles[:2] == ["john wick 2014", "john wick chapter 2 2017"]
+        assert "heat 1995" not in movie_titles
+        assert database.search_tv_shows("kin")[0]["name"] == "Vikings"
+        assert database.get_tv_show_details("office")["total_episodes"] == 1
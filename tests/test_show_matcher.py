@@ -0,0 +1,43 @@
+"""Tests for the blocked show-name matcher."""
+
+import difflib
+from pathlib import Path
+
+from file_managers.plex.utils.show_matcher import ShowNameMatcher, name_similarity
+from file_managers.plex.utils.tv_mover import _find_best_matching_show_folder
+
+
+def test_similarity_follows_difflib_scale_and_cuts_off_early():
+    """Test that scores match difflib on simple pairs and bail out below the bound."""
+    assert name_similarity("the office", "the office") == 1.0
+    assert name_similarity("the office", "the office us") == difflib.SequenceMatcher(
+        None, "the office", "the office us").ratio()
+    assert name_similarity("lost", "the lord of the rings", min_score=0.8) == 0.0
+    assert name_similarity("", "") == 1.0
+
+
+def test_match_returns_best_score_per_item_from_the_shortlist():
+    """Test exact, fuzzy and missing lookups over several variations per show."""
+    matcher = ShowNameMatcher([
+        ("breaking", ["Breaking Bad", "Breaking.Bad"]),
+        ("office", ["The Office", "The.Office"]),
+        ("lost", ["Lost"]),
+    ])
+
+    assert matcher.match("breaking.bad") == [("breaking", 1.0)]
+    assert [item for item, _ in matcher.match("the ofice")] == ["office"]
+    assert matcher.match("severance") == []
+    assert matcher.candidates("breaking bad s01") == ["breaking"]
+
+
+def test_tv_mover_folder_matching_uses_shared_matcher():
+    """Test that the prebuilt matcher gives the same folder choices."""
+    folders = {
+        "mobland": Path("/tv/MobLand"),
+        "mobland s01e01": Path("/tv/MobLand S01E01"),
+        "breaking bad": Path("/tv/Breaking Bad"),
+    }
+
+    assert _find_best_matching_show_folder("MobLand", folders) == Path("/tv/MobLand")
+    assert _find_best_matching_show_folder("Breaking.Bad.2008", folders) == Path("/tv/Breaking Bad")
+    assert _find_best_matching_show_folder("Severance", folders) is None
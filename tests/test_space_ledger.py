@@ -0,0 +1,94 @@
+"""Tests for the per-volume free-space ledger."""
+
+import os
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+from file_managers.plex.media_autoorganizer.organizer import AutoOrganizer
+from file_managers.plex.utils.space_ledger import SpaceLedger
+
+
+class FakeDiskUsage:
+    """Counts disk_usage calls and reports a fixed free size."""
+
+    def __init__(self, free: int):
+        self.free = free
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return SimpleNamespace(free=self.free)
+
+
+def _fake_other_volume(monkeypatch, volume_root):
+    """Make paths under volume_root report a different st_dev."""
+    real_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        st = real_stat(path, *args, **kwargs)
+        if str(path).startswith(str(volume_root)):
+            fields = list(tuple(st))
+            fields[2] = st.st_dev + 1
+            return os.stat_result(fields)
+        return st
+
+    monkeypatch.setattr(os, "stat", fake_stat)
+
+
+def test_reservations_are_counted_against_one_measurement(tmp_path, monkeypatch):
+    """Test that planned moves to one share use up its space without re-measuring."""
+    downloads = tmp_path / "downloads"
+    share = tmp_path / "share"
+    downloads.mkdir()
+    (share / "Movies").mkdir(parents=True)
+    _fake_other_volume(monkeypatch, share)
+    usage = FakeDiskUsage(free=10_000)
+    ledger = SpaceLedger(disk_usage=usage)
+
+    first = ledger.reserve(share / "Movies" / "A.mkv", 6_000, downloads / "A.mkv")
+
+    assert first is not None
+    assert not ledger.has_room(share / "New Show" / "Season 01", 6_000)
+    assert ledger.has_room(share / "Movies", 4_000)
+    assert usage.calls == 1
+
+    ledger.release(first, completed=False)
+    assert ledger.free_bytes(share) == 10_000
+
+
+def test_same_volume_moves_reserve_nothing_and_completed_moves_stay_booked(tmp_path, monkeypatch):
+    """Test rename moves and the settlement of finished copies."""
+    downloads = tmp_path / "downloads"
+    share = tmp_path / "share"
+    downloads.mkdir()
+    share.mkdir()
+    _fake_other_volume(monkeypatch, share)
+    ledger = SpaceLedger(disk_usage=FakeDiskUsage(free=10_000))
+
+    assert ledger.reserve(downloads / "Season 1", 3_000, downloads / "Show.S01E01.mkv") is None
+
+    assert ledger.free_bytes(downloads) == 10_000
+    copy = ledger.reserve(share / "B.mkv", 3_000, downloads / "B.mkv")
+    ledger.release(copy, completed=True)
+
+    assert ledger.free_bytes(share) == 7_000
+    assert ledger.free_bytes(downloads) == 13_000
+
+
+def test_failed_move_future_gives_its_reservation_back(tmp_path, monkeypatch):
+    """Test that a move which raised releases its space instead of leaking it."""
+    downloads = tmp_path / "downloads"
+    share = tmp_path / "share"
+    downloads.mkdir()
+    share.mkdir()
+    _fake_other_volume(monkeypatch, share)
+    organizer = AutoOrganizer.__new__(AutoOrganizer)
+    organizer.space_ledger = SpaceLedger(disk_usage=FakeDiskUsage(free=10_000))
+    reservation = organizer.space_ledger.reserve(share / "C.mkv", 4_000, downloads / "C.mkv")
+    future = Future()
+    future.add_done_callback(lambda f: organizer._settle_reservation(reservation, f))
+
+    future.set_exception(OSError("share went away"))
+
+    assert organizer.space_ledger.free_bytes(share) == 10_000
+    assert organizer.space_ledger.has_room(share, 10_000)